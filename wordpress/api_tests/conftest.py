@@ -0,0 +1,120 @@
+# api_tests/conftest.py
+"""
+Collects *.postman_collection.json files as pytest tests.
+
+    pytest api_tests                                  # against the environment file's hosts
+    pytest api_tests --postman-standin                # against a local stand-in app
+    pytest api_tests --postman-base-url http://127.0.0.1:8765
+
+Every request yields one item per pm.test in its test script, plus a "[request]"
+item that fails on transport errors and on assertions outside any pm.test.
+The whole collection runs once, on the first item, with the folders in parallel
+(see utilities/postman_runner.py); the items then report their stored outcome.
+"""
+
+import pytest
+from utilities.postman_runner import (FAILED, SKIPPED, PostmanRunner, load_json, script_of,
+                                      standin_overrides, test_names)
+
+REQUEST_ITEM = "[request]"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("postman")
+    group.addoption("--postman-env", default=None,
+                    help="Postman environment file (default: the one next to the collection)")
+    group.addoption("--postman-var", action="append", default=[], metavar="KEY=VALUE",
+                    help="Override a collection/environment variable (repeatable)")
+    group.addoption("--postman-base-url", default=None,
+                    help="Point {{verbatimly}} and {{SUPABASE_URL}} at this host")
+    group.addoption("--postman-standin", action="store_true", default=False,
+                    help="Start the local stand-in app and run the collection against it")
+    group.addoption("--postman-sequential", action="store_true", default=False,
+                    help="Run folders one after another on one shared environment (newman order)")
+
+
+def pytest_collect_file(parent, file_path):
+    if file_path.name.endswith(".postman_collection.json"):
+        return PostmanCollection.from_parent(parent, path=file_path)
+
+
+class PostmanFailure(Exception):
+    pass
+
+
+class PostmanCollection(pytest.File):
+    """One collection file; runs it once and hands each item its result."""
+
+    def collect(self):
+        self._results = None
+        self._server = None
+        collection = load_json(self.path)
+        for folder, requests in PostmanRunner(collection).folders():
+            for index, (path, item, _, _) in enumerate(requests):
+                key = (folder, index)
+                request_name = " / ".join(path)
+                yield PostmanItem.from_parent(self, name=f"{request_name}::{REQUEST_ITEM}",
+                                              key=key, test=None)
+                for test in test_names(script_of(item, "test")):
+                    yield PostmanItem.from_parent(self, name=f"{request_name}::{test}", key=key, test=test)
+
+    def _environment_path(self):
+        option = self.config.getoption("--postman-env")
+        if option:
+            return option
+        candidates = sorted(self.path.parent.glob("*.postman_environment.json"))
+        return str(candidates[0]) if len(candidates) == 1 else None
+
+    def results(self):
+        if self._results is None:
+            config = self.config
+            overrides = dict(v.split("=", 1) for v in config.getoption("--postman-var"))
+            base_url = config.getoption("--postman-base-url")
+            if config.getoption("--postman-standin"):
+                from standin import StandinServer
+                self._server = StandinServer().start()
+                config.add_cleanup(self._server.stop)
+                overrides = dict(standin_overrides(self._server.base_url), **overrides)
+            elif base_url:
+                overrides = dict({"verbatimly": base_url, "SUPABASE_URL": base_url}, **overrides)
+            runner = PostmanRunner.from_files(self.path, self._environment_path(), overrides=overrides)
+            results = runner.run(concurrent=not config.getoption("--postman-sequential"))
+            self._results = {}
+            for folder, requests in runner.folders():
+                for index in range(len(requests)):
+                    self._results[(folder, index)] = results.pop(0)
+        return self._results
+
+
+class PostmanItem(pytest.Item):
+
+    def __init__(self, *, key, test, **kwargs):
+        super().__init__(**kwargs)
+        self.key = key
+        self.test = test
+        self.add_marker("api")
+
+    def runtest(self):
+        result = self.parent.results()[self.key]
+        if self.test is None:
+            problems = ([result.error] if result.error else []) + result.script_errors
+            if problems:
+                raise PostmanFailure("\n".join(problems))
+            return
+        outcomes = [t for t in result.tests if t.name == self.test]
+        if not outcomes:
+            pytest.skip("pm.test not reached (its condition was false for this response)")
+        failed = [t for t in outcomes if t.outcome == FAILED]
+        if failed:
+            raise PostmanFailure(f"{result.method} {result.url} -> {result.status}\n"
+                                 + "\n".join(t.message for t in failed))
+        if all(t.outcome == SKIPPED for t in outcomes):
+            pytest.skip(outcomes[0].message)
+
+    def repr_failure(self, excinfo):
+        if isinstance(excinfo.value, PostmanFailure):
+            return str(excinfo.value)
+        return super().repr_failure(excinfo)
+
+    def reportinfo(self):
+        return self.path, None, self.name
@@ -0,0 +1,249 @@
+# base/auth_session.py
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import urlsplit
+from utilities.custom_logger import customLogger
+
+# Everything in localStorage as {key: value}, in one round trip
+_READ_STORAGE_JS = """
+var out = {};
+for (var i = 0; i < localStorage.length; i++) {
+  var key = localStorage.key(i);
+  out[key] = localStorage.getItem(key);
+}
+return out;
+"""
+
+_WRITE_STORAGE_JS = """
+var entries = arguments[0];
+for (var key in entries) { localStorage.setItem(key, entries[key]); }
+"""
+
+DEFAULT_TTL_S = 3000         # when neither the token nor the cookies say when they expire
+REFRESH_MARGIN_S = 60        # refresh this long before the recorded expiry
+
+
+class AuthError(Exception):
+    pass
+
+
+def origin_of(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def default_storage_key():
+    """
+    localStorage key the app keeps its Supabase session under: AUTH_STORAGE_KEY,
+    else supabase-js' default sb-<project ref>-auth-token derived from SUPABASE_URL.
+    """
+    key = os.getenv("AUTH_STORAGE_KEY")
+    if key:
+        return key
+    supabase = os.getenv("SUPABASE_URL")
+    if supabase:
+        return f"sb-{urlsplit(supabase).hostname.split('.')[0]}-auth-token"
+    return None
+
+
+class AuthSession:
+    """A logged-in browser state: cookies plus localStorage for one origin."""
+
+    __slots__ = ("origin", "cookies", "storage", "expires_at", "token", "source")
+
+    def __init__(self, origin, cookies, storage, expires_at=None, token=None, source="ui"):
+        self.origin = origin
+        self.cookies = cookies
+        self.storage = storage
+        self.token = token
+        self.source = source
+        self.expires_at = expires_at or time.time() + DEFAULT_TTL_S
+
+    @classmethod
+    def from_driver(cls, driver):
+        """Capture the session of a browser that has just logged in."""
+        storage = driver.execute_script(_READ_STORAGE_JS) or {}
+        cookies = driver.get_cookies()
+        expires_at, token = None, None
+        # The Supabase client stores {"access_token", "expires_at", ...} as JSON
+        for value in storage.values():
+            try:
+                data = json.loads(value)
+            except (TypeError, ValueError):
+                continue
+            if isinstance(data, dict) and data.get("access_token"):
+                token = data["access_token"]
+                expires_at = data.get("expires_at")
+                break
+        if expires_at is None:
+            expiries = [c["expiry"] for c in cookies if c.get("expiry")]
+            expires_at = min(expiries) if expiries else None
+        return cls(origin_of(driver.current_url), cookies, storage, expires_at, token, source="ui")
+
+    def expired(self, margin=REFRESH_MARGIN_S):
+        return time.time() + margin >= self.expires_at
+
+    def inject(self, driver):
+        """Install the cookies and localStorage entries into driver (on the session's origin)."""
+        if origin_of(driver.current_url) != self.origin:
+            driver.get(self.origin)
+        if not self._set_cookies_cdp(driver):
+            for cookie in self.cookies:
+                cookie = {k: v for k, v in cookie.items() if k in
+                          ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")}
+                try:
+                    driver.add_cookie(cookie)
+                except Exception:
+                    # host-only cookies are refused when a domain is given for them
+                    cookie.pop("domain", None)
+                    driver.add_cookie(cookie)
+        if self.storage:
+            driver.execute_script(_WRITE_STORAGE_JS, self.storage)
+
+    def _set_cookies_cdp(self, driver):
+        """All cookies in one DevTools call (Chromium only)."""
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        cookies = []
+        for c in self.cookies:
+            cookie = {"name": c["name"], "value": c["value"], "path": c.get("path", "/"),
+                      "secure": c.get("secure", False), "httpOnly": c.get("httpOnly", False)}
+            if c.get("domain"):
+                cookie["domain"] = c["domain"]
+            else:
+                cookie["url"] = self.origin
+            if c.get("expiry"):
+                cookie["expires"] = c["expiry"]
+            if c.get("sameSite"):
+                cookie["sameSite"] = c["sameSite"]
+            cookies.append(cookie)
+        try:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+            return True
+        except Exception:
+            return False
+
+
+class SessionCache:
+    """
+    One login per process, reused by every test that only needs to be signed in.
+    - via="ui": the first test's browser logs in through LoginPage2 and the
+      resulting cookies + localStorage are captured.
+    - via="api": POST <api_url>/api/auth/login, and the session is written the
+      way the app's login page writes it (storage_key JSON + sb-access-token cookie).
+    The session is captured again when it is about to expire or, if validate_path
+    is set, when the server no longer accepts its token.
+    """
+
+    def __init__(self, base_url, email, password, via="ui", api_url=None, storage_key=None,
+                 validate_path=None, landing="/dashboard", timeout=10):
+        self.base_url = base_url
+        self.origin = origin_of(base_url)
+        self.email = email
+        self.password = password
+        self.via = via
+        self.api_url = (api_url or self.origin).rstrip("/")
+        self.storage_key = storage_key or default_storage_key()
+        self.validate_path = validate_path
+        self.landing = landing
+        self.timeout = timeout
+        self.log = customLogger("selenium")
+        self._session = None
+        self._lock = threading.Lock()
+        self.stats = {"captures": 0, "capture_s": 0.0, "injections": 0, "inject_s": 0.0, "refreshes": 0}
+
+    # ---------- Capture ----------
+    def capture_api(self):
+        if not self.storage_key:
+            raise AuthError("API login needs the app's storage key: set AUTH_STORAGE_KEY or SUPABASE_URL")
+        body = json.dumps({"email": self.email, "password": self.password}).encode()
+        req = urllib.request.Request(f"{self.api_url}/api/auth/login", data=body,
+                                     headers={"Content-Type": "application/json"}, method="POST")
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                data = json.loads(resp.read() or b"{}")
+        except urllib.error.HTTPError as e:
+            raise AuthError(f"API login for {self.email} failed: HTTP {e.code}") from e
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+            raise AuthError(f"API login for {self.email} failed: {self.api_url} unreachable ({e})") from e
+        token = data.get("access_token")
+        if not token:
+            raise AuthError(f"API login for {self.email} returned no access_token")
+        cookies = [{"name": "sb-access-token", "value": token, "path": "/"}]
+        return AuthSession(self.origin, cookies, {self.storage_key: json.dumps(data)},
+                           data.get("expires_at"), token, source="api")
+
+    def capture_ui(self, driver):
+        from pages.home.login_page import LoginPage2
+        page = LoginPage2(driver)
+        if not (page.perform_login(self.email, self.password) and page.verify_login_success()):
+            raise AuthError(f"UI login for {self.email} failed")
+        return AuthSession.from_driver(driver)
+
+    def _valid(self, session):
+        if session.expired():
+            return False
+        if not self.validate_path or not session.token:
+            return True
+        req = urllib.request.Request(f"{self.api_url}{self.validate_path}",
+                                     headers={"Authorization": f"Bearer {session.token}"})
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout):
+                return True
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+            # HTTPError included: any failure to confirm the session means capture again
+            self.log.info("Session check for %s failed (%s); capturing again", self.email, e)
+            return False
+
+    def session(self, driver=None):
+        """
+        The cached session, captured or refreshed first when needed.
+        Returns (session, fresh): fresh is True when driver itself just logged in
+        through the UI and so already holds the session.
+        """
+        with self._lock:
+            if self._session is not None and self._valid(self._session):
+                return self._session, False
+            if self._session is not None:
+                self.stats["refreshes"] += 1
+            t0 = time.monotonic()
+            if self.via == "api":
+                self._session, fresh = self.capture_api(), False
+            else:
+                if driver is None:
+                    raise AuthError("UI capture needs a driver")
+                self._session, fresh = self.capture_ui(driver), True
+            self.stats["captures"] += 1
+            self.stats["capture_s"] += time.monotonic() - t0
+            self.log.info("Captured %s session for %s in %.2f s", self.via, self.email, time.monotonic() - t0)
+            return self._session, fresh
+
+    def invalidate(self):
+        with self._lock:
+            self._session = None
+
+    # ---------- Injection ----------
+    def apply(self, driver, landing=None):
+        """Sign driver in from the cache and open landing (default: the dashboard)."""
+        session, fresh = self.session(driver)
+        if not fresh:
+            t0 = time.monotonic()
+            session.inject(driver)
+            self.stats["injections"] += 1
+            self.stats["inject_s"] += time.monotonic() - t0
+        landing = self.landing if landing is None else landing
+        if landing:
+            driver.get(self.origin + landing)
+        return driver
+
+    def summary(self):
+        s = self.stats
+        lines = [f"auth via {self.via}: {s['captures']} login(s) in {s['capture_s']:.2f} s, "
+                 f"{s['refreshes']} refresh(es)"]
+        if s["injections"]:
+            lines.append(f"{s['injections']} injection(s), {1000 * s['inject_s'] / s['injections']:.0f} ms each")
+        return lines
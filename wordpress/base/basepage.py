@@ -1,7 +1,101 @@
 # base/basepage.py
-from base.selenium_driver import SeleniumDriver
+from base.selenium_driver import SeleniumDriver, LocatorGroup, FIND_JS
 from utilities.util import Util
 
+_SET_VALUE_JS = FIND_JS + """
+function setNativeValue(el, value) {
+  var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+                                                : HTMLInputElement.prototype;
+  Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+  el.dispatchEvent(new Event('input', {bubbles: true}));
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+function findFirst(locs, by) {
+  for (var k = 0; k < locs.length; k++) { var el = find(locs[k], by); if (el) return [k, el]; }
+  return [-1, null];
+}
+"""
+
+# Sets every field in one execute_script call. Uses the native value setter so
+# React's value tracker sees the change, then fires input/change like typing.
+# Each field carries its candidate locators; the first that matches wins.
+_FILL_FORM_JS = _SET_VALUE_JS + """
+var fields = arguments[0], winners = [];
+for (var i = 0; i < fields.length; i++) {
+  var hit = findFirst(fields[i][0], fields[i][2]), el = hit[1], value = fields[i][1];
+  winners.push(hit[0]);
+  if (!el) continue;
+  if (typeof value === 'boolean') {
+    if (el.checked !== value) el.click();
+    continue;
+  }
+  value = String(value);
+  if (el.maxLength > 0 && value.length > el.maxLength) value = value.slice(0, el.maxLength);
+  el.focus();
+  setNativeValue(el, value);
+  el.blur();
+}
+return winners;
+"""
+
+# Empties a field and leaves it focused, ready for CDP Input.insertText
+_FOCUS_EMPTY_JS = _SET_VALUE_JS + """
+var hit = findFirst(arguments[0], arguments[1]), el = hit[1];
+if (el) { setNativeValue(el, ''); el.focus(); }
+return hit[0];
+"""
+
+# Puts a form back to its freshly loaded state without reloading the page: every
+# text field is emptied through setNativeValue (so React state follows), ticked
+# boxes are clicked off, then form.reset() and both storages are cleared.
+_RESET_FORM_JS = _SET_VALUE_JS + """
+var form = find(arguments[0], arguments[1]);
+if (!form) return false;
+var fields = form.querySelectorAll('input, textarea');
+for (var i = 0; i < fields.length; i++) {
+  var el = fields[i];
+  if (el.type === 'checkbox' || el.type === 'radio') { if (el.checked) el.click(); }
+  else if (el.type !== 'hidden' && el.type !== 'submit' && el.value !== '') setNativeValue(el, '');
+}
+form.reset();
+try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}
+window.scrollTo(0, 0);
+return true;
+"""
+
+# Validation oracle: runs many candidate values through a live input's constraint
+# validation in one call. Values go in through the native setter without events,
+# so the app never sees them; the field's value and custom validity are restored.
+# minlength/maxlength are only enforced by browsers after a user edit, so they are
+# applied here to the set value too (flagged, with no browser message).
+_VALIDITY_JS = _SET_VALUE_JS + """
+var FLAGS = ['valueMissing', 'typeMismatch', 'patternMismatch', 'tooLong', 'tooShort',
+             'rangeUnderflow', 'rangeOverflow', 'stepMismatch', 'badInput'];
+var fields = arguments[0], out = [];
+for (var i = 0; i < fields.length; i++) {
+  var hit = findFirst(fields[i][0], fields[i][2]), el = hit[1], values = fields[i][1];
+  if (!el) { out.push([hit[0], null]); continue; }
+  var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+                                                : HTMLInputElement.prototype;
+  var setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+  var original = el.value, custom = el.validity.customError ? el.validationMessage : '';
+  el.setCustomValidity('');
+  var rows = [];
+  for (var j = 0; j < values.length; j++) {
+    setter.call(el, String(values[j]));
+    var failed = [], len = el.value.length;
+    for (var k = 0; k < FLAGS.length; k++) { if (el.validity[FLAGS[k]]) failed.push(FLAGS[k]); }
+    if (len && el.minLength > 0 && len < el.minLength && failed.indexOf('tooShort') < 0) failed.push('tooShort');
+    if (el.maxLength >= 0 && len > el.maxLength && failed.indexOf('tooLong') < 0) failed.push('tooLong');
+    rows.push([failed.length === 0, el.validationMessage, failed]);
+  }
+  setter.call(el, original);
+  el.setCustomValidity(custom);
+  out.push([hit[0], rows]);
+}
+return out;
+"""
+
 class BasePage(SeleniumDriver):
     def __init__(self, driver, explicit_wait_seconds=20, screenshots_dir="screenshots"):
         super().__init__(driver, explicit_wait_seconds, screenshots_dir)
@@ -15,3 +109,98 @@ class BasePage(SeleniumDriver):
             self.log.error("Failed to get/verify page title")
             self.screenShot("verify_title_error")
             return False
+
+    def fill_form(self, fields: dict, locatorType="xpath", use_cdp=False):
+        """
+        Fill many fields at once: {locator or LocatorGroup: value}. Boolean values tick/untick
+        checkboxes. Text goes in with one WebDriver round trip; with use_cdp=True each text
+        value is typed through CDP Input.insertText instead (real input events, Chromium only).
+        Returns the keys that were not found.
+        """
+        keys = list(fields)
+        items = [self._candidates(key, locatorType) + [fields[key]] for key in keys]
+        items = [[locs, value, by] for locs, by, value in items]
+        winners = None
+        if use_cdp:
+            try:
+                winners = self._fill_form_cdp(items)
+            except Exception as e:
+                self.log.info("CDP insertText unavailable, using script fill: %s", e)
+        if winners is None:
+            winners = self.driver.execute_script(_FILL_FORM_JS, items)
+
+        missing = []
+        for key, (locs, _, _), won in zip(keys, items, winners):
+            if won is None or won < 0:
+                missing.append(key)
+            elif isinstance(key, LocatorGroup):
+                key.record(locs[won])
+        if missing:
+            self.log.info("fill_form: %d field(s) not found", len(missing))
+        return missing
+
+    def check_validity(self, fields: dict, locatorType="xpath", chunk_size=5000):
+        """
+        HTML5 verdicts for many candidate values per field: {locator or LocatorGroup: values}.
+        Every value is checked against the live input (checkValidity/validationMessage)
+        without submitting; up to chunk_size values per field go in one round trip.
+        Returns {key: [{"value", "valid", "message", "failed"}, ...]}, None for fields not found.
+        """
+        keys = list(fields)
+        values = {key: [str(v) for v in fields[key]] for key in keys}
+        verdicts = {key: [] for key in keys}
+        longest = max((len(v) for v in values.values()), default=0)
+        for start in range(0, max(longest, 1), chunk_size):
+            batch = [key for key in keys if verdicts[key] is not None and start < len(values[key])]
+            if not batch:
+                break
+            items = []
+            for key in batch:
+                locs, by = self._candidates(key, locatorType)
+                items.append([locs, values[key][start:start + chunk_size], by])
+            results = self.driver.execute_script(_VALIDITY_JS, items)
+            for key, (locs, chunk, _), (won, rows) in zip(batch, items, results):
+                if rows is None:
+                    verdicts[key] = None
+                    continue
+                if start == 0 and isinstance(key, LocatorGroup):
+                    key.record(locs[won])
+                verdicts[key].extend({"value": value, "valid": valid, "message": message or None,
+                                      "failed": failed}
+                                     for value, (valid, message, failed) in zip(chunk, rows))
+        for key in keys:
+            if verdicts[key] is None:
+                self.log.info("check_validity: field %s not found", key)
+            else:
+                self.log.info("check_validity: %s - %d/%d value(s) valid", key,
+                              sum(v["valid"] for v in verdicts[key]), len(verdicts[key]))
+        return verdicts
+
+    def reset_form(self, form_locator="//form", locatorType="xpath"):
+        """
+        Empty the form in place (fields, checkboxes, local/session storage) so the
+        next case can reuse the loaded page. False when the form is not on the page.
+        """
+        try:
+            return bool(self.driver.execute_script(_RESET_FORM_JS, form_locator, (locatorType or "").lower()))
+        except Exception as e:
+            self.log.error("Error resetting form %s: %s", form_locator, e)
+            return False
+
+    @staticmethod
+    def _candidates(key, locatorType):
+        if isinstance(key, LocatorGroup):
+            return [key.ordered(), (key.locatorType or "").lower()]
+        return [[key], (locatorType or "").lower()]
+
+    def _fill_form_cdp(self, items):
+        winners = []
+        for locs, val, by in items:
+            if isinstance(val, bool):
+                winners += self.driver.execute_script(_FILL_FORM_JS, [[locs, val, by]])
+                continue
+            won = self.driver.execute_script(_FOCUS_EMPTY_JS, locs, by)
+            if won >= 0:
+                self.driver.execute_cdp_cmd("Input.insertText", {"text": str(val)})
+            winners.append(won)
+        return winners
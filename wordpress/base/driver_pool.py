@@ -0,0 +1,200 @@
+# base/driver_pool.py
+import threading
+import time
+from base.webdriverfactory import WebDriverFactory
+from utilities.custom_logger import customLogger
+
+
+class PooledDriver:
+    """A warm WebDriver instance plus the bookkeeping the pool needs."""
+
+    def __init__(self, driver, cfg, launch_s: float):
+        self.driver = driver
+        self.cfg = cfg
+        self.launch_s = launch_s
+        self.uses = 0
+
+
+class DriverPool:
+    """
+    Session-wide pool of warm browsers built by WebDriverFactory.
+    - Browsers are launched lazily, up to `size`, and handed out one test at a time.
+    - Between tests state is reset in place (cookies, local/session storage,
+      extra windows) instead of quitting and relaunching.
+    - Unhealthy browsers (crashed, unresponsive, leaking JS heap or simply
+      over `max_uses`) are quit and replaced on the next acquire.
+    - Keeps launch vs reuse timings so the saving can be reported.
+    """
+
+    def __init__(self, browser="chrome", headless=False, size=1, max_uses=50,
+                 max_heap_mb=512, factory=None):
+        self.factory = factory or WebDriverFactory(browser=browser, headless=headless)
+        self.size = max(1, int(size))
+        self.max_uses = max(1, int(max_uses))
+        self.max_heap_bytes = int(max_heap_mb) * 1024 * 1024
+        self.log = customLogger("selenium")
+
+        self._idle = []
+        self._live = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self.stats = {
+            "launches": 0, "launch_s": 0.0,
+            "reuses": 0, "resets": 0, "reset_s": 0.0,
+            "recycled": 0,
+        }
+
+    # ---------- Lease ----------
+    def acquire(self, timeout=None) -> PooledDriver:
+        """Hand out a healthy, reset browser; launch a new one if the pool has room."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("DriverPool is closed")
+                if self._idle:
+                    pooled = self._idle.pop()
+                    break
+                if self._live < self.size:
+                    self._live += 1
+                    pooled = None
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No browser free in pool of {self.size}")
+                self._cond.wait(remaining)
+
+        if pooled is not None and not self._healthy(pooled):
+            self._discard(pooled, keep_slot=True)
+            pooled = None
+
+        if pooled is None:
+            try:
+                pooled = self._launch()
+            except Exception:
+                with self._cond:
+                    self._live -= 1
+                    self._cond.notify()
+                raise
+        else:
+            with self._cond:
+                self.stats["reuses"] += 1
+
+        pooled.uses += 1
+        return pooled
+
+    def release(self, pooled: PooledDriver, reset=True):
+        """Return a browser to the pool, resetting its state for the next test."""
+        ok = True
+        if reset:
+            t0 = time.monotonic()
+            ok = self.reset(pooled)
+            with self._cond:
+                self.stats["resets"] += 1
+                self.stats["reset_s"] += time.monotonic() - t0
+
+        if not ok or pooled.uses >= self.max_uses:
+            self._discard(pooled)
+            return
+
+        with self._cond:
+            if self._closed:
+                self._quit(pooled)
+                self._live -= 1
+            else:
+                self._idle.append(pooled)
+            self._cond.notify()
+
+    # ---------- State reset ----------
+    def reset(self, pooled: PooledDriver) -> bool:
+        """Clear cookies, storage and extra windows, then return to the base URL."""
+        driver = pooled.driver
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            try:
+                driver.execute_script(
+                    "try { window.localStorage.clear(); } catch (e) {}"
+                    "try { window.sessionStorage.clear(); } catch (e) {}"
+                )
+            except Exception:
+                pass
+
+            # Chromium can drop cookies for every domain in one call;
+            # other browsers only clear the current document's domain.
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception:
+                driver.delete_all_cookies()
+
+            driver.get(pooled.cfg["base_url"])
+            return True
+        except Exception as e:
+            self.log.error("Driver reset failed, recycling: %s", e)
+            return False
+
+    # ---------- Health ----------
+    def _healthy(self, pooled: PooledDriver) -> bool:
+        try:
+            heap = pooled.driver.execute_script(
+                "return (window.performance && performance.memory)"
+                " ? performance.memory.usedJSHeapSize : 0;"
+            ) or 0
+        except Exception as e:
+            self.log.error("Pooled driver unresponsive, recycling: %s", e)
+            return False
+        if heap > self.max_heap_bytes:
+            self.log.info("Pooled driver JS heap %.0f MB over budget, recycling", heap / 1048576)
+            return False
+        return True
+
+    # ---------- Lifecycle ----------
+    def _launch(self) -> PooledDriver:
+        t0 = time.monotonic()
+        driver, cfg = self.factory.getWebDriverInstance()
+        elapsed = time.monotonic() - t0
+        with self._cond:
+            self.stats["launches"] += 1
+            self.stats["launch_s"] += elapsed
+        self.log.info("Launched pooled browser in %.2f s", elapsed)
+        return PooledDriver(driver, cfg, elapsed)
+
+    def _quit(self, pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+    def _discard(self, pooled: PooledDriver, keep_slot=False):
+        self._quit(pooled)
+        with self._cond:
+            self.stats["recycled"] += 1
+            if not keep_slot:
+                self._live -= 1
+                self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+            self._cond.notify_all()
+        for pooled in idle:
+            self._quit(pooled)
+
+    # ---------- Reporting ----------
+    def summary(self):
+        s = self.stats
+        avg_launch = s["launch_s"] / s["launches"] if s["launches"] else 0.0
+        avg_reset = s["reset_s"] / s["resets"] if s["resets"] else 0.0
+        return [
+            f"browsers launched: {s['launches']} (avg {avg_launch:.2f} s)",
+            f"browsers reused:   {s['reuses']} (avg reset {avg_reset:.2f} s)",
+            f"browsers recycled: {s['recycled']}",
+            f"launch time saved: {max(0.0, s['reuses'] * (avg_launch - avg_reset)):.1f} s",
+        ]
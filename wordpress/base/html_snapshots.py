@@ -0,0 +1,97 @@
+# base/html_snapshots.py
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+from utilities.custom_logger import customLogger
+
+
+class HtmlSnapshots:
+    """
+    Saves the DOM of the pages a run visits, for utilities.locator_check to test
+    locators against offline (no browser).
+    - Off unless HTML_SNAPSHOT_DIR is set (pytest --html-snapshots sets it).
+    - One file per distinct DOM: <dir>/<url path>.<hash>.html; the newest
+      HTML_SNAPSHOT_PER_PAGE (default 3) variants per URL path are kept.
+    - <dir>/index.json (index.<worker>.json on parallel workers) maps every
+      file to the URL it was taken from.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, directory, per_page=None):
+        self.log = customLogger("selenium")
+        self.directory = Path(directory)
+        self.per_page = int(per_page or os.getenv("HTML_SNAPSHOT_PER_PAGE", 3))
+        self._lock = threading.Lock()
+        self._seen = set()
+        self._per_path = {}
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        self._index_file = self.directory / (f"index.{worker}.json" if worker else "index.json")
+        self._index = self._load_index()
+        self.stats = {"captured": 0, "written": 0, "deduped": 0}
+
+    @classmethod
+    def shared(cls):
+        """The process-wide instance, or None when HTML_SNAPSHOT_DIR is not set."""
+        directory = os.getenv("HTML_SNAPSHOT_DIR")
+        if not directory:
+            return None
+        with cls._instance_lock:
+            if cls._instance is None or str(cls._instance.directory) != directory:
+                cls._instance = cls(directory)
+            return cls._instance
+
+    def _load_index(self):
+        try:
+            with open(self._index_file, encoding="utf-8") as fh:
+                index = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        # Files from earlier runs dedupe too, and are the first to go when a page has newer ones
+        for name, entry in sorted(index.items(), key=lambda kv: kv[1].get("captured", "")):
+            self._seen.add(entry.get("sha1"))
+            self._per_path.setdefault(entry.get("path", "/"), []).append(name)
+        return index
+
+    # ---------- Capture ----------
+    def capture(self, driver):
+        """Save driver's current DOM unless the same DOM is already kept; returns its file or None."""
+        try:
+            html = driver.page_source
+            url = driver.current_url
+        except Exception as e:
+            self.log.info("HTML snapshot skipped: %s", e)
+            return None
+        digest = hashlib.sha1(html.encode("utf-8")).hexdigest()
+        path = urlsplit(url).path or "/"
+        with self._lock:
+            self.stats["captured"] += 1
+            if digest in self._seen:
+                self.stats["deduped"] += 1
+                return None
+            self._seen.add(digest)
+            kept = self._per_path.setdefault(path, [])
+            while len(kept) >= self.per_page:
+                old = kept.pop(0)
+                self._seen.discard(self._index.pop(old, {}).get("sha1"))
+                (self.directory / old).unlink(missing_ok=True)
+            slug = re.sub(r"[^\w.-]+", "_", path).strip("_") or "root"
+            name = f"{slug}.{digest[:8]}.html"
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / name).write_text(html, encoding="utf-8")
+            kept.append(name)
+            self._index[name] = {"url": url, "path": path, "sha1": digest,
+                                 "captured": time.strftime("%Y-%m-%dT%H:%M:%S")}
+            self._index_file.write_text(json.dumps(self._index, indent=2), encoding="utf-8")
+            self.stats["written"] += 1
+        return str(self.directory / name)
+
+    def summary(self):
+        s = self.stats
+        return [f"HTML snapshots: {s['written']} written, {s['deduped']} unchanged "
+                f"in {self.directory}"]
@@ -0,0 +1,156 @@
+# base/locator_registry.py
+import json
+import os
+import re
+import threading
+
+# ---------- XPath -> CSS ----------
+# Only the XPath subset with an exact CSS equivalent is compiled: absolute "//"
+# paths of element steps joined by // (descendant) or / (child), predicates on
+# attributes (=, presence, contains, starts-with, joined by "and"), and unions of
+# such paths. Anything about text, position, axes or functions of the node
+# (text(), normalize-space(), translate(), following-sibling::, [1] ...) is left
+# to XPath: xpath_to_css returns None for it.
+
+_NAME = r"[A-Za-z_][\w-]*"
+_STRING = r"""(?:'[^']*'|"[^"]*")"""
+_STEP_RE = re.compile(rf"({_NAME}|\*)((?:\[[^\[\]]*\])*)$")
+_PRED_RES = (
+    (re.compile(rf"@({_NAME})\s*=\s*({_STRING})$"), '[{0}="{1}"]'),
+    (re.compile(rf"contains\(\s*@({_NAME})\s*,\s*({_STRING})\s*\)$"), '[{0}*="{1}"]'),
+    (re.compile(rf"starts-with\(\s*@({_NAME})\s*,\s*({_STRING})\s*\)$"), '[{0}^="{1}"]'),
+    (re.compile(rf"@({_NAME})$"), "[{0}]"),
+)
+_CSS_IDENT = re.compile(r"^[A-Za-z][\w-]*$")
+
+
+def _split_top(expr, sep):
+    """expr split on sep where it is outside quotes and brackets/parentheses."""
+    parts, depth, quote, start, i = [], 0, None, 0, 0
+    while i < len(expr):
+        ch = expr[i]
+        if quote:
+            quote = None if ch == quote else quote
+        elif ch in "'\"":
+            quote = ch
+        elif ch in "[(":
+            depth += 1
+        elif ch in "])":
+            depth -= 1
+        elif depth == 0 and expr.startswith(sep, i):
+            parts.append(expr[start:i])
+            i += len(sep)
+            start = i
+            continue
+        i += 1
+    parts.append(expr[start:])
+    return parts
+
+
+def _predicate(pred):
+    css = ""
+    for clause in _split_top(pred, " and "):
+        clause = clause.strip()
+        for regex, template in _PRED_RES:
+            m = regex.match(clause)
+            if m:
+                groups = [g[1:-1] if g[:1] in "'\"" else g for g in m.groups()]
+                # Values go into a "..." CSS string, where quotes, backslashes and newlines
+                # would need escaping; contains/starts-with with '' match everything in XPath
+                # but nothing in CSS. Leave those to XPath.
+                if len(groups) > 1 and (any(ch in groups[1] for ch in '"\\\n')
+                                        or not groups[1] and template != '[{0}="{1}"]'):
+                    return None
+                if len(groups) > 1 and groups[0] == "id" and template.startswith('[{0}="') \
+                        and _CSS_IDENT.match(groups[1]):
+                    css += "#" + groups[1]
+                else:
+                    css += template.format(*groups)
+                break
+        else:
+            return None
+    return css
+
+
+def _path_to_css(path):
+    path = path.strip()
+    if not path.startswith("//") or path.startswith("///"):
+        return None
+    out = []
+    # tokens alternate: combinator, step
+    rest, combinator = path[2:], " "
+    for chunk in _split_top(rest, "/"):
+        if chunk == "":
+            combinator = " "          # an empty chunk comes from "//"
+            continue
+        m = _STEP_RE.match(chunk.strip())
+        if not m or "::" in chunk:
+            return None
+        tag, preds = m.group(1), m.group(2)
+        css = "" if tag == "*" else tag.lower()
+        for pred in re.findall(r"\[([^\[\]]*)\]", preds):
+            piece = _predicate(pred)
+            if piece is None:
+                return None
+            css += piece
+        if out:
+            out.append(" " if combinator == " " else " > ")
+        out.append(css or "*")
+        combinator = ">"
+    return "".join(out) if out else None
+
+
+def xpath_to_css(xpath):
+    """The equivalent CSS selector for xpath, or None when it has none."""
+    parts = [_path_to_css(p) for p in _split_top(xpath, "|")]
+    if not parts or any(p is None for p in parts):
+        return None
+    return ", ".join(parts)
+
+
+def css_fast_path(css):
+    """("id", value) when css is a bare #id, which getElementById answers directly; else ("css", css)."""
+    if css.startswith("#") and _CSS_IDENT.match(css[1:]):
+        return "id", css[1:]
+    return "css", css
+
+
+# ---------- Registry ----------
+class LocatorRegistry:
+    """
+    XPath locators with a faster equivalent, verified on the live DOM by
+    utilities.locator_profile and stored in LOCATOR_REGISTRY_FILE (default
+    locator_registry.json). SeleniumDriver looks locators up here first, so the
+    page objects keep their XPath while the browser runs the CSS/id form.
+    No file, no rewrites; LOCATOR_REGISTRY=0 turns it off.
+    """
+    FILE = os.getenv("LOCATOR_REGISTRY_FILE", "locator_registry.json")
+    ENABLED = os.getenv("LOCATOR_REGISTRY", "1") != "0"
+    _lock = threading.Lock()
+    _map = None      # xpath -> (locatorType, locator)
+
+    @classmethod
+    def _load(cls):
+        if cls._map is None:
+            with cls._lock:
+                if cls._map is None:
+                    try:
+                        with open(cls.FILE, encoding="utf-8") as fh:
+                            entries = json.load(fh)
+                    except (OSError, ValueError):
+                        entries = {}
+                    cls._map = {xp: (e["by"], e["locator"]) for xp, e in entries.items()
+                                if e.get("verified")}
+        return cls._map
+
+    @classmethod
+    def fast(cls, locator, locatorType="xpath"):
+        """(locator, locatorType) to use for an xpath locator: its registered rewrite or itself."""
+        if not cls.ENABLED or (locatorType or "").lower() != "xpath":
+            return locator, locatorType
+        hit = cls._load().get(locator)
+        return (hit[1], hit[0]) if hit else (locator, locatorType)
+
+    @classmethod
+    def reload(cls):
+        cls._map = None
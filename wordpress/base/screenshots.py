@@ -0,0 +1,187 @@
+# base/screenshots.py
+import atexit
+import hashlib
+import io
+import os
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from utilities.custom_logger import customLogger
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional: without it frames are written as PNG as-is
+    Image = None
+
+_EXTENSIONS = {"png": "png", "jpeg": "jpg", "jpg": "jpg", "webp": "webp"}
+_RUN_DIR = re.compile(r"^\d{8}-\d{6}$")
+
+
+def new_run_id():
+    """Name of this run's screenshot folder; parallel workers share it through SCREENSHOT_RUN."""
+    return os.getenv("SCREENSHOT_RUN") or time.strftime("%Y%m%d-%H%M%S")
+
+
+class ScreenshotWriter:
+    """
+    Background writer for failure screenshots.
+    - The caller only pays for the in-memory grab (get_screenshot_as_png);
+      encoding and disk writes happen on a small thread pool.
+    - Optional downscale and JPEG/WebP re-encoding (needs Pillow).
+    - Identical frames (same content hash) are written once; later captures
+      return the first file's path.
+    - Per-run retention budget on file count and bytes; captures over budget are dropped.
+      Parallel workers (PYTEST_XDIST_WORKER_COUNT, set by xdist and utilities.parallel_runner)
+      each get an equal share, so a whole run stays within it.
+    - Each run writes to <dir>/<YYYYmmdd-HHMMSS>/; on its first capture the writer
+      deletes all but the newest SCREENSHOT_KEEP_RUNS run folders there.
+    Configured from the environment:
+      SCREENSHOT_FORMAT   png | jpeg | webp      (default png)
+      SCREENSHOT_SCALE    0.1 - 1.0              (default 1.0)
+      SCREENSHOT_QUALITY  JPEG/WebP quality      (default 80)
+      SCREENSHOT_MAX_FILES / SCREENSHOT_MAX_MB   (default 200 files / 100 MB per run)
+      SCREENSHOT_WORKERS  writer threads         (default 2)
+      SCREENSHOT_KEEP_RUNS  run folders kept     (default 10, this one included)
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, fmt=None, scale=None, quality=None, max_files=None, max_mb=None, workers=None,
+                 keep_runs=None):
+        self.log = customLogger("selenium")
+        fmt = (fmt or os.getenv("SCREENSHOT_FORMAT", "png")).lower()
+        if fmt not in _EXTENSIONS:
+            fmt = "png"
+        scale = float(scale if scale is not None else os.getenv("SCREENSHOT_SCALE", 1.0))
+        if Image is None and (fmt != "png" or scale < 1.0):
+            self.log.info("Pillow not installed, screenshots stay full size PNG")
+            fmt, scale = "png", 1.0
+        self.fmt = fmt
+        self.scale = min(1.0, max(0.1, scale))
+        self.quality = int(quality or os.getenv("SCREENSHOT_QUALITY", 80))
+        workers_in_run = max(1, int(os.getenv("PYTEST_XDIST_WORKER_COUNT") or 1))
+        self.max_files = max(1, int(max_files or os.getenv("SCREENSHOT_MAX_FILES", 200)) // workers_in_run)
+        self.max_bytes = int(float(max_mb or os.getenv("SCREENSHOT_MAX_MB", 100)) * 1024 * 1024 / workers_in_run)
+        self.keep_runs = max(1, int(keep_runs or os.getenv("SCREENSHOT_KEEP_RUNS", 10)))
+        self.run = new_run_id()
+        self._pruned = set()   # screenshot dirs already trimmed to keep_runs
+
+        self._pool = ThreadPoolExecutor(max_workers=int(workers or os.getenv("SCREENSHOT_WORKERS", 2)),
+                                        thread_name_prefix="screenshot")
+        self._lock = threading.Lock()
+        self._seen = {}        # content hash -> path of the file holding that frame
+        self._pending = []
+        self.stats = {"captured": 0, "written": 0, "deduped": 0, "dropped": 0,
+                      "bytes_in": 0, "bytes_out": 0, "grab_s": 0.0}
+
+    @classmethod
+    def shared(cls):
+        """One writer per process, shared by every SeleniumDriver."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.close)
+            return cls._instance
+
+    @classmethod
+    def existing(cls):
+        """The shared writer if anything has created it, else None (creates nothing)."""
+        return cls._instance
+
+    @property
+    def extension(self):
+        return _EXTENSIONS[self.fmt]
+
+    # ---------- Capture ----------
+    def capture(self, driver, directory, name):
+        """
+        Grab the frame in memory and queue it for writing.
+        Returns the path the frame will be available at, or None if it was not kept.
+        """
+        t0 = time.monotonic()
+        png = driver.get_screenshot_as_png()
+        grab_s = time.monotonic() - t0
+
+        digest = hashlib.sha1(png).hexdigest()
+        safe = re.sub(r"[^\w.-]+", "_", name).strip("_")[:80] or "screenshot"
+        path = Path(directory) / self.run / f"{safe}.{int(time.time() * 1000)}.{digest[:8]}.{self.extension}"
+        with self._lock:
+            if str(directory) not in self._pruned:
+                self._pruned.add(str(directory))
+                self._prune(Path(directory))
+            self.stats["captured"] += 1
+            self.stats["bytes_in"] += len(png)
+            self.stats["grab_s"] += grab_s
+            if digest in self._seen:
+                self.stats["deduped"] += 1
+                return self._seen[digest]
+            # Reserve the raw size now; _write settles it to the encoded size
+            if (self.stats["written"] >= self.max_files
+                    or self.stats["bytes_out"] + len(png) > self.max_bytes):
+                self.stats["dropped"] += 1
+                self.log.info("Screenshot budget reached, dropped %s", safe)
+                return None
+            self._seen[digest] = str(path)
+            self.stats["written"] += 1
+            self.stats["bytes_out"] += len(png)
+            self._pending.append(self._pool.submit(self._write, png, path))
+        return str(path)
+
+    # ---------- Retention ----------
+    def _prune(self, directory: Path):
+        """Delete the oldest run folders so that keep_runs remain, counting this run's."""
+        try:
+            runs = sorted(p.name for p in directory.iterdir() if p.is_dir() and _RUN_DIR.match(p.name))
+        except OSError:
+            return
+        older = [name for name in runs if name != self.run]
+        for name in older[:max(0, len(older) - (self.keep_runs - 1))]:
+            shutil.rmtree(directory / name, ignore_errors=True)
+            self.log.info("Removed old screenshot run %s", directory / name)
+
+    # ---------- Writing ----------
+    def _encode(self, png: bytes) -> bytes:
+        if Image is None or (self.fmt == "png" and self.scale >= 1.0):
+            return png
+        img = Image.open(io.BytesIO(png))
+        if self.scale < 1.0:
+            img = img.resize((max(1, int(img.width * self.scale)), max(1, int(img.height * self.scale))))
+        if self.fmt in ("jpeg", "jpg"):
+            img = img.convert("RGB")
+        out = io.BytesIO()
+        img.save(out, format="JPEG" if self.fmt == "jpg" else self.fmt.upper(), quality=self.quality)
+        return out.getvalue()
+
+    def _write(self, png: bytes, path: Path):
+        try:
+            data = self._encode(png)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+            with self._lock:
+                self.stats["bytes_out"] += len(data) - len(png)
+        except Exception as e:
+            self.log.error("Writing screenshot %s failed: %s", path, e)
+
+    # ---------- Lifecycle ----------
+    def flush(self):
+        """Block until every queued screenshot is on disk."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for fut in pending:
+            fut.result()
+
+    def close(self):
+        self.flush()
+        self._pool.shutdown(wait=True)
+
+    def summary(self):
+        s = self.stats
+        avg_grab = s["grab_s"] / s["captured"] if s["captured"] else 0.0
+        return [
+            f"screenshots captured: {s['captured']} (avg grab {avg_grab:.2f} s)",
+            f"screenshots written:  {s['written']} ({s['bytes_out'] / 1048576:.1f} MB {self.fmt})",
+            f"duplicates skipped:   {s['deduped']}, over budget: {s['dropped']}",
+        ]
@@ -1,28 +1,144 @@
 # base/selenium_driver.py
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import *
+from base.wait_engine import WaitEngine, JsCondition, FIND_JS
+from base.screenshots import ScreenshotWriter
+from base.html_snapshots import HtmlSnapshots
+from base.locator_registry import LocatorRegistry
 from utilities.custom_logger import customLogger
 from pathlib import Path
+import atexit
+import json
+import threading
 import time
 import os
 
+# Everything the verification methods need about many locators, in one call
+_SNAPSHOT_JS = FIND_JS + """
+var locs = arguments[0], out = [];
+for (var i = 0; i < locs.length; i++) {
+  var els;
+  try { els = findAll(locs[i][0], locs[i][1]); } catch (e) { els = []; }
+  if (!els.length) { out.push(null); continue; }
+  var el = els[0], visible = false;
+  for (var j = 0; j < els.length && !visible; j++) { if (isVisible(els[j])) { el = els[j]; visible = true; } }
+  out.push({
+    count: els.length,
+    visible: visible,
+    text: (el.innerText || el.textContent || '').trim().slice(0, 500),
+    value: ('value' in el) ? el.value : null,
+    validationMessage: el.validationMessage || '',
+    enabled: !el.disabled,
+    selected: !!(el.checked || el.selected)
+  });
+}
+return out;
+"""
+
+_MISSING = {"present": False, "count": 0, "visible": False, "text": "", "value": None,
+            "validationMessage": "", "enabled": False, "selected": False}
+
+# Index of the first locator in the list that matches, or -1
+_RESOLVE_GROUP_JS = FIND_JS + """
+var locs = arguments[0], by = arguments[1];
+for (var i = 0; i < locs.length; i++) {
+  try { if (find(locs[i], by)) return i; } catch (e) {}
+}
+return -1;
+"""
+
+
+class LocatorGroup:
+    """
+    Primary and fallback locators for one element, resolved together in a single
+    in-page query instead of one timeout per candidate.
+    Hits are counted per locator and persisted (LOCATOR_STATS_FILE, default
+    .locator_stats.json), so the locator that usually wins is tried first next run.
+    """
+    STATS_FILE = os.getenv("LOCATOR_STATS_FILE", ".locator_stats.json")
+    _lock = threading.Lock()
+    _stats = None      # {group name: {locator: hits}} - previous runs + this one
+    _session = {}      # hits recorded by this process, merged into the file on exit
+
+    def __init__(self, name, *locators, locatorType="xpath"):
+        self.name = name
+        self.locators = list(locators)
+        self.locatorType = locatorType
+
+    def __iter__(self):
+        return iter(self.locators)
+
+    def __repr__(self):
+        return f"LocatorGroup({self.name})"
+
+    @classmethod
+    def _load(cls):
+        if cls._stats is None:
+            try:
+                with open(cls.STATS_FILE, encoding="utf-8") as fh:
+                    cls._stats = json.load(fh)
+            except (OSError, ValueError):
+                cls._stats = {}
+            atexit.register(cls.save_stats)
+        return cls._stats
+
+    def ordered(self):
+        """Locators by past hit count, most successful first; ties keep declared order."""
+        with self._lock:
+            hits = self._load().get(self.name, {})
+        return sorted(self.locators, key=lambda loc: -hits.get(loc, 0))
+
+    def record(self, locator):
+        with self._lock:
+            for table in (self._load(), self._session):
+                group = table.setdefault(self.name, {})
+                group[locator] = group.get(locator, 0) + 1
+
+    @classmethod
+    def save_stats(cls):
+        """Add this process's hits to the stats file (re-read first: workers share it)."""
+        with cls._lock:
+            if not cls._session:
+                return
+            try:
+                with open(cls.STATS_FILE, encoding="utf-8") as fh:
+                    merged = json.load(fh)
+            except (OSError, ValueError):
+                merged = {}
+            for name, hits in cls._session.items():
+                group = merged.setdefault(name, {})
+                for loc, n in hits.items():
+                    group[loc] = group.get(loc, 0) + n
+            tmp = f"{cls.STATS_FILE}.{os.getpid()}.tmp"
+            try:
+                with open(tmp, "w", encoding="utf-8") as fh:
+                    json.dump(merged, fh, indent=1, sort_keys=True)
+                os.replace(tmp, cls.STATS_FILE)
+                cls._session = {}
+            except OSError:
+                pass
+
+
 class SeleniumDriver:
     def __init__(self, driver, explicit_wait_seconds: int = 20, screenshots_dir: str = "screenshots"):
         self.driver = driver
+        self.waits = WaitEngine.for_driver(driver)
         self.log = customLogger("selenium")
         self._wait_s = explicit_wait_seconds
         self._screens_dir = Path(screenshots_dir)
 
     # ---------- Utilities ----------
     def screenShot(self, name: str):
-        self._screens_dir.mkdir(parents=True, exist_ok=True)
-        file_name = f"{name}.{int(time.time()*1000)}.png"
-        path = self._screens_dir / file_name
-        self.driver.save_screenshot(str(path))
-        self.log.info("📸 Screenshot: %s", path)
-        return str(path)
+        """Grab the page in memory; encoding and the disk write happen in the background."""
+        try:
+            path = ScreenshotWriter.shared().capture(self.driver, self._screens_dir, name)
+        except Exception as e:
+            self.log.error("Screenshot failed: %s", e)
+            return None
+        if path:
+            self.log.info("📸 Screenshot: %s", path)
+        return path
 
     def getTitle(self):
         return self.driver.title
@@ -38,53 +154,129 @@ class SeleniumDriver:
             "link": By.LINK_TEXT
         }.get(lt, None)
 
-    def getElement(self, locator, locatorType="id"):
-        try:
-            byType = self.getByType(locatorType)
-            el = self.driver.find_element(byType, locator)
-            return el
-        except Exception as e:
-            self.log.error("getElement failed: %s (%s)", locator, locatorType)
-            return None
+    def getElement(self, locator, locatorType="id", timeout=None):
+        """First match, waiting up to timeout (default: the engine's find budget)."""
+        fast, fastType = LocatorRegistry.fast(locator, locatorType)
+        el = self.waits.find(self.getByType(fastType), fast, timeout)
+        if el is None:
+            self.log.error("getElement failed: %s (%s)", locator, locatorType, extra={"locator": locator})
+        return el
+
+    def getElementList(self, locator, locatorType="id", timeout=0):
+        locator, locatorType = LocatorRegistry.fast(locator, locatorType)
+        byType = self.getByType(locatorType)
+        return self.waits.find_all(byType, locator, timeout)
+
+    # ---------- Locator groups ----------
+    def resolve_group(self, group: LocatorGroup, timeout=0):
+        """
+        The first matching member of group (usual winner tried first), found with one
+        in-page query per attempt; waits up to timeout for any member to appear.
+        Returns the winning locator string, or None.
+        """
+        ordered = group.ordered()
+        by = (group.locatorType or "").lower()
+
+        def winner(driver):
+            index = driver.execute_script(_RESOLVE_GROUP_JS, ordered, by)
+            return ordered[index] if index is not None and index >= 0 else None
 
-    def getElementList(self, locator, locatorType="id"):
         try:
-            byType = self.getByType(locatorType)
-            return self.driver.find_elements(byType, locator)
-        except Exception:
-            return []
+            spec = JsCondition.any_of(*[JsCondition.present(loc, by) for loc in ordered])
+            locator = self.waits.until(winner, timeout, f"group {group.name}", spec=spec)
+        except (TimeoutException, WebDriverException):
+            self.log.info("No member of %s matched", group.name, extra={"locator": group.name})
+            return None
+        group.record(locator)
+        self.log.debug("Group %s resolved to %s", group.name, locator, extra={"locator": locator})
+        return locator
 
     # ---------- Waits ----------
+    # All waits go through the driver's WaitEngine: implicit wait is 0 and
+    # nested waits share one deadline, so they never stack.
     def wait_clickable(self, locator, locatorType="id", timeout=None):
+        locator, locatorType = LocatorRegistry.fast(locator, locatorType)
         byType = self.getByType(locatorType)
-        wait = WebDriverWait(self.driver, timeout or self._wait_s,
-                             poll_frequency=0.5,
-                             ignored_exceptions=[NoSuchElementException,
-                                                 ElementNotVisibleException,
-                                                 ElementNotSelectableException])
-        return wait.until(EC.element_to_be_clickable((byType, locator)))
+        return self.waits.until(EC.element_to_be_clickable((byType, locator)),
+                                timeout or self._wait_s, f"clickable {locator}",
+                                spec=JsCondition.clickable(locator, locatorType))
 
     def wait_visible(self, locator, locatorType="id", timeout=None):
+        locator, locatorType = LocatorRegistry.fast(locator, locatorType)
         byType = self.getByType(locatorType)
-        wait = WebDriverWait(self.driver, timeout or self._wait_s)
-        return wait.until(EC.visibility_of_element_located((byType, locator)))
+        return self.waits.until(EC.visibility_of_element_located((byType, locator)),
+                                timeout or self._wait_s, f"visible {locator}",
+                                spec=JsCondition.visible(locator, locatorType))
 
     def wait_present(self, locator, locatorType="id", timeout=None):
+        locator, locatorType = LocatorRegistry.fast(locator, locatorType)
         byType = self.getByType(locatorType)
-        wait = WebDriverWait(self.driver, timeout or self._wait_s)
-        return wait.until(EC.presence_of_element_located((byType, locator)))
+        return self.waits.until(EC.presence_of_element_located((byType, locator)),
+                                timeout or self._wait_s, f"present {locator}",
+                                spec=JsCondition.present(locator, locatorType))
 
     def wait_url_contains(self, fragment: str, timeout=None):
-        wait = WebDriverWait(self.driver, timeout or self._wait_s)
-        return wait.until(EC.url_contains(fragment))
+        return self.waits.until(JsCondition.url_contains(fragment), timeout or self._wait_s,
+                                f"url contains {fragment}")
+
+    # ---------- Condition-driven navigation ----------
+    def as_condition(self, condition, combine="any"):
+        """
+        Normalise a wait condition:
+          None                     -> document.readyState == 'complete'
+          (locator, locatorType)   -> element visible
+          [cond, cond, ...]        -> any of them (all of them with combine="all")
+          JsCondition              -> waited for in-page, event driven
+          callable(driver)         -> polled (e.g. expected_conditions)
+        A list made only of JsConditions stays one JsCondition, so the whole
+        composite is still resolved by a single in-page wait.
+        """
+        if condition is None:
+            return JsCondition.ready()
+        if isinstance(condition, tuple):
+            locator, locatorType = condition
+            return JsCondition.visible(locator, locatorType)
+        if isinstance(condition, list):
+            conds = [self.as_condition(c) for c in condition]
+            if all(isinstance(c, JsCondition) for c in conds):
+                return JsCondition.any_of(*conds) if combine == "any" else JsCondition.all_of(*conds)
+            return EC.any_of(*conds) if combine == "any" else EC.all_of(*conds)
+        return condition
+
+    def wait_until(self, condition=None, timeout=None, what="", combine="any"):
+        """Wait until condition holds or the deadline passes. Returns True/False, never sleeps blindly."""
+        deadline_s = timeout or self._wait_s
+        t0 = time.monotonic()
+        try:
+            self.waits.until(self.as_condition(condition, combine), deadline_s)
+            self.log.debug("Ready after %.2f s: %s", time.monotonic() - t0, what)
+            return True
+        except TimeoutException:
+            self.log.info("Not ready within %.1f s: %s", deadline_s, what)
+            return False
+
+    def navigate_and_wait(self, url, ready_condition=None, timeout=None):
+        """Open url and return as soon as ready_condition holds (up to timeout)."""
+        self.driver.get(url)
+        ready = self.wait_until(ready_condition, timeout, f"navigate {url}")
+        snapshots = HtmlSnapshots.shared()
+        if snapshots is not None:
+            snapshots.capture(self.driver)
+        return ready
+
+    def click_and_wait(self, locator="", locatorType="id", postcondition=None, timeout=None, element=None):
+        """Click and return as soon as postcondition holds (up to timeout)."""
+        self.elementClick(locator, locatorType, element)
+        return self.wait_until(postcondition, timeout, f"click {locator}")
 
     # ---------- Actions ----------
     def elementClick(self, locator="", locatorType="id", element=None):
         try:
             el = element or self.wait_clickable(locator, locatorType)
             el.click()
+            self.log.debug("Clicked %s", locator or "element", extra={"locator": locator or None})
         except Exception as e:
-            self.log.error("Click failed on %s (%s)", locator, locatorType)
+            self.log.error("Click failed on %s (%s)", locator, locatorType, extra={"locator": locator})
             self.screenShot("click_failed")
             raise
 
@@ -94,8 +286,9 @@ class SeleniumDriver:
             if clear_first:
                 el.clear()
             el.send_keys(data)
+            self.log.debug("Typed into %s", locator or "element", extra={"locator": locator or None})
         except Exception:
-            self.log.error("sendKeys failed on %s (%s)", locator, locatorType)
+            self.log.error("sendKeys failed on %s (%s)", locator, locatorType, extra={"locator": locator})
             self.screenShot("sendkeys_failed")
             raise
 
@@ -104,20 +297,52 @@ class SeleniumDriver:
         txt = (el.text or el.get_attribute("innerText") or "").strip()
         return txt
 
-    def isElementPresent(self, locator="", locatorType="id", element=None):
-        try:
-            el = element or self.getElement(locator, locatorType)
-            return el is not None
-        except Exception:
-            return False
+    # ---------- Probes ----------
+    # Presence/absence checks default to a zero budget: one round trip, no waiting.
+    def isElementPresent(self, locator="", locatorType="id", element=None, timeout=0):
+        """Probe: answers at once unless a timeout is given. After a navigation, wait first."""
+        if element is not None:
+            return True
+        locator, locatorType = LocatorRegistry.fast(locator, locatorType)
+        return self.waits.find(self.getByType(locatorType), locator, timeout) is not None
+
+    def isElementAbsent(self, locator="", locatorType="id", timeout=0):
+        locator, locatorType = LocatorRegistry.fast(locator, locatorType)
+        return self.waits.absent(self.getByType(locatorType), locator, timeout)
 
-    def isElementDisplayed(self, locator="", locatorType="id", element=None):
+    def isElementDisplayed(self, locator="", locatorType="id", element=None, timeout=0):
+        """Probe, like isElementPresent."""
+        locator, locatorType = LocatorRegistry.fast(locator, locatorType)
         try:
-            el = element or self.getElement(locator, locatorType)
+            el = element or self.waits.find(self.getByType(locatorType), locator, timeout)
             return el.is_displayed() if el else False
         except Exception:
             return False
 
+    # ---------- Snapshots ----------
+    def snapshot(self, locators, locatorType="xpath"):
+        """
+        State of many locators in one execute_script round trip.
+        locators: iterable of locator strings (all of locatorType) or (locator, locatorType) tuples.
+        Returns {locator: {present, count, visible, text, value, validationMessage, enabled, selected}};
+        when a locator matches several elements the first visible one is described.
+        """
+        pairs = [loc if isinstance(loc, tuple) else (loc, locatorType) for loc in locators]
+        try:
+            states = self.driver.execute_script(
+                _SNAPSHOT_JS, [[fast, (ft or "").lower()] for fast, ft in
+                               (LocatorRegistry.fast(loc, lt) for loc, lt in pairs)])
+        except Exception as e:
+            self.log.error("snapshot failed: %s", e)
+            states = [None] * len(pairs)
+        return {loc: (dict(st, present=True) if st else dict(_MISSING))
+                for (loc, _), st in zip(pairs, states)}
+
+    def first_visible(self, locators, locatorType="xpath"):
+        """First locator (in the given order) whose element is visible, else None."""
+        snap = self.snapshot(locators, locatorType)
+        return next((loc for loc, st in snap.items() if st["visible"]), None)
+
     def webScroll(self, direction="up", amount=1000):
         y = -abs(amount) if direction == "up" else abs(amount)
         self.driver.execute_script(f"window.scrollBy(0, {y});")
@@ -0,0 +1,313 @@
+# base/wait_engine.py
+import os
+import threading
+import time
+from contextlib import contextmanager
+from base.locator_registry import LocatorRegistry
+from selenium.common.exceptions import (NoSuchElementException, StaleElementReferenceException,
+                                        TimeoutException, WebDriverException)
+
+# Budget a plain getElement() may spend looking for an element (the old implicit wait)
+DEFAULT_FIND_BUDGET_S = 10
+# Upper bound for a single in-page event wait; longer budgets are split into several
+SCRIPT_TIMEOUT_S = 120
+
+# In-page locator helpers shared by every script that resolves locators in bulk
+FIND_JS = """
+function findAll(loc, by) {
+  if (by === 'xpath') {
+    var res = document.evaluate(loc, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var out = [];
+    for (var i = 0; i < res.snapshotLength; i++) out.push(res.snapshotItem(i));
+    return out;
+  }
+  if (by === 'id') { var el = document.getElementById(loc); return el ? [el] : []; }
+  if (by === 'name') return Array.prototype.slice.call(document.getElementsByName(loc));
+  if (by === 'class') return Array.prototype.slice.call(document.getElementsByClassName(loc));
+  if (by === 'link') return Array.prototype.filter.call(document.links,
+      function (a) { return (a.innerText || '').trim() === loc; });
+  return Array.prototype.slice.call(document.querySelectorAll(loc));
+}
+function find(loc, by) {
+  if (by === 'xpath') return document.evaluate(loc, document, null,
+      XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  return findAll(loc, by)[0] || null;
+}
+function isVisible(el) {
+  if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) return false;
+  var style = window.getComputedStyle(el);
+  return style.visibility !== 'hidden' && style.display !== 'none';
+}
+"""
+
+# Evaluates a condition spec (see JsCondition) against the live document
+_CHECK_FN_JS = FIND_JS + """
+function check(c) {
+  var i, els;
+  if (c.op === 'any') { for (i = 0; i < c.conds.length; i++) if (check(c.conds[i])) return true; return false; }
+  if (c.op === 'all') { for (i = 0; i < c.conds.length; i++) if (!check(c.conds[i])) return false; return true; }
+  switch (c.type) {
+    case 'ready': return document.readyState === 'complete';
+    case 'present': return !!find(c.locator, c.by);
+    case 'absent': return !find(c.locator, c.by);
+    case 'visible': return findAll(c.locator, c.by).some(isVisible);
+    case 'clickable':
+      return findAll(c.locator, c.by).some(function (el) { return isVisible(el) && !el.disabled; });
+    case 'text':
+      return findAll(c.locator, c.by).some(function (el) {
+        return (el.innerText || el.textContent || '').indexOf(c.value) !== -1; });
+    case 'url_contains': return window.location.href.indexOf(c.value) !== -1;
+    case 'url_changes': return window.location.href !== c.value;
+    case 'script': return !!(new Function('return (' + c.value + ');'))();
+  }
+  return false;
+}
+"""
+
+_CHECK_JS = _CHECK_FN_JS + """
+try { return check(arguments[0]); } catch (e) { return false; }
+"""
+
+# Resolves the moment the condition holds: re-checks on every DOM mutation and on
+# history/load events, with a slow tick for changes that emit no mutation
+# (pushState URL changes, CSS-only visibility). Resolves false when the budget ends.
+_WAIT_JS = _CHECK_FN_JS + """
+var spec = arguments[0], budgetMs = arguments[1], done = arguments[arguments.length - 1];
+var finished = false, observer = null, timer = null, ticker = null;
+var events = ['popstate', 'hashchange', 'load', 'transitionend', 'animationend'];
+function finish(ok) {
+  if (finished) return;
+  finished = true;
+  if (observer) observer.disconnect();
+  clearTimeout(timer);
+  clearInterval(ticker);
+  events.forEach(function (name) { window.removeEventListener(name, test, true); });
+  done(ok);
+}
+function test() {
+  var ok = false;
+  try { ok = check(spec); } catch (e) {}
+  if (ok) finish(true);
+}
+test();
+if (!finished) {
+  observer = new MutationObserver(test);
+  observer.observe(document.documentElement || document,
+                   {childList: true, subtree: true, attributes: true, characterData: true});
+  events.forEach(function (name) { window.addEventListener(name, test, true); });
+  ticker = setInterval(test, 250);
+  timer = setTimeout(function () { finish(false); }, budgetMs);
+}
+"""
+
+
+class JsCondition:
+    """
+    A wait condition that can be evaluated inside the page, so the engine can wait
+    for it with a MutationObserver instead of polling over the wire.
+    Instances are also plain callables(driver) -> bool, usable anywhere an
+    expected_conditions callable is.
+    """
+
+    def __init__(self, spec: dict, label: str = ""):
+        self.spec = spec
+        self.label = label or spec.get("type") or spec.get("op", "")
+
+    def __call__(self, driver):
+        return bool(driver.execute_script(_CHECK_JS, self.spec))
+
+    def __repr__(self):
+        return f"JsCondition({self.label})"
+
+    @classmethod
+    def _locator(cls, kind, locator, by="xpath", value=None):
+        fast, fast_by = LocatorRegistry.fast(locator, by)
+        spec = {"type": kind, "locator": fast, "by": (fast_by or "").lower()}
+        if value is not None:
+            spec["value"] = value
+        return cls(spec, f"{kind} {locator}")
+
+    @classmethod
+    def ready(cls):
+        return cls({"type": "ready"}, "document ready")
+
+    @classmethod
+    def present(cls, locator, by="xpath"):
+        return cls._locator("present", locator, by)
+
+    @classmethod
+    def absent(cls, locator, by="xpath"):
+        return cls._locator("absent", locator, by)
+
+    @classmethod
+    def visible(cls, locator, by="xpath"):
+        return cls._locator("visible", locator, by)
+
+    @classmethod
+    def clickable(cls, locator, by="xpath"):
+        return cls._locator("clickable", locator, by)
+
+    @classmethod
+    def text(cls, locator, text, by="xpath"):
+        return cls._locator("text", locator, by, text)
+
+    @classmethod
+    def url_contains(cls, fragment):
+        return cls({"type": "url_contains", "value": fragment}, f"url contains {fragment}")
+
+    @classmethod
+    def url_changes(cls, url):
+        return cls({"type": "url_changes", "value": url}, f"url changes from {url}")
+
+    @classmethod
+    def script(cls, expression):
+        """Any JS boolean expression, e.g. "!!document.querySelector('form :invalid')"."""
+        return cls({"type": "script", "value": expression}, expression)
+
+    @classmethod
+    def any_of(cls, *conds):
+        return cls({"op": "any", "conds": [c.spec for c in conds]},
+                   " | ".join(c.label for c in conds))
+
+    @classmethod
+    def all_of(cls, *conds):
+        return cls({"op": "all", "conds": [c.spec for c in conds]},
+                   " & ".join(c.label for c in conds))
+
+
+class Deadline:
+    """Absolute point on the monotonic clock; budgets are clamped against it."""
+
+    def __init__(self, seconds):
+        self.expires = time.monotonic() + max(0.0, seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires
+
+
+class WaitEngine:
+    """
+    The one place that waits for a given driver.
+    - Pins the driver's implicit wait to 0 so find_element never blocks on its own.
+    - Every lookup/wait takes an explicit budget (0 = probe, return immediately).
+    - Budgets nest: inside `with engine.deadline(s):` no wait can outlive the outer deadline,
+      so implicit and explicit waits can no longer stack.
+    - JsCondition waits are event driven (in-page MutationObserver); anything else, or a
+      page that navigates mid-wait, falls back to polling with adaptive backoff.
+      Set WAIT_EVENTS=0 to always poll.
+    """
+    IGNORED = (NoSuchElementException, StaleElementReferenceException)
+
+    def __init__(self, driver, find_budget=DEFAULT_FIND_BUDGET_S, poll_min=0.02, poll_max=0.5,
+                 events=None):
+        self.driver = driver
+        self.find_budget = find_budget
+        self.poll_min = poll_min
+        self.poll_max = poll_max
+        self.events = os.getenv("WAIT_EVENTS", "1") != "0" if events is None else events
+        self._local = threading.local()
+        driver.implicitly_wait(0)
+        if self.events:
+            try:
+                driver.set_script_timeout(SCRIPT_TIMEOUT_S + 5)
+            except Exception:
+                self.events = False
+
+    @classmethod
+    def for_driver(cls, driver):
+        """One engine per driver, shared by every page object using it."""
+        engine = getattr(driver, "_wait_engine", None)
+        if engine is None:
+            engine = cls(driver)
+            try:
+                driver._wait_engine = engine
+            except AttributeError:
+                pass
+        return engine
+
+    # ---------- Deadlines ----------
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def budget(self, seconds) -> float:
+        """Clamp a requested budget to every enclosing deadline."""
+        budget = self.find_budget if seconds is None else seconds
+        for outer in self._stack():
+            budget = min(budget, outer.remaining())
+        return max(0.0, budget)
+
+    @contextmanager
+    def deadline(self, seconds):
+        dl = Deadline(self.budget(seconds))
+        self._stack().append(dl)
+        try:
+            yield dl
+        finally:
+            self._stack().pop()
+
+    # ---------- Waiting ----------
+    def until(self, condition, timeout=None, message="", spec=None):
+        """
+        Wait until condition(driver) returns something truthy or the budget runs out.
+        When condition is a JsCondition (or a JsCondition `spec` describing it is given)
+        the wait happens in-page and resolves on the first DOM change that satisfies it;
+        condition is then evaluated once more to produce the return value.
+        Otherwise it is polled, starting fast and backing off to poll_max.
+        Raises TimeoutException like WebDriverWait.until.
+        """
+        dl = Deadline(self.budget(timeout))
+        if spec is None and isinstance(condition, JsCondition):
+            spec = condition
+        if spec is not None and self.events:
+            self._wait_event(spec, dl)
+
+        delay = self.poll_min
+        while True:
+            try:
+                value = condition(self.driver)
+                if value:
+                    return value
+            except self.IGNORED:
+                pass
+            if dl.expired():
+                raise TimeoutException(message)
+            time.sleep(min(delay, dl.remaining()))
+            delay = min(delay * 1.5, self.poll_max)
+
+    def _wait_event(self, cond: JsCondition, dl: Deadline) -> bool:
+        """In-page wait for cond; False on timeout or when the page went away mid-wait."""
+        # A navigation tears the document (and the observer) down: re-arm on the new
+        # page a couple of times, then leave the rest of the budget to backoff polling
+        for _ in range(3):
+            if dl.expired():
+                return False
+            budget_ms = int(min(dl.remaining(), SCRIPT_TIMEOUT_S) * 1000)
+            try:
+                return bool(self.driver.execute_async_script(_WAIT_JS, cond.spec, budget_ms))
+            except WebDriverException:
+                time.sleep(min(self.poll_min * 5, dl.remaining()))
+        return False
+
+    # ---------- Probes ----------
+    def find_all(self, by, locator, budget=0):
+        """All matches; with budget=0 this is a single round trip."""
+        try:
+            return self.until(lambda d: d.find_elements(by, locator), budget)
+        except (TimeoutException, WebDriverException):
+            return []
+
+    def find(self, by, locator, budget=0):
+        found = self.find_all(by, locator, budget)
+        return found[0] if found else None
+
+    def absent(self, by, locator, budget=0) -> bool:
+        """True as soon as nothing matches (waits up to budget for it to go away)."""
+        try:
+            return self.until(lambda d: not d.find_elements(by, locator), budget)
+        except (TimeoutException, WebDriverException):
+            return False
@@ -81,7 +81,8 @@ class WebDriverFactory:
         else:
             raise ValueError(f"Unsupported browser: {self.browser}")
 
-        driver.implicitly_wait(10)
+        # No implicit wait: SeleniumDriver's WaitEngine gives every lookup an explicit budget
+        driver.implicitly_wait(0)
         try:
             driver.maximize_window()
         except Exception:
@@ -6,12 +6,12 @@ With enhanced validation and email verification support
 
 import logging
 from base.basepage import BasePage
+from base.selenium_driver import LocatorGroup
 from utilities.util import Util
 import utilities.custom_logger as cl
+import os
 import time
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from base.wait_engine import JsCondition
 
 
 class LoginPage(BasePage):
@@ -36,6 +36,7 @@ class LoginPage(BasePage):
     _confirm_password_field = "//input[@id='confirmPassword']"
     _terms_checkbox = "//input[@id='agreeToTerms']"
     _create_account_button = "//button[@type='submit' and contains(., 'Create account')]"
+    _signup_form = "//form[.//input[@id='firstName']]"
 
     # Alternative locators using name attributes as backup
     _first_name_field_alt = "//input[@name='firstName']"
@@ -45,6 +46,15 @@ class LoginPage(BasePage):
     _confirm_password_field_alt = "//input[@name='confirmPassword']"
     _terms_checkbox_alt = "//input[@name='agreeToTerms']"
 
+    # Primary + backup locator per field, raced in one in-page query
+    _first_name_group = LocatorGroup("signup.first_name", _first_name_field, _first_name_field_alt)
+    _last_name_group = LocatorGroup("signup.last_name", _last_name_field, _last_name_field_alt)
+    _email_group = LocatorGroup("signup.email", _email_field, _email_field_alt)
+    _password_group = LocatorGroup("signup.password", _password_field, _password_field_alt)
+    _confirm_password_group = LocatorGroup("signup.confirm_password",
+                                           _confirm_password_field, _confirm_password_field_alt)
+    _terms_group = LocatorGroup("signup.terms", _terms_checkbox, _terms_checkbox_alt)
+
     # Password visibility toggles
     _password_toggle = "//input[@id='password']//following-sibling::button"
     _confirm_password_toggle = "//input[@id='confirmPassword']//following-sibling::button"
@@ -70,146 +80,123 @@ class LoginPage(BasePage):
         try:
             current_url = self.driver.current_url
             if "auth/signup" not in current_url:
-                signup_url = "https://dev-verbatimly.onrender.com/auth/signup"
-                self.driver.get(signup_url)
-                self.util.sleep(2)
+                signup_url = f"{os.getenv('BASE_URL', 'https://dev-verbatimly.onrender.com')}/auth/signup"
+                self.navigate_and_wait(signup_url, [(self._first_name_field, "xpath"),
+                                                    (self._first_name_field_alt, "xpath")])
 
             # Verify we're on the signup page
             return self.isElementPresent(self._page_title_heading, "xpath") or \
                    self.isElementPresent(self._first_name_field, "xpath")
         except Exception as e:
-            self.log.error(f"Error navigating to signup page: {str(e)}")
+            self.log.error("Error navigating to signup page: %s", e)
             return False
 
     def click_back_to_home(self):
         """Click back to home button"""
         try:
-            self.elementClick(self._back_to_home_button, "xpath")
-            self.util.sleep(2)
+            url_before = self.driver.current_url
+            self.click_and_wait(self._back_to_home_button, "xpath", JsCondition.url_changes(url_before))
             return True
         except Exception as e:
-            self.log.error(f"Error clicking back to home: {str(e)}")
+            self.log.error("Error clicking back to home: %s", e)
             return False
 
     # Enhanced form interaction methods
     def enter_first_name(self, first_name):
         """Enter first name with enhanced error handling"""
         try:
-            # Clear field first
-            self.clear_field(self._first_name_field)
-
-            if self.isElementPresent(self._first_name_field, "xpath"):
-                self.sendKeys(first_name, self._first_name_field, "xpath")
-            else:
-                self.sendKeys(first_name, self._first_name_field_alt, "xpath")
-            self.log.info(f"Entered first name: {first_name}")
+            if not self._fill_field(self._first_name_group, first_name):
+                self.log.error("First name field not found")
+                return False
+            self.log.info("Entered first name: %s", first_name)
             return True
         except Exception as e:
-            self.log.error(f"Error entering first name: {str(e)}")
+            self.log.error("Error entering first name: %s", e)
             return False
 
     def enter_last_name(self, last_name):
         """Enter last name with enhanced error handling"""
         try:
-            # Clear field first
-            self.clear_field(self._last_name_field)
-
-            if self.isElementPresent(self._last_name_field, "xpath"):
-                self.sendKeys(last_name, self._last_name_field, "xpath")
-            else:
-                self.sendKeys(last_name, self._last_name_field_alt, "xpath")
-            self.log.info(f"Entered last name: {last_name}")
+            if not self._fill_field(self._last_name_group, last_name):
+                self.log.error("Last name field not found")
+                return False
+            self.log.info("Entered last name: %s", last_name)
             return True
         except Exception as e:
-            self.log.error(f"Error entering last name: {str(e)}")
+            self.log.error("Error entering last name: %s", e)
             return False
 
     def enter_email(self, email):
         """Enter email address with enhanced error handling"""
         try:
-            # Clear field first
-            self.clear_field(self._email_field)
-
-            if self.isElementPresent(self._email_field, "xpath"):
-                self.sendKeys(email, self._email_field, "xpath")
-            else:
-                self.sendKeys(email, self._email_field_alt, "xpath")
-            self.log.info(f"Entered email: {email}")
+            if not self._fill_field(self._email_group, email):
+                self.log.error("Email field not found")
+                return False
+            self.log.info("Entered email: %s", email)
             return True
         except Exception as e:
-            self.log.error(f"Error entering email: {str(e)}")
+            self.log.error("Error entering email: %s", e)
             return False
 
     def enter_password(self, password):
         """Enter password with enhanced error handling"""
         try:
-            # Clear field first
-            self.clear_field(self._password_field)
-
-            if self.isElementPresent(self._password_field, "xpath"):
-                self.sendKeys(password, self._password_field, "xpath")
-            else:
-                self.sendKeys(password, self._password_field_alt, "xpath")
+            if not self._fill_field(self._password_group, password):
+                self.log.error("Password field not found")
+                return False
             self.log.info("Entered password")
             return True
         except Exception as e:
-            self.log.error(f"Error entering password: {str(e)}")
+            self.log.error("Error entering password: %s", e)
             return False
 
     def enter_confirm_password(self, password):
         """Enter confirm password with enhanced error handling"""
         try:
-            # Clear field first
-            self.clear_field(self._confirm_password_field)
-
-            if self.isElementPresent(self._confirm_password_field, "xpath"):
-                self.sendKeys(password, self._confirm_password_field, "xpath")
-            else:
-                self.sendKeys(password, self._confirm_password_field_alt, "xpath")
+            if not self._fill_field(self._confirm_password_group, password):
+                self.log.error("Confirm password field not found")
+                return False
             self.log.info("Entered confirm password")
             return True
         except Exception as e:
-            self.log.error(f"Error entering confirm password: {str(e)}")
+            self.log.error("Error entering confirm password: %s", e)
             return False
 
     def accept_terms_and_conditions(self):
         """Click the terms and conditions checkbox with enhanced handling"""
         try:
             # Check if checkbox is already checked
-            checkbox_element = None
-            if self.isElementPresent(self._terms_checkbox, "xpath"):
-                checkbox_element = self.getElement(self._terms_checkbox, "xpath")
-            else:
-                checkbox_element = self.getElement(self._terms_checkbox_alt, "xpath")
+            locator = self.resolve_group(self._terms_group)
+            if locator is None:
+                self.log.error("Terms checkbox not found")
+                return False
+            checkbox_element = self.getElement(locator, "xpath")
 
             if checkbox_element and not checkbox_element.is_selected():
-                if self.isElementPresent(self._terms_checkbox, "xpath"):
-                    self.elementClick(self._terms_checkbox, "xpath")
-                else:
-                    self.elementClick(self._terms_checkbox_alt, "xpath")
+                self.elementClick(locator, "xpath")
                 self.log.info("Accepted terms and conditions")
             else:
                 self.log.info("Terms checkbox already checked")
 
             return True
         except Exception as e:
-            self.log.error(f"Error accepting terms: {str(e)}")
+            self.log.error("Error accepting terms: %s", e)
             return False
 
     def click_create_account(self):
         """Click the Create Account button with enhanced handling"""
         try:
             # Wait for button to be clickable
-            WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, self._create_account_button))
-            )
+            self.wait_clickable(self._create_account_button, "xpath", timeout=10)
 
-            self.elementClick(self._create_account_button, "xpath")
+            # Wait for form submission to settle rather than a fixed pause
+            url_before = self.driver.current_url
+            self.click_and_wait(self._create_account_button, "xpath",
+                                self._submission_settled(url_before), timeout=10)
             self.log.info("Clicked Create Account button")
-            self.util.sleep(3)  # Wait for form submission
             return True
         except Exception as e:
-            self.log.error(f"Error clicking create account: {str(e)}")
+            self.log.error("Error clicking create account: %s", e)
             return False
 
     def click_google_signup(self):
@@ -219,7 +206,7 @@ class LoginPage(BasePage):
             self.log.info("Clicked Google signup")
             return True
         except Exception as e:
-            self.log.error(f"Error clicking Google signup: {str(e)}")
+            self.log.error("Error clicking Google signup: %s", e)
             return False
 
     # Enhanced complete registration flow
@@ -229,7 +216,7 @@ class LoginPage(BasePage):
             if confirm_password is None:
                 confirm_password = password
 
-            self.log.info(f"Starting registration for: {email}")
+            self.log.info("Starting registration for: %s", email)
 
             # Navigate to signup page if not already there
             if not self.navigate_to_signup_page():
@@ -237,43 +224,43 @@ class LoginPage(BasePage):
                 return False
 
             # Wait for page to load completely
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, self._first_name_field))
-            )
-
-            # Fill out the form step by step
-            steps = [
-                ("First Name", lambda: self.enter_first_name(first_name)),
-                ("Last Name", lambda: self.enter_last_name(last_name)),
-                ("Email", lambda: self.enter_email(email)),
-                ("Password", lambda: self.enter_password(password)),
-                ("Confirm Password", lambda: self.enter_confirm_password(confirm_password)),
-                ("Terms", lambda: self.accept_terms_and_conditions()),
-                ("Submit", lambda: self.click_create_account())
-            ]
+            self.wait_present(self._first_name_field, "xpath", timeout=10)
+
+            # Fill out the whole form in one round trip; each field races its locators in-page
+            missing = self.fill_form({
+                self._first_name_group: first_name,
+                self._last_name_group: last_name,
+                self._email_group: email,
+                self._password_group: password,
+                self._confirm_password_group: confirm_password,
+                self._terms_group: True,
+            })
+            if missing:
+                self.log.error("Failed to fill fields: %s", missing)
+                return False
 
-            for step_name, step_function in steps:
-                if not step_function():
-                    self.log.error(f"Failed at step: {step_name}")
-                    return False
-                time.sleep(0.5)  # Small delay between steps
+            if not self.click_create_account():
+                self.log.error("Failed at step: Submit")
+                return False
 
             self.log.info("Registration form completed successfully")
             return True
 
         except Exception as e:
-            self.log.error(f"Error completing registration: {str(e)}")
+            self.log.error("Error completing registration: %s", e)
             return False
 
     # Enhanced verification methods
     def verify_signup_page_loaded(self):
         """Verify that the signup page has loaded correctly"""
         try:
-            # Multiple indicators of successful page load
+            # Multiple indicators of successful page load, read in one snapshot
+            snap = self.snapshot([self._page_title_heading, self._first_name_field,
+                                  self._first_name_field_alt, self._create_account_button])
             indicators = [
-                self.isElementPresent(self._page_title_heading, "xpath"),
-                self.isElementPresent(self._first_name_field, "xpath") or self.isElementPresent(self._first_name_field_alt, "xpath"),
-                self.isElementPresent(self._create_account_button, "xpath"),
+                snap[self._page_title_heading]["present"],
+                snap[self._first_name_field]["present"] or snap[self._first_name_field_alt]["present"],
+                snap[self._create_account_button]["present"],
                 "signup" in self.driver.current_url.lower()
             ]
 
@@ -284,7 +271,7 @@ class LoginPage(BasePage):
                 self.log.error("Signup page not loaded properly")
                 return False
         except Exception as e:
-            self.log.error(f"Error verifying signup page: {str(e)}")
+            self.log.error("Error verifying signup page: %s", e)
             return False
 
     def verify_check_your_email_message(self):
@@ -302,12 +289,9 @@ class LoginPage(BasePage):
                 "//*[contains(text(), 'verification email')]"
             ]
 
-            for selector in success_selectors:
-                if self.isElementPresent(selector, "xpath"):
-                    element = self.getElement(selector, "xpath")
-                    if element and element.is_displayed():
-                        self.log.info("✅ 'Check your email' message found - Registration successful")
-                        return True
+            if self.first_visible(success_selectors):
+                self.log.info("✅ 'Check your email' message found - Registration successful")
+                return True
 
             # Also check URL for verification indicators
             current_url = self.driver.current_url.lower()
@@ -321,7 +305,7 @@ class LoginPage(BasePage):
             return False
 
         except Exception as e:
-            self.log.error(f"Error verifying email message: {str(e)}")
+            self.log.error("Error verifying email message: %s", e)
             return False
 
     def verify_registration_successful(self):
@@ -340,31 +324,34 @@ class LoginPage(BasePage):
                 "//p[contains(text(), 'inbox')]"
             ]
 
-            for indicator in verification_indicators:
-                if self.isElementPresent(indicator, "xpath"):
-                    self.log.info("Registration successful - verification page elements found")
-                    return True
+            snap = self.snapshot(verification_indicators)
+            if any(state["present"] for state in snap.values()):
+                self.log.info("Registration successful - verification page elements found")
+                return True
 
             return False
 
         except Exception as e:
-            self.log.error(f"Error verifying registration success: {str(e)}")
+            self.log.error("Error verifying registration success: %s", e)
             return False
 
     def verify_registration_failed(self):
         """Verify registration failed (still on signup page or error shown)"""
         try:
+            snap = self.snapshot([self._create_account_button, self._error_message,
+                                  self._validation_error, self._field_error])
+
             # Check if still on signup page
             still_on_signup = (
-                self.isElementPresent(self._create_account_button, "xpath") or
+                snap[self._create_account_button]["present"] or
                 "signup" in self.driver.current_url.lower()
             )
 
             # Check for error messages
             error_present = (
-                self.isElementPresent(self._error_message, "xpath") or
-                self.isElementPresent(self._validation_error, "xpath") or
-                self.isElementPresent(self._field_error, "xpath")
+                snap[self._error_message]["present"] or
+                snap[self._validation_error]["present"] or
+                snap[self._field_error]["present"]
             )
 
             # Check for validation messages on fields
@@ -377,7 +364,7 @@ class LoginPage(BasePage):
             return False
 
         except Exception as e:
-            self.log.error(f"Error verifying registration failure: {str(e)}")
+            self.log.error("Error verifying registration failure: %s", e)
             return False
 
     def check_for_validation_messages(self):
@@ -392,23 +379,28 @@ class LoginPage(BasePage):
                 self._terms_checkbox
             ]
 
-            for field in fields_to_check:
-                try:
-                    element = self.getElement(field, "xpath")
-                    if element:
-                        validation_message = element.get_attribute("validationMessage")
-                        if validation_message:
-                            self.log.info(f"Validation message found: {validation_message}")
-                            return True
-                except:
-                    continue
+            for state in self.snapshot(fields_to_check).values():
+                if state["validationMessage"]:
+                    self.log.info("Validation message found: %s", state['validationMessage'])
+                    return True
 
             return False
 
         except Exception as e:
-            self.log.error(f"Error checking validation messages: {str(e)}")
+            self.log.error("Error checking validation messages: %s", e)
             return False
 
+    def _submission_settled(self, url_before):
+        """Submit is done once we navigated, HTML5 validation blocked it, or a message is shown"""
+        return [
+            JsCondition.url_changes(url_before),
+            JsCondition.script("!!document.querySelector('form :invalid')"),
+            (self._check_your_email_message, "xpath"),
+            (self._error_message, "xpath"),
+            (self._validation_error, "xpath"),
+            (self._field_error, "xpath"),
+        ]
+
     # Enhanced security testing methods
     def inject_sql_payload(self, field_name, payload):
         """Inject SQL payload into specified field with enhanced handling"""
@@ -420,7 +412,7 @@ class LoginPage(BasePage):
             }
 
             if field_name not in field_map:
-                self.log.error(f"Invalid field name: {field_name}")
+                self.log.error("Invalid field name: %s", field_name)
                 return False
 
             # Clear field first
@@ -428,11 +420,11 @@ class LoginPage(BasePage):
 
             # Inject payload
             self.sendKeys(payload, field_map[field_name], "xpath")
-            self.log.info(f"Injected SQL payload into {field_name}: {payload[:50]}...")
+            self.log.info("Injected SQL payload into %s: %s...", field_name, payload[:50])
             return True
 
         except Exception as e:
-            self.log.error(f"Error injecting SQL payload: {str(e)}")
+            self.log.error("Error injecting SQL payload: %s", e)
             return False
 
     def inject_xss_payload(self, field_name, payload):
@@ -445,7 +437,7 @@ class LoginPage(BasePage):
             }
 
             if field_name not in field_map:
-                self.log.error(f"Invalid field name: {field_name}")
+                self.log.error("Invalid field name: %s", field_name)
                 return False
 
             # Clear field first
@@ -453,24 +445,25 @@ class LoginPage(BasePage):
 
             # Inject payload
             self.sendKeys(payload, field_map[field_name], "xpath")
-            self.log.info(f"Injected XSS payload into {field_name}: {payload[:50]}...")
+            self.log.info("Injected XSS payload into %s: %s...", field_name, payload[:50])
             return True
 
         except Exception as e:
-            self.log.error(f"Error injecting XSS payload: {str(e)}")
+            self.log.error("Error injecting XSS payload: %s", e)
             return False
 
     # Enhanced utility methods
+    def _fill_field(self, group, value):
+        """Set one field in a single round trip, whichever of its locators matches"""
+        return not self.fill_form({group: value})
+
     def clear_field(self, field_locator):
         """Clear a specific field safely"""
         try:
-            element = self.getElement(field_locator, "xpath")
-            if element:
-                element.clear()
-                time.sleep(0.2)  # Small delay after clearing
+            self.fill_form({field_locator: ""})
             return True
         except Exception as e:
-            self.log.error(f"Error clearing field: {str(e)}")
+            self.log.error("Error clearing field: %s", e)
             return False
 
     def clear_all_fields(self):
@@ -498,50 +491,68 @@ class LoginPage(BasePage):
             self.log.info("Cleared all form fields")
             return True
         except Exception as e:
-            self.log.error(f"Error clearing fields: {str(e)}")
+            self.log.error("Error clearing fields: %s", e)
             return False
 
+    def reset_signup_form(self):
+        """
+        Ready the signup form for the next case without a reload: reset it in place,
+        or load the page again when it is gone (e.g. after a successful signup).
+        """
+        if "auth/signup" in (self.driver.current_url or "") and self.reset_form(self._signup_form):
+            self.log.info("Reset signup form in place")
+            return True
+        self.log.info("Signup form not on the page, loading it")
+        return self.navigate_to_signup_page()
+
+    def validate_emails(self, values):
+        """Browser verdict for every candidate email on the loaded signup page (see BasePage.check_validity)"""
+        return self._validate(self._email_group, values)
+
+    def validate_passwords(self, values):
+        """Browser verdict for every candidate password on the loaded signup page"""
+        return self._validate(self._password_group, values)
+
+    def _validate(self, group, values):
+        try:
+            return self.check_validity({group: values})[group]
+        except Exception as e:
+            self.log.error("Error checking %s values: %s", group.name, e)
+            return None
+
     def get_field_validation_message(self, field_locator):
         """Get validation message for a specific field"""
         try:
-            # Try HTML5 validation message first
-            element = self.getElement(field_locator, "xpath")
-            if element:
-                validation_message = element.get_attribute("validationMessage")
-                if validation_message:
-                    return validation_message
-
-            # Try to find custom error messages near the field
+            # Custom error messages near the field, read together with the field itself
             error_selectors = [
                 f"{field_locator}//following-sibling::div[contains(@class, 'error')]",
                 f"{field_locator}//following-sibling::span[contains(@class, 'error')]",
                 f"{field_locator}//parent::div//following-sibling::div[contains(@class, 'error')]",
                 f"{field_locator}//parent::label//following-sibling::div[contains(@class, 'error')]"
             ]
+            snap = self.snapshot([field_locator] + error_selectors)
+
+            # HTML5 validation message first
+            if snap[field_locator]["validationMessage"]:
+                return snap[field_locator]["validationMessage"]
 
             for selector in error_selectors:
-                try:
-                    error_element = self.getElement(selector, "xpath")
-                    if error_element and error_element.is_displayed():
-                        return error_element.text.strip()
-                except:
-                    continue
+                if snap[selector]["visible"]:
+                    return snap[selector]["text"]
 
             return None
 
         except Exception as e:
-            self.log.error(f"Error getting field validation message: {str(e)}")
+            self.log.error("Error getting field validation message: %s", e)
             return None
 
     def wait_for_page_load(self, timeout=10):
         """Wait for page to load completely"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
+            self.waits.until(JsCondition.ready(), timeout, "page load")
             return True
         except Exception as e:
-            self.log.error(f"Page load timeout: {str(e)}")
+            self.log.error("Page load timeout: %s", e)
             return False
 
     def get_current_page_title(self):
@@ -549,7 +560,7 @@ class LoginPage(BasePage):
         try:
             return self.getTitle()
         except Exception as e:
-            self.log.error(f"Error getting page title: {str(e)}")
+            self.log.error("Error getting page title: %s", e)
             return ""
 
     def get_current_url(self):
@@ -557,7 +568,7 @@ class LoginPage(BasePage):
         try:
             return self.driver.current_url
         except Exception as e:
-            self.log.error(f"Error getting current URL: {str(e)}")
+            self.log.error("Error getting current URL: %s", e)
             return ""
 
     def take_screenshot(self, filename=None):
@@ -567,10 +578,10 @@ class LoginPage(BasePage):
                 filename = f"screenshot_{int(time.time())}.png"
 
             self.driver.save_screenshot(filename)
-            self.log.info(f"Screenshot saved: {filename}")
+            self.log.info("Screenshot saved: %s", filename)
             return filename
         except Exception as e:
-            self.log.error(f"Error taking screenshot: {str(e)}")
+            self.log.error("Error taking screenshot: %s", e)
             return None
 
     def scroll_to_element(self, locator, locator_type="xpath"):
@@ -579,19 +590,18 @@ class LoginPage(BasePage):
             element = self.getElement(locator, locator_type)
             if element:
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                time.sleep(0.5)
                 return True
             return False
         except Exception as e:
-            self.log.error(f"Error scrolling to element: {str(e)}")
+            self.log.error("Error scrolling to element: %s", e)
             return False
 
     def refresh_page(self):
         """Refresh the current page"""
         try:
             self.driver.refresh()
-            self.util.sleep(3)
+            self.wait_until(None, 10, "refresh")
             return True
         except Exception as e:
-            self.log.error(f"Error refreshing page: {str(e)}")
+            self.log.error("Error refreshing page: %s", e)
             return False
\ No newline at end of file
@@ -5,13 +5,13 @@ Covers login, logout, password reset, and Google authentication
 
 import logging
 from base.basepage import BasePage
+from base.selenium_driver import LocatorGroup
 from utilities.util import Util
 import utilities.custom_logger as cl
 import time
 import os
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from base.wait_engine import JsCondition
 from selenium.webdriver.common.keys import Keys
 
 
@@ -68,6 +68,13 @@ class LoginPage2(BasePage):
     _profile_menu_button = "//button[.//*[contains(@class, 'profile')]] | //div[contains(@class, 'user-avatar')]"
     _sign_out_button = "//button[contains(text(), 'Sign out')] | //a[contains(text(), 'Sign out')] | //*[contains(text(), 'Logout')]"
 
+    # LOCATOR GROUPS (primary + self-healing fallbacks, raced in one in-page query)
+    _email_group = LocatorGroup("login.email", _email_input, _email_input_alt)
+    _password_group = LocatorGroup("login.password", _password_input, _password_input_alt)
+    _forgot_password_group = LocatorGroup("login.forgot_password", _forgot_password_link, _forgot_password_text)
+    _user_menu_group = LocatorGroup("login.user_menu", _user_profile_button, _user_dropdown_button,
+                                    _user_initials_button)
+
     # VALIDATION MESSAGES
     _error_message = "//div[contains(@class, 'error')] | //span[contains(@class, 'error')] | //*[contains(@class, 'alert')]"
     _validation_message = "//div[contains(@class, 'validation')] | //span[contains(@class, 'invalid')]"
@@ -81,12 +88,12 @@ class LoginPage2(BasePage):
         """Navigate to the main application page"""
         try:
             main_url = os.getenv('BASE_URL', 'https://dev-verbatimly.onrender.com')
-            self.driver.get(main_url)
-            self.util.sleep(3)
-            self.log.info(f"Navigated to main page: {main_url}")
+            self.navigate_and_wait(main_url, [(self._sign_in_button, "xpath"),
+                                              (self._start_for_free_button, "xpath")], timeout=10)
+            self.log.info("Navigated to main page: %s", main_url)
             return True
         except Exception as e:
-            self.log.error(f"Error navigating to main page: {str(e)}")
+            self.log.error("Error navigating to main page: %s", e)
             return False
 
     def navigate_to_login_page(self):
@@ -98,19 +105,17 @@ class LoginPage2(BasePage):
 
             # Look for and click Sign In button
             if self.isElementPresent(self._sign_in_button, "xpath"):
-                self.elementClick(self._sign_in_button, "xpath")
-                self.util.sleep(2)
+                self.click_and_wait(self._sign_in_button, "xpath", self._login_form_ready())
                 self.log.info("Clicked Sign In button")
                 return True
             else:
                 # Try direct navigation to login URL
                 login_url = f"{os.getenv('BASE_URL', 'https://dev-verbatimly.onrender.com')}/auth/login"
-                self.driver.get(login_url)
-                self.util.sleep(2)
-                self.log.info(f"Direct navigation to login page: {login_url}")
+                self.navigate_and_wait(login_url, self._login_form_ready())
+                self.log.info("Direct navigation to login page: %s", login_url)
                 return True
         except Exception as e:
-            self.log.error(f"Error navigating to login page: {str(e)}")
+            self.log.error("Error navigating to login page: %s", e)
             return False
 
     def navigate_to_forgot_password_page(self):
@@ -119,24 +124,29 @@ class LoginPage2(BasePage):
             if not self.navigate_to_login_page():
                 return False
 
-            if self.isElementPresent(self._forgot_password_link, "xpath"):
-                self.elementClick(self._forgot_password_link, "xpath")
-                self.util.sleep(2)
-                self.log.info("Navigated to forgot password page using href")
-                return True
-            # Fallback using text
-            elif self.isElementPresent(self._forgot_password_text, "xpath"):
-                self.elementClick(self._forgot_password_text, "xpath")
-                self.util.sleep(2)
-                self.log.info("Navigated to forgot password page using text")
-                return True
-            else:
+            # href locator or link text, whichever matches first
+            locator = self.resolve_group(self._forgot_password_group)
+            if locator is None:
                 self.log.error("Forgot password link not found")
                 return False
+            self.click_and_wait(locator, "xpath", JsCondition.url_contains("forgot-password"))
+            self.log.info("Navigated to forgot password page using %s", locator)
+            return True
         except Exception as e:
-            self.log.error(f"Error navigating to forgot password page: {str(e)}")
+            self.log.error("Error navigating to forgot password page: %s", e)
             return False
 
+    # READY CONDITIONS
+    def _login_form_ready(self):
+        """Login form rendered (either email locator)"""
+        return [(self._email_input, "xpath"), (self._email_input_alt, "xpath")]
+
+    def _google_opened(self):
+        """Google button reacted: navigated away or opened a popup"""
+        url_before = self.driver.current_url
+        handles_before = self.driver.window_handles
+        return [JsCondition.url_changes(url_before), EC.new_window_is_opened(handles_before)]
+
     # ClearFIELD
     def clear_field_safely(self, locator, locator_type="xpath"):
         """Safely clear a field with multiple methods"""
@@ -147,68 +157,49 @@ class LoginPage2(BasePage):
                 element.click()
                 element.send_keys(Keys.CONTROL + "a")
                 element.send_keys(Keys.DELETE)
-                time.sleep(0.2)
 
                 # Method 2: Clear if still has content
                 if element.get_attribute('value'):
                     element.clear()
-                    time.sleep(0.2)
 
                 # Method 3: Backspace if still has content
                 current_value = element.get_attribute('value')
                 if current_value:
                     for _ in range(len(current_value)):
                         element.send_keys(Keys.BACKSPACE)
-                        time.sleep(0.1)
 
                 self.log.info("Field cleared successfully")
                 return True
         except Exception as e:
-            self.log.error(f"Error clearing field: {str(e)}")
+            self.log.error("Error clearing field: %s", e)
             return False
 
     def enter_email(self, email):
         """Enter email address with field clearing"""
         try:
-            # Primary locator
-            if self.isElementPresent(self._email_input, "xpath"):
-                self.clear_field_safely(self._email_input)
-                self.sendKeys(email, self._email_input, "xpath")
-                self.log.info(f"Entered email: {email}")
-                return True
-            # Fallback locator for self healing
-            elif self.isElementPresent(self._email_input_alt, "xpath"):
-                self.clear_field_safely(self._email_input_alt)
-                self.sendKeys(email, self._email_input_alt, "xpath")
-                self.log.info(f"Entered email: {email}")
+            # Primary and fallback locator (self healing) raced in one round trip
+            if not self.fill_form({self._email_group: email}):
+                self.log.info("Entered email: %s", email)
                 return True
             else:
                 self.log.error("Email input field not found")
                 return False
         except Exception as e:
-            self.log.error(f"Error entering email: {str(e)}")
+            self.log.error("Error entering email: %s", e)
             return False
 
     def enter_password(self, password):
         """Enter password with field clearing """
         try:
-            # Primary locator
-            if self.isElementPresent(self._password_input, "xpath"):
-                self.clear_field_safely(self._password_input)
-                self.sendKeys(password, self._password_input, "xpath")
-                self.log.info("Entered password")
-                return True
-            # Fallback locator self healing
-            elif self.isElementPresent(self._password_input_alt, "xpath"):
-                self.clear_field_safely(self._password_input_alt)
-                self.sendKeys(password, self._password_input_alt, "xpath")
+            # Primary and fallback locator (self healing) raced in one round trip
+            if not self.fill_form({self._password_group: password}):
                 self.log.info("Entered password")
                 return True
             else:
                 self.log.error("Password input field not found")
                 return False
         except Exception as e:
-            self.log.error(f"Error entering password: {str(e)}")
+            self.log.error("Error entering password: %s", e)
             return False
 
     def check_remember_me(self):
@@ -222,45 +213,48 @@ class LoginPage2(BasePage):
                 return True
             return True  # Not required, so return True
         except Exception as e:
-            self.log.error(f"Error with remember me checkbox: {str(e)}")
+            self.log.error("Error with remember me checkbox: %s", e)
             return True  # Not critical, continue
 
     def click_login_button(self):
         """Click the login/sign in button"""
         try:
             if self.isElementPresent(self._login_submit_button, "xpath"):
-                self.elementClick(self._login_submit_button, "xpath")
-                self.util.sleep(3)  # Wait for login processing
+                # Wait for login processing to settle rather than a fixed pause
+                url_before = self.driver.current_url
+                self.click_and_wait(self._login_submit_button, "xpath", [
+                    JsCondition.url_changes(url_before),
+                    JsCondition.script("!!document.querySelector('form :invalid')"),
+                    (self._error_message, "xpath"),
+                ])
                 self.log.info("Clicked login button")
                 return True
             else:
                 self.log.error("Login button not found")
                 return False
         except Exception as e:
-            self.log.error(f"Error clicking login button: {str(e)}")
+            self.log.error("Error clicking login button: %s", e)
             return False
 
     # COMPLETE LOGIN FLOW
     def perform_login(self, email, password, remember_me=False):
         """Complete login flow with credentials"""
         try:
-            self.log.info(f"Starting login process for: {email}")
+            self.log.info("Starting login process for: %s", email)
 
             # Navigate to login page
             if not self.navigate_to_login_page():
                 return False
 
             # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, self._email_input))
-            )
-
-            # Enter credentials
-            if not self.enter_email(email):
-                return False
+            self.wait_present(self._email_input, "xpath", timeout=10)
 
-            if not self.enter_password(password):
+            # Enter both credentials in one round trip; each field races its locators in-page
+            missing = self.fill_form({self._email_group: email, self._password_group: password})
+            if missing:
+                self.log.error("Login fields not found: %s", missing)
                 return False
+            self.log.info("Entered credentials for: %s", email)
 
             # Check remember me if requested
             if remember_me:
@@ -274,7 +268,7 @@ class LoginPage2(BasePage):
             return True
 
         except Exception as e:
-            self.log.error(f"Error in login process: {str(e)}")
+            self.log.error("Error in login process: %s", e)
             return False
 
     def login_with_env_credentials(self):
@@ -290,31 +284,32 @@ class LoginPage2(BasePage):
             return self.perform_login(username, password)
 
         except Exception as e:
-            self.log.error(f"Error logging in with env credentials: {str(e)}")
+            self.log.error("Error logging in with env credentials: %s", e)
             return False
 
     # GOOGLE AUTHENTICATION
     def click_google_login(self):
         """Click Google login button - using exact HTML structure"""
         try:
+            # The social buttons can render after the login form: wait for either variant
+            self.wait_until([(self._google_login_button, "xpath"), (self._google_button_svg, "xpath")],
+                            5, "Google login button")
             # Primary selector based on actual HTML structure
             if self.isElementPresent(self._google_login_button, "xpath"):
-                self.elementClick(self._google_login_button, "xpath")
-                self.util.sleep(3)
+                self.click_and_wait(self._google_login_button, "xpath", self._google_opened())
                 self.log.info("Clicked Google login button")
                 return True
             # Alternative selector
             elif self.isElementPresent(self._google_button_svg, "xpath"):
                 # Click parent button of the span
-                self.elementClick("//button[.//span[text()='Google']]", "xpath")
-                self.util.sleep(3)
+                self.click_and_wait("//button[.//span[text()='Google']]", "xpath", self._google_opened())
                 self.log.info("Clicked Google login button (alternative)")
                 return True
             else:
                 self.log.error("Google login button not found")
                 return False
         except Exception as e:
-            self.log.error(f"Error clicking Google login: {str(e)}")
+            self.log.error("Error clicking Google login: %s", e)
             return False
 
     def handle_google_authentication(self):
@@ -326,37 +321,40 @@ class LoginPage2(BasePage):
             if not self.click_google_login():
                 return False
 
-            # Wait for Google login page or redirect
-            self.util.sleep(5)
-
-            # Check if Google login window opened
-            current_url = self.driver.current_url
-            if "google" in current_url.lower() or "accounts.google.com" in current_url:
-                self.log.info("Google authentication page loaded")
-
-                # Clear and enter Google email if field is present
-                google_email_selectors = [
-                    "//input[@type='email']",
-                    "//input[@id='identifierId']",
-                    "//input[@name='identifier']"
-                ]
-
-                for selector in google_email_selectors:
-                    if self.isElementPresent(selector, "xpath"):
-                        self.clear_field_safely(selector)
-                        username = os.getenv('USERNAME')
-                        if username:
-                            self.sendKeys(username, selector, "xpath")
-                            self.log.info("Entered Google email")
-                        break
+            # The redirect and Google's asynchronously rendered form share one budget
+            with self.waits.deadline(15):
+                self.wait_until(JsCondition.url_contains("google"), 5, "Google sign-in page")
+
+                # Check if Google login window opened
+                current_url = self.driver.current_url
+                if "google" in current_url.lower() or "accounts.google.com" in current_url:
+                    self.log.info("Google authentication page loaded")
+
+                    # Clear and enter Google email once one of its fields has rendered
+                    google_email_selectors = [
+                        "//input[@type='email']",
+                        "//input[@id='identifierId']",
+                        "//input[@name='identifier']"
+                    ]
+                    self.wait_until([(selector, "xpath") for selector in google_email_selectors], 10,
+                                    "Google email field")
+
+                    for selector in google_email_selectors:
+                        if self.isElementPresent(selector, "xpath"):
+                            self.clear_field_safely(selector)
+                            username = os.getenv('USERNAME')
+                            if username:
+                                self.sendKeys(username, selector, "xpath")
+                                self.log.info("Entered Google email")
+                            break
 
-                return True
-            else:
-                self.log.info("Google authentication may have completed or failed")
-                return True
+                    return True
+                else:
+                    self.log.info("Google authentication may have completed or failed")
+                    return True
 
         except Exception as e:
-            self.log.error(f"Error in Google authentication: {str(e)}")
+            self.log.error("Error in Google authentication: %s", e)
             return False
 
     # FORGOT PASSWORD FUNCTIONALITY
@@ -367,19 +365,17 @@ class LoginPage2(BasePage):
                 return False
 
             # Wait for forgot password page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, self._reset_email_input))
-            )
+            self.wait_present(self._reset_email_input, "xpath", timeout=10)
 
             # Clear and enter email
             self.clear_field_safely(self._reset_email_input)
             self.sendKeys(email, self._reset_email_input, "xpath")
-            self.log.info(f"Entered email for password reset: {email}")
+            self.log.info("Entered email for password reset: %s", email)
 
             # Click send reset link
             if self.isElementPresent(self._send_reset_link_button, "xpath"):
-                self.elementClick(self._send_reset_link_button, "xpath")
-                self.util.sleep(3)
+                self.click_and_wait(self._send_reset_link_button, "xpath",
+                                    (self._check_your_email_message, "xpath"))
                 self.log.info("Clicked send reset link button")
                 return True
             else:
@@ -387,7 +383,7 @@ class LoginPage2(BasePage):
                 return False
 
         except Exception as e:
-            self.log.error(f"Error requesting password reset: {str(e)}")
+            self.log.error("Error requesting password reset: %s", e)
             return False
 
     def request_password_reset_with_env_email(self):
@@ -401,57 +397,41 @@ class LoginPage2(BasePage):
             return self.request_password_reset(email)
 
         except Exception as e:
-            self.log.error(f"Error requesting password reset with env email: {str(e)}")
+            self.log.error("Error requesting password reset with env email: %s", e)
             return False
 
     # LOGOUT FUNCTIONALITY - UPDATED BASED ON SCREENSHOTS
     def click_user_profile_menu(self):
         """Click user profile/dropdown menu - Updated for TO button with gradient"""
         try:
-            # Primary selector
-            if self.isElementPresent(self._user_profile_button, "xpath"):
-                self.elementClick(self._user_profile_button, "xpath")
-                self.util.sleep(3)  # Wait 3 seconds as specified
-                self.log.info("Clicked user profile menu (gradient TO button)")
-                return True
-
-            # Fallback selector (self healing)
-            elif self.isElementPresent(self._user_dropdown_button, "xpath"):
-                self.elementClick(self._user_dropdown_button, "xpath")
-                self.util.sleep(3)  # Wait 3 seconds as specified
-                self.log.info("Clicked user profile menu (TO text)")
-                return True
-
-            # Additional fallback selectors (self healing)
-            elif self.isElementPresent(self._user_initials_button, "xpath"):
-                self.elementClick(self._user_initials_button, "xpath")
-                self.util.sleep(3)  # Wait 3 seconds as specified
-                self.log.info("Clicked user profile menu (initials button)")
-                return True
-
-            else:
+            # One wait for whichever menu variant renders (gradient TO button, TO text, initials)
+            locator = self.resolve_group(self._user_menu_group, timeout=10)
+            if locator is None:
                 self.log.error("User profile menu not found")
                 return False
+            self.click_and_wait(locator, "xpath", (self._sign_out_button, "xpath"))
+            self.log.info("Clicked user profile menu using %s", locator)
+            return True
 
         except Exception as e:
-            self.log.error(f"Error clicking user profile menu: {str(e)}")
+            self.log.error("Error clicking user profile menu: %s", e)
             return False
     def click_sign_out(self):
         """Click sign out button - with scroll down to find it"""
         try:
             # Wait for dropdown to be fully loaded
-            self.util.sleep(1)
+            self.wait_until(JsCondition.present(self._sign_out_button), 5, "profile dropdown")
 
             if self.isElementPresent(self._sign_out_button, "xpath"):
                 # Scroll the sign out button into view
                 sign_out_element = self.getElement(self._sign_out_button, "xpath")
                 if sign_out_element:
                     self.driver.execute_script("arguments[0].scrollIntoView(true);", sign_out_element)
-                    self.util.sleep(1)
 
                     # Click the sign out button
-                    self.elementClick(self._sign_out_button, "xpath")
-                    self.util.sleep(3)
+                    url_before = self.driver.current_url
+                    self.click_and_wait(self._sign_out_button, "xpath",
+                                        [JsCondition.url_changes(url_before), (self._welcome_back_message, "xpath")])
                     self.log.info("Clicked sign out button")
                     return True
                 else:
@@ -461,7 +441,7 @@ class LoginPage2(BasePage):
                 self.log.error("Sign out button not found")
                 return False
         except Exception as e:
-            self.log.error(f"Error clicking sign out: {str(e)}")
+            self.log.error("Error clicking sign out: %s", e)
             return False
 
     def perform_logout(self):
@@ -481,15 +461,17 @@ class LoginPage2(BasePage):
             return True
 
         except Exception as e:
-            self.log.error(f"Error in logout process: {str(e)}")
+            self.log.error("Error in logout process: %s", e)
             return False
 
     # VERIFICATION METHODS
     def verify_login_success(self):
         """Verify successful login by checking for welcome message or dashboard"""
         try:
-            # Wait a bit for page to load after login
-            self.util.sleep(3)
+            # Wait for the dashboard to render after login
+            self.wait_until([(self._welcome_message, "xpath"),
+                             (self._dashboard_indicator, "xpath"),
+                             JsCondition.url_contains("dashboard")], 10, "dashboard after login")
 
             # Check for multiple success indicators
             success_indicators = [
@@ -501,12 +483,10 @@ class LoginPage2(BasePage):
                 "//div[contains(@class, 'dashboard')]"
             ]
 
-            for indicator in success_indicators:
-                if self.isElementPresent(indicator, "xpath"):
-                    element = self.getElement(indicator, "xpath")
-                    if element and element.is_displayed():
-                        self.log.info(f"Login success verified with: {indicator}")
-                        return True
+            indicator = self.first_visible(success_indicators)
+            if indicator:
+                self.log.info("Login success verified with: %s", indicator)
+                return True
 
             # Also check URL for dashboard or user area
             current_url = self.driver.current_url.lower()
@@ -514,14 +494,14 @@ class LoginPage2(BasePage):
 
             for indicator in url_indicators:
                 if indicator in current_url:
-                    self.log.info(f"Login success verified by URL containing: {indicator}")
+                    self.log.info("Login success verified by URL containing: %s", indicator)
                     return True
 
             self.log.info("Login success not verified")
             return False
 
         except Exception as e:
-            self.log.error(f"Error verifying login success: {str(e)}")
+            self.log.error("Error verifying login success: %s", e)
             return False
 
     def verify_welcome_back_message(self):
@@ -534,18 +514,15 @@ class LoginPage2(BasePage):
                 "//*[contains(text(), 'Welcome back')]"
             ]
 
-            for selector in welcome_back_selectors:
-                if self.isElementPresent(selector, "xpath"):
-                    element = self.getElement(selector, "xpath")
-                    if element and element.is_displayed():
-                        self.log.info("'Welcome back' message verified")
-                        return True
+            if self.first_visible(welcome_back_selectors):
+                self.log.info("'Welcome back' message verified")
+                return True
 
             self.log.info("'Welcome back' message not found")
             return False
 
         except Exception as e:
-            self.log.error(f"Error verifying welcome back message: {str(e)}")
+            self.log.error("Error verifying welcome back message: %s", e)
             return False
 
     def verify_check_your_email_message(self):
@@ -559,24 +536,23 @@ class LoginPage2(BasePage):
                 "//*[contains(text(), 'password reset link')]"
             ]
 
-            for selector in email_message_selectors:
-                if self.isElementPresent(selector, "xpath"):
-                    element = self.getElement(selector, "xpath")
-                    if element and element.is_displayed():
-                        self.log.info("'Check your email' message verified")
-                        return True
+            if self.first_visible(email_message_selectors):
+                self.log.info("'Check your email' message verified")
+                return True
 
             self.log.info("'Check your email' message not found")
             return False
 
         except Exception as e:
-            self.log.error(f"Error verifying check your email message: {str(e)}")
+            self.log.error("Error verifying check your email message: %s", e)
             return False
 
     def verify_logout_success(self):
         """Verify successful logout by checking for welcome back message"""
         try:
-            self.util.sleep(2)  # Wait for redirect after logout
+            # Wait for redirect after logout
+            self.wait_until([(self._welcome_back_message, "xpath"), JsCondition.url_contains("login")],
+                            5, "redirect after logout")
 
             # Check if back to login page
             if self.verify_welcome_back_message():
@@ -588,14 +564,14 @@ class LoginPage2(BasePage):
 
             for indicator in logout_indicators:
                 if indicator in current_url:
-                    self.log.info(f"Logout success verified by URL containing: {indicator}")
+                    self.log.info("Logout success verified by URL containing: %s", indicator)
                     return True
 
             self.log.info(" Logout success not verified")
             return False
 
         except Exception as e:
-            self.log.error(f"Error verifying logout success: {str(e)}")
+            self.log.error("Error verifying logout success: %s", e)
             return False
 
     def verify_login_failed(self):
@@ -620,7 +596,7 @@ class LoginPage2(BasePage):
             return False
 
         except Exception as e:
-            self.log.error(f"Error verifying login failure: {str(e)}")
+            self.log.error("Error verifying login failure: %s", e)
             return False
 
     # NAVIGATION VERIFICATION
@@ -628,8 +604,8 @@ class LoginPage2(BasePage):
         """Verify back to sign in navigation works"""
         try:
             if self.isElementPresent(self._back_to_signin_button, "xpath"):
-                self.elementClick(self._back_to_signin_button, "xpath")
-                self.util.sleep(2)
+                self.click_and_wait(self._back_to_signin_button, "xpath",
+                                    [(self._welcome_back_message, "xpath"), (self._email_input, "xpath")])
 
                 # Verify we're back to login page
                 return self.verify_welcome_back_message()
@@ -637,7 +613,7 @@ class LoginPage2(BasePage):
             return False
 
         except Exception as e:
-            self.log.error(f"Error verifying back to signin navigation: {str(e)}")
+            self.log.error("Error verifying back to signin navigation: %s", e)
             return False
 
     # UTILITY METHODS
@@ -646,7 +622,7 @@ class LoginPage2(BasePage):
         try:
             return self.driver.title
         except Exception as e:
-            self.log.error(f"Error getting page title: {str(e)}")
+            self.log.error("Error getting page title: %s", e)
             return ""
 
     def get_current_url(self):
@@ -654,7 +630,7 @@ class LoginPage2(BasePage):
         try:
             return self.driver.current_url
         except Exception as e:
-            self.log.error(f"Error getting current URL: {str(e)}")
+            self.log.error("Error getting current URL: %s", e)
             return ""
 
     def take_screenshot(self, filename=None):
@@ -664,22 +640,20 @@ class LoginPage2(BasePage):
                 filename = f"login_screenshot_{int(time.time())}.png"
 
             self.driver.save_screenshot(filename)
-            self.log.info(f"Screenshot saved: {filename}")
+            self.log.info("Screenshot saved: %s", filename)
             return filename
         except Exception as e:
-            self.log.error(f"Error taking screenshot: {str(e)}")
+            self.log.error("Error taking screenshot: %s", e)
             return None
 
     def wait_for_element_and_click(self, locator, timeout=10):
         """Wait for element to be clickable and click it"""
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable((By.XPATH, locator))
-            )
+            element = self.wait_clickable(locator, "xpath", timeout=timeout)
             element.click()
             return True
         except Exception as e:
-            self.log.error(f"Error waiting for and clicking element: {str(e)}")
+            self.log.error("Error waiting for and clicking element: %s", e)
             return False
 
     def is_user_logged_in(self):
@@ -693,9 +667,8 @@ class LoginPage2(BasePage):
                 "//button[contains(@class, 'user')]"
             ]
 
-            for indicator in login_indicators:
-                if self.isElementPresent(indicator, "xpath"):
-                    return True
+            if any(state["present"] for state in self.snapshot(login_indicators).values()):
+                return True
 
             # Check URL
             current_url = self.driver.current_url.lower()
@@ -705,7 +678,7 @@ class LoginPage2(BasePage):
             return False
 
         except Exception as e:
-            self.log.error(f"Error checking login status: {str(e)}")
+            self.log.error("Error checking login status: %s", e)
             return False
 
     # ALTERNATIVE VALIDATION METHODS
@@ -714,43 +687,41 @@ class LoginPage2(BasePage):
         try:
             return self.driver.current_url
         except Exception as e:
-            self.log.error(f"Error getting current URL: {str(e)}")
+            self.log.error("Error getting current URL: %s", e)
             return None
 
     def check_form_field_values(self):
         """Check if form fields retain their values after failed submission"""
         try:
             form_state = {}
+            snap = self.snapshot([self._email_input, self._password_input])
 
             # Check email field value
-            if self.isElementPresent(self._email_input, "xpath"):
-                email_element = self.getElement(self._email_input, "xpath")
-                form_state['email'] = email_element.get_attribute('value') if email_element else ""
+            if snap[self._email_input]["present"]:
+                form_state['email'] = snap[self._email_input]["value"] or ""
 
             # Check password field value (if visible)
-            if self.isElementPresent(self._password_input, "xpath"):
-                password_element = self.getElement(self._password_input, "xpath")
-                form_state['password'] = password_element.get_attribute('value') if password_element else ""
+            if snap[self._password_input]["present"]:
+                form_state['password'] = snap[self._password_input]["value"] or ""
 
-            self.log.info(f"Form state captured: {form_state}")
+            self.log.info("Form state captured: %s", form_state)
             return form_state
         except Exception as e:
-            self.log.error(f"Error checking form field values: {str(e)}")
+            self.log.error("Error checking form field values: %s", e)
             return {}
 
     def is_submit_button_enabled(self):
         """Check if submit button is enabled/clickable"""
         try:
-            if self.isElementPresent(self._login_submit_button, "xpath"):
-                button = self.getElement(self._login_submit_button, "xpath")
-                if button:
-                    is_enabled = button.is_enabled()
-                    is_displayed = button.is_displayed()
-                    self.log.info(f"Submit button - Enabled: {is_enabled}, Displayed: {is_displayed}")
-                    return is_enabled and is_displayed
+            button = self.snapshot([self._login_submit_button])[self._login_submit_button]
+            if button["present"]:
+                is_enabled = button["enabled"]
+                is_displayed = button["visible"]
+                self.log.info("Submit button - Enabled: %s, Displayed: %s", is_enabled, is_displayed)
+                return is_enabled and is_displayed
             return False
         except Exception as e:
-            self.log.error(f"Error checking submit button state: {str(e)}")
+            self.log.error("Error checking submit button state: %s", e)
             return False
 
     def monitor_network_activity(self):
@@ -765,10 +736,10 @@ class LoginPage2(BasePage):
                 if 'Network.request' in message or 'Network.response' in message:
                     network_requests.append(log)
 
-            self.log.info(f"Network activity detected: {len(network_requests)} requests")
+            self.log.info("Network activity detected: %s requests", len(network_requests))
             return len(network_requests) > 0
         except Exception as e:
-            self.log.error(f"Error monitoring network activity: {str(e)}")
+            self.log.error("Error monitoring network activity: %s", e)
             return None
 
     def validate_form_behavior_on_invalid_data(self, initial_url, initial_form_state):
@@ -799,9 +770,9 @@ class LoginPage2(BasePage):
             # Check submit button state
             validation_results['submit_button_functional'] = self.is_submit_button_enabled()
 
-            self.log.info(f"Form validation results: {validation_results}")
+            self.log.info("Form validation results: %s", validation_results)
             return validation_results
 
         except Exception as e:
-            self.log.error(f"Error validating form behavior: {str(e)}")
+            self.log.error("Error validating form behavior: %s", e)
             return None
\ No newline at end of file
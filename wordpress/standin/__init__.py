@@ -0,0 +1,5 @@
+# standin/__init__.py
+"""Local stand-in for the Verbatimly app, for offline and low-latency suite runs."""
+from standin.app import StandinServer, create_app
+from standin.client import StandinClient
+from standin.store import SqliteStore, Store, make_store
@@ -0,0 +1,36 @@
+# standin/__main__.py
+"""
+Serve the stand-in app:
+
+    python -m standin --port 8765 --latency 0
+    BASE_URL=http://127.0.0.1:8765 pytest tests/home
+"""
+
+import argparse
+import asyncio
+from standin.app import create_app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in Verbatimly server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Added delay per request (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra delay up to this (ms)")
+    parser.add_argument("--backend", choices=("memory", "sqlite"), default="memory", help="Storage backend")
+    args = parser.parse_args(argv)
+
+    async def serve():
+        app = create_app(latency_ms=args.latency, jitter_ms=args.jitter, backend=args.backend)
+        host, port = await app.start(args.host, args.port)
+        print(f"Stand-in Verbatimly on http://{host}:{port} (latency {args.latency} ms, {args.backend} store)")
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
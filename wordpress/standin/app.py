@@ -0,0 +1,357 @@
+# standin/app.py
+"""
+Routes of the stand-in Verbatimly app: the UI pages the page objects drive and
+the JSON endpoints of api_tests/Verbatimly.postman_collection.json.
+Status codes and messages mirror what the collection accepts from the dev server.
+"""
+
+import asyncio
+import os
+import re
+import threading
+import uuid
+from standin import pages
+from standin.http import HttpServer, Response
+from standin.store import INITIAL, Store, make_store, public
+
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+COLOR_RE = re.compile(r"^#?[0-9a-fA-F]{3,6}$|^bg-[a-z]+-\d{2,3}$")
+
+DEFAULT_PASSWORD = "TallBuildings123!"
+
+
+class MultipartCounter:
+    """
+    Incremental multipart/form-data parser that only counts: file parts' bytes
+    (parts with a filename) and how many there were. Feed it chunks of any size.
+    """
+
+    def __init__(self, boundary: bytes):
+        self.delimiter = b"\r\n--" + boundary
+        self.buf = b"\r\n"        # the first delimiter has no leading CRLF
+        self.state = "preamble"
+        self.in_file = False
+        self.files = 0
+        self.file_bytes = 0
+
+    def feed(self, data):
+        self.buf += data
+        while self.state != "end":
+            if self.state in ("preamble", "data"):
+                i = self.buf.find(self.delimiter)
+                if i < 0:
+                    # Keep a tail that could hold the start of a split delimiter
+                    keep = len(self.delimiter) - 1
+                    if len(self.buf) > keep:
+                        if self.in_file:
+                            self.file_bytes += len(self.buf) - keep
+                        self.buf = self.buf[-keep:]
+                    return
+                if self.in_file:
+                    self.file_bytes += i
+                self.buf = self.buf[i + len(self.delimiter):]
+                self.in_file = False
+                self.state = "boundary"
+            if self.state == "boundary":
+                if len(self.buf) < 2:
+                    return
+                self.state = "end" if self.buf.startswith(b"--") else "headers"
+            if self.state == "headers":
+                j = self.buf.find(b"\r\n\r\n")
+                if j < 0:
+                    if len(self.buf) > 16 * 1024:
+                        raise ValueError("multipart part headers too large")
+                    return
+                self.in_file = b"filename=" in self.buf[:j].lower()
+                self.files += self.in_file
+                self.buf = self.buf[j + 4:]
+                self.state = "data"
+
+
+def default_user():
+    """Verified account the login tests use; same env variables as tests/home/login_tests.py."""
+    return {
+        "email": os.getenv("TEST_USERNAME") or "qa.owner@example.com",
+        "password": os.getenv("TEST_PASSWORD") or DEFAULT_PASSWORD,
+        "first_name": "Test",
+        "last_name": "Owner",
+    }
+
+
+def create_app(store: Store = None, latency_ms=0.0, jitter_ms=0.0, seed=True, backend="memory") -> HttpServer:
+    store = store or make_store(backend)
+    account = default_user()
+    if seed and store.get_user(account["email"]) is None:
+        store.add_user(account["email"], account["password"],
+                       account["first_name"], account["last_name"], verified=True)
+    if INITIAL not in store.snapshots:
+        store.snapshot(INITIAL)
+    app = HttpServer(latency_ms, jitter_ms)
+    app.store = store
+
+    def page(path, render, *query_args):
+        async def handler(request):
+            return Response.html(render(*[request.query.get(a, "") for a in query_args]))
+        # The deployed app serves every page with and without the /en locale prefix
+        app.route("GET", path)(handler)
+        app.route("GET", "/en" + path if path != "/" else "/en")(handler)
+
+    page("/", pages.landing)
+    page("/auth/signup", pages.signup)
+    page("/auth/login", pages.login)
+    page("/auth/forgot-password", pages.forgot_password)
+    page("/auth/check-email", pages.check_email, "email")
+    page("/dashboard", pages.dashboard)
+    page("/google/accounts/signin", pages.google_signin)
+
+    @app.route("GET", "/auth/google")
+    async def google(request):
+        return Response.redirect("/google/accounts/signin")
+
+    def current_user(request):
+        return store.session_user(request.bearer())
+
+    # ---------- Auth ----------
+    @app.route("POST", "/api/auth/signup")
+    async def signup(request):
+        data = request.json()
+        if not isinstance(data, dict):
+            return Response.error(400, "Invalid request body")
+        email = (data.get("email") or "").strip()
+        if not EMAIL_RE.match(email):
+            return Response.error(400, "Enter a valid email address")
+        if len(data.get("password") or "") < 8:
+            return Response.error(400, "Password must be at least 8 characters")
+        if not data.get("firstName") or not data.get("lastName"):
+            return Response.error(400, "First and last name are required")
+        if store.get_user(email):
+            return Response.error(409, "Email already in use")
+        user = store.add_user(email, data["password"], data["firstName"], data["lastName"])
+        return Response.json({"message": "User created, please verify your email",
+                              "data": public(user)}, 201)
+
+    @app.route("POST", "/api/auth/login")
+    async def login(request):
+        data = request.json() or {}
+        user = store.get_user(data.get("email"))
+        if not store.check_password(user, data.get("password")):
+            return Response.error(400, "Invalid login credentials")
+        if not user["verified"]:
+            return Response.error(400, "Email not verified")
+        token, expires_at = store.open_session(user)
+        return Response.json({"access_token": token, "token_type": "bearer",
+                              "expires_at": expires_at, "user": public(user)})
+
+    @app.route("POST", "/api/auth/logout")
+    async def logout(request):
+        store.close_session(request.bearer())
+        return Response(204)
+
+    @app.route("POST", "/api/auth/forgot-password")
+    async def forgot_password(request):
+        data = request.json() or {}
+        if not EMAIL_RE.match(data.get("email") or ""):
+            return Response.error(400, "Enter a valid email address")
+        return Response.json({"message": "If the email exists, a reset link was sent"})
+
+    @app.route("GET", "/api/auth/me")
+    async def me(request):
+        user = current_user(request)
+        if user is None:
+            return Response.error(401, "Missing or invalid token")
+        return Response.json(dict(public(user), totalFiles=0))
+
+    # Supabase user endpoint used by the collection's Login request
+    @app.route("GET", "/auth/v1/user")
+    async def supabase_user(request):
+        user = current_user(request)
+        if user is None:
+            return Response.json({"code": 401, "message": "Invalid JWT",
+                                  "hint": "Provide a valid access token"}, 401)
+        return Response.json(public(user))
+
+    # ---------- Tags ----------
+    @app.route("GET", "/api/tags")
+    async def list_tags(request):
+        user = current_user(request)
+        if user is None:
+            return Response.error(401, "Missing or invalid token")
+        try:
+            limit = int(request.query["limit"]) if "limit" in request.query else None
+            offset = int(request.query.get("offset") or 0)
+        except ValueError:
+            return Response.error(400, "limit and offset must be integers")
+        data = {"data": [public(t) for t in store.user_tags(user, limit, offset)]}
+        if limit is not None:
+            data["total"] = store.count_tags(user)
+        return Response.json(data)
+
+    @app.route("POST", "/api/tags")
+    async def create_tag(request):
+        data = request.json()
+        if not isinstance(data, dict):
+            # Checked before auth, as on the dev server; the collection matches both halves
+            return Response.error(400, "Invalid request body or missing auth token")
+        user = current_user(request)
+        if user is None:
+            return Response.error(401, "Missing or invalid token")
+        # The dev server answers 401 for a missing name as well; the collection expects it
+        if not data.get("name"):
+            return Response.error(401, "Invalid tag: name is required")
+        color = data.get("color") or "#6b7280"
+        if not COLOR_RE.match(color):
+            return Response.error(400, "Invalid color")
+        if store.find_tag(user, data["name"]):
+            return Response.error(409, "Tag already exists")
+        tag = store.add_tag(user, data["name"], color, data.get("description") or "")
+        return Response.json({"message": "Tag created successfully", "data": public(tag)}, 201)
+
+    @app.route("POST", "/api/tags/update")
+    async def update_tag(request):
+        data = request.json()
+        if not isinstance(data, dict):
+            return Response.error(400, "Invalid request body")
+        user = current_user(request)
+        if user is None:
+            return Response.error(401, "Missing or invalid token")
+        try:
+            uuid.UUID(str(data.get("id")))
+        except ValueError:
+            return Response.error(400, "Invalid id")
+        tag = store.get_tag(str(data["id"]))
+        if tag is None or tag["owner"] != user["id"]:
+            return Response.error(404, "Tag not found")
+        changes = {k: data[k] for k in ("name", "color", "description", "isActive") if k in data}
+        if changes.get("name", tag["name"]) != tag["name"] and store.find_tag(user, changes["name"]):
+            return Response.error(409, "Tag already exists")
+        return Response.json({"message": "Tag updated successfully",
+                              "data": public(store.update_tag(tag["id"], **changes))})
+
+    # ---------- State control (test fixtures) ----------
+    @app.route("POST", "/__standin/reset")
+    async def reset(request):
+        store.reset()
+        return Response.json({"restored": INITIAL})
+
+    @app.route("POST", "/__standin/snapshot")
+    async def snapshot(request):
+        name = (request.json() or {}).get("name")
+        if not name:
+            return Response.error(400, "Snapshot name is required")
+        return Response.json({"snapshot": store.snapshot(name)}, 201)
+
+    @app.route("POST", "/__standin/restore")
+    async def restore(request):
+        name = (request.json() or {}).get("name") or INITIAL
+        try:
+            store.restore(name)
+        except KeyError:
+            return Response.error(404, f"No snapshot named {name}")
+        return Response.json({"restored": name})
+
+    @app.route("GET", "/__standin/snapshots")
+    async def list_snapshots(request):
+        return Response.json({"data": sorted(store.snapshots)})
+
+    @app.route("POST", "/__standin/seed")
+    async def seed_tags(request):
+        """{"tags": N, "email": optional, "prefix": optional} -> N tags for that user (default account)."""
+        data = request.json() or {}
+        user = store.get_user(data.get("email") or account["email"])
+        if user is None:
+            return Response.error(404, "No such user")
+        try:
+            count = int(data.get("tags") or 0)
+        except (TypeError, ValueError):
+            return Response.error(400, "tags must be an integer")
+        ids = store.seed_tags(user, count, data.get("prefix") or f"seed-{uuid.uuid4().hex[:6]}")
+        return Response.json({"seeded": len(ids), "sample": ids[:1000], "backend": store.backend}, 201)
+
+    # ---------- Files ----------
+    @app.route("POST", "/api/file/*")
+    async def get_file(request):
+        if current_user(request) is None:
+            return Response.error(401, "Missing or invalid token")
+        return Response.error(404, f"File not found: {request.params['rest'] or '(no id)'}")
+
+    @app.route("POST", "/api/file")
+    async def get_file_without_id(request):
+        return Response.error(400, "File id is required")
+
+    @app.route("POST", "/upload", stream=True)
+    async def upload(request):
+        # Peek at the start: an empty or whitespace-only body is "no file" for anyone
+        head = b""
+        while len(head) < 64 and not request.stream.done:
+            head += await request.stream.read()
+        if request.stream.done and not head.strip():
+            return Response.error(400, "No file provided")
+        if current_user(request) is None:
+            return Response.error(401, "Missing or invalid token")
+        boundary = re.search(r'boundary="?([^";]+)"?', request.headers.get("content-type", ""))
+        counter = MultipartCounter(boundary.group(1).encode("latin-1")) if boundary else None
+        total = len(head)
+        if counter:
+            counter.feed(head)
+        async for chunk in request.stream:     # never buffered: memory stays at one chunk
+            total += len(chunk)
+            if counter:
+                counter.feed(chunk)
+        size = counter.file_bytes if counter else total
+        if counter and not counter.files:
+            return Response.error(400, "No file provided")
+        return Response.json({"message": "File uploaded", "size": size, "received": total}, 201)
+
+    return app
+
+
+class StandinServer:
+    """
+    Runs the stand-in app on its own event loop in a background thread, so a
+    pytest session (or any script) can start it and point BASE_URL at it.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0.0, jitter_ms=0.0, store=None, backend="memory"):
+        self.app = create_app(store, latency_ms, jitter_ms, backend=backend)
+        self.host = host
+        self.port = port
+        self._loop = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._error = None
+
+    @property
+    def store(self):
+        return self.app.store
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self.host, self.port = self._loop.run_until_complete(self.app.start(self.host, self.port))
+        except Exception as e:
+            self._error = e
+            self._ready.set()
+            return
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(self.app.stop())
+        self._loop.close()
+
+    def start(self, timeout=10):
+        self._thread = threading.Thread(target=self._run, name="standin-server", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout)
+        if self._error is not None:
+            raise self._error
+        self.app.log.info("Stand-in app listening on %s", self.base_url)
+        return self
+
+    def stop(self):
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(5)
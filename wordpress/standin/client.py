@@ -0,0 +1,41 @@
+# standin/client.py
+import json
+import urllib.request
+
+
+class StandinClient:
+    """Drives the stand-in's state endpoints; used by tests/conftest.py between tests."""
+
+    def __init__(self, base_url, timeout=5):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def _post(self, path, data=None, token=None):
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        req = urllib.request.Request(f"{self.base_url}{path}", data=json.dumps(data or {}).encode(),
+                                     headers=headers, method="POST")
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            return json.loads(resp.read() or b"{}")
+
+    def reset(self):
+        """Back to the seeded state (the "initial" snapshot)."""
+        return self._post("/__standin/reset")
+
+    def snapshot(self, name):
+        return self._post("/__standin/snapshot", {"name": name})
+
+    def restore(self, name):
+        return self._post("/__standin/restore", {"name": name})
+
+    def login(self, email, password):
+        """Access token for a verified account."""
+        return self._post("/api/auth/login", {"email": email, "password": password})["access_token"]
+
+    def create_tag(self, token, name, color="#6b7280", description=""):
+        return self._post("/api/tags", {"name": name, "color": color, "description": description}, token)["data"]
+
+    def seed_tags(self, count, email=None, prefix=None):
+        """Bulk-create count tags for a user (default: the seeded account); returns the seed response."""
+        return self._post("/__standin/seed", {"tags": count, "email": email, "prefix": prefix})
@@ -0,0 +1,272 @@
+# standin/http.py
+"""
+Minimal asyncio HTTP/1.1 server for the stand-in app.
+Just enough for a browser and an API client: keep-alive, Content-Length and
+chunked bodies, exact and prefix routes, JSON/HTML responses and per-request
+latency injection. Routes registered with stream=True read the body on demand
+(request.stream), so multi-GB uploads never sit in memory.
+"""
+
+import asyncio
+import json
+import random
+from urllib.parse import parse_qs, urlsplit
+from utilities.custom_logger import customLogger
+
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 16 * 1024 * 1024      # buffered routes only; streaming routes have no cap
+LINGER_S = 5.0                          # how long an early-answered body is drained before closing
+REASONS = {200: "OK", 201: "Created", 204: "No Content", 302: "Found", 400: "Bad Request",
+           401: "Unauthorized", 404: "Not Found", 405: "Method Not Allowed", 409: "Conflict",
+           413: "Payload Too Large", 422: "Unprocessable Entity", 500: "Internal Server Error"}
+
+
+class BodyStream:
+    """A request body read on demand, de-chunking Transfer-Encoding: chunked."""
+
+    def __init__(self, reader, length=0, chunked=False):
+        self.reader = reader
+        self.remaining = length         # bytes left (of the body, or of the current chunk)
+        self.chunked = chunked
+        self.done = not chunked and not length
+        self.received = 0
+
+    async def read(self, max_bytes=256 * 1024):
+        """Up to max_bytes of body; b"" once the body is complete."""
+        if self.done:
+            return b""
+        if self.chunked and not self.remaining:
+            size_line = await self.reader.readuntil(b"\r\n")
+            self.remaining = int(size_line.split(b";")[0].strip() or b"0", 16)
+            if not self.remaining:
+                while (await self.reader.readuntil(b"\r\n")) != b"\r\n":
+                    pass    # trailers
+                self.done = True
+                return b""
+        data = await self.reader.read(min(max_bytes, self.remaining))
+        if not data:
+            raise asyncio.IncompleteReadError(b"", self.remaining)
+        self.remaining -= len(data)
+        self.received += len(data)
+        if not self.remaining:
+            if self.chunked:
+                await self.reader.readexactly(2)    # CRLF after the chunk
+            else:
+                self.done = True
+        return data
+
+    async def read_all(self, limit=MAX_BODY_BYTES):
+        """Whole body, or None when it exceeds limit."""
+        parts, size = [], 0
+        while True:
+            data = await self.read()
+            if not data:
+                return b"".join(parts)
+            size += len(data)
+            if size > limit:
+                return None
+            parts.append(data)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        data = await self.read()
+        if not data:
+            raise StopAsyncIteration
+        return data
+
+
+class Request:
+    def __init__(self, method, target, headers, body=b"", stream=None):
+        self.method = method
+        parts = urlsplit(target)
+        self.path = parts.path or "/"
+        self.query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        self.headers = headers          # lower-cased names
+        self.body = body
+        self.stream = stream            # BodyStream; already consumed into body for buffered routes
+        self.params = {}                # filled by prefix routes
+
+    def json(self):
+        """Parsed JSON body, or None when the body is empty or not JSON."""
+        try:
+            data = json.loads(self.body.decode("utf-8")) if self.body.strip() else None
+        except (UnicodeDecodeError, ValueError):
+            return None
+        return data
+
+    def bearer(self):
+        auth = self.headers.get("authorization", "")
+        return auth[7:].strip() if auth.lower().startswith("bearer ") else None
+
+
+class Response:
+    def __init__(self, status=200, body=b"", content_type="text/plain; charset=utf-8", headers=None):
+        self.status = status
+        self.body = body if isinstance(body, bytes) else str(body).encode("utf-8")
+        self.headers = {"Content-Type": content_type, **(headers or {})}
+
+    @classmethod
+    def json(cls, data, status=200, headers=None):
+        return cls(status, json.dumps(data), "application/json; charset=utf-8", headers)
+
+    @classmethod
+    def error(cls, status, message):
+        return cls.json({"error": {"message": message}, "message": message}, status)
+
+    @classmethod
+    def html(cls, markup, status=200):
+        return cls(status, markup, "text/html; charset=utf-8")
+
+    @classmethod
+    def redirect(cls, location):
+        return cls(302, b"", headers={"Location": location})
+
+    def encode(self, keep_alive=True):
+        head = [f"HTTP/1.1 {self.status} {REASONS.get(self.status, 'OK')}"]
+        headers = dict(self.headers, **{"Content-Length": str(len(self.body)),
+                                        "Connection": "keep-alive" if keep_alive else "close",
+                                        "Cache-Control": "no-store"})
+        head += [f"{k}: {v}" for k, v in headers.items()]
+        return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + self.body
+
+
+class HttpServer:
+    """
+    Routes are registered as (method, path) -> async handler(request) -> Response.
+    A path ending in "/*" matches any suffix, which is passed as request.params["rest"].
+    latency_ms/jitter_ms delay every response to mimic a remote deployment.
+    """
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.routes = {}
+        self.prefix_routes = []
+        self.streaming = set()          # handlers that read request.stream themselves
+        self.log = customLogger("standin")
+        self._server = None
+        self._connections = set()
+
+    def route(self, method, path, stream=False):
+        def register(handler):
+            if stream:
+                self.streaming.add(handler)
+            if path.endswith("/*"):
+                self.prefix_routes.append((method, path[:-1], handler))
+            else:
+                self.routes[(method, path.rstrip("/") or "/")] = handler
+            return handler
+        return register
+
+    def _match(self, request):
+        path = request.path.rstrip("/") or "/"
+        handler = self.routes.get((request.method, path))
+        if handler:
+            return handler
+        for method, prefix, handler in self.prefix_routes:
+            if request.method == method and request.path.startswith(prefix):
+                request.params["rest"] = request.path[len(prefix):]
+                return handler
+        if any(p == path for _, p in self.routes) or \
+                any(request.path.startswith(p) for _, p, _ in self.prefix_routes):
+            return None
+        return False
+
+    async def dispatch(self, request):
+        handler = self._match(request)
+        if handler is None:
+            return Response.error(405, "Method not allowed")
+        if handler is False:
+            return Response.error(404, f"No route for {request.path}")
+        if handler not in self.streaming and request.stream is not None:
+            request.body = await request.stream.read_all()
+            if request.body is None:
+                return Response.error(413, "Request body too large")
+        try:
+            return await handler(request)
+        except Exception as e:
+            self.log.error("Stand-in handler for %s %s failed: %s", request.method, request.path, e)
+            return Response.error(500, "Internal error")
+
+    async def _delay(self):
+        delay = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000.0)
+
+    # ---------- Connection handling ----------
+    async def _discard(self, stream, timeout=LINGER_S):
+        """Read and drop what is left of a body; False if it did not finish in time."""
+        async def drain():
+            while await stream.read():
+                pass
+        try:
+            await asyncio.wait_for(drain(), timeout)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            return False
+        return True
+
+    async def _read_request(self, reader):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError:
+            return None
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, _ = (lines[0].split(" ", 2) + ["", ""])[:3]
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        chunked = "chunked" in headers.get("transfer-encoding", "").lower()
+        length = 0 if chunked else int(headers.get("content-length") or 0)
+        return Request(method.upper(), target, headers, stream=BodyStream(reader, length, chunked))
+
+    async def handle(self, reader, writer):
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+                    break   # client went away, or stop() is closing idle connections
+                if request is None:
+                    writer.write(Response.error(413, "Headers too large").encode(False))
+                    break
+                await self._delay()
+                response = await self.dispatch(request)
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                writer.write(response.encode(keep_alive and request.stream.done))
+                await writer.drain()
+                if not request.stream.done:
+                    # Answered early (401/413/...): swallow the rest of the body for a while, like
+                    # a lingering close; closing with unread data would RST away the response.
+                    keep_alive = await self._discard(request.stream) and keep_alive
+                if not keep_alive:
+                    break
+        except asyncio.CancelledError:
+            pass    # stop() closing a connection mid-request
+        finally:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except BaseException:
+                pass
+            # Only now: stop() must still be able to cancel a task stuck in wait_closed()
+            self._connections.discard(task)
+
+    async def start(self, host="127.0.0.1", port=0):
+        self._server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        # Idle keep-alive connections would otherwise outlive the loop
+        tasks = list(self._connections)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
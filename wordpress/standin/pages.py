@@ -0,0 +1,264 @@
+# standin/pages.py
+"""
+HTML for the stand-in app. Ids, names and texts match what pages/home/*.py target
+(firstName, agreeToTerms, 'Create account', 'Welcome back', 'Check your email', ...).
+Validation is native HTML5 (required/minlength/type=email, a dotted-domain pattern on
+the signup email) so validationMessage
+behaves like the real app; everything else is a few lines of vanilla JS.
+"""
+
+from html import escape
+
+SESSION_KEY = "sb-standin-auth-token"
+
+_LAYOUT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title} | Verbatimly</title>
+<style>
+  body {{ font-family: sans-serif; margin: 0; }}
+  header, main {{ padding: 16px 32px; }}
+  form {{ display: flex; flex-direction: column; gap: 8px; max-width: 360px; }}
+  .field {{ display: flex; gap: 4px; }}
+  .error {{ color: #b00020; }}
+  .menu {{ display: inline-flex; gap: 8px; cursor: pointer; }}
+  #dropdown {{ display: none; }}
+  #dropdown.open {{ display: block; }}
+</style>
+</head>
+<body>
+{body}
+<script>
+var SESSION_KEY = "{session_key}";
+function showError(form, message) {{
+  var old = document.getElementById('form-error');
+  if (old) old.remove();
+  var div = document.createElement('div');
+  div.id = 'form-error';
+  div.className = 'form-error error';
+  div.setAttribute('role', 'alert');
+  div.textContent = message;
+  form.appendChild(div);
+}}
+function postJson(url, data, token) {{
+  var headers = {{'Content-Type': 'application/json'}};
+  if (token) headers['Authorization'] = 'Bearer ' + token;
+  return fetch(url, {{method: 'POST', headers: headers, body: JSON.stringify(data)}})
+    .then(function (r) {{ return r.json().catch(function () {{ return {{}}; }})
+      .then(function (body) {{ return {{ok: r.ok, status: r.status, body: body}}; }}); }});
+}}
+function session() {{
+  try {{ return JSON.parse(localStorage.getItem(SESSION_KEY) || 'null'); }} catch (e) {{ return null; }}
+}}
+{script}
+</script>
+</body>
+</html>
+"""
+
+_BACK_HOME = """<header>
+  <button type="button" onclick="location.href='/'">Back to home</button>
+  <span>Verbatimly</span>
+</header>"""
+
+
+def _page(title, body, script=""):
+    return _LAYOUT.format(title=escape(title), body=body, script=script, session_key=SESSION_KEY)
+
+
+def landing():
+    return _page("Transcription made simple", """<header>
+  <span>Verbatimly</span>
+  <button type="button" onclick="location.href='/auth/login'">Sign in</button>
+  <a href="/auth/signup">Start for free</a>
+</header>
+<main>
+  <h1>Transcribe audio and video in minutes</h1>
+  <p>Accurate transcripts, speaker labels and tags for every file.</p>
+</main>""")
+
+
+def signup():
+    return _page("Create your account", _BACK_HOME + """
+<main>
+  <h1>Create your account</h1>
+  <form id="signup-form">
+    <label for="firstName">First name</label>
+    <input id="firstName" name="firstName" type="text" required>
+    <label for="lastName">Last name</label>
+    <input id="lastName" name="lastName" type="text" required>
+    <label for="email">Email</label>
+    <input id="email" name="email" type="email" pattern="[^@\\s]+@[^@\\s]+\\.[^@\\s]+" required>
+    <label for="password">Password</label>
+    <div class="field">
+      <input id="password" name="password" type="password" minlength="8" required>
+      <button type="button" class="toggle" data-for="password">Show</button>
+    </div>
+    <label for="confirmPassword">Confirm password</label>
+    <div class="field">
+      <input id="confirmPassword" name="confirmPassword" type="password" required>
+      <button type="button" class="toggle" data-for="confirmPassword">Show</button>
+    </div>
+    <label><input id="agreeToTerms" name="agreeToTerms" type="checkbox" required>
+      I agree to the Terms of Service and Privacy Policy</label>
+    <button type="submit">Create account</button>
+  </form>
+  <button type="button" onclick="location.href='/auth/google'"><span>Google</span></button>
+  <p>Already have an account? <button type="button" onclick="location.href='/auth/login'">Sign in</button></p>
+</main>""", """
+var form = document.getElementById('signup-form');
+var password = document.getElementById('password');
+var confirmPassword = document.getElementById('confirmPassword');
+function checkMatch() {
+  confirmPassword.setCustomValidity(
+    confirmPassword.value && confirmPassword.value !== password.value ? 'Passwords do not match' : '');
+}
+password.addEventListener('input', checkMatch);
+confirmPassword.addEventListener('input', checkMatch);
+document.querySelectorAll('.toggle').forEach(function (btn) {
+  btn.addEventListener('click', function () {
+    var input = document.getElementById(btn.dataset.for);
+    input.type = input.type === 'password' ? 'text' : 'password';
+  });
+});
+form.addEventListener('submit', function (e) {
+  e.preventDefault();
+  checkMatch();
+  if (!form.reportValidity()) return;
+  var email = document.getElementById('email').value;
+  postJson('/api/auth/signup', {
+    firstName: document.getElementById('firstName').value,
+    lastName: document.getElementById('lastName').value,
+    email: email,
+    password: password.value
+  }).then(function (res) {
+    if (res.ok) location.href = '/auth/check-email?email=' + encodeURIComponent(email);
+    else showError(form, res.body.message || 'Sign up failed');
+  });
+});""")
+
+
+def check_email(email=""):
+    return _page("Check your email", _BACK_HOME + f"""
+<main class="verification">
+  <h1>Check your email</h1>
+  <p>We sent a verification email to <b>{escape(email)}</b>.
+     Open it and verify your email to finish signing up, then check your inbox for updates.</p>
+  <a href="/auth/login">Back to sign in</a>
+</main>""")
+
+
+def login():
+    return _page("Sign in", _BACK_HOME + """
+<main>
+  <h1>Welcome back</h1>
+  <p>Sign in to your account</p>
+  <form id="login-form">
+    <label for="email">Email</label>
+    <input id="email" name="email" type="email" required>
+    <label for="password">Password</label>
+    <div class="field">
+      <input id="password" name="password" type="password" required>
+      <button type="button" class="toggle"><svg class="lucide-eye" width="16" height="16"></svg></button>
+    </div>
+    <label><input type="checkbox" name="remember"> Remember me</label>
+    <a href="/auth/forgot-password">Forgot password?</a>
+    <button type="submit">Sign in</button>
+  </form>
+  <button type="button" onclick="location.href='/auth/google'"><span>Google</span></button>
+  <p>No account yet? <a href="/auth/signup">Sign up</a></p>
+</main>""", """
+var form = document.getElementById('login-form');
+document.querySelector('.toggle').addEventListener('click', function () {
+  var input = document.getElementById('password');
+  input.type = input.type === 'password' ? 'text' : 'password';
+});
+form.addEventListener('submit', function (e) {
+  e.preventDefault();
+  if (!form.reportValidity()) return;
+  postJson('/api/auth/login', {
+    email: document.getElementById('email').value,
+    password: document.getElementById('password').value
+  }).then(function (res) {
+    if (!res.ok) { showError(form, res.body.message || 'Invalid login credentials'); return; }
+    localStorage.setItem(SESSION_KEY, JSON.stringify(res.body));
+    document.cookie = 'sb-access-token=' + res.body.access_token + '; path=/';
+    location.href = '/dashboard';
+  });
+});""")
+
+
+def forgot_password():
+    return _page("Reset your password", """<header><span>Verbatimly</span></header>
+<main id="reset">
+  <h1>Reset your password</h1>
+  <form id="reset-form">
+    <label for="email">Email</label>
+    <input id="email" name="email" type="email" required>
+    <button type="submit"><span>Send reset link</span></button>
+  </form>
+  <a href="/auth/login">Back to sign in</a>
+</main>""", """
+var form = document.getElementById('reset-form');
+form.addEventListener('submit', function (e) {
+  e.preventDefault();
+  if (!form.reportValidity()) return;
+  var email = document.getElementById('email').value;
+  postJson('/api/auth/forgot-password', {email: email}).then(function (res) {
+    if (!res.ok) { showError(form, res.body.message || 'Could not send reset link'); return; }
+    var main = document.getElementById('reset');
+    main.innerHTML = '<h1>Check your email</h1><p></p><a href="/auth/login">Back to sign in</a>';
+    main.querySelector('p').textContent = 'If an account exists for ' + email + ', we sent a reset link.';
+  });
+});""")
+
+
+def dashboard():
+    return _page("Dashboard", """<header>
+  <span>Verbatimly</span>
+  <nav><a href="/dashboard">Dashboard</a></nav>
+  <div id="user-menu" class="menu">
+    <div id="initials" class="avatar"></div>
+    <div>Free plan</div>
+  </div>
+  <div id="dropdown"><button type="button" id="sign-out">Sign out</button></div>
+</header>
+<main class="dashboard" hidden>
+  <h1 id="welcome"></h1>
+  <p>Manage your transcriptions</p>
+  <section><h2>Total Files</h2><p id="total-files">0</p></section>
+</main>""", """
+var s = session();
+if (!s) location.replace('/auth/login');
+fetch('/api/auth/me', {headers: {'Authorization': 'Bearer ' + (s && s.access_token)}})
+  .then(function (r) {
+    if (!r.ok) { localStorage.removeItem(SESSION_KEY); location.replace('/auth/login'); return null; }
+    return r.json();
+  })
+  .then(function (user) {
+    if (!user) return;
+    document.getElementById('welcome').textContent = 'Welcome, ' + user.firstName;
+    document.getElementById('initials').textContent =
+      ((user.firstName || ' ')[0] + (user.lastName || ' ')[0]).toUpperCase();
+    document.getElementById('total-files').textContent = user.totalFiles || 0;
+    document.querySelector('main').hidden = false;
+  });
+document.getElementById('user-menu').addEventListener('click', function () {
+  document.getElementById('dropdown').classList.toggle('open');
+});
+document.getElementById('sign-out').addEventListener('click', function () {
+  postJson('/api/auth/logout', {}, s && s.access_token).then(function () {
+    localStorage.removeItem(SESSION_KEY);
+    document.cookie = 'sb-access-token=; Max-Age=0; path=/';
+    location.href = '/auth/login';
+  });
+});""")
+
+
+def google_signin():
+    return _page("Sign in - Google Accounts", """<main>
+  <h1>Sign in with Google</h1>
+  <input type="email" id="identifierId" name="identifier" aria-label="Email or phone">
+  <button type="button">Next</button>
+</main>""")
@@ -0,0 +1,387 @@
+# standin/store.py
+import hashlib
+import itertools
+import secrets
+import sqlite3
+import time
+import uuid
+
+TOKEN_TTL_S = 3600
+INITIAL = "initial"
+
+_MISSING = object()
+_DELETED = object()
+
+
+def _hash(password: str) -> str:
+    return hashlib.sha256(password.encode("utf-8")).hexdigest()
+
+
+class _Layer:
+    """Immutable set of writes on top of a parent layer."""
+    __slots__ = ("data", "parent", "depth")
+
+    def __init__(self, data, parent):
+        self.data = data
+        self.parent = parent
+        self.depth = parent.depth + 1 if parent else 1
+
+
+class CowTable:
+    """
+    Copy-on-write dict. Writes go to a private delta on top of a chain of frozen
+    layers; freeze() turns the delta into a new layer and thaw(layer) drops the
+    delta and points back at an older layer - both O(1), so snapshots are free.
+    Values must be replaced, never mutated in place, or snapshots would see the change.
+    """
+
+    def __init__(self):
+        self._base = None
+        self._delta = {}
+
+    def get(self, key, default=None):
+        value = self._delta.get(key, _MISSING)
+        layer = self._base
+        while value is _MISSING and layer is not None:
+            value = layer.data.get(key, _MISSING)
+            layer = layer.parent
+        return default if value is _MISSING or value is _DELETED else value
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __setitem__(self, key, value):
+        self._delta[key] = value
+
+    def pop(self, key, default=None):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self._delta[key] = _DELETED
+        return value
+
+    def items(self):
+        merged = {}
+        layers = []
+        layer = self._base
+        while layer is not None:
+            layers.append(layer.data)
+            layer = layer.parent
+        for data in reversed(layers):
+            merged.update(data)
+        merged.update(self._delta)
+        return [(k, v) for k, v in merged.items() if v is not _DELETED]
+
+    def values(self):
+        return [v for _, v in self.items()]
+
+    def __len__(self):
+        return len(self.items())
+
+    def freeze(self):
+        """
+        Seal the current state and return it as a layer. The new layer absorbs parents
+        no bigger than itself (size-tiered, like an LSM tree), so chains stay O(log n)
+        deep and freezing costs O(size of the delta) amortised - never O(table).
+        Older snapshots keep their own, untouched layers.
+        """
+        if self._delta:
+            data, parent = self._delta, self._base
+            while parent is not None and len(parent.data) <= 2 * len(data):
+                data = {**parent.data, **data}
+                parent = parent.parent
+            self._base = _Layer(data, parent)
+            self._delta = {}
+        return self._base
+
+    def thaw(self, layer):
+        """Go back to a state returned by freeze()."""
+        self._base = layer
+        self._delta = {}
+
+
+class Store:
+    """
+    In-memory users, sessions and tags for the stand-in backend, with named
+    snapshots: snapshot(name) and restore(name) cost O(1) whatever the data size.
+    The state right after seeding is kept as the "initial" snapshot, which reset() restores.
+    Name lookups are indexed; listing a user's tags scans the tags table.
+    """
+    backend = "memory"
+    TABLES = ("users", "sessions", "tags", "tag_names")
+
+    def __init__(self):
+        self.users = CowTable()        # email (lower) -> user dict
+        self.sessions = CowTable()     # access token -> {"email", "expires_at"}
+        self.tags = CowTable()         # tag id -> tag dict
+        self.tag_names = CowTable()    # (owner id, name) -> tag id
+        self.snapshots = {}
+
+    # ---------- Snapshots ----------
+    def snapshot(self, name):
+        self.snapshots[name] = {t: getattr(self, t).freeze() for t in self.TABLES}
+        return name
+
+    def restore(self, name):
+        """Return to a named snapshot; KeyError if there is no such snapshot."""
+        layers = self.snapshots[name]
+        for table in self.TABLES:
+            getattr(self, table).thaw(layers[table])
+
+    def reset(self):
+        self.restore(INITIAL)
+
+    def drop_snapshot(self, name):
+        if name != INITIAL:
+            self.snapshots.pop(name, None)
+
+    # ---------- Users ----------
+    def add_user(self, email, password, first_name, last_name, verified=False):
+        user = {
+            "id": str(uuid.uuid4()),
+            "email": email,
+            "firstName": first_name,
+            "lastName": last_name,
+            "password": _hash(password),
+            "verified": verified,
+            "createdAt": time.time(),
+        }
+        self.users[email.lower()] = user
+        return user
+
+    def get_user(self, email):
+        return self.users.get((email or "").lower())
+
+    def check_password(self, user, password) -> bool:
+        return user is not None and user["password"] == _hash(password or "")
+
+    # ---------- Sessions ----------
+    def open_session(self, user):
+        token = secrets.token_urlsafe(24)
+        expires_at = int(time.time()) + TOKEN_TTL_S
+        self.sessions[token] = {"email": user["email"].lower(), "expires_at": expires_at}
+        return token, expires_at
+
+    def session_user(self, token):
+        session = self.sessions.get(token or "")
+        if session is None or session["expires_at"] < time.time():
+            return None
+        return self.users.get(session["email"])
+
+    def close_session(self, token):
+        self.sessions.pop(token or "", None)
+
+    # ---------- Tags ----------
+    def add_tag(self, owner, name, color, description):
+        tag = _new_tag(owner, name, color, description)
+        self.tags[tag["id"]] = tag
+        self.tag_names[(owner["id"], name)] = tag["id"]
+        return tag
+
+    def seed_tags(self, owner, count, prefix="seed"):
+        """Bulk-create count tags for owner; returns their ids."""
+        return [self.add_tag(owner, f"{prefix}-{i}", "#6b7280", "")["id"] for i in range(count)]
+
+    def get_tag(self, tag_id):
+        return self.tags.get(tag_id)
+
+    def find_tag(self, owner, name):
+        tag_id = self.tag_names.get((owner["id"], name))
+        return self.tags.get(tag_id) if tag_id else None
+
+    def user_tags(self, owner, limit=None, offset=0):
+        tags = (t for t in self.tags.values() if t["owner"] == owner["id"])
+        return list(itertools.islice(tags, offset, None if limit is None else offset + limit))
+
+    def count_tags(self, owner):
+        return sum(1 for t in self.tags.values() if t["owner"] == owner["id"])
+
+    def update_tag(self, tag_id, **changes):
+        # Always a new record: the old one may be shared with a snapshot
+        old = self.tags[tag_id]
+        tag = dict(old, **changes)
+        self.tags[tag_id] = tag
+        if tag["name"] != old["name"]:
+            self.tag_names.pop((old["owner"], old["name"]))
+            self.tag_names[(tag["owner"], tag["name"])] = tag_id
+        return tag
+
+
+def _new_tag(owner, name, color, description):
+    return {
+        "id": str(uuid.uuid4()),
+        "owner": owner["id"],
+        "name": name,
+        "color": color,
+        "description": description,
+        "isActive": True,
+        "createdAt": time.time(),
+    }
+
+
+_SCHEMA = """
+CREATE TABLE users (key TEXT PRIMARY KEY, id TEXT, email TEXT, first_name TEXT, last_name TEXT,
+                    password TEXT, verified INTEGER, created_at REAL);
+CREATE TABLE sessions (token TEXT PRIMARY KEY, email TEXT, expires_at INTEGER);
+CREATE TABLE tags (seq INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT UNIQUE, owner TEXT, name TEXT,
+                   color TEXT, description TEXT, is_active INTEGER, created_at REAL);
+CREATE UNIQUE INDEX tags_owner_name ON tags (owner, name);
+CREATE INDEX tags_owner_seq ON tags (owner, seq);
+"""
+
+_TAG_COLUMNS = {"name": "name", "color": "color", "description": "description", "isActive": "is_active"}
+
+
+class SqliteStore:
+    """
+    Same interface as Store, backed by SQLite (in memory unless a path is given).
+    Tags are indexed by (owner, name) and (owner, insertion order), so lookups and
+    pages cost O(log n). Snapshots copy the database with the backup API, which is
+    O(size) - the price of the indexes, compared to Store's O(1) layers.
+    """
+    backend = "sqlite"
+
+    def __init__(self, path=":memory:"):
+        # One event loop thread uses it, but it is created on the caller's thread
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(_SCHEMA)
+        self.snapshots = {}
+
+    # ---------- Snapshots ----------
+    def snapshot(self, name):
+        copy = sqlite3.connect(":memory:", check_same_thread=False)
+        self.db.backup(copy)
+        old = self.snapshots.pop(name, None)
+        if old is not None:
+            old.close()
+        self.snapshots[name] = copy
+        return name
+
+    def restore(self, name):
+        """Return to a named snapshot; KeyError if there is no such snapshot."""
+        self.snapshots[name].backup(self.db)
+
+    def reset(self):
+        self.restore(INITIAL)
+
+    def drop_snapshot(self, name):
+        if name != INITIAL and name in self.snapshots:
+            self.snapshots.pop(name).close()
+
+    # ---------- Users ----------
+    @staticmethod
+    def _user(row):
+        if row is None:
+            return None
+        return {"id": row["id"], "email": row["email"], "firstName": row["first_name"],
+                "lastName": row["last_name"], "password": row["password"],
+                "verified": bool(row["verified"]), "createdAt": row["created_at"]}
+
+    def add_user(self, email, password, first_name, last_name, verified=False):
+        user = {"id": str(uuid.uuid4()), "email": email, "firstName": first_name, "lastName": last_name,
+                "password": _hash(password), "verified": verified, "createdAt": time.time()}
+        self.db.execute("INSERT OR REPLACE INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (email.lower(), user["id"], email, first_name, last_name, user["password"],
+                         int(verified), user["createdAt"]))
+        return user
+
+    def get_user(self, email):
+        return self._user(self.db.execute("SELECT * FROM users WHERE key = ?",
+                                          ((email or "").lower(),)).fetchone())
+
+    def check_password(self, user, password) -> bool:
+        return user is not None and user["password"] == _hash(password or "")
+
+    # ---------- Sessions ----------
+    def open_session(self, user):
+        token = secrets.token_urlsafe(24)
+        expires_at = int(time.time()) + TOKEN_TTL_S
+        self.db.execute("INSERT INTO sessions VALUES (?, ?, ?)", (token, user["email"].lower(), expires_at))
+        return token, expires_at
+
+    def session_user(self, token):
+        row = self.db.execute("SELECT u.* FROM sessions s JOIN users u ON u.key = s.email "
+                              "WHERE s.token = ? AND s.expires_at >= ?", (token or "", time.time())).fetchone()
+        return self._user(row)
+
+    def close_session(self, token):
+        self.db.execute("DELETE FROM sessions WHERE token = ?", (token or "",))
+
+    # ---------- Tags ----------
+    @staticmethod
+    def _tag(row):
+        if row is None:
+            return None
+        return {"id": row["id"], "owner": row["owner"], "name": row["name"], "color": row["color"],
+                "description": row["description"], "isActive": bool(row["is_active"]),
+                "createdAt": row["created_at"]}
+
+    def _insert_tags(self, tags):
+        self.db.executemany(
+            "INSERT INTO tags (id, owner, name, color, description, is_active, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(t["id"], t["owner"], t["name"], t["color"], t["description"], int(t["isActive"]),
+              t["createdAt"]) for t in tags])
+
+    def add_tag(self, owner, name, color, description):
+        tag = _new_tag(owner, name, color, description)
+        self._insert_tags([tag])
+        return tag
+
+    def seed_tags(self, owner, count, prefix="seed"):
+        """Bulk-create count tags for owner in one transaction; returns their ids."""
+        tags = [_new_tag(owner, f"{prefix}-{i}", "#6b7280", "") for i in range(count)]
+        self.db.execute("BEGIN")
+        try:
+            self._insert_tags(tags)
+        except sqlite3.Error:
+            self.db.execute("ROLLBACK")
+            raise
+        self.db.execute("COMMIT")
+        return [t["id"] for t in tags]
+
+    def get_tag(self, tag_id):
+        return self._tag(self.db.execute("SELECT * FROM tags WHERE id = ?", (tag_id,)).fetchone())
+
+    def find_tag(self, owner, name):
+        return self._tag(self.db.execute("SELECT * FROM tags WHERE owner = ? AND name = ?",
+                                         (owner["id"], name)).fetchone())
+
+    def user_tags(self, owner, limit=None, offset=0):
+        rows = self.db.execute("SELECT * FROM tags WHERE owner = ? ORDER BY seq LIMIT ? OFFSET ?",
+                               (owner["id"], -1 if limit is None else limit, offset))
+        return [self._tag(r) for r in rows]
+
+    def count_tags(self, owner):
+        return self.db.execute("SELECT COUNT(*) FROM tags WHERE owner = ?", (owner["id"],)).fetchone()[0]
+
+    def update_tag(self, tag_id, **changes):
+        columns = {_TAG_COLUMNS[k]: (int(v) if k == "isActive" else v)
+                   for k, v in changes.items() if k in _TAG_COLUMNS}
+        if columns:
+            assignments = ", ".join(f"{c} = ?" for c in columns)
+            self.db.execute(f"UPDATE tags SET {assignments} WHERE id = ?", (*columns.values(), tag_id))
+        return self.get_tag(tag_id)
+
+
+BACKENDS = {"memory": Store, "sqlite": SqliteStore}
+
+
+def make_store(backend="memory"):
+    """A fresh store for the named backend ("memory" or "sqlite")."""
+    try:
+        return BACKENDS[backend]()
+    except KeyError:
+        raise ValueError(f"Unknown stand-in backend {backend!r}; choose from {', '.join(BACKENDS)}")
+
+
+def public(record: dict) -> dict:
+    """Record as returned by the API (no password hash or owner id)."""
+    return {k: v for k, v in record.items() if k not in ("password", "owner")}
@@ -1,6 +1,23 @@
 # tests/conftest.py
+import os
 import pytest
 from base.webdriverfactory import WebDriverFactory
+from base.driver_pool import DriverPool
+from base.screenshots import ScreenshotWriter
+from base.html_snapshots import HtmlSnapshots
+from base.auth_session import SessionCache
+from utilities.test_data import TestDataFactory, worker_id as _worker_id
+from utilities.instrumentation import Instrumentation
+from utilities.custom_logger import set_test_context
+from utilities.results_stream import ResultStream
+from standin import StandinClient, StandinServer
+from standin.app import default_user
+
+_POOL_KEY = pytest.StashKey[DriverPool]()
+_INSTRUMENT_KEY = pytest.StashKey[Instrumentation]()
+_STANDIN_KEY = pytest.StashKey[StandinServer]()
+_RESULTS_KEY = pytest.StashKey[ResultStream]()
+_AUTH_KEY = pytest.StashKey[SessionCache]()
 
 # ---------------- CLI options ----------------
 def pytest_addoption(parser):
@@ -8,6 +25,179 @@ def pytest_addoption(parser):
                      help="Browser to run: chrome | firefox")
     parser.addoption("--headless", action="store_true",
                      help="Run headless")
+    parser.addoption("--pool-size", action="store", type=int, default=1,
+                     help="Warm browsers kept for the whole session")
+    parser.addoption("--max-driver-uses", action="store", type=int, default=50,
+                     help="Recycle a pooled browser after this many tests")
+    parser.addoption("--no-pool", action="store_true",
+                     help="Launch and quit a fresh browser for every test")
+    parser.addoption("--shard-index", action="store", type=int, default=0,
+                     help="Index of this shard (set by utilities.parallel_runner)")
+    parser.addoption("--shard-count", action="store", type=int, default=1,
+                     help="Total number of shards")
+    parser.addoption("--instrument", action="store", nargs="?", default=None,
+                     const="reports/instrumentation.json",
+                     help="Time WebDriver commands, sleeps and waits per test/page method "
+                          "and write a JSON report (default reports/instrumentation.json)")
+    parser.addoption("--results", action="store", nargs="?", default=None,
+                     const="reports/results",
+                     help="Stream per-verification and per-test results to <path>.jsonl and "
+                          "<path>.xml (JUnit) while the run goes (default reports/results)")
+    parser.addoption("--html-snapshots", action="store", nargs="?", default=None,
+                     const="html_snapshots",
+                     help="Save the DOM of visited pages (after navigations and at the end of each "
+                          "test) for python -m utilities.locator_check (default dir html_snapshots)")
+    parser.addoption("--auth-via", action="store", choices=("ui", "api"), default=None,
+                     help="How the logged_in fixture captures its cached session: ui (one browser "
+                          "login per process) or api (POST /api/auth/login). Default: api with "
+                          "--standin, else ui")
+    parser.addoption("--standin", action="store_true",
+                     help="Run against the bundled local stand-in app instead of the dev server")
+    parser.addoption("--standin-latency", action="store", type=float, default=0.0,
+                     help="Delay (ms) the stand-in adds to every response")
+    parser.addoption("--standin-jitter", action="store", type=float, default=0.0,
+                     help="Random extra stand-in delay (ms), up to this value")
+
+
+# ---------------- Session setup --------------
+def pytest_configure(config):
+    if config.getoption("--instrument"):
+        config.stash[_INSTRUMENT_KEY] = Instrumentation().install()
+    if config.getoption("--results"):
+        config.stash[_RESULTS_KEY] = ResultStream(config.getoption("--results"), _worker_id()).install()
+    if config.getoption("--html-snapshots"):
+        os.environ["HTML_SNAPSHOT_DIR"] = config.getoption("--html-snapshots")
+    if config.getoption("--standin"):
+        _start_standin(config)
+
+
+def _start_standin(config):
+    """One stand-in per process (so per parallel worker); every URL the suite reads points at it."""
+    server = StandinServer(latency_ms=config.getoption("--standin-latency"),
+                           jitter_ms=config.getoption("--standin-jitter")).start()
+    config.stash[_STANDIN_KEY] = server
+    os.environ["BASE_URL"] = os.environ["TEST_BASE_URL"] = server.base_url
+    account = default_user()
+    os.environ.setdefault("TEST_USERNAME", account["email"])
+    os.environ.setdefault("TEST_PASSWORD", account["password"])
+
+
+def pytest_unconfigure(config):
+    results = config.stash.get(_RESULTS_KEY, None)
+    if results is not None:
+        results.close()
+    server = config.stash.get(_STANDIN_KEY, None)
+    if server is not None:
+        server.stop()
+
+
+# ---------------- Instrumentation ------------
+
+
+def pytest_collection_finish(session):
+    instr = session.config.stash.get(_INSTRUMENT_KEY, None)
+    if instr is not None:
+        instr.instrument_pages()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    instr = item.config.stash.get(_INSTRUMENT_KEY, None)
+    if instr is not None:
+        instr.start_test(item.nodeid)
+    set_test_context(item.nodeid)
+    results = item.config.stash.get(_RESULTS_KEY, None)
+    if results is not None:
+        results.start_test(item.nodeid)
+    yield
+    set_test_context(None)
+    if instr is not None:
+        instr.end_test()
+
+
+# ---------------- Sharding -------------------
+def _shard_key(item):
+    """Tests marked xdist_group(name) must stay on one shard (shared accounts etc.)."""
+    mark = item.get_closest_marker("xdist_group")
+    if mark:
+        return "group:" + (mark.kwargs.get("name") or (mark.args[0] if mark.args else ""))
+    return item.nodeid
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Keep only this shard's items. Items are spread with a longest-first greedy
+    split over durations cached from earlier runs, so shards finish together.
+    """
+    count = config.getoption("--shard-count")
+    if count <= 1:
+        return
+    index = config.getoption("--shard-index")
+    durations = _cached_durations(config, count)
+    default = sum(durations.values()) / len(durations) if durations else 1.0
+
+    units = {}
+    for item in items:
+        units.setdefault(_shard_key(item), []).append(item)
+    cost = {key: sum(durations.get(i.nodeid, default) for i in group)
+            for key, group in units.items()}
+
+    loads = [0.0] * count
+    keep, drop = [], []
+    for key in sorted(units, key=lambda k: (-cost[k], k)):
+        shard = loads.index(min(loads))
+        loads[shard] += cost[key]
+        (keep if shard == index else drop).extend(units[key])
+
+    keep_ids = {id(i) for i in keep}
+    items[:] = [i for i in items if id(i) in keep_ids]
+    config.hook.pytest_deselected(items=drop)
+
+
+# Per-test durations, cached so the next sharded run can balance by them.
+# Each shard keeps its own key (parallel/durations.gw<i>) so concurrent workers
+# never overwrite each other; readers merge them over the unsharded key.
+_DURATIONS = {}
+_DURATIONS_KEY = "parallel/durations"
+
+
+def _cached_durations(config, count):
+    cache = getattr(config, "cache", None)      # None under -p no:cacheprovider
+    if cache is None:
+        return {}
+    durations = dict(cache.get(_DURATIONS_KEY, {}))
+    for i in range(count):
+        durations.update(cache.get(f"{_DURATIONS_KEY}.gw{i}", {}))
+    return durations
+
+
+def pytest_runtest_logreport(report):
+    if report.when == "call":
+        _DURATIONS[report.nodeid] = report.duration
+    if ResultStream.active is not None:
+        ResultStream.active.add_report(report)
+
+
+def pytest_sessionfinish(session):
+    shots = ScreenshotWriter.existing()
+    if shots is not None:
+        shots.flush()
+    instr = session.config.stash.get(_INSTRUMENT_KEY, None)
+    if instr is not None:
+        path = session.config.getoption("--instrument")
+        worker = _worker_id()
+        if worker != "main":
+            path = path.replace(".json", f".{worker}.json")
+        instr.write_json(path)
+        instr.uninstall()
+    cache = getattr(session.config, "cache", None)
+    if _DURATIONS and cache is not None:
+        worker = _worker_id()
+        key = _DURATIONS_KEY if worker == "main" else f"{_DURATIONS_KEY}.{worker}"
+        merged = cache.get(key, {})
+        merged.update(_DURATIONS)
+        cache.set(key, merged)
+
 
 # ---------------- Simple fixtures ------------
 @pytest.fixture(scope="session")
@@ -18,20 +208,78 @@ def browser(request):
 def headless(request):
     return request.config.getoption("--headless")
 
+@pytest.fixture(scope="session")
+def worker_id():
+    """xdist-compatible worker id: gw0, gw1, ... or 'main' when not sharded."""
+    return _worker_id()
+
+@pytest.fixture(scope="session")
+def data_factory(worker_id):
+    """Namespaced emails/names so parallel workers never collide."""
+    return TestDataFactory(worker_id)
+
+@pytest.fixture(scope="session")
+def standin(request):
+    """Client for the stand-in's state endpoints (None unless --standin)."""
+    server = request.config.stash.get(_STANDIN_KEY, None)
+    return StandinClient(server.base_url) if server is not None else None
+
+
+@pytest.fixture(autouse=True)
+def standin_state(standin):
+    """
+    Every test starts from the seeded stand-in state, whatever earlier tests
+    (or other orderings) created - a constant-time snapshot restore.
+    """
+    if standin is not None:
+        standin.reset()
+    yield standin
+
 # Keep your existing 'setUp' usage (no-op fixture)
 @pytest.fixture()
 def setUp():
     yield
 
 # ---------------- Driver factory -------------
+@pytest.fixture(scope="session")
+def driver_pool(request, browser, headless):
+    """
+    Session-wide pool of warm browsers (see base/driver_pool.py).
+    """
+    pool = DriverPool(browser=browser, headless=headless,
+                      size=request.config.getoption("--pool-size"),
+                      max_uses=request.config.getoption("--max-driver-uses"))
+    request.config.stash[_POOL_KEY] = pool
+    yield pool
+    pool.close()
+
+
+def _lease_driver(request, browser, headless):
+    """(driver, cfg, give_back): a pooled browser, or a fresh one with --no-pool."""
+    if request.config.getoption("--no-pool"):
+        wdf = WebDriverFactory(browser=browser, headless=headless)
+        driver, cfg = wdf.getWebDriverInstance()
+        give_back = driver.quit
+    else:
+        pool = request.getfixturevalue("driver_pool")
+        pooled = pool.acquire()
+        driver, cfg = pooled.driver, pooled.cfg
+        give_back = lambda: pool.release(pooled)
+
+    instr = request.config.stash.get(_INSTRUMENT_KEY, None)
+    if instr is not None:
+        instr.instrument_driver(driver)
+    return driver, cfg, give_back
+
+
 @pytest.fixture(scope="function")
 def driver_and_cfg(request, browser, headless):
     """
-    Creates a WebDriver per test using your WebDriverFactory and returns (driver, cfg).
-    Closes the driver after the test.
+    Leases a warm WebDriver from the session pool and returns (driver, cfg).
+    The browser is reset (cookies, storage, windows) and returned after the test.
+    With --no-pool a fresh driver is created per test and closed afterwards.
     """
-    wdf = WebDriverFactory(browser=browser, headless=headless)
-    driver, cfg = wdf.getWebDriverInstance()
+    driver, cfg, give_back = _lease_driver(request, browser, headless)
 
     # expose on test class if present
     if request.cls:
@@ -39,7 +287,21 @@ def driver_and_cfg(request, browser, headless):
         request.cls.cfg = cfg
 
     yield driver, cfg
-    driver.quit()
+    snapshots = HtmlSnapshots.shared()
+    if snapshots is not None:
+        snapshots.capture(driver)
+    give_back()
+
+
+@pytest.fixture(scope="class")
+def class_driver(request, browser, headless):
+    """
+    One browser leased for a whole test class, for data-driven cases that keep
+    a page loaded between them (the class resets its own page state per case).
+    """
+    driver, _, give_back = _lease_driver(request, browser, headless)
+    yield driver
+    give_back()
 
 
 @pytest.fixture(scope="function")
@@ -49,3 +311,64 @@ def driver(driver_and_cfg):
     """
     drv, _ = driver_and_cfg
     return drv
+
+
+# ---------------- Authenticated session ------
+@pytest.fixture(scope="session")
+def auth_cache(request, standin):
+    """
+    Session cache behind `logged_in` (see base/auth_session.py). Against the
+    stand-in its per-test reset revokes tokens, so the token is checked with
+    /api/auth/me before each reuse and captured again through the API when refused.
+    """
+    via = request.config.getoption("--auth-via") or ("api" if standin is not None else "ui")
+    storage_key = validate_path = None
+    if standin is not None:
+        from standin.pages import SESSION_KEY
+        storage_key, validate_path = SESSION_KEY, "/api/auth/me"
+    cache = SessionCache(os.getenv("TEST_BASE_URL") or os.getenv("BASE_URL", ""),
+                         os.getenv("TEST_USERNAME", ""), os.getenv("TEST_PASSWORD", ""),
+                         via=via, api_url=os.getenv("AUTH_API_URL"), storage_key=storage_key,
+                         validate_path=validate_path)
+    request.config.stash[_AUTH_KEY] = cache
+    return cache
+
+
+@pytest.fixture(scope="function")
+def logged_in(driver, auth_cache):
+    """The test's driver, already signed in as TEST_USERNAME and on the dashboard - no UI login."""
+    return auth_cache.apply(driver)
+
+
+# ---------------- Reporting ------------------
+def pytest_terminal_summary(terminalreporter, config):
+    pool = config.stash.get(_POOL_KEY, None)
+    if pool is not None:
+        terminalreporter.write_sep("-", "driver pool")
+        for line in pool.summary():
+            terminalreporter.write_line(line)
+    instr = config.stash.get(_INSTRUMENT_KEY, None)
+    if instr is not None and instr.tests:
+        terminalreporter.write_sep("-", "most wasteful steps (--instrument)")
+        for line in instr.summary_lines():
+            terminalreporter.write_line(line)
+    auth = config.stash.get(_AUTH_KEY, None)
+    if auth is not None and auth.stats["captures"]:
+        terminalreporter.write_sep("-", "auth session cache")
+        for line in auth.summary():
+            terminalreporter.write_line(line)
+    results = config.stash.get(_RESULTS_KEY, None)
+    if results is not None:
+        terminalreporter.write_sep("-", "results")
+        terminalreporter.write_line(f"{results.json_path} and {results.xml_path} "
+                                    f"({results.counts['tests']} tests streamed)")
+    snapshots = HtmlSnapshots.shared()
+    if snapshots is not None and snapshots.stats["captured"]:
+        terminalreporter.write_sep("-", "html snapshots")
+        for line in snapshots.summary():
+            terminalreporter.write_line(line)
+    shots = ScreenshotWriter.existing()
+    if shots is not None and shots.stats["captured"]:
+        terminalreporter.write_sep("-", "screenshots")
+        for line in shots.summary():
+            terminalreporter.write_line(line)
@@ -10,7 +10,6 @@ from utilities.teststatus import TestStatus
 from utilities.util import Util
 import utilities.custom_logger as cl
 import logging
-import time
 import os
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -125,23 +124,28 @@ PASSWORD_MISMATCH_CASES = [
 SQLI_FIRSTNAME = "'; DROP TABLE users; --"
 XSS_LASTNAME = "<script>alert('I AM A SCAMMER');</script>"
 
+# Data-driven cases (SignupFormCasesTests): one parametrized test per entry
+PASSWORD_CASES = [
+    dict(WEAK_PASSWORDS[0], confirm_password=WEAK_PASSWORDS[0]["password"], name="short password"),
+    dict(PASSWORD_MISMATCH_CASES[0], name="password mismatch"),
+]
 
-@pytest.mark.usefixtures("setUp")
-class CreateAccountTests(unittest.TestCase):
-    """Enhanced test class for account creation (no mailbox flow)."""
+SECURITY_CASES = [
+    {"name": "SQL Injection in First Name", "payload": SQLI_FIRSTNAME, "field": "first_name"},
+    {"name": "XSS in Last Name", "payload": XSS_LASTNAME, "field": "last_name"},
+]
 
-    @pytest.fixture(autouse=True)
-    def setUpObject(self, driver):
-        """Setup test objects using the driver fixture."""
-        self.driver = driver
-        self.lp = LoginPage(self.driver)
-        self.ts = TestStatus(self.driver)
-        self.util = Util()
-        self.log = cl.customLogger(logging.DEBUG)
+BOUNDARY_CASES = [
+    {"first_name": "A" * 255, "expected_fail": True, "description": "Very long first name"},
+    {"last_name": "B" * 255, "expected_fail": True, "description": "Very long last name"},
+    {"email": "a" * 290 + "@example.com", "expected_fail": True, "description": "Very long email"},
+    {"first_name": "A", "last_name": "B", "expected_fail": False, "description": "Minimum valid inputs"},
+]
+
+
+class _SignupChecks:
+    """Success/validation checks shared by the signup test classes (need self.driver, self.lp, self.log)."""
 
-    # ------------------------------
-    # Internal helpers
-    # ------------------------------
     def _quiet_find_xpath(self, xpath: str, timeout: int = 2):
         """
         Try to find element by xpath with short timeout and no error log spam.
@@ -194,7 +198,7 @@ class CreateAccountTests(unittest.TestCase):
             return False
 
         except Exception as e:
-            self.log.error(f"Error verifying email/welcome message: {str(e)}")
+            self.log.error("Error verifying email/welcome message: %s", e)
             return False
 
     def get_validation_message(self, field_locator_xpath: str):
@@ -229,9 +233,27 @@ class CreateAccountTests(unittest.TestCase):
             return None
 
         except Exception as e:
-            self.log.error(f"Error getting validation message: {str(e)}")
+            self.log.error("Error getting validation message: %s", e)
             return None
 
+
+@pytest.mark.usefixtures("setUp")
+class CreateAccountTests(_SignupChecks, unittest.TestCase):
+    """Enhanced test class for account creation (no mailbox flow)."""
+
+    @pytest.fixture(autouse=True)
+    def setUpObject(self, driver, data_factory):
+        """Setup test objects using the driver fixture."""
+        self.driver = driver
+        self.data = data_factory
+        self.lp = LoginPage(self.driver)
+        self.ts = TestStatus(self.driver)
+        self.util = Util()
+        self.log = cl.customLogger(logging.DEBUG)
+
+    # ------------------------------
+    # Internal helpers
+    # ------------------------------
     def is_running_locally(self):
         """Retained helper (no external mailbox usage)."""
         try:
@@ -263,13 +285,15 @@ class CreateAccountTests(unittest.TestCase):
         if not VALID_TEST_ACCOUNTS:
             pytest.skip("No VALID_TEST_ACCOUNTS configured in pytest.ini")
 
-        self.log.info(f"Using {len(VALID_TEST_ACCOUNTS)} test accounts from configuration")
+        self.log.info("Using %s test accounts from configuration", len(VALID_TEST_ACCOUNTS))
 
         per_account_results = []
 
         for i, account in enumerate(VALID_TEST_ACCOUNTS):
             try:
-                self.log.info(f"Testing account {i + 1}: {account['email']}")
+                # Plus-addressed alias so parallel workers/runs never reuse an email
+                account = self.data.account(account)
+                self.log.info("Testing account %s: %s", i + 1, account['email'])
 
                 # Complete registration (page object handles navigation, typing, ticking terms, and submit)
                 self.lp.complete_registration(
@@ -279,15 +303,13 @@ class CreateAccountTests(unittest.TestCase):
                     password=account["password"],
                 )
 
-                # Short pause to allow page to update
-                time.sleep(2)
-
+                # complete_registration returns once the submission has settled
                 ok = self.verify_check_your_email_message()
                 self.ts.mark(ok, f"Registration success indicator for {account['email']}")
                 per_account_results.append(ok)
 
             except Exception as e:
-                self.log.error(f"Test failed for {account['email']}: {str(e)}")
+                self.log.error("Test failed for %s: %s", account['email'], e)
                 self.ts.mark(False, f"Registration test failed for {account['email']}: {str(e)}")
                 per_account_results.append(False)
 
@@ -298,60 +320,6 @@ class CreateAccountTests(unittest.TestCase):
             f"Accounts success: {sum(per_account_results)}/{len(per_account_results)}",
         )
 
-    @pytest.mark.negative
-    def test_password_validation_enhanced(self):
-        """
-        TC_REG_002: Test password validation including short password and mismatch.
-        """
-        self.log.info("Starting test_password_validation_enhanced")
-
-        test_results = []
-
-        # A) Short password
-        try:
-            self.log.info("Testing short password validation")
-            self.lp.complete_registration(
-                first_name="Johnpo",
-                last_name="Doekll",
-                email="test@example.com",
-                password="short7!",  # too short
-                confirm_password="short7!",
-            )
-            time.sleep(2)
-            # Success indicators should NOT appear
-            ok = not self.verify_check_your_email_message()
-            self.ts.mark(ok, "Short password properly rejected")
-            test_results.append(ok)
-        except Exception as e:
-            self.log.error(f"Short password test failed: {str(e)}")
-            test_results.append(False)
-
-        # B) Password mismatch
-        try:
-            self.log.info("Testing password mismatch validation")
-            self.lp.navigate_to_signup_page()
-            self.lp.complete_registration(
-                first_name="Johnpp",
-                last_name="Doekk",
-                email="test2@example.com",
-                password="ValidPass123!",
-                confirm_password="DifferentPass123!",
-            )
-            time.sleep(2)
-            ok = not self.verify_check_your_email_message()
-            self.ts.mark(ok, "Password mismatch properly rejected")
-            test_results.append(ok)
-        except Exception as e:
-            self.log.error(f"Password mismatch test failed: {str(e)}")
-            test_results.append(False)
-
-        overall = all(test_results)
-        self.ts.markFinal(
-            "test_password_validation_enhanced",
-            overall,
-            f"Password validation tests: {sum(test_results)}/{len(test_results)} passed",
-        )
-
     @pytest.mark.negative
     def test_registration_empty_fields_with_messages(self):
         """
@@ -365,7 +333,6 @@ class CreateAccountTests(unittest.TestCase):
             # Only first name filled, others empty
             self.lp.enter_first_name("John")
             self.lp.click_create_account()
-            time.sleep(1)
 
             # Success indicators should NOT appear
             if self.verify_check_your_email_message():
@@ -393,7 +360,7 @@ class CreateAccountTests(unittest.TestCase):
             )
 
         except Exception as e:
-            self.log.error(f"Test failed with exception: {str(e)}")
+            self.log.error("Test failed with exception: %s", e)
             self.ts.markFinal(
                 "test_registration_empty_fields_with_messages",
                 False,
@@ -411,13 +378,12 @@ class CreateAccountTests(unittest.TestCase):
             self.lp.navigate_to_signup_page()
             self.lp.enter_first_name("JohnGood")
             self.lp.enter_last_name("DoeGood")
-            self.lp.enter_email("testtest@example.com")
+            self.lp.enter_email(self.data.email("testtest"))
             self.lp.enter_password("TalltttBuildings123!")
             self.lp.enter_confirm_password("TalltttBuildings123!")
 
             # Intentionally DO NOT accept terms
             self.lp.click_create_account()
-            time.sleep(1)
 
             # HTML5 constraint validation message on the required checkbox
             terms_xpath = (
@@ -444,64 +410,13 @@ class CreateAccountTests(unittest.TestCase):
             )
 
         except Exception as e:
-            self.log.error(f"Test failed with exception: {str(e)}")
+            self.log.error("Test failed with exception: %s", e)
             self.ts.markFinal(
                 "test_terms_checkbox_validation",
                 False,
                 f"Test failed with exception: {str(e)}",
             )
 
-    @pytest.mark.security
-    def test_security_comprehensive_assessment(self):
-        """
-        TC_REG_006: Basic security payload handling (sanitized/rejected either is acceptable).
-        """
-        self.log.info("Starting comprehensive security assessment")
-
-        security_tests = [
-            {"name": "SQL Injection in First Name", "payload": SQLI_FIRSTNAME, "field": "first_name"},
-            {"name": "XSS in Last Name", "payload": XSS_LASTNAME, "field": "last_name"},
-        ]
-
-        results = []
-
-        for test in security_tests:
-            try:
-                self.log.info(f"Testing: {test['name']}")
-                self.lp.navigate_to_signup_page()
-
-                if test["field"] == "first_name":
-                    self.lp.inject_sql_payload("first_name", test["payload"])
-                    self.lp.enter_last_name("Doe")
-                else:
-                    self.lp.enter_first_name("John")
-                    self.lp.inject_xss_payload("last_name", test["payload"])
-
-                self.lp.enter_email("security3333@test.com")
-                self.lp.enter_password("TalluuBuildingstttt123!")
-                self.lp.enter_confirm_password("TalluuBuildingstttt123!")
-                self.lp.accept_terms_and_conditions()
-
-                self.lp.click_create_account()
-                time.sleep(2)
-
-                # Either sanitized (success indicator appears) or rejected (no success) is acceptable
-                handled = True
-                self.ts.mark(handled, f"{test['name']}: Payload handled safely")
-                results.append(handled)
-
-            except Exception as e:
-                self.log.error(f"Error in security test {test['name']}: {str(e)}")
-                self.ts.mark(False, f"{test['name']} failed with exception")
-                results.append(False)
-
-        overall = all(results)
-        self.ts.markFinal(
-            "test_security_comprehensive_assessment",
-            overall,
-            f"Security assessment: {sum(results)}/{len(results)} tests passed",
-        )
-
     @pytest.mark.ui
     def test_form_validation_ui_elements(self):
         """
@@ -524,8 +439,9 @@ class CreateAccountTests(unittest.TestCase):
             ]
 
             all_present = True
+            snap = self.lp.snapshot([locator for locator, _ in elements_check])
             for locator, name in elements_check:
-                present = self.lp.isElementPresent(locator, "xpath")
+                present = snap[locator]["present"]
                 self.ts.mark(present, f"{name} present")
                 if not present:
                     all_present = False
@@ -537,68 +453,185 @@ class CreateAccountTests(unittest.TestCase):
             )
 
         except Exception as e:
-            self.log.error(f"Test failed with exception: {str(e)}")
+            self.log.error("Test failed with exception: %s", e)
             self.ts.markFinal(
                 "test_form_validation_ui_elements",
                 False,
                 f"Test failed with exception: {str(e)}",
             )
 
-    @pytest.mark.boundary
-    def test_boundary_values_enhanced(self):
+
+# ------------------------------
+#     DATA-DRIVEN SIGNUP CASES
+# ------------------------------
+@pytest.fixture(scope="class")
+def signup_page(class_driver):
+    """The signup page, loaded once per class (so once per worker) and shared by its cases."""
+    page = LoginPage(class_driver)
+    page.navigate_to_signup_page()
+    return page
+
+
+@pytest.fixture()
+def signup_form(signup_page):
+    """signup_page with its form reset in place for the next case (no driver.get)."""
+    signup_page.reset_signup_form()
+    return signup_page
+
+
+def _case_id(key):
+    return lambda case: case[key]
+
+
+@pytest.mark.usefixtures("setUp")
+class SignupFormCasesTests(_SignupChecks):
+    """
+    Table-driven registration cases. Every case reuses the one loaded signup page:
+    the form is reset in place between cases and the submit waits for the page to
+    settle, instead of reloading the page and sleeping per case.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setUpObject(self, signup_form, data_factory):
+        """Setup test objects on the shared signup page."""
+        self.lp = signup_form
+        self.driver = signup_form.driver
+        self.data = data_factory
+        self.ts = TestStatus(self.driver)
+        self.log = cl.customLogger(logging.DEBUG)
+
+    @pytest.mark.negative
+    def test_invalid_emails_rejected_by_browser(self):
         """
-        TC_REG_008: Boundary values with success indicator .
+        TC_REG_003: Every INVALID_EMAILS value fails the email input's HTML5 validation.
+        All values (plus one valid control) are checked in one round trip, no submits.
         """
-        self.log.info("Starting test_boundary_values_enhanced")
+        self.log.info("Starting test_invalid_emails_rejected_by_browser")
+
+        control = self.data.email("control")
+        verdicts = self.lp.validate_emails([case["email"] for case in INVALID_EMAILS] + [control])
+        if verdicts is None:
+            self.ts.markFinal("test_invalid_emails_rejected_by_browser", False, "Email field not found")
+            return
+
+        *rejected, accepted = verdicts
+        for case, verdict in zip(INVALID_EMAILS, rejected):
+            self.ts.mark(not verdict["valid"], f"{case['email']} rejected ({', '.join(verdict['failed'])})")
+            # Browser texts vary by browser/OS, so a different message is only logged
+            if verdict["message"] and case["expected_message"] not in verdict["message"]:
+                self.log.info("%s: browser says %r", case["email"], verdict["message"])
+        self.ts.mark(accepted["valid"], f"{control} accepted")
 
-        test_cases = [
-            {"first_name": "A" * 255, "expected_fail": True, "description": "Very long first name"},
-            {"last_name": "B" * 255, "expected_fail": True, "description": "Very long last name"},
-            {"email": "a" * 290 + "@example.com", "expected_fail": True, "description": "Very long email"},
-            {"first_name": "A", "last_name": "B", "expected_fail": False, "description": "Minimum valid inputs"},
-        ]
+        self.ts.markFinal(
+            "test_invalid_emails_rejected_by_browser",
+            not any(v["valid"] for v in rejected) and accepted["valid"],
+            f"Invalid emails rejected: {sum(not v['valid'] for v in rejected)}/{len(rejected)}",
+        )
 
-        results = []
+    @pytest.mark.negative
+    @pytest.mark.parametrize("case", PASSWORD_CASES, ids=_case_id("name"))
+    def test_password_validation_enhanced(self, case):
+        """
+        TC_REG_002: Test password validation including short password and mismatch.
+        """
+        self.log.info("Testing %s validation", case["name"])
 
-        for i, tc in enumerate(test_cases):
-            try:
-                self.log.info("Boundary case %d: %s", i + 1, tc["description"])
+        ok = False
+        try:
+            self.lp.complete_registration(
+                first_name="Johnpo",
+                last_name="Doekll",
+                email=self.data.email("test"),
+                password=case["password"],
+                confirm_password=case["confirm_password"],
+            )
+            # Success indicators should NOT appear
+            ok = not self.verify_check_your_email_message()
+            self.ts.mark(ok, f"{case['name'].capitalize()} properly rejected")
+        except Exception as e:
+            self.log.error("%s test failed: %s", case["name"], e)
+            self.ts.mark(False, f"{case['name']} failed with exception")
 
-                first_name = tc.get("first_name", "John")
-                last_name = tc.get("last_name", "Doe")
-                email = tc.get("email", f"test{i}@example.com")
+        self.ts.markFinal(
+            "test_password_validation_enhanced",
+            ok,
+            f"Password validation ({case['name']}): {'passed' if ok else 'failed'}",
+        )
 
-                self.lp.complete_registration(
-                    first_name=first_name,
-                    last_name=last_name,
-                    email=email,
-                    password="TallBuildings123!",
-                )
+    @pytest.mark.security
+    @pytest.mark.parametrize("case", SECURITY_CASES, ids=_case_id("name"))
+    def test_security_comprehensive_assessment(self, case):
+        """
+        TC_REG_006: Basic security payload handling (sanitized/rejected either is acceptable).
+        """
+        self.log.info("Testing: %s", case["name"])
 
-                time.sleep(2)
+        handled = False
+        try:
+            if case["field"] == "first_name":
+                self.lp.inject_sql_payload("first_name", case["payload"])
+                self.lp.enter_last_name("Doe")
+            else:
+                self.lp.enter_first_name("John")
+                self.lp.inject_xss_payload("last_name", case["payload"])
+
+            self.lp.enter_email(self.data.email("security", "test.com"))
+            self.lp.enter_password("TalluuBuildingstttt123!")
+            self.lp.enter_confirm_password("TalluuBuildingstttt123!")
+            self.lp.accept_terms_and_conditions()
 
-                success = self.verify_check_your_email_message()
+            self.lp.click_create_account()
 
-                if tc.get("expected_fail", False):
-                    # Expected rejection: success indicator should NOT appear
-                    test_passed = not success
-                    msg = f"Boundary case {i + 1} properly rejected"
-                else:
-                    # Expected acceptance: success indicator should appear
-                    test_passed = success
-                    msg = f"Boundary case {i + 1} properly accepted"
+            # Either sanitized (success indicator appears) or rejected (no success) is acceptable
+            handled = True
+            self.ts.mark(handled, f"{case['name']}: Payload handled safely")
 
-                self.ts.mark(test_passed, msg)
-                results.append(test_passed)
+        except Exception as e:
+            self.log.error("Error in security test %s: %s", case["name"], e)
+            self.ts.mark(False, f"{case['name']} failed with exception")
 
-            except Exception as e:
-                self.log.error(f"Boundary test case {i + 1} failed: {str(e)}")
-                self.ts.mark(False, f"Boundary case {i + 1} failed with exception")
-                results.append(False)
+        self.ts.markFinal(
+            "test_security_comprehensive_assessment",
+            handled,
+            f"Security assessment ({case['name']}): {'passed' if handled else 'failed'}",
+        )
+
+    @pytest.mark.boundary
+    @pytest.mark.parametrize("case", BOUNDARY_CASES, ids=_case_id("description"))
+    def test_boundary_values_enhanced(self, case):
+        """
+        TC_REG_008: Boundary values with success indicator .
+        """
+        self.log.info("Boundary case: %s", case["description"])
+
+        test_passed = False
+        try:
+            self.lp.complete_registration(
+                first_name=case.get("first_name", "John"),
+                last_name=case.get("last_name", "Doe"),
+                email=case.get("email") or self.data.email("boundary"),
+                password="TallBuildings123!",
+            )
+
+            success = self.verify_check_your_email_message()
+
+            if case.get("expected_fail", False):
+                # Expected rejection: success indicator should NOT appear
+                test_passed = not success
+                msg = f"{case['description']} properly rejected"
+            else:
+                # Expected acceptance: success indicator should appear
+                test_passed = success
+                msg = f"{case['description']} properly accepted"
+
+            self.ts.mark(test_passed, msg)
+
+        except Exception as e:
+            self.log.error("Boundary case %s failed: %s", case["description"], e)
+            self.ts.mark(False, f"{case['description']} failed with exception")
 
-        overall = all(results)
         self.ts.markFinal(
             "test_boundary_values_enhanced",
-            overall,
-            f"Boundary value testing: {sum(results)}/{len(results)} passed",
+            test_passed,
+            f"Boundary value testing ({case['description']}): {'passed' if test_passed else 'failed'}",
         )
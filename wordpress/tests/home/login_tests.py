@@ -28,6 +28,8 @@ os.environ['USERNAME'] = os.getenv('TEST_USERNAME', '')
 os.environ['PASSWORD'] = os.getenv('TEST_PASSWORD', '')
 os.environ['BASE_URL'] = os.getenv('TEST_BASE_URL', 'https://dev-verbatimly.onrender.com')
 
+# All tests log in/out of the same account, so keep them on one worker
+@pytest.mark.xdist_group(name="login_account")
 @pytest.mark.usefixtures("setUp")
 class LoginTests2(unittest.TestCase):
     """Focused test class for essential authentication functionality"""
@@ -58,7 +60,7 @@ class LoginTests2(unittest.TestCase):
                 self.ts.markFinal("test_valid_login_and_welcome_message", False, "Environment credentials not found")
                 return
 
-            self.log.info(f"Testing login with: {username}")
+            self.log.info("Testing login with: %s", username)
 
             # Perform login
             login_result = self.lp.perform_login(username, password)
@@ -79,35 +81,22 @@ class LoginTests2(unittest.TestCase):
             )
 
         except Exception as e:
-            self.log.error(f"Test failed: {str(e)}")
+            self.log.error("Test failed: %s", e)
             self.ts.markFinal("test_valid_login_and_welcome_message", False, f"Test failed: {str(e)}")
 
     @pytest.mark.smoke
+    @pytest.mark.usefixtures("logged_in")
     def test_login_logout_welcome_back(self):
         """
-        Test complete login-logout flow and verify "Welcome back"
-        Expected: Login successfully, logout, and see "Welcome back" message
+        Test logout from a signed-in session and verify "Welcome back"
+        Expected: Dashboard shows, logout, and see "Welcome back" message
+        The session comes from the logged_in fixture's cache; the UI login
+        itself is covered by test_valid_login_and_welcome_message.
         """
         self.log.info("Starting test_login_logout_welcome_back")
 
         try:
-            username = os.getenv('USERNAME')
-            password = os.getenv('PASSWORD')
-
-            if not username or not password:
-                self.ts.markFinal("test_login_logout_welcome_back", False, "Environment credentials not found")
-                return
-
-            # Step 1: Login
-            self.log.info("Step 1: Performing login")
-            login_result = self.lp.perform_login(username, password)
-            self.ts.mark(login_result, "Login completed")
-
-            if not login_result:
-                self.ts.markFinal("test_login_logout_welcome_back", False, "Login failed")
-                return
-
-            # Step 2: Verify login success
+            # Step 1: Verify the cached session shows the dashboard (logged_in fixture)
             login_success = self.lp.verify_login_success()
             self.ts.mark(login_success, "Login success verified")
 
@@ -115,15 +104,15 @@ class LoginTests2(unittest.TestCase):
                 self.ts.markFinal("test_login_logout_welcome_back", False, "Login verification failed")
                 return
 
-            # Step 3: Logout
+            # Step 2: Logout
             self.log.info("Step 2: Performing logout")
             logout_result = self.lp.perform_logout()
             self.ts.mark(logout_result, "Logout completed")
-            # Step 4: Verify "Welcome back" message
+            # Step 3: Verify "Welcome back" message
             welcome_back = self.lp.verify_welcome_back_message()
             self.ts.mark(welcome_back, "Welcome back message verified")
 
-            overall_success = login_result and login_success and logout_result and welcome_back
+            overall_success = login_success and logout_result and welcome_back
 
             self.ts.markFinal(
                 "test_login_logout_welcome_back",
@@ -132,7 +121,7 @@ class LoginTests2(unittest.TestCase):
             )
 
         except Exception as e:
-            self.log.error(f"Test failed: {str(e)}")
+            self.log.error("Test failed: %s", e)
             self.ts.markFinal("test_login_logout_welcome_back", False, f"Test failed: {str(e)}")
 
     #
@@ -152,17 +141,20 @@ class LoginTests2(unittest.TestCase):
                 self.ts.markFinal("test_login_page_elements", False, "Failed to navigate to login page")
                 return
 
-            # Check essential elements
-            email_present = self.lp.isElementPresent(self.lp._email_input, "xpath")
+            # Check essential elements (one snapshot for all of them)
+            snap = self.lp.snapshot([self.lp._email_input, self.lp._password_input,
+                                     self.lp._login_submit_button, self.lp._forgot_password_link])
+
+            email_present = snap[self.lp._email_input]["present"]
             self.ts.mark(email_present, "Email input field present")
 
-            password_present = self.lp.isElementPresent(self.lp._password_input, "xpath")
+            password_present = snap[self.lp._password_input]["present"]
             self.ts.mark(password_present, "Password input field present")
 
-            login_button_present = self.lp.isElementPresent(self.lp._login_submit_button, "xpath")
+            login_button_present = snap[self.lp._login_submit_button]["present"]
             self.ts.mark(login_button_present, "Login button present")
 
-            forgot_password_present = self.lp.isElementPresent(self.lp._forgot_password_link, "xpath")
+            forgot_password_present = snap[self.lp._forgot_password_link]["present"]
             self.ts.mark(forgot_password_present, "Forgot password link present")
 
             all_elements_present = all([email_present, password_present, login_button_present, forgot_password_present])
@@ -174,7 +166,7 @@ class LoginTests2(unittest.TestCase):
             )
 
         except Exception as e:
-            self.log.error(f"Test failed: {str(e)}")
+            self.log.error("Test failed: %s", e)
             self.ts.markFinal("test_login_page_elements", False, f"Test failed: {str(e)}")
 
 if __name__ == '__main__':
@@ -0,0 +1,57 @@
+"""
+Unit tests for base.auth_session: an unreachable or silent auth API is an AuthError, not a traceback.
+No browser; run with  pytest tests/unit
+"""
+
+import socket
+
+import pytest
+
+from base.auth_session import AuthError, AuthSession, SessionCache
+
+
+@pytest.fixture
+def refused_url():
+    """A local port with nothing listening on it."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+@pytest.fixture
+def silent_url():
+    """A local port that accepts connections and never answers."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen(8)
+        yield f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+
+def _cache(api_url, **kwargs):
+    return SessionCache(api_url, "user@example.com", "secret", via="api", api_url=api_url,
+                        storage_key="sb-test-auth-token", timeout=0.3, **kwargs)
+
+
+class CaptureApiTests:
+
+    def test_connection_refused_is_auth_error(self, refused_url):
+        with pytest.raises(AuthError, match="unreachable"):
+            _cache(refused_url).capture_api()
+
+    def test_timeout_is_auth_error(self, silent_url):
+        with pytest.raises(AuthError, match="unreachable"):
+            _cache(silent_url).capture_api()
+
+
+class ValidTests:
+
+    @pytest.mark.parametrize("url", ["refused_url", "silent_url"])
+    def test_unreachable_check_means_not_valid(self, url, request):
+        api_url = request.getfixturevalue(url)
+        session = AuthSession(api_url, [], {}, token="abc", source="api")
+        assert _cache(api_url, validate_path="/api/auth/me")._valid(session) is False
+
+    def test_without_validate_path_unexpired_is_valid(self, refused_url):
+        session = AuthSession(refused_url, [], {}, token="abc", source="api")
+        assert _cache(refused_url)._valid(session) is True
@@ -0,0 +1,114 @@
+"""
+Unit tests for base.locator_registry.xpath_to_css and the profiler's verification rule.
+No browser; run with  pytest tests/unit
+"""
+
+import json
+
+import pytest
+
+from base.locator_registry import LocatorRegistry, css_fast_path, xpath_to_css
+from utilities.locator_profile import LocatorProfile, _PROFILE_JS, registry_entries
+
+
+class XPathToCssTests:
+
+    @pytest.mark.parametrize("xpath, css", [
+        # ids and attributes
+        ("//input[@id='firstName']", "input#firstName"),
+        ("//*[@id='x']", "#x"),
+        ("//input[@id='first name']", 'input[id="first name"]'),
+        ("//div[@id='2x']", 'div[id="2x"]'),
+        ("//input[@id='a'][@type='text']", 'input#a[type="text"]'),
+        ("//input[@id='a' and @type='text']", 'input#a[type="text"]'),
+        ("//button[@disabled]", "button[disabled]"),
+        ("//a[contains(@class, 'btn')]", 'a[class*="btn"]'),
+        ("//a[starts-with(@href, '/auth')]", 'a[href^="/auth"]'),
+        ("//input[@value='']", 'input[value=""]'),
+        # combinators
+        ("//div/span", "div > span"),
+        ("//div//span", "div span"),
+        ("//form//*[@name='email']", 'form [name="email"]'),
+        ("//DIV", "div"),
+        ("//*", "*"),
+        # unions, with | inside a value left alone
+        ("//a | //b", "a, b"),
+        ("//a[@href='/a|b'] | //b", 'a[href="/a|b"], b'),
+        # quoting: ' inside "..." is fine, " is not
+        ('//a[@title="it\'s"]', 'a[title="it\'s"]'),
+        ("//a[@title='x and y']", 'a[title="x and y"]'),
+    ])
+    def test_compiles(self, xpath, css):
+        assert xpath_to_css(xpath) == css
+
+    @pytest.mark.parametrize("xpath", [
+        # position
+        "//li[1]", "//li[last()]", "(//a)[1]", "//li[position() > 1]",
+        # text
+        "//div[text()='x']", "//a[contains(text(), 'x')]", "//a[normalize-space()='x']",
+        "//button[contains(translate(text(), 'ABC', 'abc'), 'a')]",
+        # axes and relative or absolute paths
+        "//div/following-sibling::div", "//div/..", "//div[./span]", "/html/body", "div", ".//a",
+        # boolean logic CSS cannot say exactly
+        "//a[@x='1' or @y='2']", "//a[not(@x)]",
+        # values CSS would read differently
+        "//a[@title='say \"hi\"']", "//input[@value='a\\b']", "//a[contains(@class, '')]",
+        "//a[starts-with(@href, '')]",
+        # names that are not plain CSS identifiers
+        "//my.tag", "//svg:path",
+    ])
+    def test_leaves_to_xpath(self, xpath):
+        assert xpath_to_css(xpath) is None
+
+    def test_fast_path(self):
+        assert css_fast_path("#email") == ("id", "email")
+        assert css_fast_path("input#email") == ("css", "input#email")
+
+
+class _FakeDriver:
+    """execute_script stand-in: every locator matches `matches` nodes, CSS 4x faster."""
+
+    def __init__(self, matches):
+        self.matches = matches
+
+    def execute_script(self, script, specs, *args):
+        if script is _PROFILE_JS:
+            return [[self.matches, [4.0 if by == "xpath" else 1.0] * 5] for _, by in specs]
+        return [True for _ in specs]
+
+
+class VerificationTests:
+    XPATH = "//input[@id='email']"
+
+    def _rows(self, *page_matches):
+        profile = LocatorProfile([("LoginPage._email_field", self.XPATH)])
+        for i, matches in enumerate(page_matches):
+            profile.measure(_FakeDriver(matches), f"/page{i}", runs=1)
+        return profile.ranking()
+
+    def test_rewrite_matching_somewhere_is_verified(self):
+        row, = self._rows(0, 1)
+        assert row["verified"] and row["speedup"] == 4.0
+        assert registry_entries([row]) == {self.XPATH: {"by": "css", "locator": "input#email", "verified": True,
+                                                        "xpath_us": 4.0, "css_us": 1.0}}
+
+    def test_rewrite_matching_nowhere_is_not_verified(self):
+        row, = self._rows(0, 0)
+        assert not row["verified"]
+        assert registry_entries([row]) == {}
+
+    def test_registry_uses_verified_entries_only(self, tmp_path, monkeypatch):
+        path = tmp_path / "registry.json"
+        path.write_text(json.dumps({
+            "//a[@id='ok']": {"by": "id", "locator": "ok", "verified": True},
+            "//a[@id='no']": {"by": "id", "locator": "no", "verified": False},
+        }), encoding="utf-8")
+        monkeypatch.setattr(LocatorRegistry, "FILE", str(path))
+        monkeypatch.setattr(LocatorRegistry, "ENABLED", True)
+        LocatorRegistry.reload()
+        try:
+            assert LocatorRegistry.fast("//a[@id='ok']") == ("ok", "id")
+            assert LocatorRegistry.fast("//a[@id='no']") == ("//a[@id='no']", "xpath")
+            assert LocatorRegistry.fast("ok", "id") == ("ok", "id")
+        finally:
+            LocatorRegistry.reload()
@@ -0,0 +1,142 @@
+"""
+Unit tests for utilities.pm_script: JavaScript semantics the Postman scripts rely on.
+No browser or network; run with  pytest tests/unit
+"""
+
+import math
+
+import pytest
+
+from utilities.pm_script import BUILTINS, UNDEF, Interpreter, JSError, Untranslatable, js_num_str
+
+
+def js(expr):
+    """Value of a JavaScript expression."""
+    out = []
+    Interpreter({**BUILTINS, "emit": out.append}).run(f"emit({expr});")
+    return out[0]
+
+
+class LooseEqualityTests:
+
+    @pytest.mark.parametrize("expr, expected", [
+        ("null == undefined", True),
+        ("null === undefined", False),
+        ("1 == '1'", True),
+        ("1 === '1'", False),
+        ("0 == false", True),
+        ("'' == 0", True),
+        ("'0' == false", True),
+        ("null == 0", False),
+        ("undefined == false", False),
+        ("[1] == 1", True),
+        ("[1, 2] == '1,2'", True),
+        ("NaN == NaN", False),
+        ("'a' != 'b'", True),
+        ("1 != '1'", False),
+        ("1 !== '1'", True),
+    ])
+    def test_equality(self, expr, expected):
+        assert js(expr) is expected
+
+
+class NumberConversionTests:
+
+    @pytest.mark.parametrize("expr, expected", [
+        ("parseInt('12px')", 12),
+        ("parseInt('  -42abc')", -42),
+        ("parseInt('0x1f')", 31),
+        ("parseInt('ff', 16)", 255),
+        ("parseInt('101', 2)", 5),
+        ("parseFloat('3.5abc')", 3.5),
+        ("parseFloat('.5e1x')", 5.0),
+        ("parseFloat('-Infinityx')", float("-inf")),
+        ("Number('')", 0),
+        ("Number(null)", 0),
+        ("Number(' 12 ')", 12.0),
+        ("Number('0x10')", 16),
+        ("Number(true)", 1),
+        ("Number([])", 0),
+        ("+'1e3'", 1000.0),
+        ("null + 1", 1),
+    ])
+    def test_number(self, expr, expected):
+        assert js(expr) == expected
+
+    @pytest.mark.parametrize("expr", ["parseInt('px12')", "parseInt('12', 1)", "parseFloat('abc')",
+                                      "Number('12px')", "Number(undefined)", "Number('1_000')",
+                                      "Number({})", "NaN"])
+    def test_nan(self, expr):
+        assert math.isnan(js(expr))
+
+    def test_bitwise_on_nan_is_zero(self):
+        assert js("~NaN") == -1 and js("NaN | 0") == 0
+
+
+class StringConversionTests:
+
+    @pytest.mark.parametrize("value, expected", [
+        (1.0, "1"), (0.1, "0.1"), (-2.5, "-2.5"), (1e21, "1e+21"), (1e16, "10000000000000000"),
+        (1.5e-7, "1.5e-7"), (1e-6, "0.000001"), (123456789.125, "123456789.125"),
+        (float("inf"), "Infinity"), (float("-inf"), "-Infinity"), (float("nan"), "NaN"), (-0.0, "0"),
+        (10 ** 21, "1e+21"),
+    ])
+    def test_number_to_string(self, value, expected):
+        assert js_num_str(value) == expected
+
+    @pytest.mark.parametrize("expr, expected", [
+        ("String([1, 2])", "1,2"),
+        ("String([1, [2, 3], null])", "1,2,3,"),
+        ("'' + {}", "[object Object]"),
+        ("[1] + [2]", "12"),
+        ("`${1 / 0}`", "Infinity"),
+        ("'x' + 2 * 3", "x6"),
+        ("(255).toString(16)", "ff"),
+        ("(1 / 0).toFixed(2)", "Infinity"),
+        ("(2.5).toFixed(1)", "2.5"),
+    ])
+    def test_to_string(self, expr, expected):
+        assert js(expr) == expected
+
+
+class JsonTests:
+
+    @pytest.mark.parametrize("expr, expected", [
+        ("JSON.stringify({a: 1})", '{"a":1}'),
+        ("JSON.stringify([1, 2.5, 'x', true, null])", '[1,2.5,"x",true,null]'),
+        ("JSON.stringify({a: undefined, b: NaN})", '{"b":null}'),
+        ("JSON.stringify([undefined])", "[null]"),
+        ("JSON.stringify({a: [1], b: {}}, null, 2)", '{\n  "a": [\n    1\n  ],\n  "b": {}\n}'),
+        ("JSON.stringify('café')", '"café"'),
+        ("JSON.parse('{\"a\": [1, 2]}').a[1]", 2),
+    ])
+    def test_json(self, expr, expected):
+        assert js(expr) == expected
+
+    def test_stringify_undefined_is_undefined(self):
+        assert js("JSON.stringify(undefined)") is UNDEF
+
+    def test_parse_error_is_a_script_error(self):
+        with pytest.raises(JSError, match="SyntaxError"):
+            js("JSON.parse('{oops')")
+
+    def test_replacer_is_untranslatable(self):
+        with pytest.raises(Untranslatable):
+            js("JSON.stringify({a: 1}, ['a'])")
+
+
+class MathTests:
+
+    @pytest.mark.parametrize("expr, expected", [
+        ("Math.max()", float("-inf")),
+        ("Math.min()", float("inf")),
+        ("Math.max(1, '3', 2)", 3.0),
+        ("Math.round(-2.5)", -2),
+        ("Math.floor(1 / 0)", float("inf")),
+        ("isFinite('12')", True),
+    ])
+    def test_math(self, expr, expected):
+        assert js(expr) == expected
+
+    def test_max_with_nan(self):
+        assert math.isnan(js("Math.max(1, 'x')"))
@@ -0,0 +1,70 @@
+"""
+Unit tests for utilities.results_stream: merging per-worker results, including workers that died.
+No browser; run with  pytest tests/unit
+"""
+
+import xml.etree.ElementTree as ET
+
+from utilities.results_stream import ResultStream, merge_results
+
+
+class _Report:
+    """The fields of a pytest TestReport that ResultStream reads."""
+
+    def __init__(self, nodeid, when, outcome="passed", longrepr=None, duration=0.01):
+        self.nodeid, self.when, self.outcome = nodeid, when, outcome
+        self.longrepr, self.duration = longrepr, duration
+
+
+def _run(stream, nodeid, outcome="passed"):
+    stream.start_test(nodeid)
+    stream.add_report(_Report(nodeid, "setup"))
+    stream.add_report(_Report(nodeid, "call", outcome, "assert False" if outcome == "failed" else None))
+    stream.add_report(_Report(nodeid, "teardown"))
+
+
+def _abandon(stream):
+    """What a killed worker leaves: flushed files, no close()."""
+    stream._xml.close()
+    stream._json.close()
+
+
+class MergeResultsTests:
+
+    def test_closed_workers(self, tmp_path):
+        for worker in ("gw0", "gw1"):
+            stream = ResultStream(tmp_path / "results", worker)
+            _run(stream, f"tests/home/a_tests.py::ATests::test_{worker}")
+            stream.close()
+        totals = merge_results(tmp_path / "results", 2)
+        assert totals == {"tests": 2, "failures": 0, "errors": 0, "skipped": 0}
+        root = ET.parse(tmp_path / "results.xml").getroot()
+        assert root.get("tests") == "2" and len(root.findall("testsuite")) == 2
+        assert not (tmp_path / "results.gw0.xml").exists()
+
+    def test_unclosed_worker_keeps_finished_tests(self, tmp_path):
+        dead = ResultStream(tmp_path / "results", "gw0")
+        _run(dead, "tests/home/a_tests.py::ATests::test_one")
+        _run(dead, "tests/home/a_tests.py::ATests::test_two", "failed")
+        dead.start_test("tests/home/a_tests.py::ATests::test_three")     # killed mid-test
+        _abandon(dead)
+        alive = ResultStream(tmp_path / "results", "gw1")
+        _run(alive, "tests/home/b_tests.py::BTests::test_one")
+        alive.close()
+
+        totals = merge_results(tmp_path / "results", 2)
+        assert totals == {"tests": 3, "failures": 1, "errors": 0, "skipped": 0}
+        names = [case.get("name") for case in ET.parse(tmp_path / "results.xml").getroot().iter("testcase")]
+        assert sorted(names) == ["test_one", "test_one", "test_two"]
+        assert (tmp_path / "results.jsonl").read_text(encoding="utf-8").count('"type": "test"') == 3
+
+    def test_half_written_testcase_is_dropped(self, tmp_path):
+        dead = ResultStream(tmp_path / "results", "gw0")
+        _run(dead, "tests/home/a_tests.py::ATests::test_one")
+        dead._xml.write(b'<testcase classname="tests.home.a_tests.ATests" name="test_tw')
+        _abandon(dead)
+
+        totals = merge_results(tmp_path / "results", 1)
+        assert totals["tests"] == 1
+        names = [case.get("name") for case in ET.parse(tmp_path / "results.xml").getroot().iter("testcase")]
+        assert names == ["test_one"]
@@ -0,0 +1,113 @@
+"""
+Unit tests for the shard split in tests/conftest.py (pytest --shard-index/--shard-count).
+No browser; run with  pytest tests/unit
+"""
+
+import pytest
+
+from tests.conftest import pytest_collection_modifyitems
+
+
+class _Mark:
+    def __init__(self, name):
+        self.args, self.kwargs = (), {"name": name}
+
+
+class _Item:
+    def __init__(self, nodeid, group=None):
+        self.nodeid = nodeid
+        self.group = group
+
+    def get_closest_marker(self, name):
+        return _Mark(self.group) if name == "xdist_group" and self.group else None
+
+    def __repr__(self):
+        return self.nodeid
+
+
+class _Cache:
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default):
+        return self.values.get(key, default)
+
+
+class _Hook:
+    def __init__(self):
+        self.deselected = []
+
+    def pytest_deselected(self, items):
+        self.deselected.extend(items)
+
+
+class _Config:
+    def __init__(self, index, count, cache=None):
+        self.options = {"--shard-index": index, "--shard-count": count}
+        self.hook = _Hook()
+        if cache is not None:
+            self.cache = _Cache(cache)
+
+    def getoption(self, name):
+        return self.options[name]
+
+
+def _items():
+    items = [_Item(f"tests/home/a_tests.py::ATests::test_{i}") for i in range(7)]
+    items += [_Item(f"tests/home/login_tests.py::LoginTests::test_{i}", group="login_account") for i in range(3)]
+    return items
+
+
+def _split(count, cache=None, items=None):
+    """Per shard: the nodeids it keeps; also checks deselected is the complement."""
+    shards = []
+    for index in range(count):
+        config = _Config(index, count, cache)
+        kept = list(items or _items())
+        everything = [i.nodeid for i in kept]
+        pytest_collection_modifyitems(config, kept)
+        assert sorted(i.nodeid for i in kept + config.hook.deselected) == sorted(everything)
+        shards.append([i.nodeid for i in kept])
+    return shards
+
+
+class ShardSplitTests:
+
+    @pytest.mark.parametrize("count", [2, 3, 4, 11])
+    def test_every_item_runs_exactly_once(self, count):
+        shards = _split(count)
+        ran = [nodeid for shard in shards for nodeid in shard]
+        assert sorted(ran) == sorted(i.nodeid for i in _items())
+
+    @pytest.mark.parametrize("count", [2, 3, 4])
+    def test_xdist_groups_stay_on_one_shard(self, count):
+        holding = [shard for shard in _split(count) if any("login_tests" in n for n in shard)]
+        assert len(holding) == 1
+        assert sum("login_tests" in n for n in holding[0]) == 3
+
+    def test_collection_order_is_kept(self):
+        order = [i.nodeid for i in _items()]
+        for shard in _split(3):
+            assert shard == sorted(shard, key=order.index)
+
+    def test_single_shard_keeps_everything(self):
+        items = _items()
+        pytest_collection_modifyitems(_Config(0, 1), items)
+        assert len(items) == 10
+
+    def test_balances_by_cached_durations(self):
+        slow = "tests/home/a_tests.py::ATests::test_0"
+        durations = {i.nodeid: 1.0 for i in _items()}
+        durations[slow] = 100.0
+        shards = _split(2, {"parallel/durations": durations})
+        assert [slow] in shards                 # the slow test gets a shard of its own
+
+    def test_reads_per_worker_durations(self):
+        slow = "tests/home/a_tests.py::ATests::test_0"
+        cache = {"parallel/durations": {i.nodeid: 1.0 for i in _items()},
+                 "parallel/durations.gw1": {slow: 100.0}}
+        assert [slow] in _split(2, cache)
+
+    def test_works_without_a_cache_provider(self):
+        shards = _split(2, cache=None)          # config has no .cache under -p no:cacheprovider
+        assert sum(len(s) for s in shards) == 10
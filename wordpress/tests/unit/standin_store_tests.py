@@ -0,0 +1,205 @@
+"""
+Unit tests for standin.store: copy-on-write tables and named snapshot/restore on both backends.
+No browser; run with  pytest tests/unit
+"""
+
+import math
+import random
+
+import pytest
+
+from standin.store import INITIAL, CowTable, SqliteStore, Store
+
+
+def _depth(table):
+    return table._base.depth if table._base is not None else 0
+
+
+class CowTableTests:
+
+    def test_tombstones_survive_freeze_and_thaw(self):
+        table = CowTable()
+        table["a"], table["b"] = 1, 2
+        both = table.freeze()
+        assert table.pop("a") == 1
+        without_a = table.freeze()
+        assert "a" not in table and table.get("a") is None and len(table) == 1
+        with pytest.raises(KeyError):
+            table["a"]
+        table.thaw(both)
+        assert dict(table.items()) == {"a": 1, "b": 2}
+        table.thaw(without_a)
+        assert dict(table.items()) == {"b": 2}
+        table["a"] = 3                        # re-adding over a tombstone
+        assert table["a"] == 3 and len(table) == 2
+
+    def test_unsaved_writes_are_dropped_by_thaw(self):
+        table = CowTable()
+        table["a"] = 1
+        saved = table.freeze()
+        table["a"], table["b"] = 2, 3
+        table.thaw(saved)
+        assert dict(table.items()) == {"a": 1}
+
+    def test_freeze_without_writes_reuses_the_layer(self):
+        table = CowTable()
+        table["a"] = 1
+        assert table.freeze() is table.freeze()
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_a_dict_and_keeps_every_snapshot(self, seed):
+        rng = random.Random(seed)
+        table, model, snapshots = CowTable(), {}, []
+        for _ in range(3000):
+            op = rng.random()
+            key = rng.randrange(60)
+            if op < 0.55:
+                table[key] = model[key] = rng.random()
+            elif op < 0.8:
+                assert table.pop(key, "none") == model.pop(key, "none")
+            elif op < 0.93:
+                snapshots.append((table.freeze(), dict(model)))
+            elif snapshots:
+                layer, saved = rng.choice(snapshots)
+                table.thaw(layer)
+                model = dict(saved)
+            assert dict(table.items()) == model
+            assert table.get(key, "none") == model.get(key, "none")
+            assert (key in table) == (key in model)
+        # Size-tiered merges never touch layers an older snapshot still points at
+        for layer, saved in snapshots:
+            table.thaw(layer)
+            assert dict(table.items()) == saved
+            assert len(table) == len(saved)
+
+    def test_layer_chain_stays_logarithmic(self):
+        table = CowTable()
+        for i in range(4096):
+            table[i] = i
+            table.freeze()
+        assert _depth(table) <= 2 * math.log2(4096) + 1
+        assert len(table) == 4096
+
+
+def _state(store, owners):
+    """Everything a test could observe, as plain data."""
+    state = {}
+    for email in owners:
+        user = store.get_user(email)
+        if user is None:
+            state[email] = None
+            continue
+        tags = store.user_tags(user)
+        state[email] = {
+            "name": (user["firstName"], user["lastName"]),
+            "tags": [(t["name"], t["color"], t["isActive"]) for t in tags],
+            "count": store.count_tags(user),
+            "by_name": {t["name"]: store.find_tag(user, t["name"])["id"] for t in tags},
+        }
+    return state
+
+
+@pytest.fixture(params=[Store, SqliteStore], ids=["memory", "sqlite"])
+def store(request):
+    store = request.param()
+    store.add_user("owner@example.com", "pw", "Owner", "One", verified=True)
+    store.snapshot(INITIAL)
+    return store
+
+
+class StoreSnapshotTests:
+    EMAILS = ("owner@example.com", "second@example.com", "third@example.com")
+
+    def test_reset_returns_to_the_seeded_state(self, store):
+        seeded = _state(store, self.EMAILS)
+        owner = store.get_user("owner@example.com")
+        store.add_user("second@example.com", "pw", "Second", "Two")
+        store.add_tag(owner, "work", "#fff", "")
+        token, _ = store.open_session(owner)
+        assert store.session_user(token)["email"] == "owner@example.com"
+        store.reset()
+        assert _state(store, self.EMAILS) == seeded
+        assert store.session_user(token) is None
+
+    def test_snapshots_are_isolated_from_each_other(self, store):
+        owner = store.get_user("owner@example.com")
+        store.add_tag(owner, "a", "#000", "")
+        store.snapshot("one")
+        one = _state(store, self.EMAILS)
+        store.add_tag(owner, "b", "#111", "")
+        store.add_user("second@example.com", "pw", "Second", "Two")
+        store.snapshot("two")
+        two = _state(store, self.EMAILS)
+        store.add_user("third@example.com", "pw", "Third", "Three")
+
+        store.restore("one")
+        assert _state(store, self.EMAILS) == one
+        store.add_tag(owner, "c", "#222", "")         # writing after a restore leaves "two" alone
+        store.restore("two")
+        assert _state(store, self.EMAILS) == two
+        store.restore("one")
+        assert _state(store, self.EMAILS) == one
+
+    def test_update_tag_keeps_names_consistent_across_restore(self, store):
+        owner = store.get_user("owner@example.com")
+        tag = store.add_tag(owner, "old", "#000", "")
+        store.snapshot("before")
+        store.update_tag(tag["id"], name="new", color="#fff")
+        assert store.find_tag(owner, "old") is None
+        assert store.find_tag(owner, "new")["color"] == "#fff"
+        store.restore("before")
+        assert store.find_tag(owner, "new") is None
+        restored = store.find_tag(owner, "old")
+        assert restored["id"] == tag["id"] and restored["color"] == "#000"
+        # and the name is free again for a different rename
+        store.update_tag(tag["id"], name="other")
+        assert store.find_tag(owner, "other")["id"] == tag["id"]
+
+    def test_unknown_snapshot(self, store):
+        with pytest.raises(KeyError):
+            store.restore("nope")
+
+    def test_drop_snapshot_keeps_initial(self, store):
+        store.snapshot("tmp")
+        store.drop_snapshot("tmp")
+        store.drop_snapshot(INITIAL)
+        with pytest.raises(KeyError):
+            store.restore("tmp")
+        store.reset()
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_random_operations_against_a_model(self, store, seed):
+        rng = random.Random(seed)
+        owner = store.get_user("owner@example.com")
+        model, saved = {}, {}            # tag name -> (id, color) for the owner
+        for step in range(400):
+            op = rng.random()
+            if op < 0.4:
+                name = f"t{rng.randrange(40)}"
+                if name not in model:
+                    tag = store.add_tag(owner, name, "#000", "")
+                    model[name] = (tag["id"], "#000")
+            elif op < 0.65 and model:
+                name = rng.choice(sorted(model))
+                new = f"t{rng.randrange(40)}"
+                tag_id, color = model[name]
+                if new not in model:
+                    store.update_tag(tag_id, name=new)
+                    model[new] = model.pop(name)
+                else:
+                    color = f"#{step:03d}"
+                    store.update_tag(tag_id, color=color)
+                    model[name] = (tag_id, color)
+            elif op < 0.8:
+                label = f"s{rng.randrange(4)}"
+                store.snapshot(label)
+                saved[label] = dict(model)
+            elif saved:
+                label = rng.choice(sorted(saved))
+                store.restore(label)
+                model = dict(saved[label])
+            for name, (tag_id, color) in model.items():
+                found = store.find_tag(owner, name)
+                assert found is not None and found["id"] == tag_id and found["color"] == color
+            assert store.count_tags(owner) == len(model)
+            assert sorted(t["name"] for t in store.user_tags(owner)) == sorted(model)
@@ -0,0 +1,111 @@
+# utilities/async_http.py
+"""
+Tiny asyncio HTTP/1.1 client for the load and upload tools: one keep-alive
+connection, Content-Length or chunked responses, and request bodies that can be
+streamed piece by piece (with drain() backpressure) instead of built in memory.
+"""
+
+import asyncio
+import ssl
+from urllib.parse import urlsplit
+
+
+def split_url(url):
+    """(tls, host, port, target) of an absolute URL."""
+    parts = urlsplit(url)
+    tls = parts.scheme == "https"
+    target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    return tls, parts.hostname, parts.port or (443 if tls else 80), target
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection."""
+
+    def __init__(self, host, port, tls=False):
+        self.host, self.port, self.tls = host, port, tls
+        self.reader = self.writer = None
+        self.reused = False
+
+    @classmethod
+    def for_url(cls, url):
+        tls, host, port, _ = split_url(url)
+        return cls(host, port, tls)
+
+    @property
+    def host_header(self):
+        default = 443 if self.tls else 80
+        return self.host if self.port == default else f"{self.host}:{self.port}"
+
+    async def open(self):
+        context = ssl.create_default_context() if self.tls else None
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=context)
+        self.reused = False
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+    async def request(self, method, target, headers, body=b""):
+        """(status, body); reopens once if a reused connection was closed by the server."""
+        for attempt in (0, 1):
+            if self.writer is None:
+                await self.open()
+            try:
+                await self.write_head(method, target, dict(headers, **{"Content-Length": str(len(body))}))
+                await self.write(body)
+                status, _, data = await self.read_response()
+                return status, data
+            except (asyncio.IncompleteReadError, ConnectionError):
+                stale = self.reused and attempt == 0
+                self.close()
+                if not stale:
+                    raise
+
+    # ---------- Streaming ----------
+    async def write_head(self, method, target, headers):
+        if self.writer is None:
+            await self.open()
+        head = [f"{method} {target} HTTP/1.1", f"Host: {self.host_header}", "Connection: keep-alive"]
+        head += [f"{k}: {v}" for k, v in headers.items()]
+        self.writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+
+    async def write(self, data, chunked=False):
+        """Send body bytes; chunked=True frames them as one chunk (b"" ends the body)."""
+        if chunked:
+            data = b"%x\r\n%s\r\n" % (len(data), data) if data else b"0\r\n\r\n"
+        if data:
+            self.writer.write(data)
+            await self.writer.drain()
+
+    async def read_response(self, on_head=None):
+        """(status, lower-cased headers, body); on_head() is called as soon as the head is in."""
+        lines = (await self.reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        if on_head is not None:
+            on_head()
+        status = int(lines[0].split(" ", 2)[1])
+        fields = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                fields[name.strip().lower()] = value.strip()
+        if "chunked" in fields.get("transfer-encoding", "").lower():
+            data = bytearray()
+            while True:
+                size = int((await self.reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if not size:
+                    await self.reader.readuntil(b"\r\n")
+                    break
+                data += await self.reader.readexactly(size + 2)
+                del data[-2:]
+            data = bytes(data)
+        elif "content-length" in fields:
+            data = await self.reader.readexactly(int(fields["content-length"]))
+        else:
+            data = await self.reader.read()
+            fields["connection"] = "close"
+        if fields.get("connection", "").lower() == "close":
+            self.close()
+        else:
+            self.reused = True
+        return status, fields, data
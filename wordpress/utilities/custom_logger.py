@@ -1,12 +1,199 @@
 # utilities/custom_logger.py
 import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Dict
 
 _LOGGERS: Dict[str, logging.Logger] = {}
+_LISTENERS: Dict[str, QueueListener] = {}   # log file -> its single writer thread
+_LOCK = threading.Lock()
 _ROOT_CLOSED = False
 
+_FORMAT = "%(asctime)s - %(name)s - %(levelname)s: %(message)s"
+_DATEFMT = "%m/%d/%Y %I:%M:%S %p"
+
+# Queue mode (default): every named logger enqueues its records and one listener
+# thread per log file formats and writes them. AUTOMATION_LOG_QUEUE=0 goes back
+# to a file handler per logger, written synchronously by the caller.
+QUEUE_MODE = os.getenv("AUTOMATION_LOG_QUEUE", "1") != "0"
+
+# Structured sink: AUTOMATION_LOG_JSON=1 (automation.jsonl) or =path adds one JSON
+# object per record next to the text log. DEBUG records reach it only when sampled
+# (AUTOMATION_LOG_JSON_SAMPLE, fraction) and within AUTOMATION_LOG_JSON_RATE per second.
+JSON_LOG = os.getenv("AUTOMATION_LOG_JSON", "")
+JSON_SAMPLE = float(os.getenv("AUTOMATION_LOG_JSON_SAMPLE", "0.1"))
+JSON_RATE = float(os.getenv("AUTOMATION_LOG_JSON_RATE", "100"))
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Enqueues the record untouched, so %-args are merged on the writer thread
+    instead of the caller's. Only for in-process queues: the record is not pickled.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+# ---------- Structured sink ----------
+_CONTEXT = {"nodeid": None, "started": time.monotonic()}
+_PAGES_DIR = os.sep + "pages" + os.sep
+
+
+def set_test_context(nodeid=None):
+    """Tag the following records with this test (None between tests)."""
+    _CONTEXT["nodeid"] = nodeid
+    _CONTEXT["started"] = time.monotonic()
+
+
+def _page_method():
+    """"Class.method" of the innermost page-object frame on the stack, else None."""
+    frame = sys._getframe(3)
+    for _ in range(24):
+        if frame is None:
+            return None
+        code = frame.f_code
+        if _PAGES_DIR in code.co_filename:
+            owner = frame.f_locals.get("self")
+            return f"{type(owner).__name__}.{code.co_name}" if owner is not None else code.co_name
+        frame = frame.f_back
+    return None
+
+
+class ContextFilter(logging.Filter):
+    """
+    A logger filter, so it runs in the calling thread and still sees the test and
+    the call stack: decides whether a record goes to the JSON sink (DEBUG ones are
+    sampled and rate limited) and adds nodeid, worker, page, elapsed, mono and
+    skipped (DEBUG records left out just before this one) to those that do.
+    """
+
+    def __init__(self, sample=JSON_SAMPLE, rate=JSON_RATE):
+        super().__init__()
+        self.sample = sample
+        self.rate = rate
+        self.tokens = rate
+        self.refilled = time.monotonic()
+        self.dropped = 0       # DEBUG records left out since the last one written
+        self.lock = threading.Lock()
+
+    def _admit(self, record, now):
+        with self.lock:
+            if record.levelno <= logging.DEBUG:
+                self.tokens = min(self.rate, self.tokens + (now - self.refilled) * self.rate)
+                self.refilled = now
+                if random.random() >= self.sample or self.tokens < 1:
+                    self.dropped += 1
+                    return False
+                self.tokens -= 1
+            record.skipped, self.dropped = self.dropped, 0
+            return True
+
+    def filter(self, record):
+        now = time.monotonic()
+        record.structured = self._admit(record, now)
+        if not record.structured:
+            return True
+        record.nodeid = _CONTEXT["nodeid"]
+        record.worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        record.page = _page_method()
+        record.mono = now
+        record.elapsed = now - _CONTEXT["started"]
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record; locator comes from extra={"locator": ...}."""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "nodeid": record.nodeid,
+            "worker": record.worker,
+            "page": record.page,
+            "elapsed": round(record.elapsed, 4),
+            "mono": round(record.mono, 4),
+            "locator": getattr(record, "locator", None),
+            "skipped": record.skipped,
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _StructuredOnly(logging.Filter):
+    def filter(self, record):
+        return getattr(record, "structured", False)
+
+
+def json_log_path(log_file: str = "automation.log"):
+    """Where the JSON sink of log_file goes, or None when the sink is off."""
+    if not JSON_LOG or JSON_LOG == "0":
+        return None
+    path = JSON_LOG if JSON_LOG != "1" else os.path.splitext(log_file)[0] + ".jsonl"
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker and f".{worker}." not in path:
+        root, ext = os.path.splitext(path)
+        path = f"{root}.{worker}{ext}"
+    return path
+
+
+def _json_handler(path: str) -> logging.FileHandler:
+    jh = logging.FileHandler(path, mode="a", encoding="utf-8", delay=True)
+    jh.setFormatter(JsonFormatter())
+    jh.addFilter(_StructuredOnly())
+    return jh
+
+
+_CONTEXT_FILTER = ContextFilter()
+
+
+def _file_handler(log_file: str, level: int = logging.NOTSET) -> RotatingFileHandler:
+    fh = RotatingFileHandler(
+        log_file,
+        mode="a",
+        maxBytes=2_000_000,
+        backupCount=3,
+        encoding="utf-8",
+        delay=True,            # CRITICAL for Windows: open file lazily
+    )
+    fh.setLevel(level)
+    fh.setFormatter(logging.Formatter(_FORMAT, datefmt=_DATEFMT))
+    return fh
+
+
+def _console_handler() -> logging.StreamHandler:
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.INFO)
+    ch.setFormatter(logging.Formatter(_FORMAT, datefmt=_DATEFMT))
+    return ch
+
+
+def _queue_for(log_file: str):
+    """The queue feeding log_file's listener; starts the listener on first use."""
+    with _LOCK:
+        listener = _LISTENERS.get(log_file)
+        if listener is None:
+            handlers = [_file_handler(log_file), _console_handler()]
+            json_path = json_log_path(log_file)
+            if json_path:
+                handlers.append(_json_handler(json_path))
+            listener = QueueListener(queue.SimpleQueue(), *handlers, respect_handler_level=True)
+            listener.start()
+            _LISTENERS[log_file] = listener
+        return listener.queue
+
+
 def _close_logger_handlers(logger: logging.Logger):
     """Close all handlers (important on Windows to release file locks)."""
     for h in list(logger.handlers):
@@ -17,16 +204,37 @@ def _close_logger_handlers(logger: logging.Logger):
             pass
     logger.handlers.clear()
 
+
+def shutdown():
+    """Drain the queues, then close every file (also runs at exit)."""
+    global _ROOT_CLOSED
+    if _ROOT_CLOSED:
+        return
+    for listener in list(_LISTENERS.values()):
+        listener.stop()     # processes what is still queued before returning
+        for h in listener.handlers:
+            h.close()
+    _LISTENERS.clear()
+    for lg in list(_LOGGERS.values()):
+        _close_logger_handlers(lg)
+    _ROOT_CLOSED = True
+
+
+atexit.register(shutdown)
+
+
 def customLogger(
     name: str = "framework",
     log_file: str = "automation.log",
     level: int = logging.DEBUG
 ) -> logging.Logger:
     """
-    Create/fetch a  logger by name with a RotatingFileHandler.
-    - Uses delay=True to avoid pre-opening the file (helps on Windows).
-    - Ensures only one file handler per named logger.
-    - Closes handlers on exit to avoid file locks during rotation.
+    Create/fetch a  logger by name.
+    - Queue mode: a LazyQueueHandler feeding the one listener that owns log_file,
+      so a file has a single writer and rotation cannot race between loggers.
+    - Direct mode: a RotatingFileHandler per logger, delay=True to avoid
+      pre-opening the file (helps on Windows).
+    - Log with %-style args (log.info("x %s", y)): disabled levels then cost one check.
     Back-compat: if called like customLogger(logging.INFO) treat first arg as level.
     """
     # Back-compat: first positional arg was level int
@@ -34,6 +242,11 @@ def customLogger(
         level = name
         name = "framework"
 
+    # Parallel workers write their own file; the runner merges them afterwards
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if worker and log_file == "automation.log":
+        log_file = f"automation.{worker}.log"
+
     # Return existing logger if already created
     if name in _LOGGERS:
         return _LOGGERS[name]
@@ -42,46 +255,22 @@ def customLogger(
     logger.setLevel(level)
     logger.propagate = False  # avoid duplicate output via root logger
 
-    # Avoid multiple file handlers
-    has_file_handler = any(isinstance(h, RotatingFileHandler) for h in logger.handlers)
-    if not has_file_handler:
-        fh = RotatingFileHandler(
-            log_file,
-            mode="a",
-            maxBytes=2_000_000,
-            backupCount=3,
-            encoding="utf-8",
-            delay=True,            # CRITICAL for Windows: open file lazily
-        )
-        fh.setLevel(level)
-        fmt = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s: %(message)s",
-            datefmt="%m/%d/%Y %I:%M:%S %p",
-        )
-        fh.setFormatter(fmt)
-        logger.addHandler(fh)
-
-    # Console handler (info+)
-    has_console = any(isinstance(h, logging.StreamHandler) and not isinstance(h, RotatingFileHandler)
-                      for h in logger.handlers)
-    if not has_console:
-        ch = logging.StreamHandler()
-        ch.setLevel(logging.INFO)
-        fmt = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s: %(message)s",
-            datefmt="%m/%d/%Y %I:%M:%S %p",
-        )
-        ch.setFormatter(fmt)
-        logger.addHandler(ch)
-
-    # Register atexit closer once per logger
-    @atexit.register
-    def _close_on_exit():
-        global _ROOT_CLOSED
-        if not _ROOT_CLOSED:
-            for lg in list(_LOGGERS.values()):
-                _close_logger_handlers(lg)
-            _ROOT_CLOSED = True
+    if QUEUE_MODE:
+        if not any(isinstance(h, QueueHandler) for h in logger.handlers):
+            logger.addHandler(LazyQueueHandler(_queue_for(log_file)))
+    else:
+        # Avoid multiple file handlers
+        if not any(isinstance(h, RotatingFileHandler) for h in logger.handlers):
+            logger.addHandler(_file_handler(log_file, level))
+        # Console handler (info+)
+        if not any(isinstance(h, logging.StreamHandler) and not isinstance(h, RotatingFileHandler)
+                   for h in logger.handlers):
+            logger.addHandler(_console_handler())
+        json_path = json_log_path(log_file)
+        if json_path and not any(isinstance(h.formatter, JsonFormatter) for h in logger.handlers):
+            logger.addHandler(_json_handler(json_path))
+    if json_log_path(log_file):
+        logger.addFilter(_CONTEXT_FILTER)
 
     _LOGGERS[name] = logger
     return logger
@@ -0,0 +1,313 @@
+# utilities/instrumentation.py
+"""
+Where does suite time go?
+
+Enable with `pytest --instrument [path]` (see tests/conftest.py). While active:
+- every WebDriver command sent by a driver's command executor is timed,
+- time.sleep / Util.sleep count as sleep time,
+- WebDriverWait.until(_not) and WaitEngine.until count as wait time
+  (the polling sleeps inside a wait are wait time, not sleep time),
+- everything is attributed to the running test and to the innermost
+  page-object (BasePage subclass) method on the call stack.
+The result is a JSON report plus a "most wasteful steps" table.
+"""
+
+import functools
+import json
+import threading
+import time
+import types
+from pathlib import Path
+
+# Upper bounds (ms) of the command latency histogram buckets; the last bucket is open
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+TEST_BODY = "(test body)"
+NO_TEST = "(session)"
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (milliseconds)."""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float):
+        i = 0
+        while i < len(BUCKETS_MS) and ms > BUCKETS_MS[i]:
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def merge(self, other: "Histogram"):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def percentile(self, p: float) -> float:
+        """Upper bound of the bucket holding the p-th percentile (max for the open bucket)."""
+        if not self.count:
+            return 0.0
+        rank, seen = p / 100.0 * self.count, 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return float(BUCKETS_MS[i]) if i < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self):
+        labels = [f"<={b}" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}"]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 1),
+            "max_ms": round(self.max_ms, 1),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class StepStats:
+    """Counters for one (test, step) pair."""
+
+    def __init__(self):
+        self.calls = 0
+        self.elapsed_s = 0.0
+        self.commands = Histogram()
+        self.by_command = {}
+        self.sleep_s = 0.0
+        self.sleeps = 0
+        self.wait_s = 0.0
+        self.waits = 0
+
+    @property
+    def idle_s(self):
+        return self.sleep_s + self.wait_s
+
+    def merge(self, other: "StepStats"):
+        self.calls += other.calls
+        self.elapsed_s += other.elapsed_s
+        self.commands.merge(other.commands)
+        for name, n in other.by_command.items():
+            self.by_command[name] = self.by_command.get(name, 0) + n
+        self.sleep_s += other.sleep_s
+        self.sleeps += other.sleeps
+        self.wait_s += other.wait_s
+        self.waits += other.waits
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "commands": self.commands.to_dict(),
+            "by_command": dict(sorted(self.by_command.items(), key=lambda kv: -kv[1])),
+            "sleep_s": round(self.sleep_s, 3),
+            "sleeps": self.sleeps,
+            "wait_s": round(self.wait_s, 3),
+            "waits": self.waits,
+        }
+
+
+class Instrumentation:
+    """Process-wide collector; install() patches the timing points, uninstall() restores them."""
+    _active = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._patches = []
+        self.current_test = None
+        self.tests = {}        # nodeid -> {step: StepStats}
+
+    @classmethod
+    def active(cls):
+        return cls._active
+
+    # ---------- Attribution ----------
+    def _steps(self):
+        if not hasattr(self._local, "steps"):
+            self._local.steps = []
+            self._local.wait_depth = 0
+        return self._local.steps
+
+    def _stats(self, step=None) -> StepStats:
+        steps = self._steps()
+        step = step or (steps[-1] if steps else TEST_BODY)
+        per_test = self.tests.setdefault(self.current_test or NO_TEST, {})
+        return per_test.setdefault(step, StepStats())
+
+    def start_test(self, nodeid):
+        self.current_test = nodeid
+
+    def end_test(self):
+        self.current_test = None
+
+    # ---------- Recording ----------
+    def record_command(self, name, seconds):
+        with self._lock:
+            stats = self._stats()
+            stats.commands.add(seconds * 1000.0)
+            stats.by_command[name] = stats.by_command.get(name, 0) + 1
+
+    def record_sleep(self, seconds):
+        self._steps()
+        if self._local.wait_depth:
+            return  # polling inside a wait is wait time
+        with self._lock:
+            stats = self._stats()
+            stats.sleep_s += seconds
+            stats.sleeps += 1
+
+    def record_wait(self, seconds):
+        with self._lock:
+            stats = self._stats()
+            stats.wait_s += seconds
+            stats.waits += 1
+
+    # ---------- Patching ----------
+    def _patch(self, owner, name, wrapper):
+        original = getattr(owner, name)
+        self._patches.append((owner, name, original))
+        setattr(owner, name, wrapper(original))
+
+    def _sleep_wrapper(self, original):
+        @functools.wraps(original)
+        def sleep(seconds):
+            t0 = time.monotonic()
+            try:
+                return original(seconds)
+            finally:
+                self.record_sleep(time.monotonic() - t0)
+        return sleep
+
+    def _wait_wrapper(self, original):
+        @functools.wraps(original)
+        def until(*args, **kwargs):
+            self._steps()
+            self._local.wait_depth += 1
+            t0 = time.monotonic()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self._local.wait_depth -= 1
+                if not self._local.wait_depth:
+                    self.record_wait(time.monotonic() - t0)
+        return until
+
+    def install(self):
+        from selenium.webdriver.support.ui import WebDriverWait
+        from base.wait_engine import WaitEngine
+
+        self._patch(time, "sleep", self._sleep_wrapper)
+        self._patch(WebDriverWait, "until", self._wait_wrapper)
+        self._patch(WebDriverWait, "until_not", self._wait_wrapper)
+        self._patch(WaitEngine, "until", self._wait_wrapper)
+        Instrumentation._active = self
+        return self
+
+    def uninstall(self):
+        for owner, name, original in reversed(self._patches):
+            setattr(owner, name, original)
+        self._patches.clear()
+        if Instrumentation._active is self:
+            Instrumentation._active = None
+
+    def instrument_driver(self, driver):
+        """Time every command the driver's executor sends (idempotent, pooled drivers are reused)."""
+        executor = driver.command_executor
+        if getattr(executor, "_instrumented", False):
+            return driver
+        original = executor.execute
+
+        def execute(command, params):
+            t0 = time.monotonic()
+            try:
+                return original(command, params)
+            finally:
+                self.record_command(command, time.monotonic() - t0)
+
+        executor.execute = execute
+        executor._instrumented = True
+        return driver
+
+    def _method_wrapper(self, step, original):
+        @functools.wraps(original)
+        def method(*args, **kwargs):
+            steps = self._steps()
+            steps.append(step)
+            t0 = time.monotonic()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                steps.pop()
+                with self._lock:
+                    stats = self._stats(step)
+                    stats.calls += 1
+                    stats.elapsed_s += time.monotonic() - t0
+        method._instrumented = True
+        return method
+
+    def instrument_class(self, cls):
+        """Attribute calls of the public methods a page class defines itself."""
+        for name, value in list(vars(cls).items()):
+            if name.startswith("_") or not isinstance(value, types.FunctionType):
+                continue
+            if getattr(value, "_instrumented", False):
+                continue
+            step = f"{cls.__name__}.{name}"
+            self._patch(cls, name, functools.partial(self._method_wrapper, step))
+
+    def instrument_pages(self):
+        """Every BasePage subclass imported so far (call after test collection)."""
+        from base.basepage import BasePage
+        todo = list(BasePage.__subclasses__())
+        while todo:
+            cls = todo.pop()
+            self.instrument_class(cls)
+            todo.extend(cls.__subclasses__())
+
+    # ---------- Reporting ----------
+    def steps(self):
+        """Stats per step summed over all tests."""
+        merged = {}
+        for per_test in self.tests.values():
+            for step, stats in per_test.items():
+                merged.setdefault(step, StepStats()).merge(stats)
+        return merged
+
+    def report(self):
+        return {
+            "buckets_ms": list(BUCKETS_MS),
+            "tests": {nodeid: {step: s.to_dict() for step, s in per_test.items()}
+                      for nodeid, per_test in self.tests.items()},
+            "steps": {step: s.to_dict() for step, s in self.steps().items()},
+        }
+
+    def write_json(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.report(), fh, indent=1)
+        return path
+
+    def summary_lines(self, top=10):
+        """Steps ranked by idle time (sleep + wait), then by command time."""
+        steps = self.steps()
+        ranked = sorted(steps.items(), key=lambda kv: (-kv[1].idle_s, -kv[1].commands.total_ms))[:top]
+        lines = [f"{'step':<48} {'calls':>5} {'cmds':>6} {'cmd s':>7} {'p95 ms':>7}"
+                 f" {'sleep s':>8} {'wait s':>7}"]
+        for step, s in ranked:
+            lines.append(f"{step[:48]:<48} {s.calls:>5} {s.commands.count:>6}"
+                         f" {s.commands.total_ms / 1000:>7.2f} {s.commands.percentile(95):>7.0f}"
+                         f" {s.sleep_s:>8.2f} {s.wait_s:>7.2f}")
+        total = StepStats()
+        for s in steps.values():
+            total.merge(s)
+        lines.append(f"total: {total.commands.count} commands ({total.commands.total_ms / 1000:.1f} s),"
+                     f" sleep {total.sleep_s:.1f} s, wait {total.wait_s:.1f} s")
+        return lines
@@ -0,0 +1,205 @@
+# utilities/locator_check.py
+"""
+Offline check of the page objects' locators against saved HTML: no browser, needs lxml.
+
+    python -m utilities.locator_check                       # snapshots saved by pytest --html-snapshots
+    python -m utilities.locator_check --standin             # plus the stand-in's pages, rendered in-process
+    python -m utilities.locator_check --write-baseline      # record the current result as the baseline
+
+Every `_`-prefixed locator attribute of LoginPage and LoginPage2 (LocatorGroups
+resolve like in the browser: first candidate that matches) is evaluated against
+each snapshot and gets a status:
+    ok         exactly one element in at least one snapshot
+    ambiguous  several elements wherever it matches (the driver silently takes the first)
+    missing    nothing in any snapshot (or no snapshot shows that page state yet)
+    invalid    not a valid XPath 1.0 expression
+The run fails on invalid locators and, against the baseline (<snapshots>/locator_baseline.json),
+on locators that matched before and match nothing now or were unique and are now
+ambiguous. --strict also fails on any missing/ambiguous locator. Fast enough for pre-commit.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:  # lxml is optional: only this checker needs it
+    etree = lxml_html = None
+
+PAGE_CLASSES = ("pages.home.CreateAccount:LoginPage", "pages.home.login_page:LoginPage2")
+DEFAULT_SNAPSHOTS = os.getenv("HTML_SNAPSHOT_DIR", "html_snapshots")
+
+
+# ---------- Collection ----------
+def _as_xpath(locator, locatorType):
+    """XPath for an xpath/id/name locator (css needs the cssselect package), else None."""
+    kind = (locatorType or "xpath").lower()
+    if kind == "xpath":
+        return locator
+    if kind == "id":
+        return f"//*[@id='{locator}']"
+    if kind == "name":
+        return f"//*[@name='{locator}']"
+    if kind in ("css", "css_selector"):
+        try:
+            from lxml.cssselect import CSSSelector
+            return CSSSelector(locator).path
+        except Exception:
+            return None
+    return None
+
+
+def collect_locators(class_paths=PAGE_CLASSES):
+    """[(name, [xpath candidates])] for every `_` locator attribute of the given page classes."""
+    from base.selenium_driver import LocatorGroup
+    found = []
+    for path in class_paths:
+        module, _, cls_name = path.partition(":")
+        cls = getattr(importlib.import_module(module), cls_name)
+        for attr, value in vars(cls).items():
+            if not attr.startswith("_") or attr.startswith("__"):
+                continue
+            if isinstance(value, LocatorGroup):
+                candidates = [_as_xpath(loc, value.locatorType) for loc in value.locators]
+            elif isinstance(value, str) and value.lstrip().startswith(("/", "(")):
+                candidates = [value]
+            else:
+                continue
+            found.append((f"{cls_name}.{attr}", [c for c in candidates if c]))
+    return found
+
+
+# ---------- Snapshots ----------
+def load_snapshots(directory):
+    """{label: parsed document} for every .html file in directory."""
+    docs = {}
+    for path in sorted(Path(directory).glob("*.html")):
+        docs[path.stem] = lxml_html.document_fromstring(path.read_bytes())
+    return docs
+
+
+def standin_snapshots():
+    """The stand-in's pages as they are served, before any script runs."""
+    from standin import pages
+    rendered = {"/": pages.landing(), "/auth/signup": pages.signup(), "/auth/login": pages.login(),
+                "/auth/forgot-password": pages.forgot_password(),
+                "/auth/check-email": pages.check_email("user@example.com"),
+                "/dashboard": pages.dashboard(), "/google/accounts/signin": pages.google_signin()}
+    return {f"standin:{path}": lxml_html.document_fromstring(body) for path, body in rendered.items()}
+
+
+# ---------- Checking ----------
+def _count(result):
+    if isinstance(result, list):
+        return len(result)
+    return 1 if result else 0
+
+
+def check(locators, docs):
+    """Per locator: status, per-snapshot match counts and evaluation time."""
+    results = {}
+    for name, candidates in locators:
+        t0 = time.perf_counter()
+        entry = {"status": None, "counts": {}, "error": None}
+        try:
+            compiled = [etree.XPath(c) for c in candidates]
+        except etree.XPathSyntaxError as e:
+            entry.update(status="invalid", error=str(e))
+            compiled = []
+        for label, doc in docs.items():
+            for xp in compiled:
+                try:
+                    n = _count(xp(doc))
+                except etree.XPathEvalError as e:
+                    entry.update(status="invalid", error=str(e))
+                    break
+                if n:
+                    entry["counts"][label] = n
+                    break
+        if entry["status"] is None:
+            counts = entry["counts"].values()
+            entry["status"] = "missing" if not counts else "ok" if 1 in counts else "ambiguous"
+        entry["ms"] = round(1000 * (time.perf_counter() - t0), 3)
+        results[name] = entry
+    return results
+
+
+def regressions(results, baseline):
+    """Locators that got worse since the baseline, as {name: why}."""
+    worse = {}
+    for name, before in baseline.items():
+        now = results.get(name)
+        if now is None:
+            continue
+        if before in ("ok", "ambiguous") and now["status"] == "missing":
+            worse[name] = f"matched before ({before}), matches nothing now"
+        elif before == "ok" and now["status"] == "ambiguous":
+            worse[name] = "was unique, now ambiguous"
+    return worse
+
+
+def print_report(results, docs, elapsed_ms, worse, out=sys.stdout):
+    width = max((len(n) for n in results), default=10)
+    for name, entry in sorted(results.items(), key=lambda kv: (kv[1]["status"] == "ok", kv[0])):
+        counts = ", ".join(f"{label}:{n}" for label, n in entry["counts"].items()) or "-"
+        detail = entry["error"] or counts
+        flag = f"  << {worse[name]}" if name in worse else ""
+        print(f"{name:<{width}}  {entry['status']:<9}  {detail}{flag}", file=out)
+    tally = {s: sum(e["status"] == s for e in results.values()) for s in ("ok", "ambiguous", "missing", "invalid")}
+    print(f"\n{len(results)} locators x {len(docs)} snapshots in {elapsed_ms:.0f} ms: "
+          + ", ".join(f"{v} {k}" for k, v in tally.items()), file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check page-object locators against saved HTML")
+    parser.add_argument("--snapshots", default=DEFAULT_SNAPSHOTS, help="directory of saved .html pages")
+    parser.add_argument("--standin", action="store_true", help="also check the stand-in's pages")
+    parser.add_argument("--baseline", default=None, help="default <snapshots>/locator_baseline.json")
+    parser.add_argument("--write-baseline", action="store_true", help="store this run's statuses as the baseline")
+    parser.add_argument("--strict", action="store_true", help="fail on missing or ambiguous locators too")
+    parser.add_argument("--json", default="reports/locator_check.json")
+    args = parser.parse_args(argv)
+    if etree is None:
+        print("locator_check needs lxml: pip install lxml", file=sys.stderr)
+        return 2
+
+    started = time.perf_counter()
+    docs = load_snapshots(args.snapshots) if Path(args.snapshots).is_dir() else {}
+    if args.standin:
+        docs.update(standin_snapshots())
+    if not docs:
+        print(f"No snapshots in {args.snapshots}: run pytest --html-snapshots, or use --standin",
+              file=sys.stderr)
+        return 2
+    results = check(collect_locators(), docs)
+    elapsed_ms = 1000 * (time.perf_counter() - started)
+
+    baseline_path = Path(args.baseline or Path(args.snapshots) / "locator_baseline.json")
+    baseline = {}
+    if baseline_path.exists() and not args.write_baseline:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    worse = regressions(results, baseline)
+    print_report(results, docs, elapsed_ms, worse)
+
+    if args.write_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps({n: e["status"] for n, e in sorted(results.items())}, indent=2),
+                                 encoding="utf-8")
+        print(f"Baseline written to {baseline_path}")
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps({"snapshots": sorted(docs), "elapsed_ms": round(elapsed_ms, 1),
+                                               "locators": results, "regressions": worse}, indent=2),
+                                   encoding="utf-8")
+
+    bad = {"invalid"} | ({"missing", "ambiguous"} if args.strict else set())
+    return 1 if worse or any(e["status"] in bad for e in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
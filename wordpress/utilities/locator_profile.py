@@ -0,0 +1,229 @@
+# utilities/locator_profile.py
+"""
+What each page-object locator costs in the browser, and a faster form where one exists.
+
+    python -m utilities.locator_profile --standin --headless
+    python -m utilities.locator_profile --base-url http://127.0.0.1:8765 --runs 200 --write-registry
+    python -m utilities.locator_profile --standin --locator "//*[contains(text(), 'Welcome')]"
+
+Every `_` locator of LoginPage and LoginPage2 (see utilities.locator_check), plus
+any --locator, is evaluated in-page on each --pages path: --runs evaluations per
+batch, 5 batches, the median batch giving microseconds per evaluation. Locators are
+ranked by their mean cost over the pages.
+Each XPath with an exact CSS form (base.locator_registry.xpath_to_css) is timed as
+CSS too, and compared on every page: the rewrite counts as verified only when
+both forms select the same elements, in the same order, on all pages, and at
+least one page has a match. Verified
+rewrites go to the registry (--write-registry, LOCATOR_REGISTRY_FILE) that
+SeleniumDriver consults, so the page objects keep their XPath. A suggested patch
+is written to reports/locator_rewrites.txt for anyone who prefers editing the
+page objects.
+"""
+
+import argparse
+import inspect
+import json
+import os
+import statistics
+import sys
+from pathlib import Path
+
+from base.locator_registry import LocatorRegistry, css_fast_path, xpath_to_css
+from base.wait_engine import FIND_JS, JsCondition
+from utilities.custom_logger import customLogger
+from utilities.locator_check import PAGE_CLASSES, collect_locators
+
+DEFAULT_PAGES = ("/", "/auth/signup", "/auth/login", "/auth/forgot-password", "/dashboard")
+BATCHES = 5
+
+# [[locator, by], ...] -> per locator null (does not evaluate) or [matches, [us per batch ...]]
+_PROFILE_JS = FIND_JS + """
+var locs = arguments[0], runs = arguments[1], batches = arguments[2], out = [];
+for (var i = 0; i < locs.length; i++) {
+  var loc = locs[i][0], by = locs[i][1], count;
+  try { count = findAll(loc, by).length; } catch (e) { out.push(null); continue; }
+  var samples = [];
+  for (var b = 0; b < batches; b++) {
+    var t0 = performance.now();
+    for (var r = 0; r < runs; r++) findAll(loc, by);
+    samples.push((performance.now() - t0) * 1000 / runs);
+  }
+  out.push([count, samples]);
+}
+return out;
+"""
+
+# [[xpath, css], ...] -> per pair: do both select the same nodes in the same order?
+_SAME_JS = FIND_JS + """
+return arguments[0].map(function (pair) {
+  try {
+    var a = findAll(pair[0], 'xpath'), b = findAll(pair[1], 'css');
+    return a.length === b.length && a.every(function (el, i) { return el === b[i]; });
+  } catch (e) { return false; }
+});
+"""
+
+log = customLogger("locator_profile")
+
+
+class LocatorProfile:
+    """Per locator: its rewrite (if any) and timings/matches per page."""
+
+    def __init__(self, locators):
+        self.locators = locators                       # [(name, xpath)]
+        self.css = {xp: xpath_to_css(xp) for _, xp in locators}
+        self.xpath_us = {xp: {} for _, xp in locators}  # xpath -> {page: median us}
+        self.css_us = {xp: {} for _, xp in locators}
+        self.matches = {xp: {} for _, xp in locators}
+        self.same = {xp: True for _, xp in locators}
+
+    def measure(self, driver, page, runs):
+        unique = list(dict.fromkeys(xp for _, xp in self.locators))
+        rewrites = [xp for xp in unique if self.css[xp]]
+        specs = [[xp, "xpath"] for xp in unique] + [[self.css[xp], "css"] for xp in rewrites]
+        results = driver.execute_script(_PROFILE_JS, specs, runs, BATCHES)
+        for xp, res in zip(unique, results):
+            if res is not None:
+                self.matches[xp][page] = res[0]
+                self.xpath_us[xp][page] = statistics.median(res[1])
+        for xp, res in zip(rewrites, results[len(unique):]):
+            if res is not None:
+                self.css_us[xp][page] = statistics.median(res[1])
+        for xp, same in zip(rewrites, driver.execute_script(_SAME_JS, [[xp, self.css[xp]] for xp in rewrites])):
+            self.same[xp] = self.same[xp] and same
+
+    def ranking(self):
+        rows = []
+        for name, xp in self.locators:
+            cost = statistics.mean(self.xpath_us[xp].values()) if self.xpath_us[xp] else None
+            css = self.css[xp]
+            css_cost = statistics.mean(self.css_us[xp].values()) if css and self.css_us[xp] else None
+            # Matching nothing anywhere proves nothing: such a rewrite stays unverified
+            verified = (bool(css) and self.same[xp] and bool(self.css_us[xp])
+                        and any(self.matches[xp].values()))
+            rows.append({"name": name, "xpath": xp, "xpath_us": cost, "css": css, "css_us": css_cost,
+                         "verified": verified, "matches": dict(self.matches[xp]),
+                         "speedup": round(cost / css_cost, 1) if verified and cost and css_cost else None})
+        rows.sort(key=lambda r: -(r["xpath_us"] or 0))
+        return rows
+
+
+def registry_entries(rows):
+    entries = {}
+    for row in rows:
+        if row["verified"]:
+            by, locator = css_fast_path(row["css"])
+            entries[row["xpath"]] = {"by": by, "locator": locator, "verified": True,
+                                     "xpath_us": round(row["xpath_us"], 2), "css_us": round(row["css_us"], 2)}
+    return entries
+
+
+def suggested_patch(rows):
+    """file:line, attribute and CSS replacement for every verified rewrite."""
+    import importlib
+    lines = []
+    for path in PAGE_CLASSES:
+        module, _, cls_name = path.partition(":")
+        source, start = inspect.getsourcelines(getattr(importlib.import_module(module), cls_name))
+        filename = os.path.relpath(inspect.getsourcefile(importlib.import_module(module)))
+        for row in rows:
+            if not row["verified"] or not row["name"].startswith(cls_name + "."):
+                continue
+            attr = row["name"].split(".", 1)[1]
+            for offset, text in enumerate(source):
+                if text.strip().startswith(f"{attr} = "):
+                    lines.append(f"{filename}:{start + offset}: {attr}")
+                    lines.append(f"-    {attr} = {row['xpath']!r}")
+                    lines.append(f"+    {attr} = {row['css']!r}   # locatorType=\"css\" at its call sites")
+                    break
+    return lines
+
+
+def print_ranking(rows, out=sys.stdout):
+    print(f"\n{'rank':>4}  {'locator':<40}{'xpath us':>10}{'css us':>9}{'x':>7}  rewrite", file=out)
+    for i, row in enumerate(rows, 1):
+        cost = f"{row['xpath_us']:.1f}" if row["xpath_us"] is not None else "-"
+        css = f"{row['css_us']:.1f}" if row["css_us"] is not None else "-"
+        speedup = f"{row['speedup']}" if row["speedup"] else "-"
+        rewrite = (row["css"] if row["verified"] else "no CSS form" if not row["css"]
+                   else "not equivalent on these pages" if any(row["matches"].values())
+                   else "unverified: matches nothing on these pages")
+        print(f"{i:>4}  {row['name'][:39]:<40}{cost:>10}{css:>9}{speedup:>7}  {rewrite}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank page-object locators by in-page cost")
+    parser.add_argument("--pages", default=",".join(DEFAULT_PAGES), help="paths to profile, comma separated")
+    parser.add_argument("--runs", type=int, default=100, help="evaluations per batch")
+    parser.add_argument("--locator", action="append", default=[], help="extra XPath to profile (repeatable)")
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--base-url", help="app to profile")
+    parser.add_argument("--standin", action="store_true", help="start the local stand-in app and profile it")
+    parser.add_argument("--login", action="store_true", help="sign in first (TEST_USERNAME/TEST_PASSWORD)")
+    parser.add_argument("--write-registry", action="store_true",
+                        help=f"store verified rewrites in {LocatorRegistry.FILE}")
+    parser.add_argument("--json", default="reports/locator_profile.json")
+    parser.add_argument("--patch", default="reports/locator_rewrites.txt")
+    args = parser.parse_args(argv)
+
+    locators = []
+    for name, candidates in collect_locators():
+        locators.extend((name if len(candidates) == 1 else f"{name}[{i}]", xp) for i, xp in enumerate(candidates))
+    locators.extend((f"--locator {i + 1}", xp) for i, xp in enumerate(args.locator))
+    profile = LocatorProfile(locators)
+    LocatorRegistry.ENABLED = False          # time what the page objects declare, not earlier rewrites
+
+    from base.webdriverfactory import WebDriverFactory
+    from base.selenium_driver import SeleniumDriver
+    server = None
+    if args.standin:
+        from standin import StandinServer
+        from standin.app import default_user
+        server = StandinServer().start()
+        base_url = server.base_url
+        account = default_user()
+        os.environ.setdefault("TEST_USERNAME", account["email"])
+        os.environ.setdefault("TEST_PASSWORD", account["password"])
+    else:
+        base_url = (args.base_url or os.getenv("BASE_URL", "https://dev-verbatimly.onrender.com")).rstrip("/")
+    os.environ["BASE_URL"] = base_url
+    driver, _ = WebDriverFactory(browser=args.browser, headless=args.headless).getWebDriverInstance()
+    try:
+        if args.login:
+            from base.auth_session import SessionCache
+            kwargs = {}
+            if args.standin:
+                from standin.pages import SESSION_KEY
+                kwargs = {"via": "api", "storage_key": SESSION_KEY}
+            SessionCache(base_url, os.getenv("TEST_USERNAME", ""), os.getenv("TEST_PASSWORD", ""),
+                         **kwargs).apply(driver, landing="")
+        page = SeleniumDriver(driver)
+        for path in [p.strip() for p in args.pages.split(",") if p.strip()]:
+            page.navigate_and_wait(base_url + path, JsCondition.ready())
+            profile.measure(driver, path, args.runs)
+            log.info("Profiled %d locators on %s", len(locators), path)
+    finally:
+        driver.quit()
+        if server is not None:
+            server.stop()
+
+    rows = profile.ranking()
+    print_ranking(rows)
+    entries = registry_entries(rows)
+    if args.write_registry:
+        Path(LocatorRegistry.FILE).write_text(json.dumps(entries, indent=2), encoding="utf-8")
+        print(f"{len(entries)} verified rewrite(s) written to {LocatorRegistry.FILE}")
+    if args.patch and entries:
+        Path(args.patch).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.patch).write_text("\n".join(suggested_patch(rows)) + "\n", encoding="utf-8")
+        print(f"Suggested page-object edits in {args.patch}")
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps({"base_url": base_url, "pages": args.pages.split(","),
+                                               "runs": args.runs, "locators": rows}, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+# utilities/parallel_runner.py
+"""
+Run the UI suites sharded across N worker processes.
+
+    python -m utilities.parallel_runner -n 4 tests/home
+
+Each worker is a normal pytest process started with --shard-index/--shard-count
+and PYTEST_XDIST_WORKER=gw<i>, so it gets its own browser pool, its own log
+file and its own namespaced test data (see tests/conftest.py).
+When all workers finish, their JUnit reports and logs (text and JSON lines) are merged.
+pytest-xdist works as well (pytest -n 4 --dist loadgroup); this runner only
+exists so no extra plugin is needed.
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+
+from base.screenshots import new_run_id
+from utilities.results_stream import merge_results
+
+LOG_TS = re.compile(r"^(\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2} [AP]M) - ")
+LOG_TS_FMT = "%m/%d/%Y %I:%M:%S %p"
+
+
+def _worker_cmd(index, count, report_dir, pytest_args):
+    return [
+        sys.executable, "-m", "pytest",
+        "--shard-index", str(index), "--shard-count", str(count),
+        f"--junitxml={report_dir / f'junit.gw{index}.xml'}",
+        *pytest_args,
+    ]
+
+
+def run_workers(count, pytest_args, report_dir: Path):
+    """Start every shard at once and wait for all of them; returns exit codes."""
+    report_dir.mkdir(parents=True, exist_ok=True)
+    procs = []
+    run = new_run_id()              # every worker's screenshots land in one run folder
+    for i in range(count):
+        env = dict(os.environ,
+                   SCREENSHOT_RUN=run,
+                   PYTEST_XDIST_WORKER=f"gw{i}",
+                   PYTEST_XDIST_WORKER_COUNT=str(count))
+        out = open(report_dir / f"stdout.gw{i}.txt", "w", encoding="utf-8")
+        procs.append((subprocess.Popen(_worker_cmd(i, count, report_dir, pytest_args),
+                                       env=env, stdout=out, stderr=subprocess.STDOUT), out))
+    codes = []
+    for proc, out in procs:
+        codes.append(proc.wait())
+        out.close()
+    return codes
+
+
+def merge_junit(report_dir: Path, count: int) -> Path:
+    """Fold the per-worker JUnit files into a single junit.xml."""
+    merged = ET.Element("testsuites")
+    totals = dict(tests=0, failures=0, errors=0, skipped=0)
+    elapsed = 0.0
+    for i in range(count):
+        path = report_dir / f"junit.gw{i}.xml"
+        if not path.exists():
+            continue
+        root = ET.parse(path).getroot()
+        suites = [root] if root.tag == "testsuite" else list(root)
+        for suite in suites:
+            suite.set("name", f"{suite.get('name', 'pytest')}[gw{i}]")
+            for key in totals:
+                totals[key] += int(suite.get(key, 0))
+            elapsed = max(elapsed, float(suite.get("time", 0)))
+            merged.append(suite)
+    for key, value in totals.items():
+        merged.set(key, str(value))
+    merged.set("time", f"{elapsed:.3f}")
+    out = report_dir / "junit.xml"
+    ET.ElementTree(merged).write(out, encoding="utf-8", xml_declaration=True)
+    return out
+
+
+def merge_logs(log_dir: Path, count: int, target="automation.log"):
+    """
+    Append the per-worker logs to automation.log ordered by timestamp.
+    Continuation lines (tracebacks) stay attached to the record above them.
+    """
+    records = []
+    for i in range(count):
+        path = log_dir / f"automation.gw{i}.log"
+        if not path.exists():
+            continue
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                m = LOG_TS.match(line)
+                if m or not records:
+                    ts = datetime.strptime(m.group(1), LOG_TS_FMT) if m else datetime.min
+                    records.append([ts, i, f"[gw{i}] {line}"])
+                else:
+                    records[-1][2] += line
+        path.unlink()
+    records.sort(key=lambda r: (r[0], r[1]))
+    with open(log_dir / target, "a", encoding="utf-8") as fh:
+        for _, _, text in records:
+            fh.write(text)
+
+
+def merge_json_logs(log_dir: Path, count: int, target="automation.jsonl"):
+    """Append the per-worker JSON-lines logs (AUTOMATION_LOG_JSON) to target, ordered by ts."""
+    records = []
+    for i in range(count):
+        path = log_dir / f"automation.gw{i}.jsonl"
+        if not path.exists():
+            continue
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    records.append((json.loads(line).get("ts", 0.0), i, line))
+                except ValueError:
+                    continue
+        path.unlink()
+    if not records:
+        return
+    records.sort(key=lambda r: (r[0], r[1]))
+    with open(log_dir / target, "a", encoding="utf-8") as fh:
+        for _, _, line in records:
+            fh.write(line)
+
+
+def _results_path(pytest_args):
+    """The --results path passed through to the workers, or None."""
+    for i, arg in enumerate(pytest_args):
+        if arg.startswith("--results="):
+            return arg.split("=", 1)[1]
+        if arg == "--results":
+            following = pytest_args[i + 1] if i + 1 < len(pytest_args) else ""
+            # Same rule as the option's nargs="?": a following non-option argument is the path
+            return following if following and not following.startswith("-") else "reports/results"
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sharded parallel pytest runner")
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--report-dir", default="reports")
+    args, pytest_args = parser.parse_known_args(argv)
+    results = _results_path(pytest_args)
+
+    count = max(1, args.workers)
+    report_dir = Path(args.report_dir)
+    t0 = time.monotonic()
+    codes = run_workers(count, pytest_args, report_dir)
+    junit = merge_junit(report_dir, count)
+    merge_logs(Path.cwd(), count)
+    merge_json_logs(Path.cwd(), count)
+    if results:
+        merge_results(results, count)
+
+    print(f"{count} workers finished in {time.monotonic() - t0:.1f} s, exit codes {codes}")
+    print(f"merged report: {junit}")
+    if results:
+        print(f"merged results: {results}.jsonl / {results}.xml")
+    # pytest exit code 5 means "no tests collected" - an empty shard is fine
+    failed = [c for c in codes if c not in (0, 5)]
+    return failed[0] if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1138 @@
+# utilities/pm_script.py
+"""
+Interpreter for the small JavaScript subset Postman test scripts are written in,
+so utilities.postman_runner can evaluate pm.test/pm.expect without Node.
+
+Supported: const/let/var, if/else, try/catch, return, function declarations,
+arrow and function expressions, optional chaining, template and regex literals,
+array/object literals (with spread), the usual operators, and the pm, console,
+Math, Date, JSON and String/Array helpers scripts actually use.
+Anything else raises Untranslatable: the runner reports those tests as skipped
+instead of guessing.
+"""
+
+import json
+import math
+import random
+import re
+import time
+import uuid
+
+
+class Untranslatable(Exception):
+    """Syntax or API this interpreter does not support."""
+
+
+class JSError(Exception):
+    """Runtime error inside the script (Postman fails the enclosing pm.test)."""
+
+
+class AssertionFailed(JSError):
+    pass
+
+
+class _Return(Exception):
+    def __init__(self, value=None):
+        self.value = value
+
+
+class _Undefined:
+    def __repr__(self):
+        return "undefined"
+
+    def __bool__(self):
+        return False
+
+
+UNDEF = _Undefined()
+
+# ---------------------------------------------------------------- tokenizer
+_PUNCT = sorted("""
+... => === !== == != <= >= && || ?? ?. << >> ++ -- += -= *= /=
+{ } ( ) [ ] ; , < > + - * / % ! = ? : . & | ^ ~
+""".split(), key=len, reverse=True)
+_KEYWORDS = {"const", "let", "var", "if", "else", "return", "function", "try", "catch",
+             "finally", "true", "false", "null", "undefined", "typeof", "new",
+             # reserved words the parser refuses, so such scripts are skipped rather than misread
+             "class", "for", "while", "do", "switch", "async", "await", "this", "throw",
+             "delete", "instanceof", "in", "yield"}
+_REGEX_PREV = set("( , = : [ ! & | ? { } ; + - * % < > ~ ^".split()) | {
+    "=>", "===", "!==", "==", "!=", "&&", "||", "??", "return", "typeof", None}
+
+
+class Token:
+    __slots__ = ("kind", "value", "pos")
+
+    def __init__(self, kind, value, pos):
+        self.kind, self.value, self.pos = kind, value, pos
+
+    def __repr__(self):
+        return f"{self.kind}:{self.value!r}"
+
+
+def tokenize(src):
+    tokens, i, n = [], 0, len(src)
+
+    def prev():
+        return tokens[-1].value if tokens else None
+
+    while i < n:
+        c = src[i]
+        if c in " \t\r\n":
+            i += 1
+        elif src.startswith("//", i):
+            j = src.find("\n", i)
+            i = n if j < 0 else j
+        elif src.startswith("/*", i):
+            j = src.find("*/", i + 2)
+            i = n if j < 0 else j + 2
+        elif c.isdigit() or (c == "." and i + 1 < n and src[i + 1].isdigit()):
+            m = re.compile(r"0[xX][0-9a-fA-F]+|\d*\.?\d+(?:[eE][+-]?\d+)?").match(src, i)
+            text = m.group(0)
+            tokens.append(Token("num", int(text, 16) if text[:2].lower() == "0x" else float(text), i))
+            i = m.end()
+        elif c in "\"'":
+            j, out = i + 1, []
+            while j < n and src[j] != c:
+                if src[j] == "\\" and j + 1 < n:
+                    j += 1
+                    out.append({"n": "\n", "t": "\t", "r": "\r"}.get(src[j], src[j]))
+                else:
+                    out.append(src[j])
+                j += 1
+            tokens.append(Token("str", "".join(out), i))
+            i = j + 1
+        elif c == "`":
+            parts, j, buf = [], i + 1, []
+            while j < n and src[j] != "`":
+                if src.startswith("${", j):
+                    depth, k = 1, j + 2
+                    while k < n and depth:
+                        depth += {"{": 1, "}": -1}.get(src[k], 0)
+                        k += 1
+                    parts.append("".join(buf))
+                    parts.append(("expr", src[j + 2:k - 1]))
+                    buf, j = [], k
+                    continue
+                if src[j] == "\\" and j + 1 < n:
+                    j += 1
+                buf.append(src[j])
+                j += 1
+            parts.append("".join(buf))
+            tokens.append(Token("tpl", parts, i))
+            i = j + 1
+        elif c == "/" and prev() in _REGEX_PREV and not src.startswith("/=", i):
+            j, in_class = i + 1, False
+            while j < n and (src[j] != "/" or in_class):
+                if src[j] == "\\":
+                    j += 1
+                elif src[j] == "[":
+                    in_class = True
+                elif src[j] == "]":
+                    in_class = False
+                j += 1
+            m = re.compile(r"[gimsuy]*").match(src, j + 1)
+            tokens.append(Token("regex", (src[i + 1:j], m.group(0)), i))
+            i = m.end()
+        elif c.isalpha() or c in "_$":
+            m = re.compile(r"[\w$]+").match(src, i)
+            word = m.group(0)
+            tokens.append(Token("kw" if word in _KEYWORDS else "name", word, i))
+            i = m.end()
+        else:
+            for p in _PUNCT:
+                if src.startswith(p, i):
+                    tokens.append(Token("op", p, i))
+                    i += len(p)
+                    break
+            else:
+                raise Untranslatable(f"unexpected character {c!r}")
+    tokens.append(Token("eof", None, n))
+    return tokens
+
+
+# ---------------------------------------------------------------- parser
+_BINARY = {"??": 1, "||": 2, "&&": 3, "|": 4, "^": 5, "&": 6,
+           "===": 7, "!==": 7, "==": 7, "!=": 7, "<": 8, ">": 8, "<=": 8, ">=": 8,
+           "<<": 9, ">>": 9, "+": 10, "-": 10, "*": 11, "/": 11, "%": 11}
+
+
+class Parser:
+    def __init__(self, src):
+        self.tokens = tokenize(src)
+        self.i = 0
+
+    # helpers
+    @property
+    def tok(self):
+        return self.tokens[self.i]
+
+    def peek(self, k=1):
+        return self.tokens[min(self.i + k, len(self.tokens) - 1)]
+
+    def at(self, value, kind=None):
+        t = self.tok
+        return t.value == value and (kind is None or t.kind == kind) and t.kind != "str"
+
+    def eat(self, value=None):
+        t = self.tok
+        if value is not None and not self.at(value):
+            raise Untranslatable(f"expected {value!r} at {t.pos}, got {t.value!r}")
+        self.i += 1
+        return t
+
+    def maybe(self, value):
+        if self.at(value):
+            self.i += 1
+            return True
+        return False
+
+    # statements
+    def program(self):
+        body = []
+        while self.tok.kind != "eof":
+            body.append(self.statement())
+        return ("block", body)
+
+    def block(self):
+        self.eat("{")
+        body = []
+        while not self.at("}"):
+            if self.tok.kind == "eof":
+                raise Untranslatable("unterminated block")
+            body.append(self.statement())
+        self.eat("}")
+        return ("block", body)
+
+    def statement(self):
+        t = self.tok
+        if self.at("{"):
+            return self.block()
+        if self.maybe(";"):
+            return ("empty",)
+        if t.kind == "kw":
+            if t.value in ("const", "let", "var"):
+                self.eat()
+                decls = []
+                while True:
+                    name = self.eat().value
+                    init = self.assignment() if self.maybe("=") else ("lit", UNDEF)
+                    decls.append((name, init))
+                    if not self.maybe(","):
+                        break
+                self.maybe(";")
+                return ("var", decls)
+            if t.value == "if":
+                self.eat()
+                self.eat("(")
+                cond = self.expression()
+                self.eat(")")
+                then = self.statement()
+                other = self.statement() if self.maybe("else") else None
+                return ("if", cond, then, other)
+            if t.value == "return":
+                self.eat()
+                value = None if self.at(";") or self.at("}") or self.tok.kind == "eof" else self.expression()
+                self.maybe(";")
+                return ("return", value)
+            if t.value == "try":
+                self.eat()
+                body = self.block()
+                name, handler, final = None, None, None
+                if self.maybe("catch"):
+                    if self.maybe("("):
+                        name = self.eat().value
+                        self.eat(")")
+                    handler = self.block()
+                if self.maybe("finally"):
+                    final = self.block()
+                return ("try", body, name, handler, final)
+            if t.value == "function" and self.peek().kind == "name":
+                self.eat()
+                name = self.eat().value
+                return ("fundecl", name, self.function_rest())
+        expr = self.expression()
+        self.maybe(";")
+        return ("expr", expr)
+
+    # expressions
+    def expression(self):
+        expr = self.assignment()
+        while self.maybe(","):
+            expr = ("seq", expr, self.assignment())
+        return expr
+
+    def assignment(self):
+        # arrow functions: x => ..., (a, b) => ...
+        if self.tok.kind == "name" and self.peek().value == "=>":
+            name = self.eat().value
+            self.eat("=>")
+            return self.arrow_body([name])
+        if self.at("("):
+            j, depth = self.i, 0
+            while True:
+                v = self.tokens[j].value if self.tokens[j].kind == "op" else None
+                depth += {"(": 1, ")": -1}.get(v, 0)
+                if depth == 0 or self.tokens[j].kind == "eof":
+                    break
+                j += 1
+            if self.tokens[j + 1].value == "=>" if j + 1 < len(self.tokens) else False:
+                self.eat("(")
+                params = []
+                while not self.at(")"):
+                    params.append(self.eat().value)
+                    self.maybe(",")
+                self.eat(")")
+                self.eat("=>")
+                return self.arrow_body(params)
+        left = self.ternary()
+        if self.tok.kind == "op" and self.tok.value in ("=", "+=", "-=", "*=", "/="):
+            op = self.eat().value
+            if left[0] not in ("name", "member"):
+                raise Untranslatable("invalid assignment target")
+            return ("assign", op, left, self.assignment())
+        return left
+
+    def arrow_body(self, params):
+        if self.at("{"):
+            return ("func", params, self.block())
+        return ("func", params, ("block", [("return", self.assignment())]))
+
+    def function_rest(self):
+        self.eat("(")
+        params = []
+        while not self.at(")"):
+            params.append(self.eat().value)
+            self.maybe(",")
+        self.eat(")")
+        return ("func", params, self.block())
+
+    def ternary(self):
+        cond = self.binary(0)
+        if self.maybe("?"):
+            a = self.assignment()
+            self.eat(":")
+            return ("cond", cond, a, self.assignment())
+        return cond
+
+    def binary(self, min_prec):
+        left = self.unary()
+        while self.tok.kind == "op" and _BINARY.get(self.tok.value, -1) > min_prec:
+            op = self.eat().value
+            left = ("bin", op, left, self.binary(_BINARY[op]))
+        return left
+
+    def unary(self):
+        t = self.tok
+        if t.kind == "op" and t.value in ("!", "-", "+", "~"):
+            self.eat()
+            return ("unary", t.value, self.unary())
+        if t.kind == "kw" and t.value == "typeof":
+            self.eat()
+            return ("unary", "typeof", self.unary())
+        if t.kind == "op" and t.value in ("++", "--"):
+            raise Untranslatable("increment operators")
+        return self.postfix()
+
+    def postfix(self):
+        expr = self.primary()
+        while True:
+            if self.maybe("."):
+                expr = ("member", expr, ("lit", self.eat().value), False)
+            elif self.maybe("?."):
+                if self.at("("):
+                    expr = ("call", expr, self.arguments(), True)
+                elif self.maybe("["):
+                    key = self.expression()
+                    self.eat("]")
+                    expr = ("member", expr, key, True)
+                else:
+                    expr = ("member", expr, ("lit", self.eat().value), True)
+            elif self.at("("):
+                expr = ("call", expr, self.arguments(), False)
+            elif self.maybe("["):
+                key = self.expression()
+                self.eat("]")
+                expr = ("member", expr, key, False)
+            elif self.at("++") or self.at("--"):
+                raise Untranslatable("increment operators")
+            else:
+                return expr
+
+    def arguments(self):
+        self.eat("(")
+        args = []
+        while not self.at(")"):
+            if self.maybe("..."):
+                args.append(("spread", self.assignment()))
+            else:
+                args.append(self.assignment())
+            if not self.maybe(","):
+                break
+        self.eat(")")
+        return args
+
+    def primary(self):
+        t = self.eat()
+        if t.kind == "num" or t.kind == "str":
+            return ("lit", t.value)
+        if t.kind == "tpl":
+            parts = [("lit", p) if isinstance(p, str) else Parser(p[1]).expression() for p in t.value]
+            return ("tpl", parts)
+        if t.kind == "regex":
+            return ("regex", *t.value)
+        if t.kind == "kw":
+            if t.value in ("true", "false"):
+                return ("lit", t.value == "true")
+            if t.value == "null":
+                return ("lit", None)
+            if t.value == "undefined":
+                return ("lit", UNDEF)
+            if t.value == "function":
+                if self.tok.kind == "name":
+                    self.eat()
+                return self.function_rest()
+            if t.value == "new":
+                callee = self.primary()
+                args = self.arguments() if self.at("(") else []
+                return ("new", callee, args)
+            raise Untranslatable(f"keyword {t.value!r} in expression")
+        if t.kind == "name":
+            return ("name", t.value)
+        if t.value == "(":
+            expr = self.expression()
+            self.eat(")")
+            return expr
+        if t.value == "[":
+            items = []
+            while not self.at("]"):
+                items.append(("spread", self.assignment()) if self.maybe("...") else self.assignment())
+                if not self.maybe(","):
+                    break
+            self.eat("]")
+            return ("array", items)
+        if t.value == "{":
+            props = []
+            while not self.at("}"):
+                if self.maybe("..."):
+                    props.append(("spread", self.assignment()))
+                else:
+                    key = self.eat()
+                    if self.maybe(":"):
+                        props.append((key.value, self.assignment()))
+                    else:
+                        props.append((key.value, ("name", key.value)))
+                if not self.maybe(","):
+                    break
+            self.eat("}")
+            return ("object", props)
+        raise Untranslatable(f"unexpected {t.value!r} at {t.pos}")
+
+
+# ---------------------------------------------------------------- runtime
+def truthy(v):
+    if v is UNDEF or v is None or v is False:
+        return False
+    if isinstance(v, (int, float)) and not isinstance(v, bool):
+        return v != 0 and not math.isnan(v)
+    if isinstance(v, str):
+        return v != ""
+    return True
+
+
+def _is_num(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+def js_num_str(x):
+    """Number::toString: shortest round-trip digits, exponent form outside 1e-7 .. 1e21."""
+    if isinstance(x, int):
+        if abs(x) < 10 ** 21:
+            return str(x)
+        x = float(x)
+    if math.isnan(x):
+        return "NaN"
+    if math.isinf(x):
+        return "Infinity" if x > 0 else "-Infinity"
+    if x == 0:
+        return "0"
+    if x < 0:
+        return "-" + js_num_str(-x)
+    mantissa, _, exp = repr(x).partition("e")
+    whole, _, frac = mantissa.partition(".")
+    digits = (whole + frac).lstrip("0")
+    n = len(whole) + int(exp or 0) - (len(whole + frac) - len((whole + frac).lstrip("0")))
+    digits = digits.rstrip("0")
+    k = len(digits)
+    if k <= n <= 21:
+        return digits + "0" * (n - k)
+    if 0 < n <= 21:
+        return digits[:n] + "." + digits[n:]
+    if -6 < n <= 0:
+        return "0." + "0" * -n + digits
+    e = n - 1
+    return (digits[0] + ("." + digits[1:] if k > 1 else "")
+            + ("e+" if e >= 0 else "e-") + str(abs(e)))
+
+
+def js_str(v):
+    if v is UNDEF:
+        return "undefined"
+    if v is None:
+        return "null"
+    if v is True or v is False:
+        return "true" if v else "false"
+    if _is_num(v):
+        return js_num_str(v)
+    if isinstance(v, list):
+        return ",".join("" if x is None or x is UNDEF else js_str(x) for x in v)
+    if isinstance(v, dict):
+        return "[object Object]"
+    return str(v)
+
+
+_JS_SPACE = " \t\n\r\v\f\u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009" \
+            "\u200a\u2028\u2029\u202f\u205f\u3000\ufeff"
+_DECIMAL_RE = re.compile(r"[+-]?(?:Infinity|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)")
+_RADIX_RE = re.compile(r"0(?:[xX][0-9a-fA-F]+|[oO][0-7]+|[bB][01]+)")
+
+
+def js_num(v):
+    """ToNumber."""
+    if isinstance(v, bool):
+        return 1 if v else 0
+    if _is_num(v):
+        return v
+    if v is None:
+        return 0
+    if isinstance(v, str):
+        text = v.strip(_JS_SPACE)
+        if not text:
+            return 0
+        if _RADIX_RE.fullmatch(text):
+            return int(text[2:], {"x": 16, "o": 8, "b": 2}[text[1].lower()])
+        if _DECIMAL_RE.fullmatch(text):
+            return float(text.replace("Infinity", "inf"))
+        return float("nan")
+    if isinstance(v, list):
+        return js_num(js_str(v))
+    return float("nan")
+
+
+def js_int32(v):
+    """ToInt32, for the bitwise operators."""
+    n = js_num(v)
+    if isinstance(n, float) and (math.isnan(n) or math.isinf(n)):
+        return 0
+    n = int(n) & 0xFFFFFFFF
+    return n - (1 << 32) if n >= 1 << 31 else n
+
+
+def js_equal(a, b):
+    """Strict (===) equality."""
+    if a is UNDEF or b is UNDEF or a is None or b is None:
+        return a is b
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b
+    if _is_num(a) and _is_num(b):
+        return a == b
+    if isinstance(a, str) and isinstance(b, str):
+        return a == b
+    return a is b
+
+
+def js_loose_equal(a, b):
+    """Abstract (==) equality: null == undefined, numbers against strings/booleans, objects by primitive."""
+    if a is None or a is UNDEF or b is None or b is UNDEF:
+        return (a is None or a is UNDEF) and (b is None or b is UNDEF)
+    if isinstance(a, bool):
+        return js_loose_equal(js_num(a), b)
+    if isinstance(b, bool):
+        return js_loose_equal(a, js_num(b))
+    if _is_num(a) and isinstance(b, str) or isinstance(a, str) and _is_num(b):
+        return js_num(a) == js_num(b)
+    a_obj, b_obj = not isinstance(a, str) and not _is_num(a), not isinstance(b, str) and not _is_num(b)
+    if a_obj and not b_obj:
+        return js_loose_equal(js_str(a), b)
+    if b_obj and not a_obj:
+        return js_loose_equal(a, js_str(b))
+    return js_equal(a, b)
+
+
+def deep_equal(a, b):
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(deep_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(deep_equal(x, y) for x, y in zip(a, b))
+    return js_equal(a, b)
+
+
+def js_regex(source, flags=""):
+    py = 0
+    if "i" in flags:
+        py |= re.IGNORECASE
+    if "m" in flags:
+        py |= re.MULTILINE
+    if "s" in flags:
+        py |= re.DOTALL
+    # JS named groups (?<name>...) are (?P<name>...) in Python
+    return re.compile(re.sub(r"\(\?<(?![=!])", "(?P<", source), py)
+
+
+class JSFunction:
+    def __init__(self, params, body, scope, interp):
+        self.params, self.body, self.scope, self.interp = params, body, scope, interp
+
+    def __call__(self, *args):
+        scope = Scope(self.scope)
+        for i, name in enumerate(self.params):
+            scope.declare(name, args[i] if i < len(args) else UNDEF)
+        try:
+            self.interp.exec(self.body, scope)
+        except _Return as r:
+            return UNDEF if r.value is None else r.value
+        return UNDEF
+
+
+class Scope:
+    def __init__(self, parent=None):
+        self.vars = {}
+        self.parent = parent
+
+    def lookup(self, name):
+        scope = self
+        while scope is not None:
+            if name in scope.vars:
+                return scope
+            scope = scope.parent
+        return None
+
+    def get(self, name):
+        scope = self.lookup(name)
+        if scope is None:
+            raise JSError(f"ReferenceError: {name} is not defined")
+        return scope.vars[name]
+
+    def declare(self, name, value):
+        self.vars[name] = value
+
+    def set(self, name, value):
+        scope = self.lookup(name) or self
+        scope.vars[name] = value
+
+
+def _member(obj, key):
+    """Property lookup with JS semantics for the value types scripts see."""
+    if obj is None or obj is UNDEF:
+        raise JSError(f"TypeError: Cannot read properties of {js_str(obj)} (reading '{js_str(key)}')")
+    if hasattr(obj, "js_get"):
+        return obj.js_get(key)
+    if isinstance(obj, dict):
+        return obj.get(key, UNDEF) if isinstance(key, str) else obj.get(js_str(key), UNDEF)
+    if isinstance(obj, (list, str)):
+        if key == "length":
+            return len(obj)
+        if isinstance(key, (int, float)) and not isinstance(key, bool):
+            idx = int(key)
+            return obj[idx] if 0 <= idx < len(obj) else UNDEF
+        method = (_STRING_METHODS if isinstance(obj, str) else _ARRAY_METHODS).get(key)
+        if method:
+            return lambda *args: method(obj, *args)
+        return UNDEF
+    if isinstance(obj, (int, float)) and key in _NUMBER_METHODS:
+        return lambda *args: _NUMBER_METHODS[key](obj, *args)
+    if isinstance(obj, re.Pattern) and key == "test":
+        return lambda s: bool(obj.search(js_str(s)))
+    return UNDEF
+
+
+def _to_string_radix(n, radix=10):
+    n = int(js_num(n))
+    radix = int(js_num(radix))
+    if radix == 10:
+        return str(n)
+    digits, sign, out = "0123456789abcdefghijklmnopqrstuvwxyz", "-" if n < 0 else "", ""
+    n = abs(n)
+    while True:
+        n, r = divmod(n, radix)
+        out = digits[r] + out
+        if not n:
+            return sign + out
+
+
+_NUMBER_METHODS = {
+    "toString": _to_string_radix,
+    "toFixed": lambda n, d=0: (f"{js_num(n):.{int(js_num(d))}f}" if math.isfinite(js_num(n))
+                               else js_num_str(js_num(n))),
+}
+
+_STRING_METHODS = {
+    "includes": lambda s, sub, *a: js_str(sub) in s,
+    "startsWith": lambda s, sub, *a: s.startswith(js_str(sub)),
+    "endsWith": lambda s, sub, *a: s.endswith(js_str(sub)),
+    "indexOf": lambda s, sub, *a: s.find(js_str(sub)),
+    "toLowerCase": lambda s: s.lower(),
+    "toUpperCase": lambda s: s.upper(),
+    "trim": lambda s: s.strip(),
+    "substring": lambda s, a, b=UNDEF: s[int(js_num(a)):None if b is UNDEF else int(js_num(b))],
+    "slice": lambda s, a, b=UNDEF: s[int(js_num(a)):None if b is UNDEF else int(js_num(b))],
+    "padStart": lambda s, n, fill=" ": s.rjust(int(js_num(n)), js_str(fill)[:1] or " "),
+    "split": lambda s, sep: s.split(js_str(sep)) if js_str(sep) else list(s),
+    "match": lambda s, rx: (lambda m: [m.group(0), *m.groups()] if m else None)(
+        (rx if isinstance(rx, re.Pattern) else re.compile(re.escape(js_str(rx)))).search(s)),
+    "replace": lambda s, a, b: (a.sub(js_str(b), s, count=1) if isinstance(a, re.Pattern)
+                                else s.replace(js_str(a), js_str(b), 1)),
+    "toString": lambda s: s,
+}
+
+
+def _array_call(fn, items):
+    return [fn(v, i, items) for i, v in enumerate(items)]
+
+
+_ARRAY_METHODS = {
+    "includes": lambda arr, v, *a: any(js_equal(x, v) for x in arr),
+    "indexOf": lambda arr, v, *a: next((i for i, x in enumerate(arr) if js_equal(x, v)), -1),
+    "forEach": lambda arr, fn: (_array_call(fn, arr), UNDEF)[1],
+    "map": lambda arr, fn: _array_call(fn, arr),
+    "filter": lambda arr, fn: [v for v, keep in zip(arr, _array_call(fn, arr)) if truthy(keep)],
+    "some": lambda arr, fn: any(truthy(r) for r in _array_call(fn, arr)),
+    "every": lambda arr, fn: all(truthy(r) for r in _array_call(fn, arr)),
+    "find": lambda arr, fn: next((v for v, r in zip(arr, _array_call(fn, arr)) if truthy(r)), UNDEF),
+    "join": lambda arr, sep=",": js_str(sep).join(js_str(v) for v in arr),
+    "slice": lambda arr, a=0, b=UNDEF: arr[int(js_num(a)):None if b is UNDEF else int(js_num(b))],
+}
+
+
+class Namespace:
+    """Plain JS object backed by Python attributes/callables (pm, console, Math, ...)."""
+
+    def __init__(self, **members):
+        self.members = members
+
+    def js_get(self, key):
+        return self.members.get(key, UNDEF)
+
+
+class Interpreter:
+    """Runs a parsed script against a global scope."""
+
+    def __init__(self, globals_):
+        self.globals = Scope()
+        for name, value in globals_.items():
+            self.globals.declare(name, value)
+
+    def run(self, src):
+        program = Parser(src).program()
+        try:
+            self.exec(program, Scope(self.globals))
+        except _Return:
+            pass
+
+    # statements
+    def exec(self, node, scope):
+        kind = node[0]
+        if kind == "block":
+            inner = Scope(scope)
+            for stmt in node[1]:
+                if stmt[0] == "fundecl":    # hoisted, like JS
+                    inner.declare(stmt[1], JSFunction(stmt[2][1], stmt[2][2], inner, self))
+            for stmt in node[1]:
+                self.exec(stmt, inner)
+        elif kind == "var":
+            for name, init in node[1]:
+                scope.declare(name, self.eval(init, scope))
+        elif kind == "expr":
+            self.eval(node[1], scope)
+        elif kind == "if":
+            if truthy(self.eval(node[1], scope)):
+                self.exec(node[2], scope)
+            elif node[3] is not None:
+                self.exec(node[3], scope)
+        elif kind == "return":
+            raise _Return(None if node[1] is None else self.eval(node[1], scope))
+        elif kind == "try":
+            _, body, name, handler, final = node
+            try:
+                self.exec(body, scope)
+            except JSError as e:
+                if handler is None:
+                    raise
+                inner = Scope(scope)
+                if name:
+                    inner.declare(name, Namespace(message=str(e)))
+                self.exec(handler, inner)
+            finally:
+                if final is not None:
+                    self.exec(final, scope)
+        elif kind in ("empty", "fundecl"):
+            pass
+        else:
+            raise Untranslatable(f"statement {kind}")
+
+    # expressions
+    def eval(self, node, scope):
+        kind = node[0]
+        if kind == "lit":
+            return node[1]
+        if kind == "name":
+            return scope.get(node[1])
+        if kind == "tpl":
+            return "".join(js_str(self.eval(p, scope)) for p in node[1])
+        if kind == "regex":
+            return js_regex(node[1], node[2])
+        if kind == "array":
+            out = []
+            for item in node[1]:
+                if item[0] == "spread":
+                    out.extend(self.eval(item[1], scope))
+                else:
+                    out.append(self.eval(item, scope))
+            return out
+        if kind == "object":
+            out = {}
+            for key, value in node[1]:
+                if key == "spread":
+                    out.update(self.eval(value, scope))
+                else:
+                    out[key] = self.eval(value, scope)
+            return out
+        if kind == "func":
+            return JSFunction(node[1], node[2], scope, self)
+        if kind == "member":
+            obj = self.eval(node[1], scope)
+            if node[3] and (obj is None or obj is UNDEF):
+                return UNDEF
+            return _member(obj, self.eval(node[2], scope))
+        if kind == "call":
+            return self.call(node, scope)
+        if kind == "new":
+            callee = self.eval(node[1], scope)
+            if callee is _DATE:
+                return _DateValue()
+            raise Untranslatable("new on anything but Date")
+        if kind == "unary":
+            op, value = node[1], self.eval(node[2], scope)
+            if op == "!":
+                return not truthy(value)
+            if op == "-":
+                return -js_num(value)
+            if op == "+":
+                return js_num(value)
+            if op == "~":
+                return ~js_int32(value)
+            return {bool: "boolean", str: "string", dict: "object", list: "object"}.get(
+                type(value), "undefined" if value is UNDEF else
+                "function" if callable(value) else "number" if isinstance(value, (int, float)) else "object")
+        if kind == "bin":
+            return self.binary(node, scope)
+        if kind == "cond":
+            return self.eval(node[2] if truthy(self.eval(node[1], scope)) else node[3], scope)
+        if kind == "assign":
+            return self.assign(node, scope)
+        if kind == "seq":
+            self.eval(node[1], scope)
+            return self.eval(node[2], scope)
+        raise Untranslatable(f"expression {kind}")
+
+    def call(self, node, scope):
+        _, callee_node, arg_nodes, optional = node
+        fn = self.eval(callee_node, scope)
+        if optional and (fn is None or fn is UNDEF):
+            return UNDEF
+        args = []
+        for a in arg_nodes:
+            if a[0] == "spread":
+                args.extend(self.eval(a[1], scope))
+            else:
+                args.append(self.eval(a, scope))
+        if fn is UNDEF or not callable(fn):
+            name = callee_node[2][1] if callee_node[0] == "member" else callee_node[-1]
+            raise Untranslatable(f"call of unsupported function {name!r}")
+        return fn(*args)
+
+    def binary(self, node, scope):
+        op = node[1]
+        left = self.eval(node[2], scope)
+        if op == "&&":
+            return self.eval(node[3], scope) if truthy(left) else left
+        if op == "||":
+            return left if truthy(left) else self.eval(node[3], scope)
+        if op == "??":
+            return self.eval(node[3], scope) if left is None or left is UNDEF else left
+        right = self.eval(node[3], scope)
+        if op == "===":
+            return js_equal(left, right)
+        if op == "!==":
+            return not js_equal(left, right)
+        if op == "==":
+            return js_loose_equal(left, right)
+        if op == "!=":
+            return not js_loose_equal(left, right)
+        if op == "+":
+            if any(isinstance(v, (str, list, dict)) for v in (left, right)):
+                return js_str(left) + js_str(right)
+            return js_num(left) + js_num(right)
+        if op in ("<", ">", "<=", ">="):
+            if isinstance(left, str) and isinstance(right, str):
+                a, b = left, right
+            else:
+                a, b = js_num(left), js_num(right)
+            return {"<": a < b, ">": a > b, "<=": a <= b, ">=": a >= b}[op]
+        a, b = js_num(left), js_num(right)
+        if op == "-":
+            return a - b
+        if op == "*":
+            return a * b
+        if op == "/":
+            return a / b if b else (float("nan") if not a else math.copysign(float("inf"), a))
+        if op == "%":
+            return math.fmod(a, b) if b else float("nan")
+        ia, ib = js_int32(a), js_int32(b)
+        if op == "<<":
+            return js_int32(ia << (ib & 31))
+        if op == ">>":
+            return ia >> (ib & 31)
+        if op == "&":
+            return ia & ib
+        if op == "|":
+            return ia | ib
+        if op == "^":
+            return ia ^ ib
+        raise Untranslatable(f"operator {op}")
+
+    def assign(self, node, scope):
+        _, op, target, value_node = node
+        value = self.eval(value_node, scope)
+        if op != "=":
+            current = self.eval(target, scope)
+            value = self.binary(("bin", op[0], ("lit", current), ("lit", value)), scope)
+        if target[0] == "name":
+            scope.set(target[1], value)
+        else:
+            obj = self.eval(target[1], scope)
+            if not isinstance(obj, dict):
+                raise Untranslatable("assignment to a non-object property")
+            obj[js_str(self.eval(target[2], scope))] = value
+        return value
+
+
+# ---------------------------------------------------------------- builtins
+class _DateValue:
+    def __init__(self):
+        self.ms = time.time() * 1000
+
+    def js_get(self, key):
+        return {"getTime": lambda: self.ms,
+                "toISOString": lambda: time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(self.ms / 1000))
+                + f".{int(self.ms % 1000):03d}Z"}.get(key, UNDEF)
+
+
+_DATE = Namespace(now=lambda: int(time.time() * 1000))
+
+def _finite(fn):
+    """Math.floor/ceil/round: NaN and the infinities pass through unchanged."""
+    return lambda x=UNDEF: (lambda n: fn(n) if math.isfinite(n) else n)(float(js_num(x)))
+
+
+def _extreme(pick, empty):
+    def apply(*args):
+        nums = [js_num(x) for x in args]
+        if any(math.isnan(n) for n in nums):
+            return float("nan")
+        return pick(nums) if nums else empty
+    return apply
+
+
+_MATH = Namespace(random=random.random, floor=_finite(math.floor), ceil=_finite(math.ceil),
+                  round=_finite(lambda n: math.floor(n + 0.5)), abs=lambda x=UNDEF: abs(js_num(x)),
+                  max=_extreme(max, float("-inf")), min=_extreme(min, float("inf")))
+
+
+def _stringify(v, indent="", gap=""):
+    """JSON.stringify for the values scripts build; None stands for 'leave out'."""
+    if v is None:
+        return "null"
+    if v is True or v is False:
+        return "true" if v else "false"
+    if _is_num(v):
+        return js_num_str(v) if math.isfinite(v) else "null"
+    if isinstance(v, str):
+        return json.dumps(v, ensure_ascii=False)
+    if isinstance(v, _DateValue):
+        return json.dumps(v.js_get("toISOString")())
+    if v is UNDEF or callable(v):
+        return None
+    inner = indent + gap
+    sep, nl = ("," + "\n" + inner, "\n" + inner) if gap else (",", "")
+    end = "\n" + indent if gap else ""
+    if isinstance(v, list):
+        if not v:
+            return "[]"
+        items = [_stringify(x, inner, gap) or "null" for x in v]
+        return "[" + nl + sep.join(items) + end + "]"
+    if isinstance(v, dict):
+        items = [json.dumps(js_str(k), ensure_ascii=False) + (": " if gap else ":") + text
+                 for k, text in ((k, _stringify(x, inner, gap)) for k, x in v.items()) if text is not None]
+        return "{" + nl + sep.join(items) + end + "}" if items else "{}"
+    raise Untranslatable(f"JSON.stringify of {type(v).__name__}")
+
+
+def _json_stringify(v, replacer=None, space=UNDEF):
+    if replacer is not None and replacer is not UNDEF:
+        raise Untranslatable("JSON.stringify with a replacer")
+    gap = " " * max(0, min(10, int(js_num(space)))) if _is_num(space) else (
+        space[:10] if isinstance(space, str) else "")
+    text = _stringify(v, "", gap)
+    return UNDEF if text is None else text
+
+
+def _json_parse(text):
+    def no_constant(name):
+        raise ValueError(f"Unexpected token {name[0]}")
+    try:
+        return json.loads(js_str(text), parse_constant=no_constant)
+    except ValueError as e:
+        raise JSError(f"SyntaxError: {e}")
+
+
+_JSON = Namespace(stringify=_json_stringify, parse=_json_parse)
+
+
+def _parse_int(s=UNDEF, radix=UNDEF):
+    """parseInt: the longest run of radix digits after optional space, sign and 0x."""
+    text = js_str(s).lstrip(_JS_SPACE)
+    sign = -1 if text[:1] == "-" else 1
+    text = text[1:] if text[:1] in "+-" else text
+    base = js_int32(radix)
+    if base == 0:
+        base = 10
+        if text[:2].lower() == "0x":
+            base, text = 16, text[2:]
+    elif base == 16 and text[:2].lower() == "0x":
+        text = text[2:]
+    if not 2 <= base <= 36:
+        return float("nan")
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"[:base]
+    end = 0
+    while end < len(text) and text[end].lower() in digits:
+        end += 1
+    return sign * int(text[:end], base) if end else float("nan")
+
+
+def _parse_float(s=UNDEF):
+    """parseFloat: the longest decimal literal (or Infinity) at the start of the string."""
+    m = _DECIMAL_RE.match(js_str(s).lstrip(_JS_SPACE))
+    return float(m.group(0).replace("Infinity", "inf")) if m else float("nan")
+
+
+BUILTINS = {
+    "Math": _MATH,
+    "Date": _DATE,
+    "JSON": _JSON,
+    "parseInt": _parse_int,
+    "parseFloat": _parse_float,
+    "Number": lambda v=0: js_num(v),
+    "String": lambda v="": js_str(v),
+    "Boolean": lambda v=UNDEF: truthy(v),
+    "isNaN": lambda v=UNDEF: math.isnan(js_num(v)),
+    "isFinite": lambda v=UNDEF: math.isfinite(js_num(v)),
+    "NaN": float("nan"),
+    "Infinity": float("inf"),
+    "uuid": lambda: str(uuid.uuid4()),
+}
+
+
+# ---------------------------------------------------------------- chai
+_CHAIN_WORDS = {"to", "be", "been", "is", "that", "which", "and", "has", "have", "with", "at",
+                "of", "same", "does", "still", "deep"}
+
+
+def _show(v):
+    return json.dumps(v) if isinstance(v, (dict, list)) else repr(v) if isinstance(v, str) else js_str(v)
+
+
+class Expectation:
+    """chai-style pm.expect(value) chain; a failed check raises AssertionFailed."""
+
+    def __init__(self, value, message=""):
+        self.value = value
+        self.message = message
+        self.negate = False
+
+    def _check(self, ok, text):
+        if bool(ok) == self.negate:
+            prefix = f"{self.message}: " if self.message else ""
+            raise AssertionFailed(f"{prefix}expected {_show(self.value)} {'not ' if self.negate else ''}{text}")
+        return self
+
+    def js_get(self, key):
+        v = self.value
+        if key in _CHAIN_WORDS:
+            return self
+        if key == "not":
+            self.negate = not self.negate
+            return self
+        # property assertions
+        props = {
+            "exist": lambda: self._check(v is not None and v is not UNDEF, "to exist"),
+            "true": lambda: self._check(v is True, "to be true"),
+            "false": lambda: self._check(v is False, "to be false"),
+            "null": lambda: self._check(v is None, "to be null"),
+            "undefined": lambda: self._check(v is UNDEF, "to be undefined"),
+            "ok": lambda: self._check(truthy(v), "to be truthy"),
+            "empty": lambda: self._check(len(v) == 0 if isinstance(v, (str, list, dict)) else False,
+                                         "to be empty"),
+        }
+        if key in props:
+            return props[key]()
+        methods = {
+            "a": self._type, "an": self._type,
+            "include": self._include, "includes": self._include,
+            "contain": self._include, "contains": self._include,
+            "oneOf": lambda items: self._check(any(js_equal(v, x) for x in items), f"to be one of {items}"),
+            "equal": lambda x: self._check(js_equal(v, x), f"to equal {js_str(x)}"),
+            "equals": lambda x: self._check(js_equal(v, x), f"to equal {js_str(x)}"),
+            "eql": lambda x: self._check(deep_equal(v, x), f"to deeply equal {_show(x)}"),
+            "eqls": lambda x: self._check(deep_equal(v, x), f"to deeply equal {_show(x)}"),
+            "above": lambda n: self._check(js_num(v) > js_num(n), f"to be above {js_str(n)}"),
+            "gt": lambda n: self._check(js_num(v) > js_num(n), f"to be above {js_str(n)}"),
+            "below": lambda n: self._check(js_num(v) < js_num(n), f"to be below {js_str(n)}"),
+            "lt": lambda n: self._check(js_num(v) < js_num(n), f"to be below {js_str(n)}"),
+            "least": lambda n: self._check(js_num(v) >= js_num(n), f"to be at least {js_str(n)}"),
+            "most": lambda n: self._check(js_num(v) <= js_num(n), f"to be at most {js_str(n)}"),
+            "property": self._property,
+            "match": lambda rx: self._check(isinstance(v, str) and rx.search(v), f"to match {rx.pattern}"),
+            "lengthOf": lambda n: self._check(len(v) == js_num(n), f"to have length {js_str(n)}"),
+            "status": lambda code: self._check(js_equal(getattr(v, "code", UNDEF), code),
+                                               f"to have status {js_str(code)}"),
+        }
+        if key in methods:
+            return methods[key]
+        raise Untranslatable(f"chai assertion .{key}")
+
+    def _type(self, name):
+        actual = ("array" if isinstance(self.value, list) else "object" if isinstance(self.value, dict)
+                  else "string" if isinstance(self.value, str) else "boolean" if isinstance(self.value, bool)
+                  else "number" if isinstance(self.value, (int, float)) else "null" if self.value is None
+                  else "undefined")
+        return self._check(actual == name.lower(), f"to be a(n) {name}")
+
+    def _include(self, item):
+        v = self.value
+        if isinstance(v, str):
+            ok = js_str(item) in v
+        elif isinstance(v, list):
+            ok = any(js_equal(x, item) for x in v)
+        elif isinstance(v, dict) and isinstance(item, dict):
+            ok = all(k in v and deep_equal(v[k], val) for k, val in item.items())
+        else:
+            ok = False
+        return self._check(ok, f"to include {js_str(item)}")
+
+    def _property(self, name, *expected):
+        v = self.value
+        has = isinstance(v, dict) and name in v
+        if expected and has:
+            return self._check(deep_equal(v[name], expected[0]), f"to have property {name} = {js_str(expected[0])}")
+        return self._check(has, f"to have property {name}")
@@ -0,0 +1,448 @@
+# utilities/postman_runner.py
+"""
+Run api_tests/*.postman_collection.json from Python instead of newman.
+
+    python -m utilities.postman_runner api_tests/Verbatimly.postman_collection.json \
+        -e api_tests/Verbatimly_Environment.postman_environment.json
+    python -m utilities.postman_runner api_tests/Verbatimly.postman_collection.json --standin
+
+Top-level folders ("Authentication", "Positive Tests", "Negative Test") are
+independent, so they run concurrently - each on its own copy of the environment -
+over one keep-alive connection pool. Requests inside a folder run in order and
+share variables, like a newman iteration. --sequential runs the folders one after
+another on a single shared environment, exactly like newman.
+pre-request/test scripts run in utilities.pm_script; api_tests/conftest.py turns
+the results into pytest items.
+"""
+
+import argparse
+import base64
+import json
+import re
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlencode
+
+import urllib3
+
+from utilities.custom_logger import customLogger
+from utilities.pm_script import (UNDEF, AssertionFailed, Expectation, Interpreter, JSError,
+                                 Namespace, Untranslatable, BUILTINS, js_str)
+
+VAR_RE = re.compile(r"\{\{([^{}]+)\}\}")
+PM_TEST_RE = re.compile(r"""pm\.test\(\s*(["'`])(.*?)\1""")
+
+PASSED, FAILED, SKIPPED = "passed", "failed", "skipped"
+
+_DYNAMIC = {
+    "$timestamp": lambda: str(int(time.time())),
+    "$isoTimestamp": lambda: datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+    "$guid": lambda: str(uuid.uuid4()),
+    "$randomUUID": lambda: str(uuid.uuid4()),
+    "$randomInt": lambda: str(int.from_bytes(uuid.uuid4().bytes[:2], "big") % 1001),
+}
+
+
+def load_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _enabled(values):
+    return {v["key"]: v.get("value", "") for v in values or [] if not v.get("disabled") and
+            v.get("enabled", True)}
+
+
+def test_names(script):
+    """pm.test names that appear literally in a script, in order (used to build pytest items)."""
+    seen = []
+    for _, name in PM_TEST_RE.findall(script):
+        if name not in seen:
+            seen.append(name)
+    return seen
+
+
+def script_of(item, listen):
+    return "\n".join(line for ev in item.get("event", []) if ev.get("listen") == listen
+                     for line in ev.get("script", {}).get("exec", []))
+
+
+# ---------- Variables ----------
+class Variables:
+    """
+    Postman variable scopes, highest precedence first: local (pm.variables.set),
+    environment, collection. Unknown {{names}} stay in the text, as in Postman.
+    """
+
+    def __init__(self, environment=None, collection=None):
+        self.local = {}
+        self.environment = dict(environment or {})
+        self.collection = dict(collection or {})
+
+    def fork(self):
+        return Variables(self.environment, self.collection)
+
+    def get(self, key):
+        for scope in (self.local, self.environment, self.collection):
+            if key in scope:
+                return scope[key]
+        return UNDEF
+
+    def resolve(self, text, depth=5):
+        if not isinstance(text, str) or "{{" not in text:
+            return text
+
+        def sub(m):
+            name = m.group(1).strip()
+            if name in _DYNAMIC:
+                return _DYNAMIC[name]()
+            value = self.get(name)
+            return m.group(0) if value is UNDEF else js_str(value)
+
+        resolved = VAR_RE.sub(sub, text)
+        return self.resolve(resolved, depth - 1) if depth and resolved != text else resolved
+
+
+def _scope_api(scope, fallback=None):
+    """pm.environment / pm.collectionVariables / pm.variables."""
+    return Namespace(
+        get=lambda k: fallback(k) if fallback else scope.get(k, UNDEF),
+        set=lambda k, v: scope.__setitem__(k, v),
+        has=lambda k: (fallback(k) if fallback else scope.get(k, UNDEF)) is not UNDEF,
+        unset=lambda k: scope.pop(k, None),
+        replaceIn=lambda text: text,
+    )
+
+
+# ---------- Results ----------
+class TestResult:
+    __slots__ = ("name", "outcome", "message")
+
+    def __init__(self, name, outcome, message=""):
+        self.name, self.outcome, self.message = name, outcome, message
+
+    def as_dict(self):
+        return {"name": self.name, "outcome": self.outcome, "message": self.message}
+
+
+class RequestResult:
+    """One executed request: what was sent, what came back, and its pm.test outcomes."""
+
+    def __init__(self, path, method, url):
+        self.path = path            # ("Positive Tests", "Create Tag")
+        self.method = method
+        self.url = url
+        self.status = None
+        self.elapsed_ms = None
+        self.error = ""
+        self.tests = []
+        self.script_errors = []     # failures outside any pm.test
+
+    @property
+    def name(self):
+        return " / ".join(self.path)
+
+    @property
+    def failed(self):
+        return bool(self.error or self.script_errors) or any(t.outcome == FAILED for t in self.tests)
+
+    def as_dict(self):
+        return {"request": self.name, "method": self.method, "url": self.url, "status": self.status,
+                "elapsed_ms": self.elapsed_ms, "error": self.error,
+                "script_errors": self.script_errors, "tests": [t.as_dict() for t in self.tests]}
+
+
+class _Response:
+    """pm.response"""
+
+    def __init__(self, resp, elapsed_ms):
+        self.code = resp.status
+        self._resp = resp
+        self.body = resp.data
+        self.elapsed_ms = elapsed_ms
+
+    def _json(self):
+        try:
+            return json.loads(self.body.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError) as e:
+            raise JSError(f"JSONError: {e}")
+
+    def js_get(self, key):
+        return {
+            "code": self.code,
+            "status": self._resp.reason or "",
+            "responseTime": self.elapsed_ms,
+            "responseSize": len(self.body),
+            "headers": Namespace(get=lambda name: self._resp.headers.get(name, UNDEF),
+                                 has=lambda name: name in self._resp.headers),
+            "json": self._json,
+            "text": lambda: self.body.decode("utf-8", "replace"),
+            "to": Expectation(self),
+        }.get(key, UNDEF)
+
+
+# ---------- Runner ----------
+class PostmanRunner:
+    """
+    Executes a collection with an optional environment. overrides wins over both
+    (e.g. {"verbatimly": "http://127.0.0.1:8765"} to aim at the stand-in).
+    """
+
+    def __init__(self, collection, environment=None, overrides=None, timeout=30.0, pool_size=8):
+        self.collection = collection
+        self.variables = Variables(
+            dict(_enabled((environment or {}).get("values")), **(overrides or {})),
+            _enabled(collection.get("variable")))
+        self.timeout = timeout
+        self.http = urllib3.PoolManager(num_pools=4, maxsize=pool_size, block=False, retries=False,
+                                        timeout=urllib3.Timeout(total=timeout))
+        self.log = customLogger("postman")
+
+    @classmethod
+    def from_files(cls, collection_path, environment_path=None, **kwargs):
+        environment = load_json(environment_path) if environment_path else None
+        return cls(load_json(collection_path), environment, **kwargs)
+
+    # ---------- Structure ----------
+    def folders(self):
+        """[(name, [(path, item, auths, events)])] for each top-level folder; loose requests form one group."""
+        groups, loose = [], []
+        root_auth = [self.collection.get("auth")]
+        root_events = [self.collection]
+        for node in self.collection.get("item", []):
+            if "item" in node:
+                groups.append((node["name"], list(self._requests(node, (node["name"],),
+                                                                 root_auth, root_events))))
+            else:
+                loose.append(((node["name"],), node, root_auth, root_events))
+        if loose:
+            groups.insert(0, (self.collection.get("info", {}).get("name", "collection"), loose))
+        return groups
+
+    def find(self, name):
+        """(path, item, auths, events) of the first request called name or "Folder/Name"."""
+        wanted = tuple(part.strip() for part in name.split("/"))
+        for _, requests in self.folders():
+            for entry in requests:
+                if entry[0][-len(wanted):] == wanted:
+                    return entry
+        raise KeyError(f"No request named {name!r} in the collection")
+
+    def _requests(self, folder, path, auths, events):
+        auths = auths + [folder.get("auth")]
+        events = events + [folder]
+        for node in folder.get("item", []):
+            if "item" in node:
+                yield from self._requests(node, path + (node["name"],), auths, events)
+            else:
+                yield path + (node["name"],), node, auths, events
+
+    # ---------- Execution ----------
+    def run(self, concurrent=True, only=None):
+        """Run every folder (or those named in only); results come back in collection order."""
+        groups = [g for g in self.folders() if not only or g[0] in only]
+        if not concurrent:
+            shared = self.variables.fork()
+            return [r for _, requests in groups for r in self.run_folder(requests, shared)]
+        with ThreadPoolExecutor(max_workers=max(1, len(groups)), thread_name_prefix="postman") as pool:
+            futures = [pool.submit(self.run_folder, requests, self.variables.fork())
+                       for _, requests in groups]
+            return [r for f in futures for r in f.result()]
+
+    def run_folder(self, requests, variables):
+        return [self.run_request(path, item, auths, events, variables)
+                for path, item, auths, events in requests]
+
+    def run_request(self, path, item, auths, events, variables):
+        request = item.get("request", {})
+        result = RequestResult(path, request.get("method", "GET").upper(), "")
+        for source in events + [item]:
+            self._run_script(script_of(source, "prerequest"), variables, result, None, "pre-request")
+        url, headers, body = self.build(request, auths + [request.get("auth")], variables)
+        result.url = url
+        started = time.perf_counter()
+        try:
+            resp = self.http.request(result.method, url, body=body, headers=headers,
+                                     redirect=True, preload_content=True)
+        except urllib3.exceptions.HTTPError as e:
+            result.error = f"{type(e).__name__}: {e}"
+            self.log.error("%s %s failed: %s", result.method, url, result.error)
+            for name in test_names(script_of(item, "test")):
+                result.tests.append(TestResult(name, FAILED, f"request failed: {result.error}"))
+            return result
+        result.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        result.status = resp.status
+        response = _Response(resp, result.elapsed_ms)
+        for source in events + [item]:
+            self._run_script(script_of(source, "test"), variables, result, response, "test")
+        self.log.info("%s %s -> %s in %.0f ms (%s)", result.method, url, resp.status,
+                      result.elapsed_ms, result.name)
+        return result
+
+    def build(self, request, auths, variables):
+        """(url, headers, body) of a request with variables resolved and auth applied."""
+        url = request.get("url", "")
+        url = variables.resolve(url.get("raw", "") if isinstance(url, dict) else url)
+        headers = {variables.resolve(h["key"]): variables.resolve(h.get("value", ""))
+                   for h in request.get("header", []) if not h.get("disabled")}
+        lower = {k.lower() for k in headers}
+
+        # Nearest auth wins: request, then enclosing folders, then the collection
+        auth = next((a for a in reversed(auths) if a), None)
+        kind = (auth or {}).get("type", "noauth")
+        params = _enabled([dict(p, enabled=True) for p in (auth or {}).get(kind, [])]) \
+            if kind != "noauth" else {}
+        params = {k: variables.resolve(v) for k, v in params.items()}
+        if kind == "bearer" and "authorization" not in lower:
+            headers["Authorization"] = f"Bearer {params.get('token', '')}"
+        elif kind == "basic" and "authorization" not in lower:
+            raw = f"{params.get('username', '')}:{params.get('password', '')}".encode()
+            headers["Authorization"] = "Basic " + base64.b64encode(raw).decode()
+        elif kind == "apikey":
+            if params.get("in") == "query":
+                url += ("&" if "?" in url else "?") + urlencode({params.get("key", ""): params.get("value", "")})
+            else:
+                headers[params.get("key", "")] = params.get("value", "")
+        elif kind != "noauth":
+            self.log.warning("Auth type %s is not supported; request sent without it", kind)
+
+        spec = request.get("body") or {}
+        mode = spec.get("mode")
+        body = None
+        if mode == "raw":
+            body = variables.resolve(spec.get("raw", "")).encode("utf-8")
+            if spec.get("options", {}).get("raw", {}).get("language") == "json" and "content-type" not in lower:
+                headers["Content-Type"] = "application/json"
+        elif mode == "urlencoded":
+            body = urlencode({variables.resolve(p["key"]): variables.resolve(p.get("value", ""))
+                              for p in spec.get("urlencoded", []) if not p.get("disabled")}).encode()
+            headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
+        elif mode == "formdata":
+            fields = {variables.resolve(p["key"]): variables.resolve(p.get("value", ""))
+                      for p in spec.get("formdata", []) if not p.get("disabled") and p.get("type") != "file"}
+            body, content_type = urllib3.encode_multipart_formdata(fields)
+            headers["Content-Type"] = content_type
+        return url, headers, body
+
+    def _run_script(self, source, variables, result, response, event):
+        if not source.strip():
+            return
+        tests = []
+
+        def pm_test(name, fn):
+            try:
+                fn()
+                tests.append(TestResult(name, PASSED))
+            except JSError as e:
+                tests.append(TestResult(name, FAILED, str(e)))
+            except Untranslatable as e:
+                tests.append(TestResult(name, SKIPPED, f"not translatable: {e}"))
+            return UNDEF
+
+        def log(*args):
+            self.log.debug("[%s] %s", result.name, " ".join(js_str(a) for a in args))
+            return UNDEF
+
+        pm = Namespace(
+            test=pm_test,
+            expect=lambda value, message="": Expectation(value, message),
+            response=response if response is not None else UNDEF,
+            variables=_scope_api(variables.local, variables.get),
+            environment=_scope_api(variables.environment),
+            collectionVariables=_scope_api(variables.collection),
+            request=Namespace(url=result.url, method=result.method),
+            info=Namespace(requestName=result.path[-1], eventName=event),
+        )
+        try:
+            Interpreter(dict(BUILTINS, pm=pm, console=Namespace(log=log, info=log, warn=log, error=log)))\
+                .run(source)
+        except AssertionFailed as e:
+            result.script_errors.append(f"{event} script: AssertionError: {e}")
+        except JSError as e:
+            result.script_errors.append(f"{event} script: {e}")
+        except Untranslatable as e:
+            # Whole script unusable: report every literal pm.test as skipped
+            done = {t.name for t in tests}
+            tests += [TestResult(n, SKIPPED, f"not translatable: {e}")
+                      for n in test_names(source) if n not in done]
+        result.tests.extend(tests)
+
+
+# ---------- Stand-in ----------
+def standin_overrides(base_url):
+    """
+    Variables that aim the collection at a stand-in app: both hosts point at it,
+    ACCESS_TOKEN is a fresh session for the seeded user and TAG_ID an existing tag,
+    i.e. the state a previous newman run would have left in the environment.
+    """
+    from standin import StandinClient
+    from standin.app import default_user
+    client = StandinClient(base_url)
+    account = default_user()
+    token = client.login(account["email"], account["password"])
+    tag = client.create_tag(token, f"qa-seed-{uuid.uuid4().hex[:8]}", "#336699")
+    return {"verbatimly": base_url, "SUPABASE_URL": base_url,
+            "ACCESS_TOKEN": token, "TAG_ID": tag["id"], "TAG_NAME": tag["name"]}
+
+
+def print_report(results, out=sys.stdout):
+    counts = {PASSED: 0, FAILED: 0, SKIPPED: 0}
+    for r in results:
+        status = r.status if r.status is not None else "ERR"
+        print(f"{r.name}\n  {r.method} {r.url} [{status}, {r.elapsed_ms or 0:.0f} ms]", file=out)
+        for t in r.tests:
+            counts[t.outcome] += 1
+            mark = {PASSED: "ok", FAILED: "FAIL", SKIPPED: "skip"}[t.outcome]
+            print(f"    {mark:<4} {t.name}" + (f" - {t.message}" if t.message else ""), file=out)
+        for e in ([r.error] if r.error else []) + r.script_errors:
+            counts[FAILED] += 1
+            print(f"    FAIL {e}", file=out)
+    print(f"\n{len(results)} requests, {counts[PASSED]} passed, {counts[FAILED]} failed, "
+          f"{counts[SKIPPED]} skipped", file=out)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a Postman collection without newman")
+    parser.add_argument("collection")
+    parser.add_argument("-e", "--environment", help="Postman environment file")
+    parser.add_argument("--folder", action="append", help="Only run this top-level folder (repeatable)")
+    parser.add_argument("--var", action="append", default=[], metavar="KEY=VALUE",
+                        help="Override an environment variable (repeatable)")
+    parser.add_argument("--base-url", help="Point {{verbatimly}} and {{SUPABASE_URL}} at this host")
+    parser.add_argument("--standin", action="store_true", help="Start the local stand-in app and run against it")
+    parser.add_argument("--sequential", action="store_true", help="Run folders one by one on a shared environment")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    overrides = dict(v.split("=", 1) for v in args.var)
+    server = None
+    if args.standin:
+        from standin import StandinServer
+        server = StandinServer().start()
+        overrides = dict(standin_overrides(server.base_url), **overrides)
+    elif args.base_url:
+        overrides = dict({"verbatimly": args.base_url, "SUPABASE_URL": args.base_url}, **overrides)
+    try:
+        runner = PostmanRunner.from_files(args.collection, args.environment,
+                                          overrides=overrides, timeout=args.timeout)
+        started = time.perf_counter()
+        results = runner.run(concurrent=not args.sequential, only=args.folder)
+        counts = print_report(results)
+        print(f"Finished in {time.perf_counter() - started:.2f} s")
+        if args.json:
+            Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+            Path(args.json).write_text(json.dumps([r.as_dict() for r in results], indent=2), encoding="utf-8")
+    finally:
+        if server is not None:
+            server.stop()
+    return 1 if counts[FAILED] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+# utilities/results_stream.py
+"""
+Streams test results to disk while the suite runs (`pytest --results [path]`).
+
+    reports/results.jsonl   one line per TestStatus verification, one per finished test
+    reports/results.xml     JUnit XML; each <testcase> is appended as soon as the test ends
+
+Parallel workers write results.gw<N>.jsonl/.xml; utilities.parallel_runner merges them.
+The <testsuite> counters are written as fixed-width placeholders and patched in
+place on close, so the XML is always complete up to the last finished test.
+"""
+
+import json
+import os
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+
+__test__ = False
+
+PASS, FAIL = "PASS", "FAIL"
+_COUNTERS = ("tests", "failures", "errors", "skipped")
+
+
+class Verification:
+    """One TestStatus.mark/markFinal call."""
+
+    __slots__ = ("message", "status", "duration_s", "screenshot", "exception", "final", "test", "nodeid")
+
+    def __init__(self, message, status, duration_s, screenshot=None, exception=None, final=False,
+                 test=None, nodeid=None):
+        self.message = message
+        self.status = status
+        self.duration_s = duration_s
+        self.screenshot = screenshot
+        self.exception = exception
+        self.final = final
+        self.test = test
+        self.nodeid = nodeid
+
+    @property
+    def passed(self):
+        return self.status == PASS
+
+    def to_dict(self):
+        return {
+            "message": self.message,
+            "status": self.status,
+            "duration_s": round(self.duration_s, 3),
+            "screenshot": str(self.screenshot) if self.screenshot else None,
+            "exception": self.exception,
+            "final": self.final,
+            "test": self.test,
+            "nodeid": self.nodeid,
+        }
+
+
+def _junit_names(nodeid):
+    """("tests.home.login_tests.LoginTests", "test_x") from a pytest nodeid."""
+    parts = nodeid.split("::")
+    module = parts[0].replace("/", ".").replace("\\", ".")
+    if module.endswith(".py"):
+        module = module[:-3]
+    return ".".join([module] + parts[1:-1]), parts[-1]
+
+
+def _describe(longrepr):
+    """(full text, one-line reason) of a pytest report's longrepr."""
+    if not longrepr:
+        return "", None
+    if isinstance(longrepr, tuple):          # skips: (path, lineno, "Skipped: why")
+        return longrepr[2], longrepr[2].replace("Skipped: ", "", 1)
+    crash = getattr(longrepr, "reprcrash", None)
+    text = str(longrepr)
+    return text, crash.message if crash is not None else text.strip().splitlines()[-1]
+
+
+class _TestRecord:
+    __slots__ = ("nodeid", "outcome", "when", "duration_s", "longrepr", "reason", "verifications")
+
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+        self.outcome = "passed"
+        self.when = None
+        self.duration_s = 0.0
+        self.longrepr = ""
+        self.reason = None
+        self.verifications = []
+
+
+class ResultStream:
+    """Incremental JSON-lines + JUnit writer; ResultStream.active is the running one."""
+
+    active = None
+
+    def __init__(self, path="reports/results", worker="main"):
+        base = Path(path)
+        if base.suffix in (".jsonl", ".xml", ".json"):
+            base = base.with_suffix("")
+        if worker != "main":
+            base = base.with_name(f"{base.name}.{worker}")
+        base.parent.mkdir(parents=True, exist_ok=True)
+        self.worker = worker
+        self.json_path = base.with_name(base.name + ".jsonl")
+        self.xml_path = base.with_name(base.name + ".xml")
+        self.counts = dict.fromkeys(_COUNTERS, 0)
+        self.started = time.monotonic()
+        self.timestamp = datetime.now().isoformat(timespec="seconds")     # suite start, reused on every header patch
+        self.current = None
+        self._tests = {}
+        self._json = open(self.json_path, "w", encoding="utf-8")
+        self._xml = open(self.xml_path, "wb")
+        self._xml.write(b'<?xml version="1.0" encoding="utf-8"?>\n<testsuites>\n')
+        self._header_at = self._xml.tell()
+        self._xml.write(self._header())
+        self._xml.flush()
+
+    def _header(self):
+        name = "pytest" if self.worker == "main" else f"pytest[{self.worker}]"
+        attrs = " ".join(f'{k}="{self.counts[k]:010d}"' for k in _COUNTERS)
+        return (f'<testsuite name="{name}" {attrs} time="{time.monotonic() - self.started:012.3f}" '
+                f'timestamp="{self.timestamp}">\n').encode("utf-8")
+
+    def _emit(self, entry):
+        self._json.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+        self._json.flush()
+
+    # ---------- Activation ----------
+    def install(self):
+        ResultStream.active = self
+        return self
+
+    @classmethod
+    def current_nodeid(cls):
+        stream = cls.active
+        return stream.current if stream is not None else None
+
+    # ---------- Recording ----------
+    def start_test(self, nodeid):
+        self.current = nodeid
+        self._tests[nodeid] = _TestRecord(nodeid)
+
+    def add_verification(self, verification):
+        verification.nodeid = verification.nodeid or self.current
+        record = self._tests.get(verification.nodeid)
+        if record is not None:
+            record.verifications.append(verification)
+        self._emit(dict(verification.to_dict(), type="verification", worker=self.worker))
+
+    def add_report(self, report):
+        """Fold one pytest phase report in; the test is written after its teardown."""
+        record = self._tests.get(report.nodeid)
+        if record is None:
+            record = self._tests[report.nodeid] = _TestRecord(report.nodeid)
+        record.duration_s += report.duration
+        if report.outcome != "passed" and record.outcome == "passed":
+            record.outcome, record.when = report.outcome, report.when
+            record.longrepr, record.reason = _describe(report.longrepr)
+        if report.when == "teardown":
+            self._finish(self._tests.pop(report.nodeid))
+            self.current = None
+
+    def _finish(self, record):
+        failed = [v for v in record.verifications if not v.passed]
+        self._emit({
+            "type": "test",
+            "nodeid": record.nodeid,
+            "worker": self.worker,
+            "outcome": record.outcome,
+            "phase": record.when,
+            "duration_s": round(record.duration_s, 3),
+            "verifications": len(record.verifications),
+            "failed_verifications": [v.message for v in failed],
+            "reason": record.reason,
+        })
+
+        classname, name = _junit_names(record.nodeid)
+        case = ET.Element("testcase", classname=classname, name=name, time=f"{record.duration_s:.3f}")
+        if record.verifications:
+            props = ET.SubElement(case, "properties")
+            for i, v in enumerate(record.verifications):
+                ET.SubElement(props, "property", name=f"verification.{i}",
+                              value=f"{v.status} {v.duration_s:.3f}s {v.message}")
+                if v.screenshot:
+                    ET.SubElement(props, "property", name=f"verification.{i}.screenshot", value=str(v.screenshot))
+        self.counts["tests"] += 1
+        if record.outcome == "skipped":
+            self.counts["skipped"] += 1
+            ET.SubElement(case, "skipped", message=record.reason or "")
+        elif record.outcome == "failed":
+            tag = "failure" if record.when == "call" else "error"
+            self.counts["failures" if tag == "failure" else "errors"] += 1
+            message = "; ".join(v.message for v in failed) or record.reason or ""
+            ET.SubElement(case, tag, message=message).text = record.longrepr
+        self._xml.write(ET.tostring(case, encoding="utf-8") + b"\n")
+        self._patch_header()
+
+    def _patch_header(self):
+        end = self._xml.tell()
+        self._xml.seek(self._header_at)
+        self._xml.write(self._header())
+        self._xml.seek(end)
+        self._xml.flush()
+
+    def close(self):
+        for record in list(self._tests.values()):
+            self._finish(record)
+        self._tests.clear()
+        self._patch_header()
+        self._xml.write(b"</testsuite>\n</testsuites>\n")
+        self._xml.close()
+        self._json.close()
+        if ResultStream.active is self:
+            ResultStream.active = None
+
+
+def worker_results(path, count):
+    """Per-worker result files written for `path` by `count` workers, as (jsonl, xml) lists."""
+    base = Path(path)
+    if base.suffix in (".jsonl", ".xml", ".json"):
+        base = base.with_suffix("")
+    jsonl = [base.with_name(f"{base.name}.gw{i}.jsonl") for i in range(count)]
+    xml = [base.with_name(f"{base.name}.gw{i}.xml") for i in range(count)]
+    return base, [p for p in jsonl if p.exists()], [p for p in xml if p.exists()]
+
+
+def _read_worker_xml(path):
+    """
+    Root of a worker's JUnit file. A worker that died before close() left no closing
+    tags (and maybe half a testcase): keep every complete line, close the document
+    and recount the suite from the testcases that made it.
+    """
+    data = Path(path).read_bytes()
+    try:
+        return ET.fromstring(data)
+    except ET.ParseError:
+        pass
+    try:
+        root = ET.fromstring(data[:data.rfind(b"\n") + 1] + b"</testsuite>\n</testsuites>\n")
+    except ET.ParseError:
+        return None
+    for suite in root:
+        cases = suite.findall("testcase")
+        suite.set("tests", str(len(cases)))
+        for key, tag in (("failures", "failure"), ("errors", "error"), ("skipped", "skipped")):
+            suite.set(key, str(sum(case.find(tag) is not None for case in cases)))
+    return root
+
+
+def merge_results(path, count):
+    """Fold every worker's results into <path>.jsonl and <path>.xml; returns the merged totals."""
+    base, jsonl, xml = worker_results(path, count)
+    if not jsonl and not xml:
+        return None
+    with open(base.with_name(base.name + ".jsonl"), "w", encoding="utf-8") as out:
+        for p in jsonl:
+            with open(p, encoding="utf-8") as fh:
+                out.writelines(fh)
+            os.remove(p)
+    merged = ET.Element("testsuites")
+    totals = dict.fromkeys(_COUNTERS, 0)
+    elapsed = 0.0
+    for p in xml:
+        root = _read_worker_xml(p)
+        if root is None:
+            continue      # not even the header made it; the JSON lines are still merged
+        for suite in root:
+            for key in _COUNTERS:
+                value = int(suite.get(key, 0))
+                suite.set(key, str(value))
+                totals[key] += value
+            elapsed = max(elapsed, float(suite.get("time", 0)))
+            suite.set("time", f"{float(suite.get('time', 0)):.3f}")
+            merged.append(suite)
+        os.remove(p)
+    for key, value in totals.items():
+        merged.set(key, str(value))
+    merged.set("time", f"{elapsed:.3f}")
+    ET.ElementTree(merged).write(base.with_name(base.name + ".xml"), encoding="utf-8", xml_declaration=True)
+    return totals
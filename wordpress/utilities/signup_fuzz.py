@@ -0,0 +1,428 @@
+# utilities/signup_fuzz.py
+"""
+Property-based fuzzing of the signup form through LoginPage.complete_registration.
+
+    python -m utilities.signup_fuzz --standin --cases 300 --browsers 4 --seed 7 --headless
+    python -m utilities.signup_fuzz --base-url http://127.0.0.1:8765 --minutes 5
+
+Every case starts from a valid registration and mutates one field with one of the
+strategies below; the values come from a generator seeded with (--seed, case
+number), so a case is reproduced by its seed and number alone.
+    unicode     combining marks, bidi overrides, zero-width, astral, homoglyphs, controls
+    injection   SQL, script, template, path and header payloads
+    length      the field at boundary lengths (0, 1, 7, 8, 9 ... 255, 256 ... 4096)
+    format      mutations of a valid value (for emails: double @, dots, spaces, no TLD ...)
+Cases run on --browsers pooled browsers (DriverPool). Each keeps the signup page
+loaded and resets the form between cases. After each submit one script reads the
+outcome: the page path, the fields the browser flagged, the error text shown and
+the HTTP statuses the page saw. Its signature groups the cases that behaved alike.
+A case fails when:
+    crashed       complete_registration or the driver raised
+    server_error  the page got a 5xx response
+    script_ran    an injected payload executed in the page
+    silent        nothing happened: no navigation, no flagged field, no message
+The first input of each failing signature is shrunk to the smallest value that
+still fails the same way: chunks are removed, then characters simplified.
+Fuzzing creates accounts, so point it at the stand-in, never at a shared server.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from utilities.custom_logger import customLogger
+
+STRATEGIES = ("unicode", "injection", "length", "format")
+FIELDS = ("first_name", "last_name", "email", "password")
+FAILURES = ("crashed", "server_error", "script_ran", "silent")
+
+VALID = {"first_name": "Fuzz", "last_name": "Case", "password": "TallBuildings123!"}
+
+# A payload that runs sets window.__fuzzXss; the outcome script reads it
+_MARK = "window.__fuzzXss=1"
+
+UNICODE = [
+    "e\u0301\u0301\u0301", "\u202eevil\u202c", "a\u200bb\u200cc\u200dd", "\ufeffname",
+    "\U0001F469\U0001F3FD\u200d\U0001F4BB", "\u6d4b\u8bd5\u7528\u6237", "\u0430dmin", "\uff21\uff22\uff23",
+    "\U0001D518\U0001D52B\U0001D526", "\u0130stanbul", "Stra\u00dfe", "\u0645\u0631\u062d\u0628\u0627",
+    "\u0928\u092e\u0938\u094d\u0924\u0947", "a\x00b", "line\nbreak", "tab\tbed", "\u00a0padded\u00a0",
+    "Z\u0351\u036b\u0343\u036a\u0302\u036b\u033d\u034f\u0334\u0319", "\u2028sep", "\ufffd",
+]
+
+INJECTION = [
+    "'; DROP TABLE users; --", "' OR '1'='1", "admin'--", "1; SELECT pg_sleep(5)--", "\" OR \"\"=\"",
+    f"<script>{_MARK}</script>", f"<img src=x onerror=\"{_MARK}\">", f"\"><svg onload={_MARK}>",
+    f"javascript:{_MARK}", f"'-{_MARK}-'", "{{7*7}}", "${7*7}", "<%= 7*7 %>", "%s%s%s%n",
+    "../../../../etc/passwd", "a\r\nSet-Cookie: fuzz=1", "\"}]}", "{\"$gt\": \"\"}", "*)(uid=*))(|(uid=*",
+    "<!--", "]]>", "\\", "null", "undefined", "NaN", "-1", "0x7fffffff",
+]
+
+LENGTHS = (0, 1, 2, 7, 8, 9, 63, 64, 65, 127, 128, 129, 254, 255, 256, 320, 1024, 4096)
+
+# Wraps fetch/XHR once per page load to record response statuses; resets the record per case
+_HOOK_JS = """
+if (!window.__fuzz) {
+  window.__fuzz = {statuses: []};
+  if (window.fetch) {
+    var fetch0 = window.fetch;
+    window.fetch = function () {
+      return fetch0.apply(this, arguments).then(
+        function (r) { window.__fuzz.statuses.push(r.status); return r; },
+        function (e) { window.__fuzz.statuses.push(0); throw e; });
+    };
+  }
+  var send0 = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    this.addEventListener('loadend', function () { window.__fuzz.statuses.push(this.status); });
+    return send0.apply(this, arguments);
+  };
+}
+window.__fuzz.statuses = [];
+window.__fuzzXss = 0;
+"""
+
+# Everything the outcome signature needs, in one round trip (validity is read, not re-checked)
+_OUTCOME_JS = """
+var FLAGS = ['valueMissing', 'typeMismatch', 'patternMismatch', 'tooLong', 'tooShort',
+             'rangeUnderflow', 'rangeOverflow', 'stepMismatch', 'badInput', 'customError'];
+var out = {path: location.pathname, xss: !!window.__fuzzXss,
+           statuses: window.__fuzz ? window.__fuzz.statuses.slice() : null, invalid: [], errors: [],
+           success: /check your email|welcome/i.test(document.body ? document.body.innerText : '')};
+var fields = document.querySelectorAll('input, textarea, select');
+for (var i = 0; i < fields.length; i++) {
+  var el = fields[i];
+  if (!el.willValidate || el.validity.valid) continue;
+  for (var k = 0; k < FLAGS.length; k++) {
+    if (el.validity[FLAGS[k]]) { out.invalid.push((el.id || el.name) + ':' + FLAGS[k]); break; }
+  }
+}
+var errs = document.querySelectorAll("[role=alert], .error, .form-error, .field-error, .error-message");
+for (var j = 0; j < errs.length; j++) {
+  var text = (errs[j].innerText || '').trim();
+  if (text && errs[j].offsetParent !== null) out.errors.push(text.slice(0, 200));
+}
+return out;
+"""
+
+log = customLogger("fuzz")
+
+
+# ---------- Generation ----------
+class FuzzCase:
+    """One registration: valid values with one field replaced by a generated one."""
+
+    __slots__ = ("index", "strategy", "field", "values")
+
+    def __init__(self, index, strategy, field, values):
+        self.index = index
+        self.strategy = strategy
+        self.field = field
+        self.values = values
+
+    @property
+    def value(self):
+        return self.values[self.field]
+
+    def with_value(self, value, tag=None):
+        """The same case with the fuzzed field set to value (and, unless it is the email, a fresh email)."""
+        values = dict(self.values)
+        values[self.field] = value
+        if self.field == "password":
+            values["confirm_password"] = value
+        if tag is not None and self.field != "email":
+            values["email"] = f"fuzz.{self.index}.{tag}@example.com"
+        return FuzzCase(self.index, self.strategy, self.field, values)
+
+    def to_dict(self):
+        value = self.value
+        return {"case": self.index, "strategy": self.strategy, "field": self.field,
+                "value": value if len(value) <= 200 else value[:200] + "...", "length": len(value)}
+
+
+def _email_mutations(rng, email):
+    local, _, domain = email.partition("@")
+    name, _, tld = domain.rpartition(".")
+    return [
+        f"{local}@@{domain}", f"{local}{domain}", f".{local}@{domain}", f"{local}.@{domain}",
+        f"{local}@{name}..{tld}", f"{local[:3]} {local[3:]}@{domain}", f" {email} ", email.upper(),
+        f"{local}@{name}", f"\"{local}\"@{domain}", f"{local}+tag@{domain}", f"{local}@[127.0.0.1]",
+        f"{local}@xn--bcher-kva.{tld}", f"{local}@b\u00fccher.{tld}", f"@{domain}", f"{local}@",
+        f"{local}@{domain}.", f"{local}@-{domain}", f"{local}(comment)@{domain}", f"{'a' * 65}@{domain}",
+        f"{local}@{'d' * 64}.{tld}", f"{local}@{domain}\n", rng.choice(UNICODE) + email,
+    ]
+
+
+def _text_mutations(rng, value):
+    return [
+        f"  {value}  ", value.upper(), value.lower(), value.swapcase(), value * 20, value[::-1],
+        "".join(rng.choice((c, c.upper(), c + c)) for c in value), value + "1234567890", "12345678",
+        "".join(rng.choice("!@#$%^&*()_+-=[]{};:'\",.<>/?`~|\\") for _ in range(12)), " " * 8, "",
+    ]
+
+
+def generate(seed, index):
+    """Case `index` of the run seeded with `seed` (its own RNG: any case can be regenerated alone)."""
+    rng = random.Random(f"{seed}:{index}")
+    strategy = rng.choice(STRATEGIES)
+    field = rng.choice(FIELDS)
+    values = dict(VALID, email=f"fuzz.{seed}.{index}@example.com")
+    base = values[field]
+    if strategy == "unicode":
+        pieces = rng.sample(UNICODE, rng.randint(1, 3))
+        value = "".join(pieces) if field != "email" else f"{''.join(pieces)}.{base}"
+    elif strategy == "injection":
+        payload = rng.choice(INJECTION)
+        value = payload if field != "email" else rng.choice([payload, f"{payload}@example.com",
+                                                             base.replace("@", payload + "@", 1)])
+    elif strategy == "length":
+        n = rng.choice(LENGTHS)
+        if field == "email":
+            domain = "@example.com"
+            value = ("a" * max(0, n - len(domain)) + domain) if n > len(domain) else "a" * n
+        else:
+            value = (base * (n // max(1, len(base)) + 1))[:n]
+    else:
+        mutations = _email_mutations(rng, base) if field == "email" else _text_mutations(rng, base)
+        value = rng.choice(mutations)
+    values[field] = value
+    values["confirm_password"] = values["password"]
+    return FuzzCase(index, strategy, field, values)
+
+
+# ---------- Outcomes ----------
+def signature(outcome, case):
+    """What the page did, with the case's own values and any digits masked, so alike outcomes match."""
+    if outcome.get("crashed"):
+        return ("crashed", outcome["crashed"])
+    errors = []
+    for text in outcome["errors"]:
+        for value in case.values.values():
+            if len(value) > 2:
+                text = text.replace(value, "<value>")
+        errors.append(re.sub(r"\d+", "#", text.lower()))
+    statuses = sorted({f"{s // 100}xx" for s in outcome["statuses"] or []})
+    return (outcome["path"], tuple(sorted(outcome["invalid"])), tuple(sorted(set(errors))),
+            tuple(statuses), outcome["success"])
+
+
+def failure(outcome, navigated):
+    """The property the outcome breaks (one of FAILURES), or None."""
+    if outcome.get("crashed"):
+        return "crashed"
+    if outcome["xss"]:
+        return "script_ran"
+    if any(s >= 500 for s in outcome["statuses"] or []):
+        return "server_error"
+    if not (navigated or outcome["success"] or outcome["invalid"] or outcome["errors"]):
+        return "silent"
+    return None
+
+
+def _shrink_candidates(value):
+    """Smaller values first: chunks removed (halves, quarters ...), then characters made plain."""
+    n = len(value)
+    chunk = n // 2
+    while chunk >= 1:
+        for start in range(0, n, chunk):
+            yield value[:start] + value[start + chunk:]
+        chunk //= 2
+    for i, ch in enumerate(value):
+        if ch != "a":
+            yield value[:i] + "a" + value[i + 1:]
+
+
+def _simpler(a, b):
+    return (len(a), sum(map(ord, a))) < (len(b), sum(map(ord, b)))
+
+
+# ---------- Runner ----------
+class SignupFuzzer:
+    """Runs generated cases on a DriverPool's browsers and folds their outcomes together."""
+
+    def __init__(self, pool, seed, shrink_runs=60):
+        self.pool = pool
+        self.seed = seed
+        self.shrink_runs = shrink_runs
+        self.outcomes = {}        # signature -> {"count", "failure", "example"}
+        self.failures = {}        # signature -> {"failure", "case", "shrunk", "shrink_runs"}
+        self.strategies = Counter()
+        self.cases = 0
+        self.elapsed_s = 0.0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def _take(self, cases, deadline):
+        with self._lock:
+            if (cases is not None and self._next >= cases) or (deadline and time.monotonic() >= deadline):
+                return None
+            self._next += 1
+            return self._next - 1
+
+    def execute(self, page, case):
+        """Submit one case on page; (outcome, failure)."""
+        try:
+            page.reset_signup_form()
+            url_before = page.driver.current_url
+            page.driver.execute_script(_HOOK_JS)
+            page.complete_registration(case.values["first_name"], case.values["last_name"],
+                                       case.values["email"], case.values["password"],
+                                       case.values["confirm_password"])
+            outcome = page.driver.execute_script(_OUTCOME_JS)
+            navigated = page.driver.current_url.split("?")[0] != url_before.split("?")[0]
+        except Exception as e:
+            outcome, navigated = {"crashed": type(e).__name__}, False
+        return outcome, failure(outcome, navigated)
+
+    def shrink(self, page, case, kind):
+        """Smallest value of case's field that still fails with kind; (case, runs used)."""
+        best, runs, improved = case, 0, True
+        while improved and runs < self.shrink_runs:
+            improved = False
+            for value in _shrink_candidates(best.value):
+                if runs >= self.shrink_runs:
+                    break
+                if not _simpler(value, best.value):
+                    continue
+                runs += 1
+                candidate = case.with_value(value, tag=f"s{runs}")
+                if self.execute(page, candidate)[1] == kind:
+                    best, improved = candidate, True
+                    break
+        return best, runs
+
+    def _worker(self, cases, deadline):
+        from pages.home.CreateAccount import LoginPage
+        try:
+            pooled = self.pool.acquire()
+        except Exception as e:
+            log.error("No browser for %s: %s", threading.current_thread().name, e)
+            return
+        try:
+            page = LoginPage(pooled.driver)
+            page.navigate_to_signup_page()
+            while True:
+                index = self._take(cases, deadline)
+                if index is None:
+                    return
+                case = generate(self.seed, index)
+                outcome, kind = self.execute(page, case)
+                sig = signature(outcome, case)
+                with self._lock:
+                    self.cases += 1
+                    self.strategies[case.strategy] += 1
+                    entry = self.outcomes.setdefault(sig, {"count": 0, "failure": kind, "example": case.to_dict()})
+                    entry["count"] += 1
+                    new_failure = kind is not None and sig not in self.failures
+                    if new_failure:
+                        self.failures[sig] = {"failure": kind, "case": case.to_dict()}
+                if new_failure:
+                    log.info("Case %d (%s %s) failed: %s - shrinking", index, case.strategy, case.field, kind)
+                    shrunk, runs = self.shrink(page, case, kind)
+                    with self._lock:
+                        self.failures[sig].update(shrunk=shrunk.to_dict(), shrink_runs=runs)
+        finally:
+            self.pool.release(pooled)
+
+    def run(self, cases=None, minutes=None, browsers=1):
+        """Run `cases` cases (or for `minutes`) on `browsers` threads, one pooled browser each."""
+        deadline = time.monotonic() + minutes * 60 if minutes else None
+        started = time.monotonic()
+        threads = [threading.Thread(target=self._worker, args=(cases, deadline), name=f"fuzz-{i}", daemon=True)
+                   for i in range(browsers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.elapsed_s = time.monotonic() - started
+        return self.summary()
+
+    def summary(self):
+        per_minute = 60.0 * self.cases / self.elapsed_s if self.elapsed_s else 0.0
+        outcomes = sorted(self.outcomes.items(), key=lambda kv: -kv[1]["count"])
+        return {
+            "seed": self.seed,
+            "cases": self.cases,
+            "elapsed_s": round(self.elapsed_s, 2),
+            "cases_per_minute": round(per_minute, 1),
+            "strategies": dict(self.strategies),
+            "outcomes": [dict(entry, signature=list(sig)) for sig, entry in outcomes],
+            "failures": list(self.failures.values()),
+        }
+
+
+def print_summary(summary, out=sys.stdout):
+    print(f"\n{summary['cases']} cases in {summary['elapsed_s']} s "
+          f"({summary['cases_per_minute']} cases/min), seed {summary['seed']}", file=out)
+    print("strategies  " + "  ".join(f"{k}: {v}" for k, v in sorted(summary["strategies"].items())), file=out)
+    print(f"{len(summary['outcomes'])} distinct outcome(s)", file=out)
+    for entry in summary["outcomes"]:
+        if entry["signature"][0] == "crashed":
+            print(f"  {entry['count']:>6}  crashed: {entry['signature'][1]}  [crashed]", file=out)
+            continue
+        path, invalid, errors, statuses, success = entry["signature"]
+        what = ", ".join(filter(None, [path, " ".join(invalid or []), " | ".join(errors or []),
+                                       " ".join(statuses or []), "success" if success else None]))
+        flag = f"  [{entry['failure']}]" if entry["failure"] else ""
+        print(f"  {entry['count']:>6}  {what}{flag}", file=out)
+    for f in summary["failures"]:
+        shrunk = f.get("shrunk") or f["case"]
+        print(f"FAIL {f['failure']}: case {f['case']['case']} {f['case']['field']} = {shrunk['value']!r} "
+              f"(shrunk from {f['case']['length']} to {shrunk['length']} chars)", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Property-based fuzzing of the signup form")
+    parser.add_argument("--cases", type=int, default=200, help="cases to run (unless --minutes)")
+    parser.add_argument("--minutes", type=float, default=None, help="run for this long instead")
+    parser.add_argument("--seed", type=int, default=None, help="generator seed (default: printed, time based)")
+    parser.add_argument("--browsers", type=int, default=2, help="pooled browsers running cases in parallel")
+    parser.add_argument("--browser", default="chrome", help="chrome | firefox")
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--shrink-runs", type=int, default=60, help="submits spent shrinking each failure")
+    parser.add_argument("--base-url", help="app to fuzz (a stand-in you started)")
+    parser.add_argument("--standin", action="store_true", help="Start the local stand-in app and fuzz it")
+    parser.add_argument("--standin-latency", type=float, default=0.0)
+    parser.add_argument("--json", default="reports/signup_fuzz.json")
+    args = parser.parse_args(argv)
+    if not (args.standin or args.base_url):
+        parser.error("give --standin or --base-url: fuzzing creates accounts")
+    seed = args.seed if args.seed is not None else int(time.time())
+
+    from base.driver_pool import DriverPool
+    server = None
+    if args.standin:
+        from standin import StandinServer
+        server = StandinServer(latency_ms=args.standin_latency).start()
+        base_url = server.base_url
+    else:
+        base_url = args.base_url.rstrip("/")
+    os.environ["BASE_URL"] = base_url      # read by WebDriverFactory and the page objects
+    pool = DriverPool(browser=args.browser, headless=args.headless, size=args.browsers, max_uses=10_000)
+    try:
+        log.info("Fuzzing %s/auth/signup: seed %d, %s on %d browser(s)", base_url, seed,
+                 f"{args.minutes} min" if args.minutes else f"{args.cases} cases", args.browsers)
+        fuzzer = SignupFuzzer(pool, seed, shrink_runs=args.shrink_runs)
+        summary = fuzzer.run(None if args.minutes else args.cases, args.minutes, args.browsers)
+    finally:
+        pool.close()
+        if server is not None:
+            server.stop()
+
+    summary["base_url"] = base_url
+    print_summary(summary)
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Results written to {args.json}")
+    return 1 if summary["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+# utilities/signup_load.py
+"""
+Load generator for POST /api/auth/signup, built on the collection's Registration request.
+
+    python -m utilities.signup_load --standin --users 50 --duration 30 --ramp-up 10
+    python -m utilities.signup_load --model open --rate 40 --users 100 --base-url http://127.0.0.1:8765
+
+closed model: --users virtual users, each sending its next request as soon as the
+    previous one answered (plus --think ms); users start evenly over --ramp-up.
+open model:   requests arrive at --rate per second whatever the server does (the rate
+    ramps up linearly over --ramp-up); at most --users are in flight, arrivals
+    beyond that are counted as dropped instead of silently queued.
+Each request carries a fresh email from Util.getUniqueName. Every virtual user
+keeps one keep-alive connection. Results (p50/p95/p99, status histogram,
+per-second timeline) go to the console and to --json.
+Against the in-process stand-in (--standin) client and server share one Python
+process; for numbers that only measure the server, run `python -m standin` separately.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from utilities.async_http import Connection, split_url
+from utilities.custom_logger import customLogger
+from utilities.instrumentation import Histogram
+from utilities.postman_runner import PostmanRunner
+from utilities.util import Util
+
+DEFAULT_COLLECTION = "api_tests/Verbatimly.postman_collection.json"
+DEFAULT_REQUEST = "Positive Tests/Registration"
+
+log = customLogger("load")
+
+
+# ---------- Stats ----------
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(p / 100.0 * len(sorted_values)) - 1)]
+
+
+class LoadStats:
+    def __init__(self):
+        self.latencies = []
+        self.statuses = Counter()
+        self.histogram = Histogram()
+        self.timeline = Counter()       # second since start -> completed requests
+        self.dropped = 0
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def record(self, status, ms):
+        self.latencies.append(ms)
+        self.statuses[str(status)] += 1
+        self.histogram.add(ms)
+        self.timeline[int(time.perf_counter() - self.started)] += 1
+
+    def summary(self):
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        values = sorted(self.latencies)
+        return {
+            "requests": len(values),
+            "dropped": self.dropped,
+            "elapsed_s": round(elapsed, 2),
+            "throughput_rps": round(len(values) / elapsed, 1) if elapsed else 0.0,
+            "latency_ms": {
+                "min": round(values[0], 1) if values else 0.0,
+                "p50": round(percentile(values, 50), 1),
+                "p95": round(percentile(values, 95), 1),
+                "p99": round(percentile(values, 99), 1),
+                "max": round(values[-1], 1) if values else 0.0,
+                "mean": round(sum(values) / len(values), 1) if values else 0.0,
+            },
+            "status": dict(sorted(self.statuses.items())),
+            "histogram": self.histogram.to_dict(),
+            "timeline": [self.timeline.get(s, 0) for s in range(int(elapsed) + 1)],
+        }
+
+
+# ---------- Load ----------
+class SignupLoad:
+    """Sends the Registration request with a unique email per call."""
+
+    def __init__(self, url, headers, template, timeout=30.0):
+        self.url = url
+        self.target = split_url(url)[3]
+        self.headers = {k: v for k, v in headers.items() if k.lower() not in ("host", "content-length")}
+        self.headers.setdefault("Content-Type", "application/json")
+        self.template = template
+        self.timeout = timeout
+        self.util = Util()
+        self.stats = LoadStats()
+
+    def payload(self):
+        unique = self.util.getUniqueName(12)
+        return json.dumps(dict(self.template, email=f"load.{unique}@example.com",
+                               lastName=unique.capitalize())).encode("utf-8")
+
+    async def send(self, conn):
+        started = time.perf_counter()
+        try:
+            status, _ = await asyncio.wait_for(
+                conn.request("POST", self.target, self.headers, self.payload()), self.timeout)
+        except asyncio.TimeoutError:
+            conn.close()
+            status = "timeout"
+        except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+            conn.close()
+            status = f"error:{type(e).__name__}"
+        self.stats.record(status, (time.perf_counter() - started) * 1000)
+
+    def connection(self):
+        return Connection.for_url(self.url)
+
+    async def closed(self, users, duration, ramp_up=0.0, think_ms=0.0, iterations=None):
+        deadline = time.perf_counter() + duration
+
+        async def user(index):
+            await asyncio.sleep(ramp_up * index / users if users > 1 else 0.0)
+            conn = self.connection()
+            done = 0
+            try:
+                while time.perf_counter() < deadline and (iterations is None or done < iterations):
+                    await self.send(conn)
+                    done += 1
+                    if think_ms:
+                        await asyncio.sleep(think_ms / 1000.0)
+            finally:
+                conn.close()
+
+        await asyncio.gather(*(user(i) for i in range(users)))
+        self.stats.finished = time.perf_counter()
+
+    async def open(self, rate, users, duration, ramp_up=0.0):
+        idle = [self.connection() for _ in range(users)]
+        inflight = set()
+
+        async def one():
+            conn = idle.pop()
+            try:
+                await self.send(conn)
+            finally:
+                idle.append(conn)
+
+        start = time.perf_counter()
+        sent = 0.0   # requests due so far (fractional, integrated over the ramp)
+        while True:
+            now = time.perf_counter() - start
+            if now >= duration:
+                break
+            # Arrivals due by now: rate ramps linearly from 0 to `rate` over ramp_up
+            if ramp_up and now < ramp_up:
+                due = rate * now * now / (2 * ramp_up)
+            else:
+                due = rate * (now - ramp_up / 2)
+            while sent + 1 <= due:
+                sent += 1
+                if not idle:
+                    self.stats.dropped += 1
+                    continue
+                task = asyncio.ensure_future(one())
+                inflight.add(task)
+                task.add_done_callback(inflight.discard)
+            await asyncio.sleep(min(0.005, 1.0 / rate if rate else 0.005))
+        if inflight:
+            await asyncio.gather(*inflight)
+        self.stats.finished = time.perf_counter()
+        for conn in idle:
+            conn.close()
+
+
+def print_summary(summary, out=sys.stdout):
+    lat = summary["latency_ms"]
+    print(f"\n{summary['requests']} requests in {summary['elapsed_s']} s "
+          f"({summary['throughput_rps']} req/s), {summary['dropped']} dropped", file=out)
+    print(f"latency ms  min {lat['min']}  p50 {lat['p50']}  p95 {lat['p95']}  "
+          f"p99 {lat['p99']}  max {lat['max']}  mean {lat['mean']}", file=out)
+    print("status      " + "  ".join(f"{k}: {v}" for k, v in summary["status"].items()), file=out)
+    buckets = summary["histogram"]["buckets"] if "buckets" in summary["histogram"] else {}
+    width = max(buckets.values() or [1])
+    for label, count in buckets.items():
+        if count:
+            print(f"  {label:>8} ms  {'#' * max(1, round(40 * count / width))} {count}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent load on the signup endpoint")
+    parser.add_argument("--collection", default=DEFAULT_COLLECTION)
+    parser.add_argument("-e", "--environment", default=None)
+    parser.add_argument("--request", default=DEFAULT_REQUEST, help='"Folder/Name" of the request to replay')
+    parser.add_argument("--model", choices=("closed", "open"), default="closed")
+    parser.add_argument("--users", type=int, default=10, help="virtual users (closed) / max in flight (open)")
+    parser.add_argument("--rate", type=float, default=20.0, help="arrivals per second (open model)")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="seconds to reach full users/rate")
+    parser.add_argument("--iterations", type=int, default=None, help="requests per user (closed model)")
+    parser.add_argument("--think", type=float, default=0.0, help="ms between a user's requests")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--base-url", help="Point {{verbatimly}} at this host")
+    parser.add_argument("--standin", action="store_true", help="Start the local stand-in app and load it")
+    parser.add_argument("--standin-latency", type=float, default=0.0)
+    parser.add_argument("--json", default="reports/signup_load.json")
+    args = parser.parse_args(argv)
+
+    server = None
+    overrides = {}
+    if args.standin:
+        from standin import StandinServer
+        server = StandinServer(latency_ms=args.standin_latency).start()
+        overrides["verbatimly"] = server.base_url
+    elif args.base_url:
+        overrides["verbatimly"] = args.base_url
+    try:
+        runner = PostmanRunner.from_files(args.collection, args.environment, overrides=overrides)
+        _, item, auths, _ = runner.find(args.request)
+        request = item["request"]
+        url, headers, body = runner.build(request, auths + [request.get("auth")], runner.variables.fork())
+        load = SignupLoad(url, headers, json.loads(body or b"{}"), timeout=args.timeout)
+        log.info("Signup load: %s model, %d users, %.0f s against %s", args.model, args.users,
+                 args.duration, url)
+        if args.model == "closed":
+            asyncio.run(load.closed(args.users, args.duration, args.ramp_up, args.think, args.iterations))
+        else:
+            asyncio.run(load.open(args.rate, args.users, args.duration, args.ramp_up))
+    finally:
+        if server is not None:
+            server.stop()
+
+    summary = dict(load.stats.summary(), model=args.model, users=args.users, url=url,
+                   rate=args.rate if args.model == "open" else None, ramp_up_s=args.ramp_up)
+    print_summary(summary)
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        print(f"Results written to {args.json}")
+    return 0 if summary["requests"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+# utilities/tags_bench.py
+"""
+How /api/tags latency scales with the number of tags a user owns.
+
+    python -m utilities.tags_bench                                   # memory store, 10 / 1k / 100k tags
+    python -m utilities.tags_bench --backend memory --backend sqlite --clients 16
+    python -m utilities.tags_bench --base-url http://127.0.0.1:8765  # a `python -m standin` you started
+
+For each volume the stand-in is reset and seeded (POST /__standin/seed), then
+--clients parallel clients, each on its own keep-alive connection, run --ops
+requests per phase:
+    create     POST /api/tags with a new name
+    update     POST /api/tags/update on a random seeded tag
+    list_page  GET /api/tags?limit=--page-size at a random offset
+    list_all   GET /api/tags (a tenth of --ops: the response grows with the volume)
+The report gives p50/p95/p99 per phase and volume, and the growth exponent k of
+p50 ~ n^k between the smallest and largest volume (k ~ 0 flat, k ~ 1 linear).
+Seeding needs the stand-in's /__standin endpoints; never point this at a shared server.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from utilities.async_http import Connection, split_url
+from utilities.custom_logger import customLogger
+from utilities.signup_load import LoadStats
+
+PHASES = ("create", "update", "list_page", "list_all")
+
+log = customLogger("tags_bench")
+
+
+class TagsClient:
+    """One benchmark client: a keep-alive connection plus the bearer token."""
+
+    def __init__(self, base_url, token):
+        self.conn = Connection.for_url(base_url)
+        self.prefix = split_url(base_url)[3].rstrip("/")
+        self.headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+
+    async def call(self, stats, method, path, data=None):
+        body = json.dumps(data).encode() if data is not None else b""
+        started = time.perf_counter()
+        try:
+            status, _ = await self.conn.request(method, self.prefix + path, self.headers, body)
+        except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+            self.conn.close()
+            status = f"error:{type(e).__name__}"
+        stats.record(status, (time.perf_counter() - started) * 1000)
+
+    def close(self):
+        self.conn.close()
+
+
+async def run_phase(phase, clients, ops, ids, volume, page_size):
+    stats = LoadStats()
+
+    async def worker(index, client):
+        for i in range(ops):
+            if phase == "create":
+                await client.call(stats, "POST", "/api/tags", {
+                    "name": f"bench-{index}-{i}-{uuid.uuid4().hex[:6]}", "color": "#336699",
+                    "description": "tags benchmark"})
+            elif phase == "update":
+                await client.call(stats, "POST", "/api/tags/update", {
+                    "id": random.choice(ids), "name": f"upd-{uuid.uuid4().hex[:10]}",
+                    "color": "#ff6633", "description": "updated by tags benchmark"})
+            elif phase == "list_page":
+                offset = random.randrange(max(1, volume - page_size + 1))
+                await client.call(stats, "GET", f"/api/tags?limit={page_size}&offset={offset}")
+            else:
+                await client.call(stats, "GET", "/api/tags")
+
+    await asyncio.gather(*(worker(i, c) for i, c in enumerate(clients)))
+    stats.finished = time.perf_counter()
+    summary = stats.summary()
+    return {k: summary[k] for k in ("requests", "elapsed_s", "throughput_rps", "latency_ms", "status")}
+
+
+async def run_volume(base_url, token, volume, ids, clients, ops, page_size):
+    pool = [TagsClient(base_url, token) for _ in range(clients)]
+    try:
+        results = {}
+        for phase in PHASES:
+            phase_ops = max(1, ops // 10) if phase == "list_all" else ops
+            results[phase] = await run_phase(phase, pool, phase_ops, ids, volume, page_size)
+        return results
+    finally:
+        for client in pool:
+            client.close()
+
+
+def scaling(volumes, results):
+    """Per phase: k in p50 ~ n^k between the smallest and largest volume."""
+    out = {}
+    small, large = min(volumes), max(volumes)
+    for phase in PHASES:
+        a = results[small][phase]["latency_ms"]["p50"]
+        b = results[large][phase]["latency_ms"]["p50"]
+        out[phase] = round(math.log(b / a) / math.log(large / small), 2) if a > 0 and b > 0 and large > small \
+            else None
+    return out
+
+
+def short(n):
+    return f"{n // 1000}k" if n >= 1000 and n % 1000 == 0 else str(n)
+
+
+def print_backend(name, volumes, results, exponents, out=sys.stdout):
+    print(f"\n{name} store - p50 / p99 ms per phase", file=out)
+    print(f"{'phase':<10}" + "".join(f"{short(v):>18}" for v in volumes) + f"{'scaling':>12}", file=out)
+    for phase in PHASES:
+        cells = "".join(f"{results[v][phase]['latency_ms']['p50']:>9} /{results[v][phase]['latency_ms']['p99']:>7}"
+                        for v in volumes)
+        k = exponents[phase]
+        print(f"{phase:<10}{cells}{('n^' + str(k)) if k is not None else '-':>12}", file=out)
+
+
+def bench_backend(base_url, volumes, clients, ops, page_size):
+    from standin import StandinClient
+    from standin.app import default_user
+    admin = StandinClient(base_url, timeout=300)
+    account = default_user()
+    results, backend = {}, None
+    for volume in volumes:
+        admin.reset()
+        token = admin.login(account["email"], account["password"])
+        started = time.perf_counter()
+        seeded = admin.seed_tags(volume)
+        backend = seeded["backend"]
+        log.info("Seeded %d tags (%s store) in %.2f s", volume, backend, time.perf_counter() - started)
+        results[volume] = asyncio.run(run_volume(base_url, token, volume, seeded["sample"] or [str(uuid.uuid4())],
+                                                 clients, ops, page_size))
+        results[volume]["seed_s"] = round(time.perf_counter() - started, 2)
+    admin.reset()
+    return backend, results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tags API latency vs data volume")
+    parser.add_argument("--backend", action="append", choices=("memory", "sqlite"),
+                        help="stand-in storage backend to start (repeatable; default memory)")
+    parser.add_argument("--volumes", default="10,1000,100000", help="tags per user, comma separated")
+    parser.add_argument("--clients", type=int, default=8, help="parallel clients (one connection each)")
+    parser.add_argument("--ops", type=int, default=100, help="requests per client per phase")
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="stand-in latency per request (ms)")
+    parser.add_argument("--base-url", help="use an already running stand-in instead of starting one")
+    parser.add_argument("--json", default="reports/tags_bench.json")
+    args = parser.parse_args(argv)
+    volumes = sorted(int(v) for v in args.volumes.split(","))
+
+    report = {"volumes": volumes, "clients": args.clients, "ops": args.ops, "backends": {}}
+    targets = [(None, args.base_url)] if args.base_url else [(b, None) for b in (args.backend or ["memory"])]
+    for backend, base_url in targets:
+        server = None
+        if base_url is None:
+            from standin import StandinServer
+            server = StandinServer(latency_ms=args.latency, backend=backend).start()
+            base_url = server.base_url
+        try:
+            name, results = bench_backend(base_url, volumes, args.clients, args.ops, args.page_size)
+        finally:
+            if server is not None:
+                server.stop()
+        exponents = scaling(volumes, results)
+        report["backends"][name] = {"results": {str(v): r for v, r in results.items()}, "scaling": exponents}
+        print_backend(name, volumes, results, exponents)
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
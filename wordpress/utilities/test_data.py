@@ -0,0 +1,48 @@
+# utilities/test_data.py
+import os
+from utilities.util import Util
+
+
+def worker_id() -> str:
+    """
+    Id of the current parallel worker ("gw0", "gw1", ...) or "main" when not sharded.
+    Reads the same variable pytest-xdist sets, so both runners behave alike.
+    """
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+class TestDataFactory:
+    """
+    Namespaced test data so parallel workers never collide on emails or names.
+    Every value carries the worker id plus a random token from Util.getUniqueName.
+    """
+    __test__ = False
+
+    def __init__(self, namespace: str = None):
+        self.util = Util()
+        self.namespace = (namespace or worker_id()).lower()
+
+    def token(self, charCount=6) -> str:
+        return f"{self.namespace}{self.util.getUniqueName(charCount)}"
+
+    def name(self, prefix="user") -> str:
+        return f"{prefix}{self.token()}"
+
+    def email(self, prefix="test", domain="example.com") -> str:
+        return f"{prefix}.{self.token()}@{domain}"
+
+    def alias_email(self, email: str) -> str:
+        """Plus-address an existing mailbox: jo@x.com -> jo+gw0abcdef@x.com"""
+        local, _, domain = email.partition("@")
+        local = local.split("+", 1)[0]
+        return f"{local}+{self.token()}@{domain}"
+
+    def account(self, base: dict = None) -> dict:
+        """Fresh registration payload, optionally derived from a configured account."""
+        base = base or {}
+        return {
+            "first_name": base.get("first_name") or self.name("First"),
+            "last_name": base.get("last_name") or self.name("Last"),
+            "email": self.alias_email(base["email"]) if base.get("email") else self.email(),
+            "password": base.get("password") or "TallBuildings123!",
+        }
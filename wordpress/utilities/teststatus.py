@@ -4,8 +4,11 @@ __test__ = False
 
 import utilities.custom_logger as cl
 import logging
+import sys
+import time
 from base.selenium_driver import SeleniumDriver
-from traceback import print_stack
+from traceback import format_exception_only, print_stack
+from utilities.results_stream import FAIL, PASS, ResultStream, Verification
 
 
 class TestStatus(SeleniumDriver):
@@ -20,34 +23,51 @@ class TestStatus(SeleniumDriver):
         """
         super(TestStatus, self).__init__(driver)
         self.driver = driver
-        self.resultList = []
+        self.results = []
+        self._last_mark = time.monotonic()
 
-    def setResult(self, result, resultMessage):
+    @property
+    def resultList(self):
+        """"PASS"/"FAIL" per verification since the last markFinal (kept for older callers)."""
+        return [v.status for v in self.results]
+
+    def setResult(self, result, resultMessage, final=False, testName=None):
         """
-        Set the test result and log the appropriate message.
+        Record a verification and log the appropriate message.
 
         Args:
         - result (bool): Test result (True for pass, False for fail).
         - resultMessage (str): Message to log.
+        Returns the Verification entry (message, status, duration since the
+        previous mark, screenshot path, exception being handled if any).
         """
+        now = time.monotonic()
+        screenshot = exception = None
         try:
-            if result is not None:
-                if result:
-                    self.resultList.append("PASS")
-                    self.log.info(f"### VERIFICATION SUCCESSFUL: {resultMessage}")
-                else:
-                    self.resultList.append("FAIL")
-                    self.log.error(f"### VERIFICATION FAILED: {resultMessage}")
-                    self.screenShot(resultMessage)
+            if result:
+                status = PASS
+                self.log.info("### VERIFICATION SUCCESSFUL: %s", resultMessage)
             else:
-                self.resultList.append("FAIL")
-                self.log.error(f"### VERIFICATION FAILED: {resultMessage}")
-                self.screenShot(resultMessage)
-        except:
-            self.resultList.append("FAIL")
+                status = FAIL
+                self.log.error("### VERIFICATION FAILED: %s", resultMessage)
+                screenshot = self.screenShot(resultMessage)
+                # Marks made inside an except block keep the exception that caused them
+                handled = sys.exc_info()[1]
+                if handled is not None:
+                    exception = "".join(format_exception_only(type(handled), handled)).strip()
+        except Exception as e:
+            status = FAIL
+            exception = "".join(format_exception_only(type(e), e)).strip()
             self.log.error("### An Exception Occurred!")
-            self.screenShot(resultMessage)
+            screenshot = self.screenShot(resultMessage)
             print_stack()
+        entry = Verification(resultMessage, status, now - self._last_mark, screenshot, exception,
+                             final=final, test=testName, nodeid=ResultStream.current_nodeid())
+        self._last_mark = now
+        self.results.append(entry)
+        if ResultStream.active is not None:
+            ResultStream.active.add_verification(entry)
+        return entry
 
     def mark(self, result, resultMessage):
         """
@@ -57,7 +77,7 @@ class TestStatus(SeleniumDriver):
         - result (bool): Test result (True for pass, False for fail).
         - resultMessage (str): Message to log.
         """
-        self.setResult(result, resultMessage)
+        return self.setResult(result, resultMessage)
 
     def markFinal(self, testName, result, resultMessage):
         """
@@ -69,13 +89,13 @@ class TestStatus(SeleniumDriver):
         - result (bool): Test result (True for pass, False for fail).
         - resultMessage (str): Message to log.
         """
-        self.setResult(result, resultMessage)
+        self.setResult(result, resultMessage, final=True, testName=testName)
+        failed = [v.message for v in self.results if not v.passed]
+        self.results.clear()
 
-        if "FAIL" in self.resultList:
-            self.log.error(f"{testName} - TEST FAILED")
-            self.resultList.clear()
-            assert False
+        if failed:
+            self.log.error("%s - TEST FAILED", testName)
+            assert False, "; ".join(failed)
         else:
-            self.log.info(f"{testName} - TEST PASSED SUCCESSFULLY")
-            self.resultList.clear()
+            self.log.info("%s - TEST PASSED SUCCESSFULLY", testName)
             assert True
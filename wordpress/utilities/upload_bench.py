@@ -0,0 +1,315 @@
+# utilities/upload_bench.py
+"""
+Upload benchmark for {{verbatimly}}/upload with audio-sized files.
+
+    python -m utilities.upload_bench --standin --size 10MB --size 200MB --concurrency 4
+    python -m utilities.upload_bench --base-url http://127.0.0.1:8765 --size 2GB --file-name podcast.wav
+
+Files are WAV streams generated on the fly (or --file, read from disk chunk by
+chunk) and sent as multipart/form-data with Transfer-Encoding: chunked
+(--content-length sends the exact length instead). Nothing larger than one
+chunk is held in memory, so client RSS stays flat from megabytes to gigabytes;
+the benchmark samples it to prove that.
+Per upload: upload time (last body byte written), time to the response head
+(status line and headers), total time and throughput. Per round: aggregate
+throughput and peak RSS growth (where the platform reports RSS).
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import re
+import struct
+import sys
+import time
+import uuid
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage, and no /proc either
+    resource = None
+
+from utilities.async_http import Connection, split_url
+from utilities.custom_logger import customLogger
+from utilities.postman_runner import PostmanRunner
+from utilities.signup_load import DEFAULT_COLLECTION, percentile
+
+DEFAULT_REQUEST = "Negative Test/Upload Files"
+UNITS = {"B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}
+
+log = customLogger("upload")
+
+
+def parse_size(text):
+    m = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMG]?)B?\s*", text.upper())
+    if not m:
+        raise argparse.ArgumentTypeError(f"not a size: {text!r} (try 50MB, 1.5GB)")
+    return int(float(m.group(1)) * UNITS[m.group(2) + "B"])
+
+
+def human(n):
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+# ---------- Sources ----------
+class WavSource:
+    """
+    A 16 kHz mono 16-bit WAV of exactly `size` bytes, generated chunk by chunk:
+    one second of a 440 Hz tone is computed once and repeated.
+    """
+    RATE = 16000
+
+    def __init__(self, size, chunk_size=256 * 1024, name="generated.wav"):
+        self.size = max(size, 44)
+        self.chunk_size = chunk_size
+        self.name = name
+        self.content_type = "audio/wav"
+        second = b"".join(struct.pack("<h", int(12000 * math.sin(2 * math.pi * 440 * i / self.RATE)))
+                          for i in range(self.RATE))
+        self._block = (second * (chunk_size // len(second) + 2))[:chunk_size + len(second)]
+        self._period = len(second)
+
+    def header(self):
+        data = self.size - 44
+        return (b"RIFF" + struct.pack("<I", min(36 + data, 0xFFFFFFFF)) + b"WAVEfmt "
+                + struct.pack("<IHHIIHH", 16, 1, 1, self.RATE, self.RATE * 2, 2, 16)
+                + b"data" + struct.pack("<I", min(data, 0xFFFFFFFF)))
+
+    def chunks(self):
+        yield self.header()
+        left, offset = self.size - 44, 0
+        while left:
+            n = min(left, self.chunk_size)
+            yield self._block[offset:offset + n]     # slice of the precomputed block, no growth
+            offset = (offset + n) % self._period
+            left -= n
+
+
+class FileSource:
+    """An existing file, read chunk by chunk."""
+
+    def __init__(self, path, chunk_size=256 * 1024):
+        self.path = path
+        self.size = os.path.getsize(path)
+        self.chunk_size = chunk_size
+        self.name = os.path.basename(path)
+        self.content_type = "audio/wav" if path.lower().endswith(".wav") else "application/octet-stream"
+
+    def chunks(self):
+        with open(self.path, "rb") as f:
+            while True:
+                data = f.read(self.chunk_size)
+                if not data:
+                    return
+                yield data
+
+
+class Multipart:
+    """multipart/form-data around a source, as a stream of pieces with a known total length."""
+
+    def __init__(self, source, field="file"):
+        self.source = source
+        self.boundary = f"----upload{uuid.uuid4().hex}"
+        self.preamble = (f"--{self.boundary}\r\nContent-Disposition: form-data; name=\"{field}\"; "
+                         f"filename=\"{source.name}\"\r\nContent-Type: {source.content_type}\r\n\r\n").encode()
+        self.epilogue = f"\r\n--{self.boundary}--\r\n".encode()
+
+    @property
+    def content_type(self):
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self):
+        return len(self.preamble) + self.source.size + len(self.epilogue)
+
+    def pieces(self):
+        yield self.preamble
+        yield from self.source.chunks()
+        yield self.epilogue
+
+
+# ---------- Memory ----------
+def rss_bytes():
+    """Current resident set size (Linux /proc), else the peak from getrusage, else None."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        if resource is None:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RssSampler:
+    """Samples RSS every interval seconds while a round runs; growth is None where RSS is unknown."""
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.baseline = self.peak = rss_bytes()
+        self._task = None
+
+    async def _run(self):
+        while True:
+            self.peak = max(self.peak, rss_bytes())
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        if self.baseline is not None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return None
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self.peak = max(self.peak, rss_bytes())
+        return self.peak - self.baseline
+
+
+# ---------- Upload ----------
+async def upload(url, headers, source, chunked=True, timeout=600.0):
+    """Stream one multipart upload; returns its timings."""
+    body = Multipart(source)
+    conn = Connection.for_url(url)
+    head = dict(headers, **{"Content-Type": body.content_type})
+    if chunked:
+        head["Transfer-Encoding"] = "chunked"
+    else:
+        head["Content-Length"] = str(len(body))
+    started = time.perf_counter()
+    result = {"bytes": len(body), "status": None}
+    try:
+        await asyncio.wait_for(conn.open(), timeout)
+        await conn.write_head("POST", split_url(url)[3], head)
+        try:
+            for piece in body.pieces():
+                await conn.write(piece, chunked)
+            if chunked:
+                await conn.write(b"", chunked=True)
+        except ConnectionError:
+            # The server answered early (401, 413, ...) and closed; its response may be buffered
+            pass
+        sent = time.perf_counter()
+        head = []
+        status, _, data = await asyncio.wait_for(
+            conn.read_response(on_head=lambda: head.append(time.perf_counter())), timeout)
+        result.update(status=status, upload_s=sent - started, ttfb_s=head[0] - started,
+                      server_s=head[0] - sent, response=data[:200].decode("utf-8", "replace"))
+    except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+        result.update(status=f"error:{type(e).__name__}")
+    finally:
+        conn.close()
+    total = time.perf_counter() - started
+    result["total_s"] = total
+    ok = isinstance(result["status"], int) and result["status"] < 300
+    result["throughput_mbps"] = round(len(body) * 8 / total / 1e6, 1) if ok and total else 0.0
+    return result
+
+
+async def run_round(url, headers, make_source, concurrency, chunked, timeout):
+    sampler = RssSampler()
+    sampler.start()
+    started = time.perf_counter()
+    results = await asyncio.gather(*(upload(url, headers, make_source(), chunked, timeout)
+                                     for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+    rss_growth = await sampler.stop()
+    ok = [r for r in results if isinstance(r["status"], int) and r["status"] < 300]
+    ttfb = sorted(r["ttfb_s"] * 1000 for r in ok)
+    total_bytes = sum(r["bytes"] for r in ok)
+    return {
+        "file_bytes": results[0]["bytes"] if results else 0,
+        "concurrency": concurrency,
+        "ok": len(ok),
+        "status": sorted({str(r["status"]) for r in results}),
+        "wall_s": round(wall, 3),
+        "throughput_mbps": round(total_bytes * 8 / wall / 1e6, 1) if wall else 0.0,
+        "throughput_mb_s": round(total_bytes / wall / 1024 ** 2, 1) if wall else 0.0,
+        "ttfb_ms": {"p50": round(percentile(ttfb, 50), 1), "max": round(ttfb[-1], 1) if ttfb else 0.0},
+        "server_ms_max": round(max((r["server_s"] for r in ok), default=0.0) * 1000, 1),
+        "rss_baseline_mb": None if sampler.baseline is None else round(sampler.baseline / 1024 ** 2, 1),
+        "rss_growth_mb": None if rss_growth is None else round(rss_growth / 1024 ** 2, 1),
+        "uploads": [{k: (round(v, 4) if isinstance(v, float) else v) for k, v in r.items()} for r in results],
+    }
+
+
+def print_round(r, out=sys.stdout):
+    print(f"{human(r['file_bytes']):>9} x{r['concurrency']:<3} ok {r['ok']}/{r['concurrency']}  "
+          f"{r['throughput_mb_s']:>7} MB/s  ttfb p50 {r['ttfb_ms']['p50']} ms  "
+          + (f"RSS +{r['rss_growth_mb']} MB  " if r["rss_growth_mb"] is not None else "RSS n/a  ")
+          + f"status {', '.join(r['status'])}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streaming multipart upload benchmark")
+    parser.add_argument("--size", type=parse_size, action="append",
+                        help="generated file size, e.g. 5MB or 1GB (repeatable; default 1MB, 10MB, 100MB)")
+    parser.add_argument("--file", help="upload this file instead of a generated WAV")
+    parser.add_argument("--file-name", default="generated.wav")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--chunk-size", type=parse_size, default=256 * 1024)
+    parser.add_argument("--content-length", action="store_true",
+                        help="send Content-Length instead of Transfer-Encoding: chunked")
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--collection", default=DEFAULT_COLLECTION)
+    parser.add_argument("-e", "--environment", default=None)
+    parser.add_argument("--request", default=DEFAULT_REQUEST, help='"Folder/Name" of the upload request')
+    parser.add_argument("--base-url", help="Point {{verbatimly}} at this host")
+    parser.add_argument("--token", help="Bearer token (default: ACCESS_TOKEN from the environment)")
+    parser.add_argument("--standin", action="store_true", help="Start the local stand-in app and upload to it")
+    parser.add_argument("--json", default="reports/upload_bench.json")
+    args = parser.parse_args(argv)
+
+    server = None
+    overrides = {}
+    if args.standin:
+        from standin import StandinClient, StandinServer
+        from standin.app import default_user
+        server = StandinServer().start()
+        account = default_user()
+        overrides["verbatimly"] = server.base_url
+        overrides["ACCESS_TOKEN"] = StandinClient(server.base_url).login(account["email"], account["password"])
+    elif args.base_url:
+        overrides["verbatimly"] = args.base_url
+    if args.token:
+        overrides["ACCESS_TOKEN"] = args.token
+
+    rounds = []
+    try:
+        runner = PostmanRunner.from_files(args.collection, args.environment, overrides=overrides)
+        _, item, auths, _ = runner.find(args.request)
+        request = item["request"]
+        url, headers, _ = runner.build(request, auths + [request.get("auth")], runner.variables.fork())
+        headers = {k: v for k, v in headers.items() if k.lower() not in ("content-type", "content-length")}
+        if args.file:
+            plans = [(os.path.getsize(args.file), lambda: FileSource(args.file, args.chunk_size))]
+        else:
+            plans = [(size, lambda size=size: WavSource(size, args.chunk_size, args.file_name))
+                     for size in (args.size or [parse_size("1MB"), parse_size("10MB"), parse_size("100MB")])]
+        log.info("Upload benchmark against %s: %s x%d (%s)", url, ", ".join(human(s) for s, _ in plans),
+                 args.concurrency, "Content-Length" if args.content_length else "chunked")
+        for _, make_source in plans:
+            r = asyncio.run(run_round(url, headers, make_source, args.concurrency,
+                                      not args.content_length, args.timeout))
+            rounds.append(r)
+            print_round(r)
+    finally:
+        if server is not None:
+            server.stop()
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps({"url": url, "chunked": not args.content_length,
+                                               "rounds": rounds}, indent=2), encoding="utf-8")
+        print(f"Results written to {args.json}")
+    return 0 if rounds and all(r["ok"] == r["concurrency"] for r in rounds) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())